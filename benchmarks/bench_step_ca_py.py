@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+# Compares the throughput of signing against a local stand-in ca, one request
+# at a time and overlapped, run with `python -m benchmarks.bench_step_ca_py`.
+# The stand-in adds a fixed latency to each request, like a remote ca would.
+
+import argparse
+import asyncio
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from step.python.step_ca_py import AsyncStepCaClient, StepCaClient
+from step.testing.stub_ca import StubCa
+
+
+def _csr() -> str:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "host.example.com")])
+    csr = x509.CertificateSigningRequestBuilder().subject_name(name)
+    return (
+        csr.sign(key, hashes.SHA256()).public_bytes(serialization.Encoding.PEM)
+    ).decode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark signing throughput.")
+    parser.add_argument(
+        "-n", "--requests", help="Requests per client.", type=int, default=1000
+    )
+    parser.add_argument(
+        "-c", "--concurrency", help="Requests in flight.", type=int, default=64
+    )
+    parser.add_argument(
+        "-l", "--latency", help="Latency of the ca, ms.", type=float, default=5.0
+    )
+    args = parser.parse_args()
+    csr = _csr()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stub = StubCa(Path(tmp_dir)).start()
+        stub.delay = args.latency / 1000
+
+        def sequential() -> None:
+            with StepCaClient(stub.url, stub.root_path) as client:
+                for _ in range(args.requests):
+                    client.sign(csr, "token")
+
+        def threaded() -> None:
+            with StepCaClient(
+                stub.url, stub.root_path, pool_size=args.concurrency
+            ) as client, ThreadPoolExecutor(args.concurrency) as executor:
+                list(
+                    executor.map(
+                        lambda _: client.sign(csr, "token"), range(args.requests)
+                    )
+                )
+
+        async def overlapped() -> None:
+            async with AsyncStepCaClient(
+                stub.url, stub.root_path, max_connections=args.concurrency
+            ) as client:
+                await asyncio.gather(
+                    *(client.sign(csr, "token") for _ in range(args.requests))
+                )
+
+        clients: dict[str, Callable[[], object]] = {
+            "StepCaClient": sequential,
+            "StepCaClient threads": threaded,
+            "AsyncStepCaClient": lambda: asyncio.run(overlapped()),
+        }
+        baseline = 0.0
+        for name, run in clients.items():
+            start = time.perf_counter()
+            run()
+            per_second = args.requests / (time.perf_counter() - start)
+            baseline = baseline or per_second
+            print(f"{name:20} {per_second:8.1f} signs/s {per_second / baseline:6.1f}x")
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
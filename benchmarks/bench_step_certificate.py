@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+# Compares loading a large PEM bundle eagerly with cryptography and through
+# StepCertificate, run with `python -m benchmarks.bench_step_certificate`.
+
+import argparse
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from step import StepCertificate
+
+
+def _bundle(count: int) -> bytes:
+    key = ec.generate_private_key(ec.SECP256R1())
+    now = datetime.now(timezone.utc)
+    pems = []
+    for i in range(count):
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, f"host{i}")])
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(i + 1)
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=1))
+            .add_extension(
+                x509.SubjectAlternativeName([x509.DNSName(f"host{i}.example.com")]),
+                False,
+            )
+            .sign(key, hashes.SHA256())
+        )
+        pems.append(cert.public_bytes(serialization.Encoding.PEM))
+    return b"".join(pems)
+
+
+def _eager(data: bytes) -> list:
+    """Parses every certificate and keeps it, like the old model."""
+    certs = x509.load_pem_x509_certificates(data)
+    for c in certs:
+        c.subject.rfc4514_string()
+        c.extensions.get_extension_for_class(x509.SubjectAlternativeName)
+    return certs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark certificate loading.")
+    parser.add_argument(
+        "-n", "--certs", help="Certificates in the bundle.", type=int, default=20000
+    )
+    parser.add_argument(
+        "-w", "--workers", help="Processes to decode on.", type=int, default=4
+    )
+    args = parser.parse_args()
+    data = _bundle(args.certs)
+
+    def decoded(max_workers: int) -> list:
+        certs = StepCertificate.load_all(data, max_workers)
+        for c in certs:
+            c.subject, c.sans
+        return certs
+
+    loaders: dict[str, Callable[[], object]] = {
+        "cryptography": lambda: _eager(data),
+        "StepCertificate split": lambda: StepCertificate.load_all(data),
+        "StepCertificate fields": lambda: decoded(0),
+        f"StepCertificate {args.workers} procs": lambda: decoded(args.workers),
+    }
+    print(f"{args.certs} certificates, {os.cpu_count()} cpus")
+    for name, load in loaders.items():
+        start = time.perf_counter()
+        load()
+        elapsed = time.perf_counter() - start
+        # python objects kept, cryptography's rust side is not traced
+        tracemalloc.start()
+        result = load()
+        kept, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        print(f"{name:24} {elapsed * 1e3:8.1f} ms {kept / 2**20:8.1f} MiB kept")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+# Compares the cost of spawning step through a shell and directly, run with
+# `python -m benchmarks.bench_step_cli_exec`. The binary defaults to `true`,
+# so only the spawn itself is measured.
+
+import argparse
+import shutil
+import subprocess
+import time
+from collections.abc import Callable
+
+from step.cli.step_cli_exec import PosixSpawnExecutor, SubprocessExecutor
+
+
+def _time(run: Callable[[], object], calls: int) -> float:
+    """Times calls to run, returning the seconds per call."""
+    run()  # warm up
+    start = time.perf_counter()
+    for _ in range(calls):
+        run()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark step process spawning.")
+    parser.add_argument("-b", "--binary", help="Stand-in for step.", default="true")
+    parser.add_argument(
+        "-n", "--calls", help="Calls per backend.", type=int, default=500
+    )
+    args = parser.parse_args()
+    binary = shutil.which(args.binary) or args.binary
+    argv = [binary, "ca", "certificate", "host.example.com", "--san=host.example.com"]
+
+    backends: dict[str, Callable[[], object]] = {
+        "shell=True string": lambda: subprocess.run(
+            " ".join(argv[:4] + [f"'{argv[4]}'"]),
+            shell=True,
+            check=True,
+            stdout=subprocess.PIPE,
+        ),
+        "SubprocessExecutor": lambda: SubprocessExecutor().run(argv),
+        "PosixSpawnExecutor": lambda: PosixSpawnExecutor().run(argv),
+    }
+    baseline = 0.0
+    for name, run in backends.items():
+        per_call = _time(run, args.calls)
+        baseline = baseline or per_call
+        print(
+            f"{name:20} {per_call * 1e6:9.1f} us/call "
+            + f"{1 / per_call:8.1f} calls/s {1 - per_call / baseline:7.1%} saved"
+        )
+
+
+if __name__ == "__main__":
+    main()
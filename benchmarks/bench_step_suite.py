@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+# Times the hot paths of StepCli and StepCaClient without step or a ca, run
+# with `python -m benchmarks.bench_step_suite`. step is replaced by the
+# stand-in of benchmarks.fake_step and the ca by step.testing.stub_ca.
+#
+# Save the results of a release with `--save benchmarks/results/0.1.1.json`
+# and compare a change against them with `--compare`, which exits with an
+# error if any benchmark got slower by more than `--threshold`, unless
+# `--report-only` is given.
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tomllib
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.fake_step import make_fake_step, nodes, render_help
+from step import StepCli, StepCliCrawler, StepCliParser, StepCommand, StepCommands
+from step.cli import step_cli
+from step.cli.step_cli_cache import StepCliCache
+from step.cli.step_cli_exec import StepExecutor, step_binary
+from step.python.step_ca_py import AsyncStepCaClient, StepCaClient
+from step.python.step_token import StepTokens
+from step.testing.stub_ca import StubCa
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA = str(ROOT / "step" / "cli" / "step-cli.json")
+
+
+def _version() -> str:
+    with open(ROOT / "pyproject.toml", "rb") as pyproject:
+        return tomllib.load(pyproject)["project"]["version"]
+
+
+def _time(run: Callable[[], object], min_time: float, rounds: int = 5) -> float:
+    """Times calls to run, returning the best seconds per call of the rounds."""
+    run()  # warm up
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / rounds:
+            break
+        calls *= 2
+    best = elapsed / calls
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+class _NoSpawnExecutor(StepExecutor):
+    """Returns an output without running step, to time the calls alone."""
+
+    def __init__(self, stdout: bytes = b"") -> None:
+        self.stdout = stdout
+
+    def run(self, argv, stdin=None, stderr=None) -> subprocess.CompletedProcess:
+        return subprocess.CompletedProcess(argv, 0, self.stdout)
+
+
+def _cli_benchmarks(hosts: int) -> dict[str, Callable[[], object]]:
+    """The benchmarks of StepCli, which runs the stand-in step."""
+    step = StepCli()
+    certificate = step.ca.certificate
+    hosts_cli, inspect = step.ssh.hosts, step.certificate.inspect
+    version = step.version
+    hosts_output = b"HOSTNAME ID TAGS\n" + b"".join(
+        b"host-%d.internal %d env=prod role=web\n" % (i, i) for i in range(hosts)
+    )
+    with open(
+        ROOT / "benchmarks" / "recordings" / "certificate_inspect.txt", "rb"
+    ) as f:
+        inspect_output = f.read()
+    no_args = hosts_cli._step_args((), {})
+    inspect_args = inspect._step_args(("host.crt",), {})
+
+    with open(SCHEMA) as schema_file:
+        certificate_node = json.load(schema_file)["ca"]["certificate"]
+    help_parser = StepCliParser()
+    help_parser.executor = _NoSpawnExecutor(
+        render_help(["step", "ca", "certificate"], certificate_node).encode("utf-8")
+    )
+
+    no_spawn = StepCli(executor=_NoSpawnExecutor())
+    typed = StepCommands(no_spawn)
+    certificate_args = ("host.example.com", "host.crt", "host.key")
+
+    def navigate_cold() -> object:
+        StepCommand._commands.clear()
+        return StepCli().ca.certificate
+
+    def load_schema() -> bool:
+        StepCliParser().command_dict.clear()
+        return StepCliParser.load_schema(SCHEMA, check_cli_version=False)
+
+    def crawl() -> None:
+        crawler = StepCliCrawler(max_workers=8)
+        crawler.crawl()
+        assert not crawler.failed, crawler.failed
+
+    return {
+        "StepCli()": StepCli,
+        "load schema": load_schema,
+        "parse help": lambda: help_parser.parse_help(["step", "ca", "certificate"]),
+        "navigate cold": navigate_cold,
+        "navigate warm": lambda: step.ca.certificate,
+        "StepArgs": lambda: certificate._step_args(
+            ("host.example.com", "host.crt", "host.key"),
+            {
+                "san": ["host.example.com", "10.0.0.1"],
+                "ca_url": "https://ca.example.com",
+                "not_after": "24h",
+                "force": True,
+            },
+        ),
+        "call no spawn": lambda: no_spawn.ca.certificate(
+            *certificate_args,
+            san=["host.example.com", "10.0.0.1"],
+            not_after="24h",
+            force=True,
+            _raw_output=True,
+        ),
+        "call no spawn typed": lambda: typed.ca.certificate(
+            *certificate_args,
+            san=["host.example.com", "10.0.0.1"],
+            not_after="24h",
+            force=True,
+            _raw_output=True,
+        ),
+        f"parse ssh hosts x{hosts}": lambda: hosts_cli._output(
+            hosts_output, no_args, False, False
+        ),
+        "parse version": lambda: version._output(
+            b"Smallstep CLI/0.24.4 (linux/amd64)\n"
+            + b"Release Date: 2023-05-11 19:53 UTC\n",
+            no_args,
+            False,
+            False,
+        ),
+        "parse inspect json": lambda: inspect._output(
+            inspect_output, inspect_args, False, True
+        ),
+        "call ca health": step.ca.health,
+        "call ssh hosts": step.ssh.hosts,
+        "crawl schema": crawl,
+    }
+
+
+def _ca_benchmarks(stub: StubCa, concurrency: int) -> dict[str, Callable[[], object]]:
+    """The benchmarks of the clients of the ca, against the stub."""
+    client = StepCaClient(stub.url, stub.root_path)
+    stub.jwk_provisioner("bench", b"password")
+    tokens = StepTokens(client, stub.url, stub.fingerprint)
+
+    async def overlapped() -> None:
+        async with AsyncStepCaClient(
+            stub.url, stub.root_path, max_connections=concurrency
+        ) as async_client:
+            await asyncio.gather(*(async_client.version() for _ in range(concurrency)))
+
+    return {
+        "StepCaClient version": client.version,
+        "StepTokens token": lambda: tokens.token("host", "bench", b"password"),
+        f"AsyncStepCaClient version x{concurrency}": lambda: asyncio.run(overlapped()),
+    }
+
+
+def _compare(results: dict[str, float], baseline_path: str, threshold: float) -> int:
+    """Prints the change from a baseline, returning the regression count."""
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    print(f"\ncompared to {baseline['version']} ({baseline_path})")
+    regressions = 0
+    for name, seconds in results.items():
+        before = baseline["results"].get(name)
+        if not before:
+            print(f"{name:32} {'new':>9}")
+            continue
+        change = seconds / before - 1
+        regressed = change > threshold
+        regressions += regressed
+        print(f"{name:32} {change:+9.1%}" + ("  REGRESSION" if regressed else ""))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the step hot paths.")
+    parser.add_argument(
+        "-t", "--min-time", help="Seconds per benchmark.", type=float, default=0.5
+    )
+    parser.add_argument(
+        "-k", "--filter", help="Only benchmarks containing this.", default=""
+    )
+    parser.add_argument(
+        "--hosts", help="Lines of the parsed ssh hosts.", type=int, default=1000
+    )
+    parser.add_argument(
+        "-c", "--concurrency", help="Requests in flight.", type=int, default=64
+    )
+    parser.add_argument("--save", help="Write the results to this file.")
+    parser.add_argument("--compare", help="Compare with results saved before.")
+    parser.add_argument(
+        "--threshold",
+        help="Slowdown counted as a regression.",
+        type=float,
+        default=0.25,
+    )
+    parser.add_argument(
+        "--report-only",
+        help="Print the regressions without failing.",
+        action="store_true",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        make_fake_step(os.path.join(tmp_dir, "bin"), SCHEMA)
+        os.environ["PATH"] = f"{tmp_dir}/bin{os.pathsep}{os.environ['PATH']}"
+        step_binary.cache_clear()
+        # a cache of parsed commands and the compiled schema, not the user's
+        StepCliParser._cache = StepCliCache.for_binary(
+            StepCliParser.PARSER_VERSION,
+            cache_root=os.path.join(tmp_dir, "cache"),
+            cli_version=StepCliParser._installed_cli_version(),
+        )
+        StepCliParser._cache_resolved = True
+        step_cli.STEP_JSON = SCHEMA
+        stub = StubCa(Path(tmp_dir)).start()
+        with open(SCHEMA) as schema_file:
+            commands = sum(1 for _ in nodes(json.load(schema_file), ["step"]))
+        print(
+            f"smallstep-py {_version()}, python {platform.python_version()}, "
+            + f"{os.cpu_count()} cpus, schema of {commands} commands"
+        )
+        benchmarks = {
+            **_cli_benchmarks(args.hosts),
+            **_ca_benchmarks(stub, args.concurrency),
+        }
+        results = {}
+        for name, run in benchmarks.items():
+            if args.filter not in name:
+                continue
+            seconds = results[name] = _time(run, args.min_time)
+            print(f"{name:32} {seconds * 1e6:12.1f} us/op {1 / seconds:12.1f} ops/s")
+        stub.stop()
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as save_file:
+            json.dump(
+                {
+                    "version": _version(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                save_file,
+                indent=4,
+            )
+    if (
+        args.compare
+        and _compare(results, args.compare, args.threshold)
+        and not args.report_only
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
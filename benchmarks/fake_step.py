@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+# A stand-in for the step binary, so the benchmarks run without step or a ca.
+# `--help` pages are rendered from the recorded schema, step/cli/step-cli.json,
+# in the format step prints them, and commands replay the outputs under
+# recordings/.
+
+import json
+import os
+import shutil
+from collections.abc import Iterator
+
+RECORDINGS = os.path.join(os.path.dirname(__file__), "recordings")
+
+BOLDER = "\x1b[0;1;99m"
+UNDERLINE = "\x1b[0;4;39m"
+END = "\x1b[0m"
+
+SCRIPT = """#!/bin/sh
+dir='{directory}'
+for last in "$@"; do :; done
+if [ "$last" = "--help" ]; then
+    key=$(printf '%s_' "$@")
+    key=${{key%--help_}}
+    key=${{key%_}}
+    exec cat "$dir/help/step${{key:+_$key}}.txt"
+fi
+for key in "$1_$2_$3" "$1_$2" "$1"; do
+    if [ -f "$dir/out/$key.txt" ]; then
+        exec cat "$dir/out/$key.txt"
+    fi
+done
+echo "fake step: no recording for $*" >&2
+exit 1
+"""
+
+
+def _option(name: str, arg: dict) -> str:
+    param = f"={UNDERLINE}{arg['param']}{END}" if "param" in arg else ""
+    line = f"  {BOLDER}--{name}{END}{param}"
+    if arg.get("alt_form"):
+        line += f", {BOLDER}-{arg['alt_form']}{END}{param}"
+    return line
+
+
+def render_help(command_stack: list[str], node: dict) -> str:
+    """Renders a node of the schema as step prints its help.
+
+    Args:
+        command_stack (List[str]): The command, starting with step.
+        node (Dict): The node of the schema for the command.
+    Returns:
+        str: The help page, with step's ANSI sequences.
+    """
+    lines = [f"{BOLDER}NAME{END}", f"      {' '.join(command_stack)}", ""]
+    if node.get("__subcommands__"):
+        lines.append(f"{BOLDER}COMMANDS{END}")
+        lines += [
+            f"{UNDERLINE}{name}{END}      {description}"
+            for name, description in node["__subcommands__"].items()
+        ]
+        lines.append("")
+    arguments = node.get("__arguments__", {})
+    # the second form of an option is printed on the line of the first
+    seen = set()
+    sections: dict[str, list[str]] = {"POSITIONAL ARGUMENTS": [], "OPTIONS": []}
+    for name, arg in arguments.items():
+        if name in seen:
+            continue
+        seen.update({name, arg.get("alt_form", "")})
+        if arg["type"] == "positional argument":
+            entry = [f"  {UNDERLINE}{name}{END}"]
+            section = "POSITIONAL ARGUMENTS"
+        else:
+            entry = [_option(name, arg)]
+            section = "OPTIONS"
+        if arg.get("description"):
+            entry.append(f"    {arg['description']}")
+        sections[section] += entry + [""]
+    for section, section_lines in sections.items():
+        if section_lines:
+            lines += [f"{BOLDER}{section}{END}", *section_lines]
+    if "__cli_version__" in node:
+        lines += [f"{BOLDER}VERSION{END}", f"  Smallstep CLI/{node['__cli_version__']}"]
+    return "\n".join(lines) + "\n"
+
+
+def nodes(schema: dict, command_stack: list[str]) -> Iterator[tuple[list[str], dict]]:
+    """Yields every command of the schema, with its node."""
+    yield command_stack, schema
+    for subcommand in schema.get("__subcommands__", {}):
+        node = schema.get(subcommand)
+        if isinstance(node, dict):
+            yield from nodes(node, command_stack + [subcommand])
+
+
+def make_fake_step(directory: str, schema_path: str) -> str:
+    """Writes a stand-in step binary, with its help pages and recordings.
+
+    Args:
+        directory (str): Where to write it, put it first on the PATH to use it.
+        schema_path (str): The recorded schema, for the help pages.
+    Returns:
+        str: The path of the stand-in binary.
+    """
+    with open(schema_path) as schema_file:
+        schema = json.load(schema_file)
+    os.makedirs(os.path.join(directory, "help"), exist_ok=True)
+    for command_stack, node in nodes(schema, ["step"]):
+        help_path = os.path.join(directory, "help", "_".join(command_stack) + ".txt")
+        with open(help_path, "w") as help_file:
+            help_file.write(render_help(command_stack, node))
+    shutil.copytree(RECORDINGS, os.path.join(directory, "out"), dirs_exist_ok=True)
+    step_path = os.path.join(directory, "step")
+    with open(step_path, "w") as step_file:
+        step_file.write(SCRIPT.format(directory=directory))
+    os.chmod(step_path, 0o755)
+    return step_path
@@ -16,17 +16,37 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 # Python package to interact with (small)step ca through python
 
-from .cli.step_cli import StepCli
-from .cli.step_cli_parser import StepCliParser
+from .cli.step_cli import AsyncStepCli, StepCli, StepCommand, StepResult
+from .cli.step_cli_native import StepNativeUnsupported, register_native_command
+from .cli.step_cli_output import StepOutputParser, register_output_parser
+from .cli.step_cli_parser import StepCliCrawler, StepCliParser
 from .models import StepAdmin, StepCertificate, StepSshHost, StepVersion
 from .python.step_py import StepPy
 
 __all__ = [
+    "AsyncStepCli",
     "StepAdmin",
     "StepCertificate",
     "StepSshHost",
     "StepVersion",
     "StepCli",
+    "StepCliCrawler",
     "StepCliParser",
+    "StepCommand",
+    "StepCommands",
+    "StepNativeUnsupported",
+    "StepOutputParser",
     "StepPy",
+    "StepResult",
+    "register_native_command",
+    "register_output_parser",
 ]
+
+
+def __getattr__(name: str):
+    # the generated api is large, only imported when used
+    if name == "StepCommands":
+        from .cli.step_commands import StepCommands
+
+        return StepCommands
+    raise AttributeError(f"module {__name__} has no attribute {name}")
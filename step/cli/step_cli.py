@@ -17,16 +17,33 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import os
 import subprocess
-from typing import Any
-
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, ClassVar
+
+from step.cli.step_cli_exec import StepExecutor, SubprocessExecutor, step_binary
+from step.cli.step_cli_native import (
+    StepNativeCommand,
+    StepNativeUnsupported,
+    native_command_for,
+)
+from step.cli.step_cli_output import StepOutputParser, output_parser_for
 from step.cli.step_cli_parser import StepCliParser
-from step.models import StepAdmin, StepCertificate, StepSshHost, StepVersion
+from step.metrics import step_metrics
 
-STEP_JSON = os.environ.get("STEP_JSON", ".step-cli.json")
+STEP_JSON = os.environ.get(
+    "STEP_JSON", os.path.join(os.path.dirname(__file__), "step-cli.json")
+)
+STEP_NATIVE = os.environ.get("STEP_NATIVE", "1") != "0"
 
 
 def parse_args():
@@ -86,7 +103,7 @@ class StepArgs:
     named: dict[str, str]
     command: str
     possible_args: dict[str, str] = {}
-    arg_list: list[str] = []
+    argv: list[str] = []  # the arguments for running step directly
 
     def __init__(
         self,
@@ -94,15 +111,19 @@ class StepArgs:
         positional: list[str],
         named: dict[str, Any],
         possible_args: dict[str, Any],
+        flags: dict[str, str] | None = None,
     ) -> None:
         self.command = command
         self.positional = positional
         self.named = named
         self.possible_args = possible_args
-        self.arg_list = [str(a) for a in self.positional]
+        self.argv = [str(a) for a in self.positional]
+        flags = flags or {}
         for key, value in self.named.items():
             if key.startswith("_"):
                 continue
+            elif key in flags:
+                key = flags[key]
             else:
                 key = key.replace("_", "-")
             if key not in self.possible_args:
@@ -110,12 +131,38 @@ class StepArgs:
                     f"argument '{key}' not found in command '{self.command}'"
                 )
             if value is True:
-                self.arg_list += [f"'--{key}'"]
+                self.argv += [f"--{key}"]
             elif isinstance(value, list):
-                for v in value:
-                    self.arg_list += [f"'--{key}={v}'"]
+                self.argv += [f"--{key}={v}" for v in value]
             else:
-                self.arg_list += [f"'--{key}={value}'"]
+                self.argv += [f"--{key}={value}"]
+
+    @classmethod
+    def compiled(
+        cls, command: str, positional: list[str], named: dict[str, Any], argv: list[str]
+    ) -> "StepArgs":
+        """Makes the arguments of a generated command, already checked and built.
+
+        Args:
+            command (str): The command.
+            positional (List[str]): The positional arguments.
+            named (Dict[str, Any]): The named arguments, by argument name.
+            argv (List[str]): The positional then named arguments for step.
+        Returns:
+            StepArgs: The arguments.
+        """
+        step_args = object.__new__(cls)
+        step_args.command = command
+        step_args.positional = positional
+        step_args.named = named
+        step_args.argv = argv
+        return step_args
+
+    @property
+    def arg_list(self) -> list[str]:
+        """The arguments quoted for a shell, only made for logging."""
+        start = len(self.positional)
+        return self.argv[:start] + [f"'{arg}'" for arg in self.argv[start:]]
 
     def __repr__(self) -> str:
         return (
@@ -127,36 +174,201 @@ class StepArgs:
         return " ".join(self.arg_list)
 
 
+class StepResult:
+    """The result of one command run by `StepCli._batch`."""
+
+    index: int  # the position of the command in the batch
+    command: str  # the command that was run
+    output: Any = None  # the output, processed unless raw output was asked for
+    error: Exception | None = None  # why the command failed, if it did
+
+    def __init__(self, index: int, command_path: str | Sequence[str]) -> None:
+        self.index = index
+        self.command = (
+            command_path if isinstance(command_path, str) else " ".join(command_path)
+        )
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"StepResult(index={self.index}, command={self.command}, " + (
+            f"output={self.output!r})" if self.ok else f"error={self.error!r})"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StepCommand:
+    """A parsed step command, shared by every StepCli pointing at it."""
+
+    command_stack: tuple[str, ...]  # the parts of the command, starting with step
+    command: str  # the command as it is run
+    command_dict: dict  # the parsed command, subcommands, arguments, etc.
+    arguments: dict[str, dict]  # the arguments the command accepts
+    flags: dict[str, str]  # python keyword names to their argument names
+    subcommands: frozenset[str]  # the names of the subcommands
+    output: StepOutputParser  # how the output of the command is parsed
+    native: StepNativeCommand | None  # runs the command without step, if it can
+
+    _commands: ClassVar[dict[tuple[str, ...], "StepCommand"]] = {}
+
+    @classmethod
+    def get(cls, command_stack: tuple[str, ...]) -> "StepCommand":
+        """Gets the parsed command, parsing it only the first time.
+
+        Args:
+            command_stack (Tuple[str, ...]): The parts of the command.
+        Returns:
+            StepCommand: The parsed command.
+        """
+        step_command = cls._commands.get(command_stack)
+        if step_command is None:
+            command_dict = StepCliParser().parse(list(command_stack))
+            arguments = command_dict.get("__arguments__", {})
+            step_command = cls(
+                command_stack=command_stack,
+                command=" ".join(command_stack),
+                command_dict=command_dict,
+                arguments=arguments,
+                flags={arg.replace("-", "_"): arg for arg in arguments},
+                subcommands=frozenset(command_dict.get("__subcommands__", {})),
+                output=output_parser_for(command_stack, arguments),
+                native=native_command_for(command_stack),
+            )
+            # another thread may have got here first, keep only one of them
+            step_command = cls._commands.setdefault(command_stack, step_command)
+        return step_command
+
+
+@dataclass(frozen=True, slots=True)
+class StepCommandSpec:
+    """The precomputed flags of a command of the generated typed api."""
+
+    command_stack: tuple[str, ...]  # the parts of the command, starting with step
+    flags: tuple[str, ...]  # argument names, in the order of the parameters
+    options: tuple[str, ...] = field(init=False)  # the flags as passed, `--name`
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "options", tuple(f"--{flag}" for flag in self.flags))
+
+
+class StepCommandGroup:
+    """The base of the typed commands generated from the schema.
+
+    Calls skip the checks and name conversions of StepCli, the signatures of
+    the generated methods already only take the arguments of the command.
+    """
+
+    __slots__ = ("_cli",)
+
+    _cli: "StepCli"  # runs the commands, with its executor and global args
+
+    def __init__(self, cli: "StepCli | None" = None) -> None:
+        """Initializes the commands.
+
+        Args:
+            cli (StepCli): Runs the commands, a new StepCli by default.
+        """
+        self._cli = cli or StepCli()
+
+    def _call(
+        self,
+        spec: StepCommandSpec,
+        positional: tuple[str | None, ...],
+        values: tuple[Any, ...],
+        no_stdin: bool,
+        no_stderr: bool,
+        raw_output: bool,
+    ) -> Any:
+        """Runs a command, like `StepCli.__call__`.
+
+        Args:
+            spec (StepCommandSpec): The command.
+            positional (Tuple): The positional arguments, None if not given.
+            values (Tuple): The value of each flag of the command, in the order
+                of `spec.flags`, None or False if not given.
+        Returns:
+            Any: The output, None if step failed.
+        """
+        args = [str(arg) for arg in positional if arg is not None]
+        argv = args.copy()
+        named = {}
+        for flag, option, value in zip(spec.flags, spec.options, values):
+            if value is None or value is False:
+                continue
+            named[flag] = value
+            if value is True:
+                argv.append(option)
+            elif isinstance(value, list):
+                argv += [f"{option}={v}" for v in value]
+            else:
+                argv.append(f"{option}={value}")
+        cli = self._cli._at(StepCommand.get(spec.command_stack))
+        stdin = subprocess.DEVNULL if no_stdin else None
+        stderr = subprocess.DEVNULL if no_stderr else None
+        try:
+            if cli._global_args:
+                return cli._run(tuple(args), named, stdin, stderr, raw_output)
+            step_args = StepArgs.compiled(cli._command, args, named, argv)
+            return cli._run_args(step_args, stdin, stderr, raw_output)
+        except subprocess.CalledProcessError as e:
+            cli._log.error(f"step return error: {e}")
+            return None
+
+
 class StepCli:
     """Class to run step cli commands nicely from python."""
 
-    _command_stack: list[str] = []  # the stack of parts of the command to run
-    # _cli_dict: dict[str, Any] = {}
-    _command: str = ""  # the command the class is representing
-    _command_dict: dict = {}  # the parsed command, subcommands, arguements, etc.
+    _step_command: StepCommand  # the command the object is representing
     _log: logging.Logger = logging.getLogger(__name__)
-    _global_args = {}  # global args to pass to the command
-
-    def __init__(self) -> None:
-        """Initializes the StepCli class."""
-        # self._cli_dict = {}
-        self._command = "step"
-        self._command_stack = ["step"]
-        self._command_dict = {}
-        self._log = logging.getLogger(__name__)
+    _global_args: dict[str, Any]  # global args to pass to the command
+    _args_lock: threading.Lock  # guards the global args, shared with subcommands
+    _subcommands: dict[str, "StepCli"]  # subcommands already navigated to
+    _executor: StepExecutor  # runs the step processes
+    _native: bool  # runs offline commands in process when it can
+
+    def __init__(
+        self, executor: StepExecutor | None = None, native: bool = STEP_NATIVE
+    ) -> None:
+        """Initializes the StepCli class.
+
+        Args:
+            executor (StepExecutor): Runs the step processes, by default with
+                subprocess.
+            native (bool): Run offline commands, like `step certificate
+                fingerprint`, in this process when they are covered.
+        """
+        StepCliParser.load_schema(STEP_JSON)
+        self._step_command = StepCommand.get(("step",))
         self._global_args = {}
-        self._command_dict = StepCliParser().parse(["step"])
+        self._args_lock = threading.Lock()
+        self._subcommands = {}
+        self._executor = executor or SubprocessExecutor()
+        self._native = native
+
+    def _at(self, step_command: StepCommand) -> "StepCli":
+        """Makes a StepCli for another command, sharing the global args."""
+        step_cli = object.__new__(type(self))
+        step_cli._step_command = step_command
+        step_cli._global_args = self._global_args
+        step_cli._args_lock = self._args_lock
+        step_cli._subcommands = {}
+        step_cli._executor = self._executor
+        step_cli._native = self._native
+        return step_cli
 
-    def _set_command(
-        self,
-    ) -> None:  # , next_step: str, global_args: dict | None = None) -> None:
-        """Makes the command to run."""
-        self._command = " ".join(self._command_stack)
-        self._log.debug(f"command: {self._command}")
-        self._command_dict = StepCliParser().parse(self._command_stack)
-        # if global_args:
-        #     self._log.debug(f"global args passed: {global_args}")
-        #     self._global_args = global_args
+    @property
+    def _command(self) -> str:
+        return self._step_command.command
+
+    @property
+    def _command_stack(self) -> list[str]:
+        return list(self._step_command.command_stack)
+
+    @property
+    def _command_dict(self) -> dict:
+        return self._step_command.command_dict
 
     def __str__(self) -> str:
         return self._command
@@ -165,84 +377,139 @@ class StepCli:
         return f"StepCli: {self._command}, args: {self._global_args}"
 
     def _add_args(self, **kwargs) -> None:
-        self._global_args.update(kwargs)
-
-    def _process_output(self, raw_output: str, command_ran: str) -> Any:
-        output = raw_output
-        if "admin" in self._command:
-            return [StepAdmin(l) for l in output.split("\n")[1:]]
-        elif self._command == "step ssh hosts":
-            return [StepSshHost(l) for l in output.split("\n")[1:]]
-        elif self._command == "step context list":
-            return [(l.strip("▶ "), "▶" in l) for l in output.split("\n")]
-        elif self._command == "step ca health":
-            return output == "ok"
-        elif self._command == "step version":
-            return StepVersion(output)
-        elif self._command == "step ca certificate":
-            cert_path = command_ran.split(" ")[4].strip()
-            return StepCertificate(cert_path)
-        try:
-            output = json.loads(raw_output)
-        except:
-            return output
+        with self._args_lock:
+            self._global_args.update(kwargs)
 
-    def __getattribute__(self, name: str) -> Any:
-        """Gets the attribute of the StepCli class.
+    def __getattr__(self, name: str) -> "StepCli":
+        """Gets a subcommand of the command, only called for unknown attributes.
 
         Args:
-            __name (str): The name of the attribute to get.
+            name (str): The name of the subcommand, with `_` for `-`.
+
+        Returns:
+            StepCli: The subcommand.
+        """
+        if name.startswith("_"):
+            raise AttributeError(f"StepCli object has no attribute {name}")
+        subcommand = self._subcommands.get(name)
+        if subcommand is not None:
+            return subcommand
+        part = name.lower().replace("_", "-")
+        if part not in self._step_command.subcommands:
+            raise AttributeError(f"StepCli object has no attribute {name}")
+        subcommand = self._at(
+            StepCommand.get(self._step_command.command_stack + (part,))
+        )
+        return self._subcommands.setdefault(name, subcommand)
+
+    def _step_args(self, args: tuple, kwargs: dict[str, Any]) -> StepArgs:
+        """Makes the arguments for a run of the command, with the global args."""
+        with self._args_lock:
+            named_args = {**self._global_args, **kwargs}
+        return StepArgs(
+            self._command,
+            [str(r) for r in args],
+            named_args,
+            self._step_command.arguments,
+            self._step_command.flags,
+        )
+
+    def _json_argv(self, step_args: StepArgs, raw: bool) -> tuple[str, ...]:
+        """Gets the flag asking step for JSON, unless raw output or another
+        format is wanted."""
+        output = self._step_command.output
+        if raw or not output.json_argv or output.json_arg in step_args.named:
+            return ()
+        return output.json_argv
+
+    def _native_stdout(
+        self, step_args: StepArgs, json_argv: tuple[str, ...], stdin: int | None
+    ) -> bytes | None:
+        """Runs the command in this process, if it is covered.
 
         Returns:
-            Any: The attribute of the StepCli class.
+            bytes | None: What step would write to stdout, or None to run step.
         """
-        if name == "__dict__":
-            return object.__getattribute__(self, name)
-        # logging.getLogger(__name__).debug(
-        #         f"obj dict: {object.__getattribute__(self, '__dict__')}"
-        #     )
+        native = self._step_command.native
+        if native is None or not self._native:
+            return None
+        flags = self._step_command.flags
+        named = {
+            flags.get(key, key.replace("_", "-")): value
+            for key, value in step_args.named.items()
+            if not key.startswith("_")
+        }
+        if json_argv:
+            json_arg = self._step_command.output.json_arg
+            named[json_arg] = "json" if json_arg == "format" else True
         try:
-            if name in object.__getattribute__(self, "__dict__"):
-                return object.__getattribute__(self, name)
-            next_part = name.lower()
-            # self._command_stack.append(next_part)
-            # self._set_command()
-            # self._command = " ".join(self._command_stack)
-            # self._command_dict = StepCliParser().parse(self._command_stack)
-            match next_part:
-                case "_command":
-                    default_get = "step"
-                case "_command_stack":
-                    default_get = []
-                case "_command_dict":
-                    default_get = {}
-                case _:
-                    default_get = ""
-            # return object.__getattribute__(self, '__dict__').get(next_part, default_get)
-            # if next_part not in self._cli_dict and next_part in self._command_dict.get(
-            #     "__subcommands__", {}
-            # ):
-            #     # TODO: make crazy singleton to avoid this
-            #     self._cli_dict[next_part] = StepCli()._make_command(
-            #         self._command_stack + [next_part], self._global_args
-            #     )
-            # if next_part in self._cli_dict:
-            #     return self._cli_dict[next_part]
-            return object.__getattribute__(self, name)
-        except AttributeError:
-            logging.getLogger(__name__).debug(
-                f"obj dict: {object.__getattribute__(self, '__dict__')}"
+            with step_metrics.command(self._command):
+                return native(step_args.positional, named, stdin)
+        except (StepNativeUnsupported, OSError, ValueError) as e:
+            # step gives the same error, or covers what this does not
+            self._log.debug(f"running step for {self._command}: {e}")
+            return None
+
+    def _output(
+        self, stdout: bytes, step_args: StepArgs, raw: bool, as_json: bool
+    ) -> Any:
+        """Parses the output of a run, unless raw output is wanted."""
+        self._log.debug(f"output: {len(stdout)} bytes")
+        if raw:
+            return stdout.decode("utf-8").strip()
+        started = time.perf_counter()
+        if as_json:
+            output = json.loads(stdout)
+        else:
+            output = self._step_command.output.parse(stdout, step_args.positional)
+        if step_metrics.exporters:
+            step_metrics.observe(
+                "step_command_parse_seconds",
+                time.perf_counter() - started,
+                command=self._command,
             )
-            if not self._command_dict:
-                self._command_dict = {}
-            if not self._command_stack:
-                self._command_stack = ["step"]
-            else:
-                raise AttributeError(f"StepCli object has no attribute {name}")
-        finally:
-            if self._command_stack:
-                self._command_stack.pop()
-                self._set_command()
+        return output
+
+    def _run(
+        self,
+        args: tuple,
+        kwargs: dict[str, Any],
+        stdin: int | None = None,
+        stderr: int | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Runs the command, raising an error instead of logging it.
+
+        Raises:
+            ValueError: If an argument is not accepted by the command.
+            subprocess.CalledProcessError: If step exits with an error.
+        """
+        return self._run_args(self._step_args(args, kwargs), stdin, stderr, raw)
+
+    def _run_args(
+        self,
+        step_args: StepArgs,
+        stdin: int | None = None,
+        stderr: int | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Runs the command with arguments already made, like `_run`."""
+        json_argv = self._json_argv(step_args, raw)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(f"running command: {self._command} {step_args}")
+        stdout = self._native_stdout(step_args, json_argv, stdin)
+        if stdout is None:
+            with step_metrics.command(self._command):
+                stdout = self._executor.run(
+                    [*self._step_command.command_stack, *step_args.argv, *json_argv],
+                    stdin=stdin,
+                    stderr=stderr,
+                ).stdout
+        if step_metrics.exporters:
+            step_metrics.observe(
+                "step_command_output_bytes", len(stdout), command=self._command
+            )
+        return self._output(stdout, step_args, raw, bool(json_argv))
 
     def __call__(
         self,
@@ -257,36 +524,128 @@ class StepCli:
         Args:
             command (str): The command to run.
         """
-        self._log.debug(f"global args: {self._global_args}")
-        self._log.debug(f"args: {args}")
-        self._log.debug(f"kwargs: {kwargs}")
-        self._log.debug(f"command_dict: {self._command_dict}")
-        command_to_run = self._command
-        named_args = {**self._global_args, **kwargs}
-        command_to_run += f" {StepArgs(self._command, [str(r) for r in args], named_args, self._command_dict.get('__arguments__', {}))}"
         try:
-            self._log.debug(f"running command: {command_to_run}")
-            _stdin = subprocess.DEVNULL if _no_stdin else None
-            _stderr = subprocess.DEVNULL if _no_stderr else None
-            process_result = subprocess.run(
-                command_to_run,
-                shell=True,
-                check=True,
-                stdin=_stdin,
-                stderr=_stderr,
-                stdout=subprocess.PIPE,
+            return self._run(
+                args,
+                kwargs,
+                stdin=subprocess.DEVNULL if _no_stdin else None,
+                stderr=subprocess.DEVNULL if _no_stderr else None,
+                raw=_raw_output,
             )
-            _raw_output = process_result.stdout.decode("utf-8").strip()
         except subprocess.CalledProcessError as e:
             self._log.error(f"step return error: {e}")
             return None
 
-        self._log.debug(f"raw_output: `{_raw_output}`")
-        return (
-            _raw_output
-            if _raw_output
-            else self._process_output(_raw_output, command_to_run)
+    def _stream(
+        self,
+        *args: Any,
+        _no_stdin=False,
+        _no_stderr=False,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Runs the command, yielding its output as step writes it.
+
+        List outputs, like `step ssh hosts`, yield a record per line, other
+        commands yield each line. Stopping the iteration early stops step.
+
+        Raises:
+            ValueError: If an argument is not accepted by the command.
+            subprocess.CalledProcessError: If step exits with an error.
+        """
+        step_args = self._step_args(args, kwargs)
+        self._log.debug(f"streaming command: {self._command} {step_args}")
+        header_lines = self._step_command.output.header_lines
+        parse = self._step_command.output.record or str
+        lines = self._executor.stream(
+            [*self._step_command.command_stack, *step_args.argv],
+            stdin=subprocess.DEVNULL if _no_stdin else None,
+            stderr=subprocess.DEVNULL if _no_stderr else None,
         )
+        try:
+            for number, line in enumerate(lines):
+                text = line.decode("utf-8").rstrip("\r\n")
+                if number >= header_lines and text.strip():
+                    yield parse(text)
+        finally:
+            lines.close()
+
+    def _navigate(self, command_path: str | Sequence[str]) -> "StepCli":
+        """Gets a subcommand from its path, like `ca certificate`."""
+        if isinstance(command_path, str):
+            command_path = command_path.split()
+        step_cli = self
+        for part in command_path:
+            step_cli = getattr(step_cli, part)
+        return step_cli
+
+    def _batch_run(
+        self, index: int, item: tuple[str | Sequence[str], Sequence, dict], raw: bool
+    ) -> StepResult:
+        command_path, args, kwargs = item
+        result = StepResult(index, command_path)
+        try:
+            step_cli = self._navigate(command_path)
+            result.command = step_cli._command
+            result.output = step_cli._run(
+                tuple(args),
+                kwargs,
+                stdin=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                raw=raw,
+            )
+        except (AttributeError, ValueError, OSError, subprocess.SubprocessError) as e:
+            result.error = e
+        return result
+
+    def _batch(
+        self,
+        items: Iterable[tuple[str | Sequence[str], Sequence, dict]],
+        max_workers: int = 8,
+        ordered: bool = True,
+        _raw_output: bool = False,
+    ) -> Iterator[StepResult]:
+        """Runs many commands on a pool of workers.
+
+        Items are only taken from `items` as workers free up, so it can be a
+        generator over any number of commands. Stopping the iteration early
+        cancels the commands that have not started yet.
+
+        Args:
+            items (Iterable): (command path, args, kwargs) for each command, the
+                path relative to this command, like `ca certificate`.
+            max_workers (int): The most commands to run at once.
+            ordered (bool): Yield results in the order of `items`, otherwise as
+                they complete.
+            _raw_output (bool): Don't process the output of the commands.
+
+        Yields:
+            StepResult: The result of each command, with the error if it failed.
+        """
+        items_iter = enumerate(items)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending: set[Future] = set()
+        finished_results: dict[int, StepResult] = {}
+        next_index = 0
+        try:
+            while True:
+                for index, item in islice(items_iter, 2 * max_workers - len(pending)):
+                    pending.add(
+                        executor.submit(self._batch_run, index, item, _raw_output)
+                    )
+                if not pending:
+                    break
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    result = future.result()
+                    if not ordered:
+                        yield result
+                        continue
+                    finished_results[result.index] = result
+                while next_index in finished_results:
+                    yield finished_results.pop(next_index)
+                    next_index += 1
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     @property
     def _step_path(self) -> str:
@@ -295,13 +654,8 @@ class StepCli:
         Returns:
             str: The step path.
         """
-        prev_command = self._command
-        if self._command != "step":
-            self._command = "step"
-        # only works if called from a step command, so save old command if not
-        step_path = self.path()
-        self._command = prev_command
-        return step_path
+        # always run synchronously, also from an AsyncStepCli
+        return StepCli.__call__(self._at(StepCommand.get(("step", "path"))))
 
     def _add_step_defaults(self, **kwargs) -> None:
         """Adds arguments to the step defaults config file."""
@@ -317,3 +671,119 @@ class StepCli:
 
         with open(f"{self._step_path}/config/defaults.json", "w") as defaults_file:
             json.dump(defaults, defaults_file, indent=4)
+
+
+class AsyncStepCli(StepCli):
+    """Class to run step cli commands from asyncio, `await step.ca.health()`."""
+
+    _semaphore: asyncio.Semaphore  # limits the step processes running at once
+
+    def __init__(self, max_concurrency: int = 16, native: bool = STEP_NATIVE) -> None:
+        """Initializes the AsyncStepCli class.
+
+        Args:
+            max_concurrency (int): The most step processes to run at once, shared
+                by all the subcommands.
+            native (bool): Run offline commands in this process when covered.
+        """
+        super().__init__(native=native)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _at(self, step_command: StepCommand) -> "AsyncStepCli":
+        step_cli = super()._at(step_command)
+        step_cli._semaphore = self._semaphore
+        return step_cli
+
+    async def __call__(
+        self,
+        *args: Any,
+        _no_stdin=False,
+        _no_stderr=False,
+        _raw_output=False,
+        **kwargs: Any,
+    ) -> Any:
+        """Runs the command without blocking the event loop.
+
+        Takes the same arguments as `StepCli.__call__`.
+        """
+        step_args = self._step_args(args, kwargs)
+        json_argv = self._json_argv(step_args, _raw_output)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(f"running command: {self._command} {step_args}")
+        stdout = self._native_stdout(
+            step_args,
+            json_argv,
+            subprocess.DEVNULL if _no_stdin else None,
+        )
+        if stdout is not None:
+            return self._output(stdout, step_args, _raw_output, bool(json_argv))
+        try:
+            async with self._semaphore:
+                started = time.perf_counter()
+                with step_metrics.command(self._command):
+                    process = await asyncio.create_subprocess_exec(
+                        step_binary(),
+                        *self._step_command.command_stack[1:],
+                        *step_args.argv,
+                        *json_argv,
+                        stdin=asyncio.subprocess.DEVNULL if _no_stdin else None,
+                        stderr=asyncio.subprocess.DEVNULL if _no_stderr else None,
+                        stdout=asyncio.subprocess.PIPE,
+                    )
+                    step_metrics.spawned(started)
+                    stdout, _ = await process.communicate()
+                    if process.returncode:
+                        raise subprocess.CalledProcessError(
+                            process.returncode, f"{self._command} {step_args}"
+                        )
+        except subprocess.CalledProcessError as e:
+            self._log.error(f"step return error: {e}")
+            return None
+        if step_metrics.exporters:
+            step_metrics.observe(
+                "step_command_output_bytes", len(stdout), command=self._command
+            )
+
+        return self._output(stdout, step_args, _raw_output, bool(json_argv))
+
+    async def _stream(  # type: ignore[override]
+        self,
+        *args: Any,
+        _no_stdin=False,
+        _no_stderr=False,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Runs the command, yielding its output as step writes it.
+
+        Takes the same arguments as `StepCli._stream`.
+        """
+        step_args = self._step_args(args, kwargs)
+        self._log.debug(f"streaming command: {self._command} {step_args}")
+        header_lines = self._step_command.output.header_lines
+        parse = self._step_command.output.record or str
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                step_binary(),
+                *self._step_command.command_stack[1:],
+                *step_args.argv,
+                stdin=asyncio.subprocess.DEVNULL if _no_stdin else None,
+                stderr=asyncio.subprocess.DEVNULL if _no_stderr else None,
+                stdout=asyncio.subprocess.PIPE,
+            )
+            finished = False
+            try:
+                number = 0
+                async for line in process.stdout:  # type: ignore[union-attr]
+                    text = line.decode("utf-8").rstrip("\r\n")
+                    if number >= header_lines and text.strip():
+                        yield parse(text)
+                    number += 1
+                finished = True
+            finally:
+                if not finished and process.returncode is None:
+                    process.kill()
+                returncode = await process.wait()
+        if returncode:
+            raise subprocess.CalledProcessError(
+                returncode, [self._command, *step_args.argv]
+            )
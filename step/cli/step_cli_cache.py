@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+from step.cli.step_cli_exec import STEP_BIN, step_binary
+
+
+def _user_cache_dir() -> str:
+    """Gets the platform's per user cache directory."""
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches")
+    if sys.platform == "win32":
+        return os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    return os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+
+
+STEP_CLI_CACHE = os.environ.get(
+    "STEP_CLI_CACHE", os.path.join(_user_cache_dir(), "python-step")
+)
+BINARY_FILE = "binary.json"
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Atomically writes a file, so readers in other processes never see half."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_json(path: str, data: dict) -> None:
+    """Atomically writes a dict as a json file."""
+    # one shot encodes in C
+    write_atomic(path, json.dumps(data).encode("utf-8"))
+
+
+def read_json(path: str) -> dict | None:
+    """Reads a json file, or None if it is missing or not json."""
+    try:
+        with open(path) as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return None
+
+
+class StepCliCache:
+    """On-disk cache of parsed command nodes for one step binary.
+
+    Entries live in a directory keyed by the binary path, mtime and size, the
+    step version and the parser version, with one file per command node. When
+    the binary at a path changes, the entries for its old key are removed.
+    """
+
+    binary_path: str
+    cli_version: str  # of the step binary, empty if unknown
+    cache_dir: str
+    key: str
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        binary_path: str,
+        parser_version: str,
+        cache_root: str = "",
+        cli_version: str = "",
+    ) -> None:
+        """Initializes the cache for a step binary.
+
+        Args:
+            binary_path (str): The resolved path of the step binary.
+            parser_version (str): The version of the parser writing the nodes.
+            cache_root (str): The directory to keep caches in.
+            cli_version (str): The version of the step binary.
+        """
+        cache_root = cache_root or STEP_CLI_CACHE
+        stat = os.stat(binary_path)
+        self.binary_path = binary_path
+        self.cli_version = cli_version
+        self._binary = {
+            "path": binary_path,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "cli_version": cli_version,
+            "parser_version": parser_version,
+        }
+        self.key = hashlib.sha256(
+            json.dumps(self._binary, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+        self.cache_dir = os.path.join(cache_root, self.key)
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            write_json(os.path.join(self.cache_dir, BINARY_FILE), self._binary)
+            self._drop_stale(cache_root)
+
+    @classmethod
+    def for_binary(
+        cls,
+        parser_version: str,
+        binary: str = STEP_BIN,
+        cache_root: str = "",
+        cli_version: str = "",
+    ) -> "StepCliCache | None":
+        """Gets the cache for an installed step binary.
+
+        Args:
+            parser_version (str): The version of the parser writing the nodes.
+            binary (str): The name or path of the step binary.
+            cache_root (str): The directory to keep caches in.
+            cli_version (str): The version of the step binary.
+        Returns:
+            StepCliCache | None: The cache, or None if step is not installed or
+                the cache directory is not writable.
+        """
+        binary_path = step_binary(binary)
+        if not os.path.isfile(binary_path):
+            return None
+        try:
+            return cls(binary_path, parser_version, cache_root, cli_version)
+        except OSError as e:
+            cls.log.warning(f"not caching step commands: {e}")
+            return None
+
+    def _drop_stale(self, cache_root: str) -> None:
+        """Removes the entries of older versions of the same binary.
+
+        Directories without a readable binary file are kept, they may not be
+        caches, or another process may be writing one.
+        """
+        for entry in os.listdir(cache_root):
+            entry_dir = os.path.join(cache_root, entry)
+            if entry == self.key or not os.path.isdir(entry_dir):
+                continue
+            binary = read_json(os.path.join(entry_dir, BINARY_FILE))
+            if binary is not None and binary.get("path") == self.binary_path:
+                self.log.debug(f"dropping stale cache {entry_dir}")
+                shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def _node_path(self, command_stack: list[str]) -> str:
+        return os.path.join(self.cache_dir, ".".join(command_stack) + ".json")
+
+    def get(self, command_stack: list[str]) -> dict | None:
+        """Gets a parsed command node.
+
+        Args:
+            command_stack (List[str]): The full command, starting with step.
+        Returns:
+            Dict | None: The node without its subcommand nodes, if cached.
+        """
+        return read_json(self._node_path(command_stack))
+
+    def put(self, command_stack: list[str], command_dict: dict) -> None:
+        """Stores a parsed command node.
+
+        Args:
+            command_stack (List[str]): The full command, starting with step.
+            command_dict (Dict): The parsed node, subcommand nodes are skipped.
+        """
+        node = {
+            key: value for key, value in command_dict.items() if key.startswith("__")
+        }
+        self._write(os.path.basename(self._node_path(command_stack)), node)
+
+    def _write(self, file_name: str, data: dict) -> None:
+        try:
+            # recreated in case another process dropped it as stale
+            os.makedirs(self.cache_dir, exist_ok=True)
+            write_json(os.path.join(self.cache_dir, file_name), data)
+        except OSError as e:
+            self.log.warning(f"failed to cache {file_name}: {e}")
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+# Generates step/cli/step_commands.py, the typed api of step, from the schema
+# with `python -m step.cli.step_cli_codegen`. Run it again after recording a
+# new schema with StepCliCrawler; `--check` fails if it was not, and runs as a
+# pre-commit hook.
+
+import argparse
+import difflib
+import json
+import keyword
+import os
+import re
+import textwrap
+
+from step.cli.step_cli import STEP_JSON
+
+OUTPUT = os.path.join(os.path.dirname(__file__), "step_commands.py")
+LINE_LENGTH = 88
+
+HEADER = '''#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+# Generated by `python -m step.cli.step_cli_codegen` from the schema of step
+# {version}, do not edit.
+
+from typing import Any
+
+from step.cli.step_cli import StepCommandGroup, StepCommandSpec
+
+STEP_CLI_VERSION = "{version}"
+
+StepValue = str | int | float | list[str]
+'''
+
+
+def _identifier(name: str, taken: set[str]) -> str:
+    """Makes a python name of a command or argument, unique among `taken`."""
+    identifier = re.sub(r"\W+", "_", name).strip("_").lower() or "arg"
+    if identifier[0].isdigit():
+        identifier = f"arg_{identifier}"
+    while keyword.iskeyword(identifier) or identifier in taken | {"self"}:
+        identifier += "_"
+    taken.add(identifier)
+    return identifier
+
+
+def _class_name(command_stack: list[str]) -> str:
+    if len(command_stack) == 1:
+        return "StepCommands"
+    parts = re.split(r"\W+", " ".join(command_stack[1:]))
+    return "_" + "".join(part.capitalize() for part in parts if part)
+
+
+def _spec_name(command_stack: list[str]) -> str:
+    return "_" + re.sub(r"\W+", "_", "_".join(command_stack[1:])).upper()
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+
+
+def _sentence(description: str) -> str:
+    """Gets the first sentence of a description, capitalized."""
+    text = " ".join(description.split())
+    text = re.split(r"(?<=[.!?])\s", text, maxsplit=1)[0] if text else ""
+    return text[:1].upper() + text[1:]
+
+
+def _docstring(summary: str, args: list[tuple[str, str, str]], indent: int) -> str:
+    """Renders a docstring with an Args section, wrapped to the line length.
+
+    Args:
+        summary (str): The first line.
+        args (List[Tuple[str, str, str]]): Name, type and description of each
+            argument.
+        indent (int): The indentation of the docstring.
+    Returns:
+        str: The lines of the docstring.
+    """
+    pad = " " * indent
+    width = LINE_LENGTH - indent
+    summary = _escape(_sentence(summary) or "Runs the command.")
+    if not summary.endswith((".", "!", "?")):
+        summary += "."
+    lines = textwrap.wrap(summary, width - 6)
+    if args:
+        lines += ["", "Args:"]
+        for name, arg_type, description in args:
+            text = f"{name} ({arg_type}): {_escape(_sentence(description))}".rstrip()
+            lines += textwrap.wrap(
+                text,
+                width,
+                initial_indent="    ",
+                subsequent_indent="        ",
+                break_on_hyphens=False,
+            )
+    lines[0] = f'"""{lines[0]}'
+    if len(lines) == 1:
+        return f'{pad}{lines[0]}"""\n'
+    if lines[-1].endswith('"'):
+        lines[-1] += " "
+    return "".join(f"{pad}{line}\n" if line else "\n" for line in lines) + (
+        f'{pad}"""\n'
+    )
+
+
+def _sequence(items: list[str], indent: int, suffix: str = ",") -> str:
+    """Renders a tuple on one line if it fits, otherwise one item per line."""
+    pad = " " * indent
+    if len(items) == 1:
+        inline = f"({items[0]},){suffix}"
+    else:
+        inline = f"({', '.join(items)}){suffix}"
+    if len(pad) + len(inline) <= LINE_LENGTH:
+        return f"{pad}{inline}\n"
+    inner = "".join(f"{pad}    {item},\n" for item in items)
+    return f"{pad}(\n{inner}{pad}){suffix}\n"
+
+
+def _arguments(node: dict) -> tuple[list, list]:
+    """Splits the arguments of a command into positional and flags.
+
+    Only the longer form of a flag and its `alt_form` is kept, like `force`
+    for `--force, -f`, as step takes either for the same argument.
+
+    Returns:
+        Tuple[List, List]: (name, argument) of the positional arguments and of
+            the flags.
+    """
+    positional, flags = [], []
+    arguments = node.get("__arguments__", {})
+    seen: set[str] = set()
+    for name, arg in arguments.items():
+        if name in seen or name in ("help", "h"):
+            continue
+        alt_form = arg.get("alt_form", "")
+        seen.update({name, alt_form})
+        if len(alt_form) > len(name) and alt_form in arguments:
+            name, arg = alt_form, arguments[alt_form]
+        if arg["type"] == "positional argument":
+            positional.append((name, arg))
+        else:
+            flags.append((name, arg))
+    return positional, flags
+
+
+def _command(
+    command_stack: list[str], node: dict, summary: str, method_name: str
+) -> tuple[str, str]:
+    """Renders the spec and the method of a command.
+
+    Returns:
+        Tuple[str, str]: The spec, at module level, and the method.
+    """
+    positional, flags = _arguments(node)
+    taken: set[str] = set()
+    positional_names = [_identifier(name, taken) for name, _ in positional]
+    flag_names = [_identifier(name, taken) for name, _ in flags]
+    spec_name = _spec_name(command_stack)
+
+    spec = f"{spec_name} = StepCommandSpec(\n"
+    spec += _sequence([json.dumps(part) for part in command_stack], 4)
+    spec += _sequence([json.dumps(name) for name, _ in flags], 4) + ")\n"
+
+    params = ["self"]
+    params += [f"{name}: str | None = None" for name in positional_names]
+    if positional_names:
+        params.append("/")
+    params.append("*")
+    for name, (_, arg) in zip(flag_names, flags):
+        if "param" in arg:
+            params.append(f"{name}: StepValue | None = None")
+        else:
+            params.append(f"{name}: bool = False")
+    params += [f"_{name}: bool = False" for name in ("no_stdin", "no_stderr")]
+    params.append("_raw_output: bool = False")
+    docs = [
+        (name, "str", arg.get("description", ""))
+        for name, (_, arg) in zip(positional_names, positional)
+    ]
+    docs += [
+        (name, "StepValue" if "param" in arg else "bool", arg.get("description", ""))
+        for name, (_, arg) in zip(flag_names, flags)
+    ]
+    method = f"    def {method_name}(\n"
+    method += "".join(f"        {param},\n" for param in params)
+    method += "    ) -> Any:\n"
+    method += _docstring(summary, docs, 8)
+    method += "        return self._call(\n"
+    method += f"            {spec_name},\n"
+    method += _sequence(positional_names, 12)
+    method += _sequence(flag_names, 12)
+    method += (
+        "            _no_stdin,\n            _no_stderr,\n            _raw_output,\n"
+    )
+    method += "        )\n"
+    return spec, method
+
+
+def _group(command_stack: list[str], node: dict, summary: str, out: list[str]) -> None:
+    """Renders a group of commands, after the classes of its subgroups."""
+    members = []
+    taken: set[str] = set()
+    for subcommand, description in node.get("__subcommands__", {}).items():
+        subnode = node.get(subcommand)
+        if not isinstance(subnode, dict):
+            continue
+        sub_stack = command_stack + [subcommand]
+        name = _identifier(subcommand, taken)
+        if subnode.get("__subcommands__"):
+            _group(sub_stack, subnode, description, out)
+            class_name = _class_name(sub_stack)
+            members.append(
+                "    @property\n"
+                + f"    def {name}(self) -> {class_name}:\n"
+                + _docstring(description, [], 8)
+                + f"        return {class_name}(self._cli)\n"
+            )
+        else:
+            spec, method = _command(sub_stack, subnode, description, name)
+            out.append(spec)
+            members.append(method)
+    doc = _docstring(f"The commands of `{' '.join(command_stack)}`: {summary}", [], 4)
+    out.append(
+        f"class {_class_name(command_stack)}(StepCommandGroup):\n"
+        + doc
+        + "\n    __slots__ = ()\n\n"
+        + "\n".join(members)
+    )
+
+
+def generate(schema: dict) -> str:
+    """Generates the typed api of step from a schema.
+
+    Args:
+        schema (Dict): The schema, as recorded in step-cli.json.
+    Returns:
+        str: The source of the module.
+    """
+    version = schema.get("__cli_version__", "")
+    out: list[str] = []
+    _group(["step"], schema, "the (small)step cli.", out)
+    return HEADER.format(version=version) + "".join(f"\n\n{part}" for part in out)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate the typed api of step from its schema."
+    )
+    parser.add_argument("-s", "--schema", help="The schema.", default=STEP_JSON)
+    parser.add_argument("-o", "--output", help="The module.", default=OUTPUT)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check the module is current, print the diff if not.",
+    )
+    args = parser.parse_args()
+    with open(args.schema) as schema_file:
+        source = generate(json.load(schema_file))
+    if args.check:
+        with open(args.output) as output_file:
+            current = output_file.read()
+        diff = list(
+            difflib.unified_diff(
+                current.splitlines(keepends=True),
+                source.splitlines(keepends=True),
+                args.output,
+                f"{args.output} (generated)",
+            )
+        )
+        if diff:
+            print("".join(diff), end="")
+            raise SystemExit(f"{args.output} is out of date, regenerate it")
+        return
+    with open(args.output, "w") as output_file:
+        output_file.write(source)
+
+
+if __name__ == "__main__":
+    main()
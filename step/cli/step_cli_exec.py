@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import functools
+import logging
+import os
+import selectors
+import shutil
+import subprocess
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+from step.metrics import step_metrics
+
+STEP_BIN = os.environ.get("STEP_BIN", "step")
+
+
+@functools.cache
+def step_binary(name: str = STEP_BIN) -> str:
+    """Resolves the step binary on the PATH, once per process.
+
+    Args:
+        name (str): The name or path of the binary.
+    Returns:
+        str: The resolved path, or the name if it is not on the PATH.
+    """
+    path = shutil.which(name)
+    return os.path.realpath(path) if path else name
+
+
+class StepExecutor(ABC):
+    """Runs step commands from an argv list, without a shell in between."""
+
+    log = logging.getLogger(__name__)
+
+    def _argv(self, argv: list[str]) -> list[str]:
+        """Swaps the leading step for the resolved binary."""
+        if argv and argv[0] == "step":
+            return [step_binary()] + argv[1:]
+        return argv
+
+    @abstractmethod
+    def run(
+        self,
+        argv: list[str],
+        stdin: int | None = None,
+        stderr: int | None = None,
+    ) -> subprocess.CompletedProcess:
+        """Runs a command and waits for it, capturing stdout.
+
+        Args:
+            argv (List[str]): The command, starting with step.
+            stdin (int | None): None to inherit stdin, subprocess.DEVNULL or
+                an open file descriptor.
+            stderr (int | None): None to inherit stderr, subprocess.DEVNULL or
+                subprocess.PIPE to capture it.
+        Returns:
+            subprocess.CompletedProcess: The finished process.
+        Raises:
+            subprocess.CalledProcessError: If the command exits with an error.
+            ValueError: If stdin is not supported by the executor.
+        """
+
+    def stream(
+        self,
+        argv: list[str],
+        stdin: int | None = None,
+        stderr: int | None = None,
+    ) -> Iterator[bytes]:
+        """Runs a command, yielding its stdout line by line as it is written.
+
+        The command is killed if the lines are not all read.
+
+        Args:
+            argv (List[str]): The command, starting with step.
+            stdin (int | None): None to inherit stdin, or subprocess.DEVNULL.
+            stderr (int | None): None to inherit stderr, or subprocess.DEVNULL.
+        Yields:
+            bytes: Each line of stdout, with its newline.
+        Raises:
+            subprocess.CalledProcessError: If the command exits with an error,
+                after all its output is read.
+        """
+        argv = self._argv(argv)
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            argv, stdin=stdin, stderr=stderr, stdout=subprocess.PIPE
+        )
+        step_metrics.spawned(started)
+        finished = False
+        try:
+            assert process.stdout is not None
+            yield from process.stdout
+            finished = True
+        finally:
+            process.stdout.close()  # type: ignore[union-attr]
+            if not finished:
+                process.kill()
+            returncode = process.wait()
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, argv)
+
+
+class SubprocessExecutor(StepExecutor):
+    """Runs step with subprocess, which uses vfork or posix_spawn if it can."""
+
+    def run(
+        self,
+        argv: list[str],
+        stdin: int | None = None,
+        stderr: int | None = None,
+    ) -> subprocess.CompletedProcess:
+        argv = self._argv(argv)
+        if not step_metrics.exporters:
+            return subprocess.run(
+                argv, check=True, stdin=stdin, stderr=stderr, stdout=subprocess.PIPE
+            )
+        started = time.perf_counter()
+        # subprocess.run, split to time the spawn
+        with subprocess.Popen(
+            argv, stdin=stdin, stderr=stderr, stdout=subprocess.PIPE
+        ) as process:
+            step_metrics.spawned(started)
+            try:
+                stdout, stderr_output = process.communicate()
+            except BaseException:
+                process.kill()
+                raise
+        if process.returncode:
+            raise subprocess.CalledProcessError(
+                process.returncode, argv, stdout, stderr_output
+            )
+        return subprocess.CompletedProcess(
+            argv, process.returncode, stdout, stderr_output
+        )
+
+
+class PosixSpawnExecutor(StepExecutor):
+    """Runs step with os.posix_spawn, skipping subprocess's bookkeeping.
+
+    Besides None and subprocess.DEVNULL, stdin may be an open file
+    descriptor, but not subprocess.PIPE.
+    """
+
+    def run(
+        self,
+        argv: list[str],
+        stdin: int | None = None,
+        stderr: int | None = None,
+    ) -> subprocess.CompletedProcess:
+        argv = self._argv(argv)
+        if not os.path.isabs(argv[0]):
+            raise FileNotFoundError(f"step binary not found: {argv[0]}")
+        file_actions: list[tuple] = []
+        if stdin == subprocess.DEVNULL:
+            file_actions.append((os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0))
+        elif isinstance(stdin, int) and stdin >= 0:
+            file_actions.append((os.POSIX_SPAWN_DUP2, stdin, 0))
+        elif stdin is not None:
+            raise ValueError(f"unsupported stdin for posix_spawn: {stdin}")
+        stdout_read, stdout_write = os.pipe()
+        file_actions.append((os.POSIX_SPAWN_DUP2, stdout_write, 1))
+        stderr_read = stderr_write = None
+        if stderr == subprocess.DEVNULL:
+            file_actions.append((os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0))
+        elif stderr == subprocess.PIPE:
+            stderr_read, stderr_write = os.pipe()
+            file_actions.append((os.POSIX_SPAWN_DUP2, stderr_write, 2))
+        started = time.perf_counter()
+        try:
+            pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=file_actions)
+            step_metrics.spawned(started)
+        except BaseException:
+            os.close(stdout_read)
+            if stderr_read is not None:
+                os.close(stderr_read)
+            raise
+        finally:
+            os.close(stdout_write)
+            if stderr_write is not None:
+                os.close(stderr_write)
+        outputs = self._read_all(stdout_read, stderr_read)
+        _, status = os.waitpid(pid, 0)
+        returncode = os.waitstatus_to_exitcode(status)
+        stdout, stderr_output = outputs[stdout_read], outputs.get(stderr_read)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, argv, stdout, stderr_output)
+        return subprocess.CompletedProcess(argv, returncode, stdout, stderr_output)
+
+    @staticmethod
+    def _read_all(*fds: int | None) -> dict[int, bytes]:
+        """Reads pipes until they all close, so neither can fill up and block."""
+        chunks: dict[int, list[bytes]] = {}
+        with selectors.DefaultSelector() as selector:
+            for fd in fds:
+                if fd is not None:
+                    chunks[fd] = []
+                    selector.register(fd, selectors.EVENT_READ)
+            while selector.get_map():
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, 65536)
+                    if chunk:
+                        chunks[key.fd].append(chunk)
+                    else:
+                        selector.unregister(key.fd)
+                        os.close(key.fd)
+        return {fd: b"".join(fd_chunks) for fd, fd_chunks in chunks.items()}
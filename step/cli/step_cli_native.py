@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import base64
+import hashlib
+import os
+import subprocess
+import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from cryptography import x509
+
+from step.models import StepCertificate
+
+
+class StepNativeUnsupported(Exception):
+    """A call a native command does not cover, step is run for it instead."""
+
+
+@dataclass(frozen=True, slots=True)
+class StepNativeCommand:
+    """A command run in this process, with the output step would print."""
+
+    # positional, named arguments by argument name and stdin, to stdout
+    run: Callable[[Sequence[str], dict[str, Any], int | None], bytes]
+    flags: frozenset[str]  # the arguments it covers, others run step
+
+    def __call__(
+        self, positional: Sequence[str], named: dict[str, Any], stdin: int | None
+    ) -> bytes:
+        """Runs the command.
+
+        Args:
+            positional (Sequence[str]): The positional arguments.
+            named (Dict[str, Any]): The named arguments, by argument name.
+            stdin (int | None): None to read stdin, or subprocess.DEVNULL.
+        Returns:
+            bytes: What step would write to stdout.
+        Raises:
+            StepNativeUnsupported: If step has to run instead.
+        """
+        if not named.keys() <= self.flags:
+            raise StepNativeUnsupported(f"{set(named) - self.flags} not covered")
+        return self.run(positional, named, stdin)
+
+
+_NATIVE: dict[tuple[str, ...], StepNativeCommand] = {}
+
+
+def register_native_command(
+    command: str,
+    run: Callable[[Sequence[str], dict[str, Any], int | None], bytes],
+    flags: Sequence[str] = (),
+) -> None:
+    """Runs a command in this process, instead of step, when it can.
+
+    Commands use the native command registered when they are first navigated
+    to. `run` raises StepNativeUnsupported for calls it does not cover.
+
+    Args:
+        command (str): The command, like `step certificate fingerprint`.
+        run (Callable): Gets the stdout of step from the positional and named
+            arguments and the stdin.
+        flags (Sequence[str]): The arguments it covers.
+    """
+    _NATIVE[tuple(command.split())] = StepNativeCommand(run, frozenset(flags))
+
+
+def native_command_for(command_stack: Sequence[str]) -> StepNativeCommand | None:
+    """Gets the native command registered for a command, if any."""
+    return _NATIVE.get(tuple(command_stack))
+
+
+def _read_certs(path: str) -> list[bytes]:
+    """Reads the DER of the certificates of a local PEM or DER file."""
+    if path == "-" or not os.path.isfile(path):
+        raise StepNativeUnsupported(f"{path} is not a local file")
+    with open(path, "rb") as f:
+        ders = [cert.raw for cert in StepCertificate.from_bytes(f.read(), path)]
+    if not ders:
+        raise StepNativeUnsupported(f"no certificate in {path}")
+    for der in ders:
+        x509.load_der_x509_certificate(der)  # step fails on invalid ones
+    return ders
+
+
+_FINGERPRINT_FORMATS: dict[str, Callable[[bytes], bytes]] = {
+    "hex": lambda digest: digest.hex().encode("ascii"),
+    "base64": base64.standard_b64encode,
+    "base64-url": base64.urlsafe_b64encode,
+    "base64-raw": lambda digest: base64.standard_b64encode(digest).rstrip(b"="),
+    "base64-url-raw": lambda digest: base64.urlsafe_b64encode(digest).rstrip(b"="),
+}
+
+
+def certificate_fingerprint(
+    positional: Sequence[str], named: dict[str, Any], stdin: int | None
+) -> bytes:
+    """`step certificate fingerprint` of a local file."""
+    encode = _FINGERPRINT_FORMATS.get(named.get("format", "hex"))
+    if len(positional) != 1 or encode is None:
+        raise StepNativeUnsupported("remote or emoji fingerprints")
+    ders = _read_certs(positional[0])
+    if not named.get("bundle"):
+        ders = ders[:1]
+    return b"".join(encode(hashlib.sha256(der).digest()) + b"\n" for der in ders)
+
+
+def _read_stdin(stdin: int | None) -> bytes:
+    if stdin == subprocess.DEVNULL:
+        return b""
+    if sys.stdin is None:
+        raise StepNativeUnsupported("no stdin")
+    return sys.stdin.buffer.read()
+
+
+def base64_command(
+    positional: Sequence[str], named: dict[str, Any], stdin: int | None
+) -> bytes:
+    """`step base64`, of stdin."""
+    if positional:
+        raise StepNativeUnsupported("step base64 takes no arguments")
+    data = _read_stdin(stdin)
+    raw = bool(named.get("raw") or named.get("r"))
+    url = bool(named.get("url") or named.get("u"))
+    if not (named.get("decode") or named.get("d")):
+        encoded = (base64.urlsafe_b64encode if url else base64.standard_b64encode)(data)
+        return (encoded.rstrip(b"=") if raw else encoded) + b"\n"
+    data = b"".join(data.split())
+    # like step, the encoding is detected unless given
+    if not (raw or url):
+        url = any(c in data for c in b"-_")
+    if url:
+        data = data.translate(bytes.maketrans(b"-_", b"+/"))
+    try:
+        return base64.b64decode(data + b"=" * (-len(data) % 4), validate=True)
+    except ValueError as e:
+        # stdin is read, so step can't run instead, fail like it would
+        raise subprocess.CalledProcessError(1, ["step", "base64"], stderr=str(e))
+
+
+_DIGESTS = {
+    "sha1": "sha1",
+    "sha": "sha1",
+    "sha224": "sha224",
+    "sha256": "sha256",
+    "sha384": "sha384",
+    "sha512": "sha512",
+    "sha512-224": "sha512_224",
+    "sha512-256": "sha512_256",
+}
+
+
+def hash_digest(
+    positional: Sequence[str], named: dict[str, Any], stdin: int | None
+) -> bytes:
+    """`step crypto hash digest` of local files."""
+    algorithm = _DIGESTS.get(named.get("alg", "sha256"))
+    if algorithm is None or not positional:
+        raise StepNativeUnsupported("md5, or no file")
+    lines = []
+    for path in positional:
+        if not os.path.isfile(path):
+            raise StepNativeUnsupported(f"{path} is not a file")
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, algorithm).hexdigest()
+        lines.append(f"{digest}  {path}\n")
+    return "".join(lines).encode("utf-8")
+
+
+register_native_command(
+    "step certificate fingerprint", certificate_fingerprint, ("format", "bundle")
+)
+register_native_command(
+    "step base64",
+    base64_command,
+    ("decode", "d", "raw", "r", "url", "u"),
+)
+register_native_command("step crypto hash digest", hash_digest, ("alg",))
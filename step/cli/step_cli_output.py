@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import dataclasses
+import json
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from step.models import StepAdmin, StepCertificate, StepSshHost, StepVersion
+
+_JSON_WORD = re.compile(r"\bjson\b", re.IGNORECASE)
+
+
+def parse_text(stdout: bytes, positional: Sequence[str]) -> Any:
+    """Parses JSON objects and arrays, and returns anything else as text."""
+    output = stdout.strip()
+    if output[:1] in (b"{", b"["):
+        try:
+            return json.loads(output)
+        except ValueError:
+            pass
+    return output.decode("utf-8")
+
+
+def parse_json(stdout: bytes, positional: Sequence[str]) -> Any:
+    """Parses JSON, for commands run with their JSON flag."""
+    return json.loads(stdout)
+
+
+@dataclass(frozen=True, slots=True)
+class StepOutputParser:
+    """How the output of a command is parsed, resolved once per command."""
+
+    parse: Callable[[bytes, Sequence[str]], Any] = parse_text  # stdout, positional
+    header_lines: int = 0  # lines before the records of a list output
+    record: Callable[[str], Any] | None = None  # parses a line of a list output
+    json_arg: str = ""  # the argument asking step for JSON, if it has one
+    json_argv: tuple[str, ...] = ()  # what is passed to ask for JSON
+
+    @classmethod
+    def records(
+        cls, record: Callable[[str], Any], header_lines: int = 0
+    ) -> "StepOutputParser":
+        """Makes a parser for list outputs, a record per line.
+
+        Args:
+            record (Callable[[str], Any]): Parses a line.
+            header_lines (int): The lines to skip first.
+        Returns:
+            StepOutputParser: The parser.
+        """
+
+        def parse(stdout: bytes, positional: Sequence[str]) -> list:
+            lines = stdout.decode("utf-8").splitlines()[header_lines:]
+            return [record(line) for line in lines if line.strip()]
+
+        return cls(parse, header_lines, record)
+
+
+def _context(line: str) -> tuple[str, bool]:
+    """Parses a line of `step context list`, as the name and if it is current."""
+    return line.strip("▶ "), "▶" in line
+
+
+def _certificate(stdout: bytes, positional: Sequence[str]) -> Any:
+    """Loads the certificate `step ca certificate` wrote."""
+    if len(positional) < 2:
+        return parse_text(stdout, positional)
+    return StepCertificate(positional[1])
+
+
+_PARSERS: dict[tuple[str, ...], tuple[StepOutputParser, bool]] = {}
+
+
+def register_output_parser(
+    command: str, parser: StepOutputParser, prefix: bool = False
+) -> None:
+    """Sets how the output of a command is parsed.
+
+    Commands use the parser registered when they are first navigated to.
+
+    Args:
+        command (str): The command, like `step ssh hosts`.
+        parser (StepOutputParser): The parser.
+        prefix (bool): Also use it for the subcommands, unless they have their
+            own.
+    """
+    _PARSERS[tuple(command.split())] = (parser, prefix)
+
+
+def output_parser_for(
+    command_stack: Sequence[str], arguments: dict[str, dict]
+) -> StepOutputParser:
+    """Resolves the parser of a command, from the registry and its arguments.
+
+    Args:
+        command_stack (Sequence[str]): The parts of the command.
+        arguments (Dict[str, dict]): The arguments the command accepts.
+    Returns:
+        StepOutputParser: The registered parser, or the default, with the
+            flag asking for JSON if the command has one.
+    """
+    command_stack = tuple(command_stack)
+    parser = StepOutputParser()
+    for end in range(len(command_stack), 0, -1):
+        registered = _PARSERS.get(command_stack[:end])
+        if registered and (registered[1] or end == len(command_stack)):
+            parser = registered[0]
+            break
+    if parser.json_arg or parser.record is not None:
+        return parser
+    format_arg = arguments.get("format", {})
+    if _JSON_WORD.search(format_arg.get("description", "")):
+        return dataclasses.replace(
+            parser, json_arg="format", json_argv=("--format=json",)
+        )
+    if arguments.get("json", {}).get("type") == "option":
+        return dataclasses.replace(parser, json_arg="json", json_argv=("--json",))
+    return parser
+
+
+register_output_parser("step ca admin", StepOutputParser.records(StepAdmin, 1), True)
+register_output_parser("step ssh hosts", StepOutputParser.records(StepSshHost, 1))
+register_output_parser("step context list", StepOutputParser.records(_context))
+register_output_parser(
+    "step ca health", StepOutputParser(lambda stdout, _: stdout.strip() == b"ok")
+)
+register_output_parser(
+    "step version",
+    StepOutputParser(lambda stdout, _: StepVersion(stdout.decode("utf-8").strip())),
+)
+register_output_parser("step ca certificate", StepOutputParser(_certificate))
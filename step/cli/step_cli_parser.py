@@ -15,18 +15,169 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import argparse
+import functools
 import json
 import logging
+import os
+import re
 import string
 import subprocess
-
-ANSI_START = "[0;"
-ANSI_BOLDER = "[0;1;99m"
-ANSI_UNDERLINE = "[0;4;39m"
-ANSI_ITALIC = "[0;3;39m"
-ANSI_BOLD = "[0;1;39m"
-ANSI_END = "[0m"
-ANSI_SEQS = [ANSI_BOLDER, ANSI_UNDERLINE, ANSI_ITALIC, ANSI_BOLD, ANSI_END]
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from step.cli.step_cli_cache import StepCliCache
+from step.cli.step_cli_exec import StepExecutor, SubprocessExecutor
+from step.cli.step_cli_schema import StepSchema
+from step.metrics import step_metrics
+
+HELP_SECTION = "section"  # a header, like OPTIONS
+HELP_FLAG = "flag"  # an option, like --provisioner=name, --issuer=name
+HELP_NAME = "name"  # an underlined name, of a positional argument or a command
+HELP_TEXT = "text"  # a line of a description
+HELP_BLANK = "blank"
+
+# any SGR sequence, like \x1b[0;1;99m, with its parameters
+_SGR = re.compile(r"\x1b\[([0-9;]*)m")
+# the characters dropped from help pages, escapes only when not of an SGR
+_NON_PRINTABLE = re.compile(r"[^\x1b%s]+" % re.escape(string.printable))
+_STRAY_ESCAPE = re.compile(r"\x1b(?!\[[0-9;]*m)")
+
+
+@dataclass(slots=True)
+class StepHelpToken:
+    """A line of a help page, classified by the styles step prints it with.
+
+    Not frozen, as one is made per line and frozen ones are several times
+    slower to make, but never changed once made.
+    """
+
+    kind: str  # one of the HELP_* kinds
+    text: str  # the line without styles, stripped
+    name: str = ""  # of a flag, positional argument or command
+    alt_form: str = ""  # the other form of the flag or command, if any
+    param: str = ""  # the name of the value of a flag, if it takes one
+    description: str = ""  # the text after the name of a command
+
+
+_BLANK = StepHelpToken(HELP_BLANK, "")
+
+
+def _split_flag(text: str) -> tuple[str, str, str]:
+    """Splits an option like `--provisioner=name, --issuer=name`.
+
+    Args:
+        text (str): The option, without styles.
+    Returns:
+        Tuple[str, str, str]: The name, the other form and the param.
+    """
+    arg, _, alt_form = text.lstrip(" -").partition(",")
+    arg, _, param = arg.partition("=")
+    alt_form = alt_form.partition(",")[0].strip("- ").partition("=")[0]
+    return arg, alt_form, param.partition("=")[0]
+
+
+@functools.lru_cache(maxsize=64)
+def _sgr_style(style: tuple[bool, bool], sgr: str) -> tuple[bool, bool]:
+    """Applies an SGR sequence to a style.
+
+    Args:
+        style (Tuple[bool, bool]): Whether the text is bold and underlined.
+        sgr (str): The parameters of the sequence, like `0;1;99`.
+    Returns:
+        Tuple[bool, bool]: The style of the text after the sequence.
+    """
+    bold, underline = style
+    for code in sgr.split(";"):
+        if code in ("", "0"):
+            bold = underline = False
+        elif code == "1":
+            bold = True
+        elif code == "22":
+            bold = False
+        elif code == "4":
+            underline = True
+        elif code == "24":
+            underline = False
+    return bold, underline
+
+
+def _printable(output: str) -> str:
+    """Drops the characters of a help page that are not printable, but SGRs."""
+    # checking is much faster than the regex, and nearly always enough
+    text = _SGR.sub("", output)
+    if text.isascii() and text.replace("\n", "").isprintable():
+        return output
+    return _STRAY_ESCAPE.sub("", _NON_PRINTABLE.sub("", output))
+
+
+def _help_token(spans: list[tuple[tuple[bool, bool], str]]) -> StepHelpToken:
+    """Classifies a line by the style of its first text.
+
+    A bold line that is not indented is a header, a bold text starting with
+    `-` is a flag and an underlined text is a name, whatever the colors.
+    """
+    text = "".join(span for _, span in spans).strip()
+    if not text:
+        return _BLANK
+    lead = 0
+    while not spans[lead][1].strip():
+        lead += 1
+    (bold, underline), lead_text = spans[lead]
+    if bold:
+        if not lead_text[0].isspace() and not any(s for _, s in spans[:lead]):
+            return StepHelpToken(HELP_SECTION, text)
+        if lead_text.lstrip().startswith("-"):
+            name, alt_form, param = _split_flag(text)
+            return StepHelpToken(HELP_FLAG, text, name, alt_form, param)
+    elif underline:
+        name, _, alt_form = lead_text.strip().partition(",")
+        description = "".join(span for _, span in spans[lead + 1 :]).strip()
+        return StepHelpToken(
+            HELP_NAME, text, name, alt_form.strip(), description=description
+        )
+    return StepHelpToken(HELP_TEXT, text)
+
+
+def tokenize_help(output: str) -> list[StepHelpToken]:
+    """Splits a help page of step into a token per line.
+
+    Args:
+        output (str): The help page, with the ANSI sequences step styles it
+            with.
+    Returns:
+        List[StepHelpToken]: The lines of the page.
+    """
+    tokens = []
+    plain = style = (False, False)
+    for line in _printable(output).split("\n"):
+        if "\x1b" not in line:
+            text = line.strip()
+            if not text:
+                tokens.append(_BLANK)
+            elif style == plain:
+                tokens.append(StepHelpToken(HELP_TEXT, text))
+            else:
+                tokens.append(_help_token([(style, line)]))
+            continue
+        # the text between the sequences, with the parameters of each
+        parts = _SGR.split(line)
+        if style == plain and parts[0].strip():
+            # most lines of descriptions, only styled after their first word
+            for sgr in parts[1::2]:
+                style = _sgr_style(style, sgr)
+            tokens.append(StepHelpToken(HELP_TEXT, "".join(parts[::2]).strip()))
+            continue
+        spans = [(style, parts[0])] if parts[0] else []
+        for k in range(1, len(parts), 2):
+            style = _sgr_style(style, parts[k])
+            if parts[k + 1]:
+                spans.append((style, parts[k + 1]))
+        tokens.append(_help_token(spans))
+    return tokens
 
 
 class StepCliParser:
@@ -34,13 +185,23 @@ class StepCliParser:
 
     PARSER_VERSION: str = "0.1.1"
     __total_command_dict = None
+    _cache: StepCliCache | None = None
+    _cache_resolved: bool = False
+    _schema: StepSchema | None = None  # the loaded schema, decoded node by node
+    _cli_version: str | None = None  # of the installed step, once resolved
+    # schemas not used, by path, mtime and the installed step version checked
+    _rejected_schemas: set[tuple[str, int, str]] = set()
+    _lock = threading.RLock()  # guards the shared command dict and the cache
+    _node_locks: dict[tuple[str, ...], threading.Lock] = {}
+    executor: StepExecutor = SubprocessExecutor()  # runs step for the help
     command_stack: list[str] = []
     log = logging.getLogger(__name__)
     command_dict: dict = {}
-    command_output: list[str] = []
+    tokens: list[StepHelpToken] = []  # the lines of the help being parsed
     command: str = ""
     i: int = -1
-    line: str = ""
+    token: StepHelpToken = _BLANK
+    section: str = ""
     arg_type: str = ""
 
     @classmethod
@@ -56,99 +217,159 @@ class StepCliParser:
                 continue
         return 0
 
-    @staticmethod
-    def _make_printable(s: str) -> str:
-        return "".join(filter(lambda x: x in string.printable, s))
-
-    @staticmethod
-    def _remove_ansi_sequences(s: str) -> str:
-        """Removes the ANSI escape sequences from a string.
+    @classmethod
+    def _get_cache(cls) -> StepCliCache | None:
+        """Gets the on-disk cache for the installed step binary.
 
-        Args:
-            s (str): The string to remove the sequences from.
         Returns:
-            str: The string without the sequences.
+            StepCliCache | None: The cache, or None if step is not installed.
         """
-        for ansi in ANSI_SEQS:
-            s = s.replace(ansi, "")
-        return s
+        with cls._lock:
+            if not cls._cache_resolved:
+                cls._cache = StepCliCache.for_binary(
+                    cls.PARSER_VERSION, cli_version=cls._installed_cli_version()
+                )
+                cls._cache_resolved = True
+            return cls._cache
 
-    @staticmethod
-    def _arg_param_check(arg: str) -> tuple[str, str]:
-        """Checks if the argument has a parameter.
+    @classmethod
+    def _installed_cli_version(cls) -> str:
+        """Gets the version of the installed step binary, once per process.
 
-        Args:
-            arg (str): The argument.
         Returns:
-            Tuple[str, str]: The argument and the parameter.
+            str: The version, or an empty string if step is not installed.
         """
-        param = ""
-        if "=" in arg:
-            param = arg.split("=")[1]
-            arg = arg.split("=")[0]
-        return arg, param
+        if cls._cli_version is not None:
+            return cls._cli_version
+        try:
+            output = cls.executor.run(
+                ["step", "version"], stderr=subprocess.DEVNULL
+            ).stdout.decode("utf-8")
+        except (OSError, subprocess.CalledProcessError):
+            output = ""
+        cli_version = ""
+        if "CLI/" in output:
+            cli_version = output[output.index("CLI/") + 4 :].split()[0]
+        with cls._lock:
+            StepCliParser._cli_version = cli_version
+        return cli_version
 
-    @staticmethod
-    def _arg_form_check(arg: str) -> tuple[str, str]:
-        """Checks if the argument has two forms.
+    @classmethod
+    def load_schema(cls, schema_path: str, check_cli_version: bool = True) -> bool:
+        """Loads a prebuilt command schema, like the one written by `main`.
+
+        The schema is only used if it was written by this parser version and,
+        when checked, for the same version of step that is installed. It is
+        kept compiled, in the cache of the installed step, and its nodes are
+        only decoded into the shared tree when they are first parsed. Without
+        a cache, the whole schema is read into the tree, as compiling it each
+        time costs more than that. A schema that is not used is remembered,
+        so it is not read and checked again until it or step changes.
 
         Args:
-            arg (str): The argument.
+            schema_path (str): The path to the schema json file.
+            check_cli_version (bool): Compare against the installed step binary.
         Returns:
-            Tuple[str, str]: The first form and the second form.
+            bool: True if the schema was loaded, False if it has to be scraped.
         """
-        alt_form = ""
-        if "," in arg:
-            alt_form = arg.split(",")[1].strip("- ").split("=")[0]
-            arg = arg.split(",")[0]
-        return arg, alt_form
+        command_dict = cls().command_dict
+        if command_dict.get("__cli_version__"):
+            return True
+        try:
+            stat = os.stat(schema_path)
+        except OSError:
+            cls.log.debug(f"no schema found at {schema_path}")
+            return False
+        installed_cli_version = (
+            cls._installed_cli_version() if check_cli_version else ""
+        )
+        key = (os.path.abspath(schema_path), stat.st_mtime_ns, installed_cli_version)
+        with cls._lock:
+            if key in cls._rejected_schemas:
+                return False
+        loaded = cls._load_schema(schema_path, installed_cli_version)
+        if not loaded:
+            with cls._lock:
+                cls._rejected_schemas.add(key)
+        return loaded
+
+    @classmethod
+    def _load_schema(cls, schema_path: str, installed_cli_version: str) -> bool:
+        """Reads and checks a schema, see `load_schema`."""
+        command_dict = cls().command_dict
+        cache = cls._get_cache()
+        schema = None
+        try:
+            if cache:
+                schema = StepSchema.load(schema_path, cache.cache_dir)
+                root = schema.node(["step"]) or {}
+            else:
+                with open(schema_path) as schema_file:
+                    root = json.load(schema_file)
+        except (OSError, ValueError) as e:
+            cls.log.info(f"schema at {schema_path} not loaded: {e}")
+            return False
+        parser_version = root.get("__version__", "")
+        if cls._ver_comp(parser_version) != 0:
+            cls.log.info(
+                f"schema parser version {parser_version} "
+                + f"does not match {cls.PARSER_VERSION}"
+            )
+            return False
+        schema_cli_version = root.get("__cli_version__", "").split(" ")[0]
+        if installed_cli_version and installed_cli_version != schema_cli_version:
+            cls.log.info(
+                f"schema cli version {schema_cli_version} "
+                + f"does not match installed {installed_cli_version}"
+            )
+            return False
+        with cls._lock:
+            command_dict.clear()
+            command_dict.update(root)
+            StepCliParser._schema = schema
+        cls.log.debug(f"loaded schema from {schema_path}")
+        return True
 
     def __init__(self):
         # borg pattern
-        if not StepCliParser.__total_command_dict:
-            StepCliParser.__total_command_dict = self.command_dict
-            self.command_dict["__subcommands__"] = {}
-            self.command_dict["__arguments__"] = {}
+        with StepCliParser._lock:
+            if not StepCliParser.__total_command_dict:
+                StepCliParser.__total_command_dict = self.command_dict
+                self.command_dict["__subcommands__"] = {}
+                self.command_dict["__arguments__"] = {}
 
         self.__total_command_dict = StepCliParser.__total_command_dict
         self.command_dict = self.__total_command_dict
 
-    def _next_line(self):
+    def _next_token(self):
         self.i += 1
-        self.line = self.command_output[self.i]
+        self.token = self.tokens[self.i]
 
     def _still_description(self) -> bool:
-        if self.line != "":
-            return True
-        if self.i + 1 >= len(self.command_output):
+        if self.i + 1 >= len(self.tokens):
             return False
-        next_line = self.command_output[self.i + 1]
-        if next_line.startswith(ANSI_BOLDER):
+        next_token = self.tokens[self.i + 1]
+        if next_token.kind == HELP_SECTION:
             return False
-        next_line = next_line.strip(" ")
-        if self.section == "options":
-            rtn = not next_line.startswith(f"{ANSI_BOLDER}-")
-        else:
-            rtn = not next_line.startswith(ANSI_UNDERLINE)
-        self.log.debug(f"next_line: `{next_line}`, still_description: {rtn}")
+        if self.token.kind != HELP_BLANK:
+            return True
+        # a blank line ends the description if the next entry follows
+        entry = HELP_FLAG if self.section == "options" else HELP_NAME
+        rtn = next_token.kind != entry
+        self.log.debug(f"next: {next_token.kind}, still_description: {rtn}")
         return rtn
 
     def _get_description(self) -> str:
-        """Gets the description of an option from the command output.
+        """Gets the description of an argument, from the lines after it.
 
-        Args:
-            command_output (List[str]): The command output.
-            i (int): The index of the option.
         Returns:
-            str: The description of the option.
+            str: The description, its lines joined by spaces.
         """
-
-        description = ""
+        lines = []
         while self._still_description():
-            self._next_line()
-            description += self._remove_ansi_sequences(self.line).strip() + " "
-
-        return description.strip(" ")
+            self._next_token()
+            lines.append(self.token.text)
+        return " ".join(lines).strip(" ")
 
     def _parse_subcommand(self) -> tuple[str, str]:
         """Parses the subcommand from the command output.
@@ -156,32 +377,31 @@ class StepCliParser:
         Returns:
             Tuple[str, str]: The parsed subcommand and the description.
         """
-        subcommand = self._remove_ansi_sequences(self.line.split(ANSI_END)[0]).strip()
-        alt_form = ""
-        if "," in subcommand:
-            alt_form = subcommand.split(",")[1].strip()
-            subcommand = subcommand.split(",")[0]
-        description = self._remove_ansi_sequences(self.line.split(ANSI_END)[1]).strip()
-
+        subcommand, alt_form = self.token.name, self.token.alt_form
+        description = self.token.description
         self.log.debug(
             f"subcommand: {subcommand}{'/'+alt_form if alt_form else ''}, description: {description}"
         )
         return subcommand, description
 
     def _parse_command_parts(self) -> tuple[str, dict[str, str]]:
-        """Parses the command arguments and options.
+        """Parses a flag or a positional argument, and its description.
+
+        Lines that are not styled like either are read as a flag.
 
-        Args:
-            command_output (List[str]): The command output.
-            i (int): The index of the option.
         Returns:
-            Dict[str, str]: The parsed command arguments.
+            Tuple[str, Dict[str, str]]: The argument and its parsed dict.
         """
         arg_dict = {}
         self.arg_type = self.section.rstrip("s")
-        arg = self._remove_ansi_sequences(self.line).lstrip(" -")
-        arg, alt_form = self._arg_form_check(arg)
-        arg, param = self._arg_param_check(arg)
+        if self.token.kind in (HELP_FLAG, HELP_NAME):
+            arg, alt_form, param = (
+                self.token.name,
+                self.token.alt_form,
+                self.token.param,
+            )
+        else:
+            arg, alt_form, param = _split_flag(self.token.text)
         arg_dict["description"] = self._get_description()
         if param:
             self.arg_type = "optional argument"
@@ -200,88 +420,243 @@ class StepCliParser:
     def parse(self, command_stack: list[str]) -> dict[str, dict]:
         """Recursively parses the command to find the sub commands and options.
 
+        Safe to call from many threads at once, each node of the shared tree
+        is only parsed by one of them.
+
         Returns:
             Dict[str, Dict]: The parsed command.
         """
+        command_dict = self.__total_command_dict
         if not command_stack or len(command_stack) <= 1 and command_stack[0] == "":
-            return self.command_dict
+            return command_dict
         if command_stack[0] != "step":
             command_stack = ["step"] + command_stack
-        self.command = command_stack[-1]
-        if self.command in self.command_dict:
-            self.command_dict = self.command_dict[self.command]
-            return self.command_dict
-        self.command_stack = command_stack
-        if len(self.command_stack) == "1" and self.command_stack[0] == "step":
-            return self.parse_loop()
-        for part in self.command_stack[1:]:
+        if len(command_stack) == 1:
+            return self._parse_node(command_stack, command_dict)
+        for depth, part in enumerate(command_stack[1:], start=2):
             self.log.debug(f"part: {part}")
-            if part not in self.command_dict:
-                self.command_dict[part] = {"__subcommands__": {}, "__arguments__": {}}
-            self.command_dict = self.command_dict[part]
+            with StepCliParser._lock:
+                command_dict = command_dict.setdefault(
+                    part, {"__subcommands__": {}, "__arguments__": {}}
+                )
             try:
-                self.parse_loop()
+                self._parse_node(command_stack[:depth], command_dict)
             except Exception as e:
-                self.log.error(
-                    f"Error parsing {self.command}: {e}\n{self.command_dict}"
-                )
+                self.log.error(f"Error parsing {' '.join(command_stack)}: {e}")
                 raise e
 
-        return self.command_dict
+        return command_dict
+
+    @staticmethod
+    def _is_parsed(command_dict: dict) -> bool:
+        return bool(
+            command_dict.get("__subcommands__")
+            or command_dict.get("__arguments__")
+            or command_dict.get("__cli_version__")
+        )
+
+    @classmethod
+    def _node_lock(cls, command_stack: list[str]) -> threading.Lock:
+        with cls._lock:
+            return cls._node_locks.setdefault(tuple(command_stack), threading.Lock())
+
+    def _parse_node(
+        self, command_stack: list[str], command_dict: dict
+    ) -> dict[str, dict]:
+        """Parses a node of the shared tree, reusing the on-disk cache.
+
+        The help is parsed by a new parser into a separate dict, so the shared
+        node only ever changes from unparsed to fully parsed.
+
+        Args:
+            command_stack (List[str]): The full command, starting with step.
+            command_dict (Dict): The node of the shared tree for the command.
+        Returns:
+            Dict[str, Dict]: The parsed node.
+        """
+        if self._is_parsed(command_dict):
+            return command_dict
+        with self._node_lock(command_stack):
+            if self._is_parsed(command_dict):
+                return command_dict
+            schema = StepCliParser._schema
+            parsed_dict = schema.node(command_stack) if schema else None
+            cache = self._get_cache()
+            if parsed_dict is None and cache:
+                parsed_dict = cache.get(command_stack)
+            if parsed_dict is None:
+                parsed_dict = StepCliParser().parse_help(command_stack)
+                if cache:
+                    cache.put(command_stack, parsed_dict)
+            with StepCliParser._lock:
+                for key in ("__subcommands__", "__arguments__"):
+                    if key not in parsed_dict:
+                        command_dict.pop(key, None)
+                command_dict.update(parsed_dict)
+        return command_dict
+
+    def parse_help(self, command_stack: list[str]) -> dict[str, dict]:
+        """Parses the help of a single command, outside of the shared tree.
+
+        Args:
+            command_stack (List[str]): The full command, starting with step.
+        Returns:
+            Dict[str, Dict]: The parsed command, without any subcommand nodes.
+        """
+        self.command_stack = command_stack
+        self.command = command_stack[-1]
+        self.command_dict = {"__subcommands__": {}, "__arguments__": {}}
+        return self.parse_loop()
 
     def parse_loop(self) -> dict[str, dict]:
-        if not all(
-            [
-                str(key) in ["__subcommands__", "__arguments__"]
-                for key in self.command_dict.keys()
-            ]
-        ):
+        if any(self.command_dict.values()):
             self.log.debug(f"pre-cached command_dict: {self.command_dict}")
             return self.command_dict
 
         self.section = "none"
-        raw_command_output = subprocess.run(
-            self.command_stack + ["--help"], shell=True, check=True, capture_output=True
-        ).stdout
-        self.command_output = self._make_printable(
-            raw_command_output.decode("utf-8")
-        ).split("\n")
-        while self.i <= len(self.command_output):
-            try:
-                self._next_line()
-            except IndexError:
-                break
-            if self.line.startswith(ANSI_BOLDER):
-                self.section = self._remove_ansi_sequences(self.line).lower()
+        self.i = -1
+        with step_metrics.command(" ".join(self.command_stack + ["--help"])):
+            raw_command_output = self.executor.run(
+                self.command_stack + ["--help"], stderr=subprocess.PIPE
+            ).stdout
+        started = time.perf_counter()
+        self.tokens = tokenize_help(raw_command_output.decode("utf-8"))
+        while self.i + 1 < len(self.tokens):
+            self._next_token()
+            kind = self.token.kind
+            if kind == HELP_SECTION:
+                self.section = self.token.text.lower()
                 self.log.debug(f"section: {self.section}")
                 continue
-            if self.section == "none":
+            if self.section == "none" or kind == HELP_BLANK:
                 continue
             if self.section == "positional arguments" or self.section == "options":
                 self._parse_command_parts()
                 continue
-            if self.section == "commands" and self.line:
+            if self.section == "commands" and self.token.name:
                 subcommand, description = self._parse_subcommand()
                 self.command_dict["__subcommands__"][subcommand] = description
                 continue
-            if self.section == "version" and self.line:
-                step_version = self.line[self.line.index("CLI/") + 4 :].strip()
-                step_version = self._remove_ansi_sequences(step_version)
+            if self.section == "version" and "CLI/" in self.token.text:
+                step_version = self.token.text.partition("CLI/")[2].strip()
                 self.command_dict["__cli_version__"] = step_version
                 continue
 
-        self.log.info(f"command_dict: {self.command_dict}")
-
         if self.command_dict["__subcommands__"] == {}:
             self.command_dict.pop("__subcommands__")
         if self.command_dict["__arguments__"] == {}:
             self.command_dict.pop("__arguments__")
+        if step_metrics.exporters:
+            step_metrics.observe(
+                "step_help_parse_seconds",
+                time.perf_counter() - started,
+                command=" ".join(self.command_stack),
+            )
 
         return self.command_dict
 
 
+class StepCliCrawler:
+    """Crawls the full step command tree, parsing help pages in parallel."""
+
+    max_workers: int
+    progress: Callable[[int, int, list[str]], None] | None
+    failed: list[list[str]]
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        progress: Callable[[int, int, list[str]], None] | None = None,
+    ) -> None:
+        """Initializes the crawler.
+
+        Args:
+            max_workers (int): The most `--help` subprocesses to run at once.
+            progress (Callable): Called with the done and discovered node counts
+                and the command stack after each node finishes.
+        """
+        self.max_workers = max_workers
+        self.progress = progress
+        self.failed = []
+
+    def _parse_node(self, command_stack: list[str]) -> dict[str, dict]:
+        return StepCliParser().parse_help(command_stack)
+
+    def crawl(self, command_stack: list[str] | None = None) -> dict[str, dict]:
+        """Parses the command and every subcommand below it.
+
+        Nodes that fail to parse, whether step fails or its help is not
+        understood, are left empty and recorded in `failed`, so they are
+        parsed again lazily when used.
+
+        Args:
+            command_stack (List[str]): The command to start from, default step.
+        Returns:
+            Dict[str, Dict]: The parsed command tree.
+        """
+        command_stack = command_stack or ["step"]
+        self.failed = []
+        StepCliParser()  # set up the shared state before the workers start
+        root: dict[str, dict] = {}
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: dict[Future, tuple[list[str], dict]] = {
+                executor.submit(self._parse_node, command_stack): (command_stack, root)
+            }
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stack, node = pending.pop(future)
+                    done += 1
+                    try:
+                        node.update(future.result())
+                    except Exception as e:
+                        self.log.warning(f"failed to parse {' '.join(stack)}: {e!r}")
+                        self.failed.append(stack)
+                    for subcommand in node.get("__subcommands__", {}):
+                        child: dict[str, dict] = {}
+                        node[subcommand] = child
+                        child_stack = stack + [subcommand]
+                        pending[executor.submit(self._parse_node, child_stack)] = (
+                            child_stack,
+                            child,
+                        )
+                    self.log.info(
+                        f"[{done}/{done + len(pending)}] parsed {' '.join(stack)}"
+                    )
+                    if self.progress:
+                        self.progress(done, done + len(pending), stack)
+
+        self.log.info(f"parsed {done} commands, {len(self.failed)} failed")
+        root["__version__"] = StepCliParser.PARSER_VERSION
+        return root
+
+    def dump(self, schema_path: str) -> None:
+        """Crawls the full tree and writes it as a schema file.
+
+        Args:
+            schema_path (str): The path to write the schema json file to.
+        """
+        command_dict = self.crawl()
+        with open(schema_path, "w") as schema_file:
+            json.dump(command_dict, schema_file, indent=4)
+
+
 def main():
-    json.dump(StepCliParser().parse(["step"]), open("step.json", "w"), indent=4)
+    parser = argparse.ArgumentParser(description="Write the step cli schema file.")
+    parser.add_argument(
+        "-o", "--output", help="The file to write.", default="step.json"
+    )
+    parser.add_argument(
+        "-w", "--workers", help="Parallel help parses.", type=int, default=8
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    crawler = StepCliCrawler(max_workers=args.workers)
+    crawler.dump(args.output)
+    if crawler.failed:
+        raise SystemExit(f"{len(crawler.failed)} commands failed to parse")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from step.cli.step_cli_cache import write_atomic
+
+SCHEMA_FORMAT = 1  # of the compiled blob, compiled again when it changes
+
+
+@dataclass(frozen=True, slots=True)
+class StepArgSpec:
+    """What an argument takes, shared by every command and form with it."""
+
+    type: str  # positional argument, optional argument or option
+    description: str
+    param: str  # the name of the value, empty for options
+
+
+class StepArg(dict):
+    """An argument of a command, the same dict the parser writes.
+
+    The two forms of an argument, like `--provisioner, --issuer`, point to
+    the same spec and only differ in `alt_form`. An argument is shared by
+    every command with it, so it is not to be changed.
+    """
+
+    __slots__ = ("spec",)
+
+    spec: StepArgSpec
+
+    def __init__(self, spec: StepArgSpec, alt_form: str = "") -> None:
+        super().__init__(description=spec.description)
+        if spec.param:
+            self["param"] = spec.param
+        if alt_form:
+            self["alt_form"] = alt_form
+        self["type"] = spec.type
+        self.spec = spec
+
+
+class StepSchema:
+    """The command schema of step, compiled to a compact blob.
+
+    Strings are stored once in a table, argument specs once across all the
+    commands, and each command as its own marshal record, so only the nodes
+    used are decoded. The decoded specs and arguments are shared by every
+    node using them.
+    """
+
+    parser_version: str  # the version of the parser that wrote the schema
+    cli_version: str  # the version of step the schema was written for
+    log = logging.getLogger(__name__)
+
+    def __init__(self, blob: bytes) -> None:
+        """Initializes the schema from a blob, see `compile`.
+
+        Raises:
+            ValueError: If the blob is not a compiled schema of this format.
+        """
+        try:
+            header_size = int.from_bytes(blob[:4], "big")
+            header = marshal.loads(blob[4 : 4 + header_size])
+            schema_format, self.parser_version, self.cli_version = header[:3]
+            strings, self._specs, self._index = header[3:]
+        except (EOFError, TypeError, ValueError) as e:
+            raise ValueError(f"not a compiled schema: {e}")
+        if schema_format != SCHEMA_FORMAT:
+            raise ValueError(f"compiled schema format {schema_format}")
+        self._strings = tuple(sys.intern(s) for s in strings)
+        self._blob = memoryview(blob)[4 + header_size :]
+        self._spec_cache: dict[int, StepArgSpec] = {}
+        self._arg_cache: dict[tuple[int, int], StepArg] = {}
+
+    @staticmethod
+    def compile(schema: dict) -> bytes:
+        """Compiles a schema, as written by StepCliCrawler, into a blob.
+
+        Args:
+            schema (Dict): The schema.
+        Returns:
+            bytes: The blob, a header with the string table, the specs and the
+                offset of each node, then the node records.
+        """
+        strings: dict[str, int] = {}
+        specs: dict[tuple[str, str, str], int] = {}
+        index: dict[str, tuple[int, int]] = {}
+        records = bytearray()
+
+        def string(value: str) -> int:
+            return strings.setdefault(value, len(strings))
+
+        def add(command_stack: list[str], node: dict) -> None:
+            subcommands = node.get("__subcommands__", {})
+            arguments = []
+            for name, arg in node.get("__arguments__", {}).items():
+                spec = (
+                    arg.get("type", ""),
+                    arg.get("description", ""),
+                    arg.get("param", ""),
+                )
+                spec_id = specs.setdefault(spec, len(specs))
+                arguments += [string(name), string(arg.get("alt_form", "")), spec_id]
+            record = marshal.dumps(
+                (
+                    tuple(string(s) for pair in subcommands.items() for s in pair),
+                    tuple(arguments),
+                )
+            )
+            index[" ".join(command_stack)] = (len(records), len(record))
+            records.extend(record)
+            for subcommand in subcommands:
+                if isinstance(node.get(subcommand), dict):
+                    add(command_stack + [subcommand], node[subcommand])
+
+        add(["step"], schema)
+        spec_table = tuple(tuple(string(s) for s in spec) for spec in specs)
+        header = marshal.dumps(
+            (
+                SCHEMA_FORMAT,
+                schema.get("__version__", ""),
+                schema.get("__cli_version__", ""),
+                tuple(strings),
+                spec_table,
+                index,
+            )
+        )
+        return len(header).to_bytes(4, "big") + header + bytes(records)
+
+    @classmethod
+    def load(cls, schema_path: str, cache_dir: str | None = None) -> "StepSchema":
+        """Loads a schema file, compiled once and kept in a cache directory.
+
+        Args:
+            schema_path (str): The schema json file.
+            cache_dir (str | None): Where to keep the compiled schema, by the
+                path, mtime and size of the file. Compiled each time if None.
+        Returns:
+            StepSchema: The schema.
+        Raises:
+            OSError: If the schema file can't be read.
+            ValueError: If it is not a schema.
+        """
+        stat = os.stat(schema_path)
+        blob_path = ""
+        if cache_dir:
+            key = f"{os.path.abspath(schema_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+            key = hashlib.sha256(f"{key}:{SCHEMA_FORMAT}".encode()).hexdigest()[:32]
+            blob_path = os.path.join(cache_dir, f"schema-{key}.bin")
+            try:
+                with open(blob_path, "rb") as blob_file:
+                    return cls(blob_file.read())
+            except (OSError, ValueError):
+                pass
+        with open(schema_path) as schema_file:
+            blob = cls.compile(json.load(schema_file))
+        if blob_path:
+            try:
+                write_atomic(blob_path, blob)
+            except OSError as e:
+                cls.log.debug(f"not keeping the compiled schema: {e}")
+        return cls(blob)
+
+    def __contains__(self, command_stack: Sequence[str]) -> bool:
+        return " ".join(command_stack) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _arg(self, spec_id: int, alt_form: int) -> StepArg:
+        arg = self._arg_cache.get((spec_id, alt_form))
+        if arg is None:
+            spec = self._spec_cache.get(spec_id)
+            if spec is None:
+                kind, description, param = (
+                    self._strings[i] for i in self._specs[spec_id]
+                )
+                spec = self._spec_cache.setdefault(
+                    spec_id, StepArgSpec(kind, description, param)
+                )
+            arg = self._arg_cache.setdefault(
+                (spec_id, alt_form), StepArg(spec, self._strings[alt_form])
+            )
+        return arg
+
+    def node(self, command_stack: Sequence[str]) -> dict | None:
+        """Decodes the node of a command, like StepCliParser.parse_help.
+
+        Args:
+            command_stack (Sequence[str]): The command, starting with step.
+        Returns:
+            Dict | None: The node, without its subcommand nodes, or None if
+                the command is not in the schema.
+        """
+        location = self._index.get(" ".join(command_stack))
+        if location is None:
+            return None
+        offset, size = location
+        subcommands, arguments = marshal.loads(self._blob[offset : offset + size])
+        strings = self._strings
+        node: dict = {}
+        if subcommands:
+            node["__subcommands__"] = {
+                strings[subcommands[i]]: strings[subcommands[i + 1]]
+                for i in range(0, len(subcommands), 2)
+            }
+        if arguments:
+            node["__arguments__"] = {
+                strings[arguments[i]]: self._arg(arguments[i + 2], arguments[i + 1])
+                for i in range(0, len(arguments), 3)
+            }
+        if len(command_stack) == 1:
+            node["__cli_version__"] = self.cli_version
+            node["__version__"] = self.parser_version
+        return node
@@ -0,0 +1,12366 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+# Generated by `python -m step.cli.step_cli_codegen` from the schema of step
+# 0.24.4 (darwin/arm64), do not edit.
+
+from typing import Any
+
+from step.cli.step_cli import StepCommandGroup, StepCommandSpec
+
+STEP_CLI_VERSION = "0.24.4 (darwin/arm64)"
+
+StepValue = str | int | float | list[str]
+
+
+_HELP = StepCommandSpec(
+    ("step", "help"),
+    ("http", "html", "markdown", "report"),
+)
+
+
+_VERSION = StepCommandSpec(
+    ("step", "version"),
+    (),
+)
+
+
+_BASE64 = StepCommandSpec(
+    ("step", "base64"),
+    ("decode", "raw", "url"),
+)
+
+
+_CA_HEALTH = StepCommandSpec(
+    ("step", "ca", "health"),
+    ("ca-url", "root", "context"),
+)
+
+
+_CA_INIT = StepCommandSpec(
+    ("step", "ca", "init"),
+    (
+        "root",
+        "key",
+        "pki",
+        "ssh",
+        "helm",
+        "deployment-type",
+        "name",
+        "dns",
+        "address",
+        "provisioner",
+        "password-file",
+        "provisioner-password-file",
+        "with-ca-url",
+        "ra",
+        "kms",
+        "kms-root",
+        "kms-intermediate",
+        "kms-ssh-host",
+        "kms-ssh-user",
+        "issuer",
+        "issuer-fingerprint",
+        "issuer-provisioner",
+        "credentials-file",
+        "no-db",
+        "context",
+        "remote-management",
+        "acme",
+        "admin-subject",
+        "profile",
+        "authority",
+    ),
+)
+
+
+_CA_BOOTSTRAP = StepCommandSpec(
+    ("step", "ca", "bootstrap"),
+    (
+        "ca-url",
+        "fingerprint",
+        "install",
+        "team",
+        "team-authority",
+        "team-url",
+        "redirect-url",
+        "force",
+        "context",
+        "profile",
+        "authority",
+    ),
+)
+
+
+_CA_TOKEN = StepCommandSpec(
+    ("step", "ca", "token"),
+    (
+        "kid",
+        "san",
+        "principal",
+        "host",
+        "ca-config",
+        "force",
+        "not-after",
+        "not-before",
+        "cert-not-after",
+        "cert-not-before",
+        "provisioner",
+        "password-file",
+        "provisioner-password-file",
+        "kms",
+        "x5c-cert",
+        "x5c-key",
+        "x5c-insecure",
+        "sshpop-cert",
+        "sshpop-key",
+        "nebula-cert",
+        "nebula-key",
+        "key",
+        "output-file",
+        "revoke",
+        "renew",
+        "rekey",
+        "ssh",
+        "k8ssa-token-path",
+        "offline",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_CERTIFICATE = StepCommandSpec(
+    ("step", "ca", "certificate"),
+    (
+        "san",
+        "attestation-ca-url",
+        "attestation-ca-root",
+        "tpm-storage-directory",
+        "set",
+        "set-file",
+        "ca-config",
+        "ca-url",
+        "root",
+        "token",
+        "context",
+        "provisioner",
+        "provisioner-password-file",
+        "kty",
+        "curve",
+        "size",
+        "not-after",
+        "not-before",
+        "attestation-uri",
+        "force",
+        "offline",
+        "password-file",
+        "console",
+        "kms",
+        "x5c-cert",
+        "x5c-key",
+        "x5c-chain",
+        "nebula-cert",
+        "nebula-key",
+        "acme",
+        "standalone",
+        "webroot",
+        "contact",
+        "http-listen",
+        "k8ssa-token-path",
+    ),
+)
+
+
+_CA_REKEY = StepCommandSpec(
+    ("step", "ca", "rekey"),
+    (
+        "out-cert",
+        "out-key",
+        "private-key",
+        "expires-in",
+        "pid",
+        "pid-file",
+        "signal",
+        "exec",
+        "daemon",
+        "rekey-period",
+        "kty",
+        "curve",
+        "size",
+        "force",
+        "offline",
+        "password-file",
+        "root",
+        "ca-url",
+        "ca-config",
+    ),
+)
+
+
+_CA_RENEW = StepCommandSpec(
+    ("step", "ca", "renew"),
+    (
+        "mtls",
+        "ca-config",
+        "force",
+        "offline",
+        "password-file",
+        "output-file",
+        "expires-in",
+        "pid",
+        "pid-file",
+        "signal",
+        "exec",
+        "daemon",
+        "renew-period",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_REVOKE = StepCommandSpec(
+    ("step", "ca", "revoke"),
+    (
+        "cert",
+        "key",
+        "reason",
+        "reasonCode",
+        "token",
+        "ca-config",
+        "offline",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_PROVISIONER_LIST = StepCommandSpec(
+    ("step", "ca", "provisioner", "list"),
+    ("ca-url", "root", "context"),
+)
+
+
+_CA_PROVISIONER_JWE_KEY = StepCommandSpec(
+    ("step", "ca", "provisioner", "jwe-key"),
+    ("ca-url", "root", "context"),
+)
+
+
+_CA_PROVISIONER_ADD = StepCommandSpec(
+    ("step", "ca", "provisioner", "add"),
+    (
+        "type",
+        "public-key",
+        "create",
+        "private-key",
+        "client-id",
+        "client-secret",
+        "listen-address",
+        "configuration-endpoint",
+        "admin",
+        "domain",
+        "group",
+        "tenant-id",
+        "x5c-roots",
+        "nebula-root",
+        "require-eab",
+        "force-cn",
+        "challenge",
+        "attestation-format",
+        "attestation-roots",
+        "capabilities",
+        "include-root",
+        "min-public-key-length",
+        "encryption-algorithm-identifier",
+        "aws-account",
+        "azure-tenant",
+        "azure-resource-group",
+        "azure-audience",
+        "azure-subscription-id",
+        "azure-object-id",
+        "gcp-service-account",
+        "gcp-project",
+        "instance-age",
+        "disable-custom-sans",
+        "disable-trust-on-first-use",
+        "x509-template",
+        "x509-template-data",
+        "ssh-template",
+        "ssh-template-data",
+        "x509-min-dur",
+        "x509-max-dur",
+        "x509-default-dur",
+        "ssh-user-min-dur",
+        "ssh-user-max-dur",
+        "ssh-user-default-dur",
+        "ssh-host-min-dur",
+        "ssh-host-max-dur",
+        "ssh-host-default-dur",
+        "disable-renewal",
+        "allow-renewal-after-expiry",
+        "ssh",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "password-file",
+        "ca-url",
+        "root",
+        "context",
+        "ca-config",
+    ),
+)
+
+
+_CA_PROVISIONER_UPDATE = StepCommandSpec(
+    ("step", "ca", "provisioner", "update"),
+    (
+        "name",
+        "public-key",
+        "create",
+        "private-key",
+        "client-id",
+        "client-secret",
+        "listen-address",
+        "configuration-endpoint",
+        "admin",
+        "remove-admin",
+        "domain",
+        "remove-domain",
+        "group",
+        "tenant-id",
+        "x5c-roots",
+        "nebula-root",
+        "require-eab",
+        "force-cn",
+        "challenge",
+        "remove-challenge",
+        "attestation-format",
+        "remove-attestation-format",
+        "attestation-roots",
+        "capabilities",
+        "include-root",
+        "min-public-key-length",
+        "encryption-algorithm-identifier",
+        "aws-account",
+        "remove-aws-account",
+        "azure-tenant",
+        "azure-resource-group",
+        "remove-azure-resource-group",
+        "azure-audience",
+        "azure-subscription-id",
+        "remove-azure-subscription-id",
+        "azure-object-id",
+        "remove-azure-object-id",
+        "gcp-service-account",
+        "remove-gcp-service-account",
+        "gcp-project",
+        "remove-gcp-project",
+        "instance-age",
+        "disable-custom-sans",
+        "disable-trust-on-first-use",
+        "x509-template",
+        "x509-template-data",
+        "ssh-template",
+        "ssh-template-data",
+        "x509-min-dur",
+        "x509-max-dur",
+        "x509-default-dur",
+        "ssh-user-min-dur",
+        "ssh-user-max-dur",
+        "ssh-user-default-dur",
+        "ssh-host-min-dur",
+        "ssh-host-max-dur",
+        "ssh-host-default-dur",
+        "disable-renewal",
+        "allow-renewal-after-expiry",
+        "ssh",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "password-file",
+        "ca-url",
+        "root",
+        "context",
+        "ca-config",
+    ),
+)
+
+
+_CA_PROVISIONER_REMOVE = StepCommandSpec(
+    ("step", "ca", "provisioner", "remove"),
+    (
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+        "ca-config",
+    ),
+)
+
+
+_CA_PROVISIONER_WEBHOOK_ADD = StepCommandSpec(
+    ("step", "ca", "provisioner", "webhook", "add"),
+    (
+        "url",
+        "kind",
+        "bearer-token-file",
+        "basic-auth-username",
+        "basic-auth-password-file",
+        "disable-tls-client-auth",
+        "cert-type",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+        "ca-config",
+    ),
+)
+
+
+_CA_PROVISIONER_WEBHOOK_UPDATE = StepCommandSpec(
+    ("step", "ca", "provisioner", "webhook", "update"),
+    (
+        "url",
+        "kind",
+        "bearer-token-file",
+        "basic-auth-username",
+        "basic-auth-password-file",
+        "disable-tls-client-auth",
+        "cert-type",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+        "ca-config",
+    ),
+)
+
+
+_CA_PROVISIONER_WEBHOOK_REMOVE = StepCommandSpec(
+    ("step", "ca", "provisioner", "webhook", "remove"),
+    (
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+        "ca-config",
+    ),
+)
+
+
+class _CaProvisionerWebhook(StepCommandGroup):
+    """The commands of `step ca provisioner webhook`: create and manage webhooks for
+    a provisioner.
+    """
+
+    __slots__ = ()
+
+    def add(
+        self,
+        provisioner_name: str | None = None,
+        webhook_name: str | None = None,
+        /,
+        *,
+        url: StepValue | None = None,
+        kind: StepValue | None = None,
+        bearer_token_file: StepValue | None = None,
+        basic_auth_username: StepValue | None = None,
+        basic_auth_password_file: StepValue | None = None,
+        disable_tls_client_auth: bool = False,
+        cert_type: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add a webhook to a provisioner.
+
+        Args:
+            provisioner_name (str): The name of the provisioner.
+            webhook_name (str): The name of the webhook.
+            url (StepValue): The url of the webhook server.
+            kind (StepValue): The kind of webhook.
+            bearer_token_file (StepValue): The token to be set in the Authorization
+                header of the request to the webhook server.
+            basic_auth_username (StepValue): The username portion of the Authorization
+                header of the request to the webhook server when using basic
+                authentication.
+            basic_auth_password_file (StepValue): The password porition of the
+                Authorization header of the request to the webhook server when using
+                basic authentication.
+            disable_tls_client_auth (bool): The CA will not send a client certificate
+                when requested by the webhook server.
+            cert_type (StepValue): Whether to call this webhook when signing X509
+                certificates, SSH certificates, or ALL certificates.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+            ca_config (StepValue): The certificate authority configuration file.
+        """
+        return self._call(
+            _CA_PROVISIONER_WEBHOOK_ADD,
+            (provisioner_name, webhook_name),
+            (
+                url,
+                kind,
+                bearer_token_file,
+                basic_auth_username,
+                basic_auth_password_file,
+                disable_tls_client_auth,
+                cert_type,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+                ca_config,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def update(
+        self,
+        provisioner_name: str | None = None,
+        webhook_name: str | None = None,
+        /,
+        *,
+        url: StepValue | None = None,
+        kind: StepValue | None = None,
+        bearer_token_file: StepValue | None = None,
+        basic_auth_username: StepValue | None = None,
+        basic_auth_password_file: StepValue | None = None,
+        disable_tls_client_auth: bool = False,
+        cert_type: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Update a webhook attached to a provisioner.
+
+        Args:
+            provisioner_name (str): The name of the provisioner.
+            webhook_name (str): The name of the webhook.
+            url (StepValue): The url of the webhook server.
+            kind (StepValue): The kind of webhook.
+            bearer_token_file (StepValue): The token to be set in the Authorization
+                header of the request to the webhook server.
+            basic_auth_username (StepValue): The username portion of the Authorization
+                header of the request to the webhook server when using basic
+                authentication.
+            basic_auth_password_file (StepValue): The password porition of the
+                Authorization header of the request to the webhook server when using
+                basic authentication.
+            disable_tls_client_auth (bool): The CA will not send a client certificate
+                when requested by the webhook server.
+            cert_type (StepValue): Whether to call this webhook when signing X509
+                certificates, SSH certificates, or ALL certificates.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+            ca_config (StepValue): The certificate authority configuration file.
+        """
+        return self._call(
+            _CA_PROVISIONER_WEBHOOK_UPDATE,
+            (provisioner_name, webhook_name),
+            (
+                url,
+                kind,
+                bearer_token_file,
+                basic_auth_username,
+                basic_auth_password_file,
+                disable_tls_client_auth,
+                cert_type,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+                ca_config,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        provisioner_name: str | None = None,
+        webhook_name: str | None = None,
+        /,
+        *,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove a webhook from a provisioner.
+
+        Args:
+            provisioner_name (str): The name of the provisioner.
+            webhook_name (str): The name of the webhook.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+            ca_config (StepValue): The certificate authority configuration file.
+        """
+        return self._call(
+            _CA_PROVISIONER_WEBHOOK_REMOVE,
+            (provisioner_name, webhook_name),
+            (
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+                ca_config,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaProvisioner(StepCommandGroup):
+    """The commands of `step ca provisioner`: create and manage the certificate
+    authority provisioners.
+    """
+
+    __slots__ = ()
+
+    def list(
+        self,
+        *,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """List provisioners configured in the CA.
+
+        Args:
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_PROVISIONER_LIST,
+            (),
+            (ca_url, root, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def jwe_key(
+        self,
+        *,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Retrieve and print a provisioning key in the CA.
+
+        Args:
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_PROVISIONER_JWE_KEY,
+            (),
+            (ca_url, root, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def add(
+        self,
+        name: str | None = None,
+        /,
+        *,
+        type: StepValue | None = None,
+        public_key: StepValue | None = None,
+        create: bool = False,
+        private_key: StepValue | None = None,
+        client_id: StepValue | None = None,
+        client_secret: StepValue | None = None,
+        listen_address: StepValue | None = None,
+        configuration_endpoint: StepValue | None = None,
+        admin: StepValue | None = None,
+        domain: StepValue | None = None,
+        group: StepValue | None = None,
+        tenant_id: StepValue | None = None,
+        x5c_roots: StepValue | None = None,
+        nebula_root: StepValue | None = None,
+        require_eab: bool = False,
+        force_cn: bool = False,
+        challenge: StepValue | None = None,
+        attestation_format: StepValue | None = None,
+        attestation_roots: StepValue | None = None,
+        capabilities: StepValue | None = None,
+        include_root: bool = False,
+        min_public_key_length: StepValue | None = None,
+        encryption_algorithm_identifier: StepValue | None = None,
+        aws_account: StepValue | None = None,
+        azure_tenant: StepValue | None = None,
+        azure_resource_group: StepValue | None = None,
+        azure_audience: StepValue | None = None,
+        azure_subscription_id: StepValue | None = None,
+        azure_object_id: StepValue | None = None,
+        gcp_service_account: StepValue | None = None,
+        gcp_project: StepValue | None = None,
+        instance_age: StepValue | None = None,
+        disable_custom_sans: bool = False,
+        disable_trust_on_first_use: bool = False,
+        x509_template: StepValue | None = None,
+        x509_template_data: StepValue | None = None,
+        ssh_template: StepValue | None = None,
+        ssh_template_data: StepValue | None = None,
+        x509_min_dur: StepValue | None = None,
+        x509_max_dur: StepValue | None = None,
+        x509_default_dur: StepValue | None = None,
+        ssh_user_min_dur: StepValue | None = None,
+        ssh_user_max_dur: StepValue | None = None,
+        ssh_user_default_dur: StepValue | None = None,
+        ssh_host_min_dur: StepValue | None = None,
+        ssh_host_max_dur: StepValue | None = None,
+        ssh_host_default_dur: StepValue | None = None,
+        disable_renewal: bool = False,
+        allow_renewal_after_expiry: bool = False,
+        ssh: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add a provisioner.
+
+        Args:
+            name (str): The name of the provisioner.
+            type (StepValue): The type of provisioner to create.
+            public_key (StepValue): The file containing the JWK public key.
+            create (bool): Create the JWK key pair for the provisioner.
+            private_key (StepValue): The file containing the JWK private key.
+            client_id (StepValue): The id used to validate the audience in an OpenID
+                Connect token.
+            client_secret (StepValue): The secret used to obtain the OpenID Connect
+                tokens.
+            listen_address (StepValue): The callback address used in the OpenID Connect
+                flow (e.g.
+            configuration_endpoint (StepValue): OpenID Connect configuration url.
+            admin (StepValue): The email of an admin user in an OpenID Connect
+                provisioner, this user will not have restrictions in the certificates to
+                sign.
+            domain (StepValue): The domain used to validate the email claim in an OpenID
+                Connect provisioner.
+            group (StepValue): The group list used to validate the groups extension in
+                an OpenID Connect token.
+            tenant_id (StepValue): The tenant-id used to replace the templatized
+                tenantid value in the OpenID Configuration.
+            x5c_roots (StepValue): PEM-formatted root certificate(s) file used to
+                validate the signature on X5C provisioning tokens.
+            nebula_root (StepValue): Root certificate (chain) file used to validate the
+                signature on Nebula provisioning tokens.
+            require_eab (bool): Require (and enable) External Account Binding (EAB) for
+                Account creation.
+            force_cn (bool): Always set the common name in provisioned certificates.
+            challenge (StepValue): With a SCEP provisioner the challenge is a shared
+                secret between a client and the CA.
+            attestation_format (StepValue): Enable an ACME attestation statement format
+                in the provisioner.
+            attestation_roots (StepValue): PEM-formatted root certificate(s) file used
+                to validate the attestation certificates.
+            capabilities (StepValue): The SCEP capabilities to advertise
+            include_root (bool): Include the CA root certificate in the SCEP CA
+                certificate chain
+            min_public_key_length (StepValue): The minimum public key length of the SCEP
+                RSA encryption key
+            encryption_algorithm_identifier (StepValue): The id for the SCEP encryption
+                algorithm to use.
+            aws_account (StepValue): The AWS account id used to validate the identity
+                documents.
+            azure_tenant (StepValue): The Microsoft Azure tenant id used to validate the
+                identity tokens.
+            azure_resource_group (StepValue): The Microsoft Azure resource group name
+                used to validate the identity tokens.
+            azure_audience (StepValue): The Microsoft Azure audience name used to
+                validate the identity tokens.
+            azure_subscription_id (StepValue): The Microsoft Azure subscription id used
+                to validate the identity tokens.
+            azure_object_id (StepValue): The Microsoft Azure AD object id used to
+                validate the identity tokens.
+            gcp_service_account (StepValue): The Google service account email or id used
+                to validate the identity tokens.
+            gcp_project (StepValue): The Google project id used to validate the identity
+                tokens.
+            instance_age (StepValue): The maximum duration to grant a certificate in AWS
+                and GCP provisioners.
+            disable_custom_sans (bool): On cloud provisioners, if enabled only the
+                internal DNS and IP will be added as a SAN.
+            disable_trust_on_first_use (bool): On cloud provisioners, if enabled
+                multiple sign request for this provisioner with the same instance will
+                be accepted.
+            x509_template (StepValue): The x509 certificate template file, a JSON
+                representation of the certificate to create.
+            x509_template_data (StepValue): The x509 certificate template data file, a
+                JSON map of data that can be used by the certificate template.
+            ssh_template (StepValue): The x509 certificate template file, a JSON
+                representation of the certificate to create.
+            ssh_template_data (StepValue): The ssh certificate template data file, a
+                JSON map of data that can be used by the certificate template.
+            x509_min_dur (StepValue): The minimum duration for an x509 certificate
+                generated by this provisioner.
+            x509_max_dur (StepValue): The maximum duration for an x509 certificate
+                generated by this provisioner.
+            x509_default_dur (StepValue): The default duration for an x509 certificate
+                generated by this provisioner.
+            ssh_user_min_dur (StepValue): The minimum duration for an ssh user
+                certificate generated by this provisioner.
+            ssh_user_max_dur (StepValue): The maximum duration for an ssh user
+                certificate generated by this provisioner.
+            ssh_user_default_dur (StepValue): The maximum duration for an ssh user
+                certificate generated by this provisioner.
+            ssh_host_min_dur (StepValue): The minimum duration for an ssh host
+                certificate generated by this provisioner.
+            ssh_host_max_dur (StepValue): The maximum duration for an ssh host
+                certificate generated by this provisioner.
+            ssh_host_default_dur (StepValue): The maximum duration for an ssh host
+                certificate generated by this provisioner.
+            disable_renewal (bool): Disable renewal for all certificates generated by
+                this provisioner.
+            allow_renewal_after_expiry (bool): Allow renewals for expired certificates
+                generated by this provisioner.
+            ssh (bool): Enable provisioning of ssh certificates.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+            ca_config (StepValue): The certificate authority configuration file.
+        """
+        return self._call(
+            _CA_PROVISIONER_ADD,
+            (name,),
+            (
+                type,
+                public_key,
+                create,
+                private_key,
+                client_id,
+                client_secret,
+                listen_address,
+                configuration_endpoint,
+                admin,
+                domain,
+                group,
+                tenant_id,
+                x5c_roots,
+                nebula_root,
+                require_eab,
+                force_cn,
+                challenge,
+                attestation_format,
+                attestation_roots,
+                capabilities,
+                include_root,
+                min_public_key_length,
+                encryption_algorithm_identifier,
+                aws_account,
+                azure_tenant,
+                azure_resource_group,
+                azure_audience,
+                azure_subscription_id,
+                azure_object_id,
+                gcp_service_account,
+                gcp_project,
+                instance_age,
+                disable_custom_sans,
+                disable_trust_on_first_use,
+                x509_template,
+                x509_template_data,
+                ssh_template,
+                ssh_template_data,
+                x509_min_dur,
+                x509_max_dur,
+                x509_default_dur,
+                ssh_user_min_dur,
+                ssh_user_max_dur,
+                ssh_user_default_dur,
+                ssh_host_min_dur,
+                ssh_host_max_dur,
+                ssh_host_default_dur,
+                disable_renewal,
+                allow_renewal_after_expiry,
+                ssh,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                password_file,
+                ca_url,
+                root,
+                context,
+                ca_config,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def update(
+        self,
+        *,
+        name: StepValue | None = None,
+        public_key: StepValue | None = None,
+        create: bool = False,
+        private_key: StepValue | None = None,
+        client_id: StepValue | None = None,
+        client_secret: StepValue | None = None,
+        listen_address: StepValue | None = None,
+        configuration_endpoint: StepValue | None = None,
+        admin: StepValue | None = None,
+        remove_admin: StepValue | None = None,
+        domain: StepValue | None = None,
+        remove_domain: StepValue | None = None,
+        group: StepValue | None = None,
+        tenant_id: StepValue | None = None,
+        x5c_roots: StepValue | None = None,
+        nebula_root: StepValue | None = None,
+        require_eab: bool = False,
+        force_cn: bool = False,
+        challenge: StepValue | None = None,
+        remove_challenge: StepValue | None = None,
+        attestation_format: StepValue | None = None,
+        remove_attestation_format: StepValue | None = None,
+        attestation_roots: StepValue | None = None,
+        capabilities: StepValue | None = None,
+        include_root: bool = False,
+        min_public_key_length: StepValue | None = None,
+        encryption_algorithm_identifier: StepValue | None = None,
+        aws_account: StepValue | None = None,
+        remove_aws_account: StepValue | None = None,
+        azure_tenant: StepValue | None = None,
+        azure_resource_group: StepValue | None = None,
+        remove_azure_resource_group: StepValue | None = None,
+        azure_audience: StepValue | None = None,
+        azure_subscription_id: StepValue | None = None,
+        remove_azure_subscription_id: StepValue | None = None,
+        azure_object_id: StepValue | None = None,
+        remove_azure_object_id: StepValue | None = None,
+        gcp_service_account: StepValue | None = None,
+        remove_gcp_service_account: StepValue | None = None,
+        gcp_project: StepValue | None = None,
+        remove_gcp_project: StepValue | None = None,
+        instance_age: StepValue | None = None,
+        disable_custom_sans: bool = False,
+        disable_trust_on_first_use: bool = False,
+        x509_template: StepValue | None = None,
+        x509_template_data: StepValue | None = None,
+        ssh_template: StepValue | None = None,
+        ssh_template_data: StepValue | None = None,
+        x509_min_dur: StepValue | None = None,
+        x509_max_dur: StepValue | None = None,
+        x509_default_dur: StepValue | None = None,
+        ssh_user_min_dur: StepValue | None = None,
+        ssh_user_max_dur: StepValue | None = None,
+        ssh_user_default_dur: StepValue | None = None,
+        ssh_host_min_dur: StepValue | None = None,
+        ssh_host_max_dur: StepValue | None = None,
+        ssh_host_default_dur: StepValue | None = None,
+        disable_renewal: bool = False,
+        allow_renewal_after_expiry: bool = False,
+        ssh: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Update a provisioner.
+
+        Args:
+            name (StepValue): The new name for the provisioner.
+            public_key (StepValue): The file containing the JWK public key.
+            create (bool): Create the JWK key pair for the provisioner.
+            private_key (StepValue): The file containing the JWK private key.
+            client_id (StepValue): The id used to validate the audience in an OpenID
+                Connect token.
+            client_secret (StepValue): The secret used to obtain the OpenID Connect
+                tokens.
+            listen_address (StepValue): The callback address used in the OpenID Connect
+                flow (e.g.
+            configuration_endpoint (StepValue): OpenID Connect configuration url.
+            admin (StepValue): The email of an admin user in an OpenID Connect
+                provisioner, this user will not have restrictions in the certificates to
+                sign.
+            remove_admin (StepValue): Remove the email of an admin user in an OpenID
+                Connect provisioner, this user will not have restrictions in the
+                certificates to sign.
+            domain (StepValue): The domain used to validate the email claim in an OpenID
+                Connect provisioner.
+            remove_domain (StepValue): Remove the domain used to validate the email
+                claim in an OpenID Connect provisioner.
+            group (StepValue): The group list used to validate the groups extension in
+                an OpenID Connect token.
+            tenant_id (StepValue): The tenant-id used to replace the templatized
+                tenantid value in the OpenID Configuration.
+            x5c_roots (StepValue): PEM-formatted root certificate(s) file used to
+                validate the signature on X5C provisioning tokens.
+            nebula_root (StepValue): Root certificate (chain) file used to validate the
+                signature on Nebula provisioning tokens.
+            require_eab (bool): Require (and enable) External Account Binding (EAB) for
+                Account creation.
+            force_cn (bool): Always set the common name in provisioned certificates.
+            challenge (StepValue): With a SCEP provisioner the challenge is a shared
+                secret between a client and the CA.
+            remove_challenge (StepValue): Remove an ACME challenge from the list
+                configured in the provisioner.
+            attestation_format (StepValue): Enable an ACME attestation statement format
+                in the provisioner.
+            remove_attestation_format (StepValue): Remove an ACME attestation statement
+                format from the list configured in the provisioner.
+            attestation_roots (StepValue): PEM-formatted root certificate(s) file used
+                to validate the attestation certificates.
+            capabilities (StepValue): The SCEP capabilities to advertise
+            include_root (bool): Include the CA root certificate in the SCEP CA
+                certificate chain
+            min_public_key_length (StepValue): The minimum public key length of the SCEP
+                RSA encryption key
+            encryption_algorithm_identifier (StepValue): The id for the SCEP encryption
+                algorithm to use.
+            aws_account (StepValue): The AWS account id used to validate the identity
+                documents.
+            remove_aws_account (StepValue): Remove an AWS account id used to validate
+                the identity documents.
+            azure_tenant (StepValue): The Microsoft Azure tenant id used to validate the
+                identity tokens.
+            azure_resource_group (StepValue): The Microsoft Azure resource group name
+                used to validate the identity tokens.
+            remove_azure_resource_group (StepValue): Remove a Microsoft Azure resource
+                group name used to validate the identity tokens.
+            azure_audience (StepValue): The Microsoft Azure audience name used to
+                validate the identity tokens.
+            azure_subscription_id (StepValue): The Microsoft Azure subscription id used
+                to validate the identity tokens.
+            remove_azure_subscription_id (StepValue): Remove a Microsoft Azure
+                subscription id used to validate the identity tokens.
+            azure_object_id (StepValue): The Microsoft Azure AD object id used to
+                validate the identity tokens.
+            remove_azure_object_id (StepValue): Remove a Microsoft Azure AD object id
+                used to validate the identity tokens.
+            gcp_service_account (StepValue): The Google service account email or id used
+                to validate the identity tokens.
+            remove_gcp_service_account (StepValue): Remove a Google service account
+                email or id used to validate the identity tokens.
+            gcp_project (StepValue): The Google project id used to validate the identity
+                tokens.
+            remove_gcp_project (StepValue): Remove a Google project id used to validate
+                the identity tokens.
+            instance_age (StepValue): The maximum duration to grant a certificate in AWS
+                and GCP provisioners.
+            disable_custom_sans (bool): On cloud provisioners, if enabled only the
+                internal DNS and IP will be added as a SAN.
+            disable_trust_on_first_use (bool): On cloud provisioners, if enabled
+                multiple sign request for this provisioner with the same instance will
+                be accepted.
+            x509_template (StepValue): The x509 certificate template file, a JSON
+                representation of the certificate to create.
+            x509_template_data (StepValue): The x509 certificate template data file, a
+                JSON map of data that can be used by the certificate template.
+            ssh_template (StepValue): The x509 certificate template file, a JSON
+                representation of the certificate to create.
+            ssh_template_data (StepValue): The ssh certificate template data file, a
+                JSON map of data that can be used by the certificate template.
+            x509_min_dur (StepValue): The minimum duration for an x509 certificate
+                generated by this provisioner.
+            x509_max_dur (StepValue): The maximum duration for an x509 certificate
+                generated by this provisioner.
+            x509_default_dur (StepValue): The default duration for an x509 certificate
+                generated by this provisioner.
+            ssh_user_min_dur (StepValue): The minimum duration for an ssh user
+                certificate generated by this provisioner.
+            ssh_user_max_dur (StepValue): The maximum duration for an ssh user
+                certificate generated by this provisioner.
+            ssh_user_default_dur (StepValue): The maximum duration for an ssh user
+                certificate generated by this provisioner.
+            ssh_host_min_dur (StepValue): The minimum duration for an ssh host
+                certificate generated by this provisioner.
+            ssh_host_max_dur (StepValue): The maximum duration for an ssh host
+                certificate generated by this provisioner.
+            ssh_host_default_dur (StepValue): The maximum duration for an ssh host
+                certificate generated by this provisioner.
+            disable_renewal (bool): Disable renewal for all certificates generated by
+                this provisioner.
+            allow_renewal_after_expiry (bool): Allow renewals for expired certificates
+                generated by this provisioner.
+            ssh (bool): Enable provisioning of ssh certificates.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+            ca_config (StepValue): The certificate authority configuration file.
+        """
+        return self._call(
+            _CA_PROVISIONER_UPDATE,
+            (),
+            (
+                name,
+                public_key,
+                create,
+                private_key,
+                client_id,
+                client_secret,
+                listen_address,
+                configuration_endpoint,
+                admin,
+                remove_admin,
+                domain,
+                remove_domain,
+                group,
+                tenant_id,
+                x5c_roots,
+                nebula_root,
+                require_eab,
+                force_cn,
+                challenge,
+                remove_challenge,
+                attestation_format,
+                remove_attestation_format,
+                attestation_roots,
+                capabilities,
+                include_root,
+                min_public_key_length,
+                encryption_algorithm_identifier,
+                aws_account,
+                remove_aws_account,
+                azure_tenant,
+                azure_resource_group,
+                remove_azure_resource_group,
+                azure_audience,
+                azure_subscription_id,
+                remove_azure_subscription_id,
+                azure_object_id,
+                remove_azure_object_id,
+                gcp_service_account,
+                remove_gcp_service_account,
+                gcp_project,
+                remove_gcp_project,
+                instance_age,
+                disable_custom_sans,
+                disable_trust_on_first_use,
+                x509_template,
+                x509_template_data,
+                ssh_template,
+                ssh_template_data,
+                x509_min_dur,
+                x509_max_dur,
+                x509_default_dur,
+                ssh_user_min_dur,
+                ssh_user_max_dur,
+                ssh_user_default_dur,
+                ssh_host_min_dur,
+                ssh_host_max_dur,
+                ssh_host_default_dur,
+                disable_renewal,
+                allow_renewal_after_expiry,
+                ssh,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                password_file,
+                ca_url,
+                root,
+                context,
+                ca_config,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        *,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove a provisioner from the CA configuration.
+
+        Args:
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+            ca_config (StepValue): The certificate authority configuration file.
+        """
+        return self._call(
+            _CA_PROVISIONER_REMOVE,
+            (),
+            (
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+                ca_config,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def webhook(self) -> _CaProvisionerWebhook:
+        """Create and manage webhooks for a provisioner."""
+        return _CaProvisionerWebhook(self._cli)
+
+
+_CA_SIGN = StepCommandSpec(
+    ("step", "ca", "sign"),
+    (
+        "token",
+        "provisioner",
+        "provisioner-password-file",
+        "not-before",
+        "not-after",
+        "set",
+        "set-file",
+        "force",
+        "offline",
+        "password-file",
+        "console",
+        "kms",
+        "x5c-cert",
+        "x5c-key",
+        "x5c-chain",
+        "nebula-cert",
+        "nebula-key",
+        "acme",
+        "standalone",
+        "webroot",
+        "contact",
+        "http-listen",
+        "k8ssa-token-path",
+        "ca-config",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_ROOT = StepCommandSpec(
+    ("step", "ca", "root"),
+    ("force", "fingerprint", "ca-url", "context"),
+)
+
+
+_CA_ROOTS = StepCommandSpec(
+    ("step", "ca", "roots"),
+    ("ca-url", "force", "root", "context"),
+)
+
+
+_CA_FEDERATION = StepCommandSpec(
+    ("step", "ca", "federation"),
+    ("ca-url", "force", "root", "context"),
+)
+
+
+_CA_ACME_EAB_LIST = StepCommandSpec(
+    ("step", "ca", "acme", "eab", "list"),
+    (
+        "limit",
+        "no-pager",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_ACME_EAB_ADD = StepCommandSpec(
+    ("step", "ca", "acme", "eab", "add"),
+    (
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_ACME_EAB_REMOVE = StepCommandSpec(
+    ("step", "ca", "acme", "eab", "remove"),
+    (
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaAcmeEab(StepCommandGroup):
+    """The commands of `step ca acme eab`: create and manage ACME External Account
+    Binding Keys.
+    """
+
+    __slots__ = ()
+
+    def list(
+        self,
+        provisioner: str | None = None,
+        eab_key_reference: str | None = None,
+        /,
+        *,
+        limit: StepValue | None = None,
+        no_pager: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """List all ACME External Account Binding Keys.
+
+        Args:
+            provisioner (str): Name of the provisioner to list ACME EAB keys for
+            eab_key_reference (str): (Optional) reference (from external system) for the
+                key to be listed
+            limit (StepValue): The number of entities to return per (paging) API
+                request.
+            no_pager (bool): Disables usage of $PAGER for paging purposes
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ACME_EAB_LIST,
+            (provisioner, eab_key_reference),
+            (
+                limit,
+                no_pager,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def add(
+        self,
+        provisioner: str | None = None,
+        eab_key_reference: str | None = None,
+        /,
+        *,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add ACME External Account Binding Key.
+
+        Args:
+            provisioner (str): Name of the provisioner to which the ACME EAB key will be
+                added
+            eab_key_reference (str): (Optional) reference (from external system) for the
+                key that will be added
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ACME_EAB_ADD,
+            (provisioner, eab_key_reference),
+            (
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        provisioner: str | None = None,
+        eab_key_id: str | None = None,
+        /,
+        *,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove an ACME EAB Key from the CA.
+
+        Args:
+            provisioner (str): Name of the provisioner to remove an ACME EAB key for
+            eab_key_id (str): The ACME EAB Key ID to remove
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ACME_EAB_REMOVE,
+            (provisioner, eab_key_id),
+            (
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaAcme(StepCommandGroup):
+    """The commands of `step ca acme`: manage ACME settings."""
+
+    __slots__ = ()
+
+    @property
+    def eab(self) -> _CaAcmeEab:
+        """Create and manage ACME External Account Binding Keys."""
+        return _CaAcmeEab(self._cli)
+
+
+_CA_POLICY_AUTHORITY_VIEW = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "view"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_REMOVE = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "remove"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_ALLOW_CN = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "allow", "cn"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_ALLOW_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "allow", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_ALLOW_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "allow", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_ALLOW_IP = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "allow", "ip"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_ALLOW_URI = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "allow", "uri"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAuthorityX509Allow(StepCommandGroup):
+    """The commands of `step ca policy authority x509 allow`: manage allowed names
+    for X.509 certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def cn(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove common names.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided Common Names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_ALLOW_CN,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_ALLOW_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_ALLOW_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def ip(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove ip addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided IPs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_ALLOW_IP,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def uri(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove URI domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided URIs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_ALLOW_URI,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_AUTHORITY_X509_DENY_CN = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "deny", "cn"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_DENY_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "deny", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_DENY_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "deny", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_DENY_IP = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "deny", "ip"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_DENY_URI = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "deny", "uri"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAuthorityX509Deny(StepCommandGroup):
+    """The commands of `step ca policy authority x509 deny`: manage denied names for
+    X.509 certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def cn(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove common names.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided Common Names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_DENY_CN,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_DENY_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_DENY_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def ip(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove ip addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided IPs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_DENY_IP,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def uri(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove URI domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided URIs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_DENY_URI,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_AUTHORITY_X509_WILDCARDS_ALLOW = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "wildcards", "allow"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_X509_WILDCARDS_DENY = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "x509", "wildcards", "deny"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAuthorityX509Wildcards(StepCommandGroup):
+    """The commands of `step ca policy authority x509 wildcards`: manage wildcard
+    name settings for X.509 certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def allow(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Allow wildcard names in X.509 certificate issuance policies.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_WILDCARDS_ALLOW,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def deny(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Deny wildcard names in X.509 certificate issuance policies.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_X509_WILDCARDS_DENY,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaPolicyAuthorityX509(StepCommandGroup):
+    """The commands of `step ca policy authority x509`: manage X.509 certificate
+    issuance policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def allow(self) -> _CaPolicyAuthorityX509Allow:
+        """Manage allowed names for X.509 certificate issuance policies."""
+        return _CaPolicyAuthorityX509Allow(self._cli)
+
+    @property
+    def deny(self) -> _CaPolicyAuthorityX509Deny:
+        """Manage denied names for X.509 certificate issuance policies."""
+        return _CaPolicyAuthorityX509Deny(self._cli)
+
+    @property
+    def wildcards(self) -> _CaPolicyAuthorityX509Wildcards:
+        """Manage wildcard name settings for X.509 certificate issuance policies."""
+        return _CaPolicyAuthorityX509Wildcards(self._cli)
+
+
+_CA_POLICY_AUTHORITY_SSH_HOST_ALLOW_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "host", "allow", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_SSH_HOST_ALLOW_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "host", "allow", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_SSH_HOST_ALLOW_PRINCIPAL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "host", "allow", "principal"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAuthoritySshHostAllow(StepCommandGroup):
+    """The commands of `step ca policy authority ssh host allow`: manage allowed SSH
+    host certificate principals.
+    """
+
+    __slots__ = ()
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_HOST_ALLOW_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_HOST_ALLOW_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def principal(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove principals.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided Principals from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_HOST_ALLOW_PRINCIPAL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_AUTHORITY_SSH_HOST_DENY_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "host", "deny", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_SSH_HOST_DENY_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "host", "deny", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_SSH_HOST_DENY_PRINCIPAL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "host", "deny", "principal"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAuthoritySshHostDeny(StepCommandGroup):
+    """The commands of `step ca policy authority ssh host deny`: manage denied dSSH
+    host certificate principals.
+    """
+
+    __slots__ = ()
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_HOST_DENY_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_HOST_DENY_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def principal(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove principals.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided Principals from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_HOST_DENY_PRINCIPAL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaPolicyAuthoritySshHost(StepCommandGroup):
+    """The commands of `step ca policy authority ssh host`: manage SSH host
+    certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def allow(self) -> _CaPolicyAuthoritySshHostAllow:
+        """Manage allowed SSH host certificate principals."""
+        return _CaPolicyAuthoritySshHostAllow(self._cli)
+
+    @property
+    def deny(self) -> _CaPolicyAuthoritySshHostDeny:
+        """Manage denied dSSH host certificate principals."""
+        return _CaPolicyAuthoritySshHostDeny(self._cli)
+
+
+_CA_POLICY_AUTHORITY_SSH_USER_ALLOW_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "user", "allow", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_SSH_USER_ALLOW_PRINCIPAL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "user", "allow", "principal"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAuthoritySshUserAllow(StepCommandGroup):
+    """The commands of `step ca policy authority ssh user allow`: manage allowed SSH
+    user certificate principals.
+    """
+
+    __slots__ = ()
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_USER_ALLOW_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def principal(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove principals.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided Principals from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_USER_ALLOW_PRINCIPAL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_AUTHORITY_SSH_USER_DENY_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "user", "deny", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_AUTHORITY_SSH_USER_DENY_PRINCIPAL = StepCommandSpec(
+    ("step", "ca", "policy", "authority", "ssh", "user", "deny", "principal"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAuthoritySshUserDeny(StepCommandGroup):
+    """The commands of `step ca policy authority ssh user deny`: manage denied SSH
+    user certificate principals.
+    """
+
+    __slots__ = ()
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_USER_DENY_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def principal(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove principals.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided Principals from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_SSH_USER_DENY_PRINCIPAL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaPolicyAuthoritySshUser(StepCommandGroup):
+    """The commands of `step ca policy authority ssh user`: manage SSH user
+    certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def allow(self) -> _CaPolicyAuthoritySshUserAllow:
+        """Manage allowed SSH user certificate principals."""
+        return _CaPolicyAuthoritySshUserAllow(self._cli)
+
+    @property
+    def deny(self) -> _CaPolicyAuthoritySshUserDeny:
+        """Manage denied SSH user certificate principals."""
+        return _CaPolicyAuthoritySshUserDeny(self._cli)
+
+
+class _CaPolicyAuthoritySsh(StepCommandGroup):
+    """The commands of `step ca policy authority ssh`: manage SSH certificate
+    issuance policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def host(self) -> _CaPolicyAuthoritySshHost:
+        """Manage SSH host certificate issuance policies."""
+        return _CaPolicyAuthoritySshHost(self._cli)
+
+    @property
+    def user(self) -> _CaPolicyAuthoritySshUser:
+        """Manage SSH user certificate issuance policies."""
+        return _CaPolicyAuthoritySshUser(self._cli)
+
+
+class _CaPolicyAuthority(StepCommandGroup):
+    """The commands of `step ca policy authority`: manage certificate issuance
+    policies for authorities.
+    """
+
+    __slots__ = ()
+
+    def view(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """View current certificate issuance policy.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_VIEW,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove certificate issuance policy.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_AUTHORITY_REMOVE,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def x509(self) -> _CaPolicyAuthorityX509:
+        """Manage X.509 certificate issuance policies."""
+        return _CaPolicyAuthorityX509(self._cli)
+
+    @property
+    def ssh(self) -> _CaPolicyAuthoritySsh:
+        """Manage SSH certificate issuance policies."""
+        return _CaPolicyAuthoritySsh(self._cli)
+
+
+_CA_POLICY_PROVISIONER_VIEW = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "view"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_REMOVE = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "remove"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_ALLOW_CN = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "allow", "cn"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_ALLOW_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "allow", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_ALLOW_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "allow", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_ALLOW_IP = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "allow", "ip"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_ALLOW_URI = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "allow", "uri"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyProvisionerX509Allow(StepCommandGroup):
+    """The commands of `step ca policy provisioner x509 allow`: manage allowed names
+    for X.509 certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def cn(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove common names.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided Common Names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_ALLOW_CN,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_ALLOW_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_ALLOW_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def ip(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove ip addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided IPs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_ALLOW_IP,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def uri(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove URI domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided URIs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_ALLOW_URI,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_PROVISIONER_X509_DENY_CN = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "deny", "cn"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_DENY_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "deny", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_DENY_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "deny", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_DENY_IP = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "deny", "ip"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_DENY_URI = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "deny", "uri"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyProvisionerX509Deny(StepCommandGroup):
+    """The commands of `step ca policy provisioner x509 deny`: manage denied names
+    for X.509 certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def cn(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove common names.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided Common Names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_DENY_CN,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_DENY_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_DENY_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def ip(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove ip addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided IPs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_DENY_IP,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def uri(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove URI domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided URIs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_DENY_URI,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_PROVISIONER_X509_WILDCARDS_ALLOW = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "wildcards", "allow"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_X509_WILDCARDS_DENY = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "x509", "wildcards", "deny"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyProvisionerX509Wildcards(StepCommandGroup):
+    """The commands of `step ca policy provisioner x509 wildcards`: manage wildcard
+    name settings for X.509 certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def allow(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Allow wildcard names in X.509 certificate issuance policies.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_WILDCARDS_ALLOW,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def deny(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Deny wildcard names in X.509 certificate issuance policies.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_X509_WILDCARDS_DENY,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaPolicyProvisionerX509(StepCommandGroup):
+    """The commands of `step ca policy provisioner x509`: manage X.509 certificate
+    issuance policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def allow(self) -> _CaPolicyProvisionerX509Allow:
+        """Manage allowed names for X.509 certificate issuance policies."""
+        return _CaPolicyProvisionerX509Allow(self._cli)
+
+    @property
+    def deny(self) -> _CaPolicyProvisionerX509Deny:
+        """Manage denied names for X.509 certificate issuance policies."""
+        return _CaPolicyProvisionerX509Deny(self._cli)
+
+    @property
+    def wildcards(self) -> _CaPolicyProvisionerX509Wildcards:
+        """Manage wildcard name settings for X.509 certificate issuance policies."""
+        return _CaPolicyProvisionerX509Wildcards(self._cli)
+
+
+_CA_POLICY_PROVISIONER_SSH_HOST_ALLOW_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "host", "allow", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_SSH_HOST_ALLOW_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "host", "allow", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_SSH_HOST_ALLOW_PRINCIPAL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "host", "allow", "principal"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyProvisionerSshHostAllow(StepCommandGroup):
+    """The commands of `step ca policy provisioner ssh host allow`: manage allowed
+    SSH host certificate principals.
+    """
+
+    __slots__ = ()
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_HOST_ALLOW_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_HOST_ALLOW_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def principal(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove principals.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided Principals from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_HOST_ALLOW_PRINCIPAL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_PROVISIONER_SSH_HOST_DENY_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "host", "deny", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_SSH_HOST_DENY_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "host", "deny", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_SSH_HOST_DENY_PRINCIPAL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "host", "deny", "principal"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyProvisionerSshHostDeny(StepCommandGroup):
+    """The commands of `step ca policy provisioner ssh host deny`: manage denied dSSH
+    host certificate principals.
+    """
+
+    __slots__ = ()
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_HOST_DENY_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_HOST_DENY_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def principal(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove principals.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided Principals from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_HOST_DENY_PRINCIPAL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaPolicyProvisionerSshHost(StepCommandGroup):
+    """The commands of `step ca policy provisioner ssh host`: manage SSH host
+    certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def allow(self) -> _CaPolicyProvisionerSshHostAllow:
+        """Manage allowed SSH host certificate principals."""
+        return _CaPolicyProvisionerSshHostAllow(self._cli)
+
+    @property
+    def deny(self) -> _CaPolicyProvisionerSshHostDeny:
+        """Manage denied dSSH host certificate principals."""
+        return _CaPolicyProvisionerSshHostDeny(self._cli)
+
+
+_CA_POLICY_PROVISIONER_SSH_USER_ALLOW_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "user", "allow", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_SSH_USER_ALLOW_PRINCIPAL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "user", "allow", "principal"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyProvisionerSshUserAllow(StepCommandGroup):
+    """The commands of `step ca policy provisioner ssh user allow`: manage allowed
+    SSH user certificate principals.
+    """
+
+    __slots__ = ()
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_USER_ALLOW_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def principal(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove principals.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided Principals from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_USER_ALLOW_PRINCIPAL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_PROVISIONER_SSH_USER_DENY_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "user", "deny", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_PROVISIONER_SSH_USER_DENY_PRINCIPAL = StepCommandSpec(
+    ("step", "ca", "policy", "provisioner", "ssh", "user", "deny", "principal"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyProvisionerSshUserDeny(StepCommandGroup):
+    """The commands of `step ca policy provisioner ssh user deny`: manage denied SSH
+    user certificate principals.
+    """
+
+    __slots__ = ()
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_USER_DENY_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def principal(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove principals.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided Principals from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_SSH_USER_DENY_PRINCIPAL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaPolicyProvisionerSshUser(StepCommandGroup):
+    """The commands of `step ca policy provisioner ssh user`: manage SSH user
+    certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def allow(self) -> _CaPolicyProvisionerSshUserAllow:
+        """Manage allowed SSH user certificate principals."""
+        return _CaPolicyProvisionerSshUserAllow(self._cli)
+
+    @property
+    def deny(self) -> _CaPolicyProvisionerSshUserDeny:
+        """Manage denied SSH user certificate principals."""
+        return _CaPolicyProvisionerSshUserDeny(self._cli)
+
+
+class _CaPolicyProvisionerSsh(StepCommandGroup):
+    """The commands of `step ca policy provisioner ssh`: manage SSH certificate
+    issuance policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def host(self) -> _CaPolicyProvisionerSshHost:
+        """Manage SSH host certificate issuance policies."""
+        return _CaPolicyProvisionerSshHost(self._cli)
+
+    @property
+    def user(self) -> _CaPolicyProvisionerSshUser:
+        """Manage SSH user certificate issuance policies."""
+        return _CaPolicyProvisionerSshUser(self._cli)
+
+
+class _CaPolicyProvisioner(StepCommandGroup):
+    """The commands of `step ca policy provisioner`: manage certificate issuance
+    policies for provisioners.
+    """
+
+    __slots__ = ()
+
+    def view(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """View current certificate issuance policy.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_VIEW,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove certificate issuance policy.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_PROVISIONER_REMOVE,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def x509(self) -> _CaPolicyProvisionerX509:
+        """Manage X.509 certificate issuance policies."""
+        return _CaPolicyProvisionerX509(self._cli)
+
+    @property
+    def ssh(self) -> _CaPolicyProvisionerSsh:
+        """Manage SSH certificate issuance policies."""
+        return _CaPolicyProvisionerSsh(self._cli)
+
+
+_CA_POLICY_ACME_VIEW = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "view"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_REMOVE = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "remove"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_ALLOW_CN = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "allow", "cn"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_ALLOW_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "allow", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_ALLOW_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "allow", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_ALLOW_IP = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "allow", "ip"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_ALLOW_URI = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "allow", "uri"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAcmeX509Allow(StepCommandGroup):
+    """The commands of `step ca policy acme x509 allow`: manage allowed names for
+    X.509 certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def cn(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove common names.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided Common Names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_ALLOW_CN,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_ALLOW_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_ALLOW_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def ip(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove ip addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided IPs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_ALLOW_IP,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def uri(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove URI domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided URIs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_ALLOW_URI,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_ACME_X509_DENY_CN = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "deny", "cn"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_DENY_DNS = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "deny", "dns"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_DENY_EMAIL = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "deny", "email"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_DENY_IP = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "deny", "ip"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_DENY_URI = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "deny", "uri"),
+    (
+        "provisioner",
+        "remove",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAcmeX509Deny(StepCommandGroup):
+    """The commands of `step ca policy acme x509 deny`: manage denied names for X.509
+    certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def cn(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove common names.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided Common Names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_DENY_CN,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def dns(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove DNS domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided DNS names from the policy instead of
+                adding them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_DENY_DNS,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def email(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove email addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided emails from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_DENY_EMAIL,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def ip(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove ip addresses.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            remove (bool): Removes the provided IPs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_DENY_IP,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def uri(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        remove: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add or remove URI domains.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            remove (bool): Removes the provided URIs from the policy instead of adding
+                them
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_DENY_URI,
+            (),
+            (
+                provisioner,
+                remove,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CA_POLICY_ACME_X509_WILDCARDS_ALLOW = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "wildcards", "allow"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_POLICY_ACME_X509_WILDCARDS_DENY = StepCommandSpec(
+    ("step", "ca", "policy", "acme", "x509", "wildcards", "deny"),
+    (
+        "provisioner",
+        "eab-key-id",
+        "eab-key-reference",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaPolicyAcmeX509Wildcards(StepCommandGroup):
+    """The commands of `step ca policy acme x509 wildcards`: manage wildcard name
+    settings for X.509 certificate issuance policies.
+    """
+
+    __slots__ = ()
+
+    def allow(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Allow wildcard names in X.509 certificate issuance policies.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_WILDCARDS_ALLOW,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def deny(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Deny wildcard names in X.509 certificate issuance policies.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_X509_WILDCARDS_DENY,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CaPolicyAcmeX509(StepCommandGroup):
+    """The commands of `step ca policy acme x509`: manage X.509 certificate issuance
+    policies.
+    """
+
+    __slots__ = ()
+
+    @property
+    def allow(self) -> _CaPolicyAcmeX509Allow:
+        """Manage allowed names for X.509 certificate issuance policies."""
+        return _CaPolicyAcmeX509Allow(self._cli)
+
+    @property
+    def deny(self) -> _CaPolicyAcmeX509Deny:
+        """Manage denied names for X.509 certificate issuance policies."""
+        return _CaPolicyAcmeX509Deny(self._cli)
+
+    @property
+    def wildcards(self) -> _CaPolicyAcmeX509Wildcards:
+        """Manage wildcard name settings for X.509 certificate issuance policies."""
+        return _CaPolicyAcmeX509Wildcards(self._cli)
+
+
+class _CaPolicyAcme(StepCommandGroup):
+    """The commands of `step ca policy acme`: manage certificate issuance policies
+    for ACME accounts.
+    """
+
+    __slots__ = ()
+
+    def view(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """View current certificate issuance policy.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_VIEW,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        *,
+        provisioner: StepValue | None = None,
+        eab_key_id: StepValue | None = None,
+        eab_key_reference: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove certificate issuance policy.
+
+        Args:
+            provisioner (StepValue): The provisioner name
+            eab_key_id (StepValue): An ACME EAB Key ID.
+            eab_key_reference (StepValue): An ACME EAB Key Reference.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_POLICY_ACME_REMOVE,
+            (),
+            (
+                provisioner,
+                eab_key_id,
+                eab_key_reference,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def x509(self) -> _CaPolicyAcmeX509:
+        """Manage X.509 certificate issuance policies."""
+        return _CaPolicyAcmeX509(self._cli)
+
+
+class _CaPolicy(StepCommandGroup):
+    """The commands of `step ca policy`: manage certificate issuance policies."""
+
+    __slots__ = ()
+
+    @property
+    def authority(self) -> _CaPolicyAuthority:
+        """Manage certificate issuance policies for authorities."""
+        return _CaPolicyAuthority(self._cli)
+
+    @property
+    def provisioner(self) -> _CaPolicyProvisioner:
+        """Manage certificate issuance policies for provisioners."""
+        return _CaPolicyProvisioner(self._cli)
+
+    @property
+    def acme(self) -> _CaPolicyAcme:
+        """Manage certificate issuance policies for ACME accounts."""
+        return _CaPolicyAcme(self._cli)
+
+
+_CA_ADMIN_LIST = StepCommandSpec(
+    ("step", "ca", "admin", "list"),
+    (
+        "super",
+        "provisioner",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_ADMIN_ADD = StepCommandSpec(
+    ("step", "ca", "admin", "add"),
+    (
+        "super",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_ADMIN_REMOVE = StepCommandSpec(
+    ("step", "ca", "admin", "remove"),
+    (
+        "provisioner",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_CA_ADMIN_UPDATE = StepCommandSpec(
+    ("step", "ca", "admin", "update"),
+    (
+        "super",
+        "provisioner",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _CaAdmin(StepCommandGroup):
+    """The commands of `step ca admin`: create and manage the certificate authority
+    admins.
+    """
+
+    __slots__ = ()
+
+    def list(
+        self,
+        *,
+        super: bool = False,
+        provisioner: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """List all admins in the CA configuration.
+
+        Args:
+            super (bool): Only return super-admins.
+            provisioner (StepValue): The provisioner name by which to filter admins.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ADMIN_LIST,
+            (),
+            (
+                super,
+                provisioner,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def add(
+        self,
+        subject: str | None = None,
+        provisioner: str | None = None,
+        /,
+        *,
+        super: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add an admin to the CA configuration.
+
+        Args:
+            subject (str): The subject name that must appear in the identifying
+                credential of the admin.
+            provisioner (str): The name of the provisioner
+            super (bool): Give administrator SuperAdmin privileges.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ADMIN_ADD,
+            (subject, provisioner),
+            (
+                super,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        name: str | None = None,
+        /,
+        *,
+        provisioner: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove an admin from the CA configuration.
+
+        Args:
+            name (str): The name of the admin to be removed.
+            provisioner (StepValue): The provisioner name by which to filter admins.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ADMIN_REMOVE,
+            (name,),
+            (
+                provisioner,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def update(
+        self,
+        id: str | None = None,
+        /,
+        *,
+        super: bool = False,
+        provisioner: StepValue | None = None,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Update an admin.
+
+        Args:
+            id (str): The name of the admin to update.
+            super (bool): Update the admin with super-admin privileges.
+            provisioner (StepValue): The provisioner name by which to filter admins.
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ADMIN_UPDATE,
+            (id,),
+            (
+                super,
+                provisioner,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _Ca(StepCommandGroup):
+    """The commands of `step ca`: initialize and manage a certificate authority."""
+
+    __slots__ = ()
+
+    def health(
+        self,
+        *,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Get the status of the CA.
+
+        Args:
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_HEALTH,
+            (),
+            (ca_url, root, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def init(
+        self,
+        *,
+        root: StepValue | None = None,
+        key: StepValue | None = None,
+        pki: bool = False,
+        ssh: bool = False,
+        helm: bool = False,
+        deployment_type: StepValue | None = None,
+        name: StepValue | None = None,
+        dns: StepValue | None = None,
+        address: StepValue | None = None,
+        provisioner: StepValue | None = None,
+        password_file: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        with_ca_url: StepValue | None = None,
+        ra: StepValue | None = None,
+        kms: StepValue | None = None,
+        kms_root: StepValue | None = None,
+        kms_intermediate: StepValue | None = None,
+        kms_ssh_host: StepValue | None = None,
+        kms_ssh_user: StepValue | None = None,
+        issuer: StepValue | None = None,
+        issuer_fingerprint: StepValue | None = None,
+        issuer_provisioner: StepValue | None = None,
+        credentials_file: StepValue | None = None,
+        no_db: bool = False,
+        context: StepValue | None = None,
+        remote_management: bool = False,
+        acme: bool = False,
+        admin_subject: StepValue | None = None,
+        profile: StepValue | None = None,
+        authority: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Initialize the CA PKI.
+
+        Args:
+            root (StepValue): The path of an existing PEM file to be used as the root
+                certificate authority.
+            key (StepValue): The path of an existing key file of the root certificate
+                authority.
+            pki (bool): Generate only the PKI without the CA configuration.
+            ssh (bool): Create keys to sign SSH certificates.
+            helm (bool): Generates a Helm values YAML to be used with step-certificates
+                chart.
+            deployment_type (StepValue): The name of the deployment type to use.
+            name (StepValue): The name of the new PKI.
+            dns (StepValue): The DNS name or IP address of the new CA.
+            address (StepValue): The address that the new CA will listen at.
+            provisioner (StepValue): The name of the first provisioner.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt the keys.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to encrypt the provisioner key.
+            with_ca_url (StepValue): URI of the Step Certificate Authority to write in
+                defaults.json
+            ra (StepValue): The registration authority type to use.
+            kms (StepValue): The key manager service type to use to manage keys.
+            kms_root (StepValue): The kms URI used to generate the root certificate key.
+            kms_intermediate (StepValue): The kms URI used to generate the intermediate
+                certificate key.
+            kms_ssh_host (StepValue): The kms URI used to generate the key used to sign
+                SSH host certificates.
+            kms_ssh_user (StepValue): The kms URI used to generate the key used to sign
+                SSH user certificates.
+            issuer (StepValue): The registration authority issuer url to use.
+            issuer_fingerprint (StepValue): The root certificate fingerprint of the
+                issuer CA.
+            issuer_provisioner (StepValue): The name of an existing provisioner in the
+                issuer CA.
+            credentials_file (StepValue): The registration authority credentials file to
+                use.
+            no_db (bool): Generate a CA configuration without the DB stanza.
+            context (StepValue): The name of the context for the new authority.
+            remote_management (bool): Enable Remote Management.
+            acme (bool): Create a default ACME provisioner.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            profile (StepValue): The name that will serve as the profile name for the
+                context.
+            authority (StepValue): The name that will serve as the authority name for
+                the context.
+        """
+        return self._call(
+            _CA_INIT,
+            (),
+            (
+                root,
+                key,
+                pki,
+                ssh,
+                helm,
+                deployment_type,
+                name,
+                dns,
+                address,
+                provisioner,
+                password_file,
+                provisioner_password_file,
+                with_ca_url,
+                ra,
+                kms,
+                kms_root,
+                kms_intermediate,
+                kms_ssh_host,
+                kms_ssh_user,
+                issuer,
+                issuer_fingerprint,
+                issuer_provisioner,
+                credentials_file,
+                no_db,
+                context,
+                remote_management,
+                acme,
+                admin_subject,
+                profile,
+                authority,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def bootstrap(
+        self,
+        *,
+        ca_url: StepValue | None = None,
+        fingerprint: StepValue | None = None,
+        install: bool = False,
+        team: StepValue | None = None,
+        team_authority: StepValue | None = None,
+        team_url: StepValue | None = None,
+        redirect_url: StepValue | None = None,
+        force: bool = False,
+        context: StepValue | None = None,
+        profile: StepValue | None = None,
+        authority: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Initialize the environment to use the CA commands.
+
+        Args:
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            fingerprint (StepValue): The fingerprint of the targeted root certificate.
+            install (bool): Install the root certificate into the system truststore.
+            team (StepValue): The team ID used to bootstrap the environment.
+            team_authority (StepValue): The sub-domain of the certificate authority to
+                bootstrap.
+            team_url (StepValue): The url step queries to retrieve initial team
+                configuration.
+            redirect_url (StepValue): The url to open in the system browser when the
+                OAuth flow is successful.
+            force (bool): Force the overwrite of files without asking.
+            context (StepValue): The context name to apply for the given command.
+            profile (StepValue): The name that will serve as the profile name for the
+                context.
+            authority (StepValue): The name that will serve as the authority name for
+                the context.
+        """
+        return self._call(
+            _CA_BOOTSTRAP,
+            (),
+            (
+                ca_url,
+                fingerprint,
+                install,
+                team,
+                team_authority,
+                team_url,
+                redirect_url,
+                force,
+                context,
+                profile,
+                authority,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def token(
+        self,
+        subject: str | None = None,
+        /,
+        *,
+        kid: StepValue | None = None,
+        san: StepValue | None = None,
+        principal: StepValue | None = None,
+        host: bool = False,
+        ca_config: StepValue | None = None,
+        force: bool = False,
+        not_after: StepValue | None = None,
+        not_before: StepValue | None = None,
+        cert_not_after: StepValue | None = None,
+        cert_not_before: StepValue | None = None,
+        provisioner: StepValue | None = None,
+        password_file: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        kms: StepValue | None = None,
+        x5c_cert: StepValue | None = None,
+        x5c_key: StepValue | None = None,
+        x5c_insecure: bool = False,
+        sshpop_cert: StepValue | None = None,
+        sshpop_key: StepValue | None = None,
+        nebula_cert: StepValue | None = None,
+        nebula_key: StepValue | None = None,
+        key: StepValue | None = None,
+        output_file: StepValue | None = None,
+        revoke: bool = False,
+        renew: bool = False,
+        rekey: bool = False,
+        ssh: bool = False,
+        k8ssa_token_path: StepValue | None = None,
+        offline: bool = False,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate an OTT granting access to the CA.
+
+        Args:
+            subject (str): The Common Name, DNS Name, or IP address that will be set by
+                the certificate authority.
+            kid (StepValue): The provisioner kid to use.
+            san (StepValue): Add dns|ip|email|uri Subject Alternative Name(s) (SANs)
+                that should be authorized.
+            principal (StepValue): Add the principals (user or host names) that the
+                token is authorized to request.
+            host (bool): Create a host certificate instead of a user certificate.
+            ca_config (StepValue): The certificate authority configuration file.
+            force (bool): Force the overwrite of files without asking.
+            not_after (StepValue): The time|duration when the certificate validity
+                period ends.
+            not_before (StepValue): The time|duration when the certificate validity
+                period starts.
+            cert_not_after (StepValue): The time|duration when the certificate validity
+                period ends.
+            cert_not_before (StepValue): The time|duration when the certificate validity
+                period starts.
+            provisioner (StepValue): The provisioner name to use.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            kms (StepValue): The uri to configure a Cloud KMS or an HSM.
+            x5c_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'x5c' header of a JWT.
+            x5c_key (StepValue): Private key file, used to sign a JWT, corresponding to
+                the certificate that will be stored in the 'x5c' header.
+            x5c_insecure (bool): Use the JWT header 'x5cInsecure' instead of 'x5c'.
+            sshpop_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'sshpop' header of a JWT.
+            sshpop_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the certificate that will be stored in the 'sshpop' header.
+            nebula_cert (StepValue): Certificate file in PEM format to store in the
+                'nebula' header of a JWT.
+            nebula_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the certificate that will be stored in the 'nebula' header.
+            key (StepValue): The private key file used to sign the JWT.
+            output_file (StepValue): The destination file of the generated one-time
+                token.
+            revoke (bool): Create a token for authorizing 'Revoke' requests.
+            renew (bool): Create a token for authorizing 'renew' requests.
+            rekey (bool): Create a token for authorizing 'rekey' requests.
+            ssh (bool): Create a token for authorizing an SSH certificate signing
+                request.
+            k8ssa_token_path (StepValue): Configure the file from which to read the
+                kubernetes service account token.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_TOKEN,
+            (subject,),
+            (
+                kid,
+                san,
+                principal,
+                host,
+                ca_config,
+                force,
+                not_after,
+                not_before,
+                cert_not_after,
+                cert_not_before,
+                provisioner,
+                password_file,
+                provisioner_password_file,
+                kms,
+                x5c_cert,
+                x5c_key,
+                x5c_insecure,
+                sshpop_cert,
+                sshpop_key,
+                nebula_cert,
+                nebula_key,
+                key,
+                output_file,
+                revoke,
+                renew,
+                rekey,
+                ssh,
+                k8ssa_token_path,
+                offline,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def certificate(
+        self,
+        subject: str | None = None,
+        crt_file: str | None = None,
+        key_file: str | None = None,
+        /,
+        *,
+        san: StepValue | None = None,
+        attestation_ca_url: StepValue | None = None,
+        attestation_ca_root: StepValue | None = None,
+        tpm_storage_directory: StepValue | None = None,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        token: StepValue | None = None,
+        context: StepValue | None = None,
+        provisioner: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        kty: StepValue | None = None,
+        curve: StepValue | None = None,
+        size: StepValue | None = None,
+        not_after: StepValue | None = None,
+        not_before: StepValue | None = None,
+        attestation_uri: StepValue | None = None,
+        force: bool = False,
+        offline: bool = False,
+        password_file: StepValue | None = None,
+        console: bool = False,
+        kms: StepValue | None = None,
+        x5c_cert: StepValue | None = None,
+        x5c_key: StepValue | None = None,
+        x5c_chain: StepValue | None = None,
+        nebula_cert: StepValue | None = None,
+        nebula_key: StepValue | None = None,
+        acme: StepValue | None = None,
+        standalone: bool = False,
+        webroot: StepValue | None = None,
+        contact: StepValue | None = None,
+        http_listen: StepValue | None = None,
+        k8ssa_token_path: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate a new private key and certificate signed by the root certificate.
+
+        Args:
+            subject (str): The Common Name, DNS Name, or IP address that will be set as
+                the Subject Common Name for the certificate.
+            crt_file (str): File to write the certificate (PEM format)
+            key_file (str): File to write the private key (PEM format)
+            san (StepValue): Add dns|ip|email|uri Subject Alternative Name(s) (SANs)
+                that should be authorized.
+            attestation_ca_url (StepValue): The base url of the Attestation CA to use
+            attestation_ca_root (StepValue): The path to the PEM file with trusted roots
+                when connecting to the Attestation CA
+            tpm_storage_directory (StepValue): The directory where TPM keys and
+                certificates will be stored
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            token (StepValue): The one-time token used to authenticate with the CA in
+                order to create the certificate.
+            context (StepValue): The context name to apply for the given command.
+            provisioner (StepValue): The provisioner name to use.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            kty (StepValue): The kty to build the certificate upon.
+            curve (StepValue): The elliptic curve to use for EC and OKP key types.
+            size (StepValue): The size (in bits) of the key for RSA and oct key types.
+            not_after (StepValue): The time|duration when the certificate validity
+                period ends.
+            not_before (StepValue): The time|duration when the certificate validity
+                period starts.
+            attestation_uri (StepValue): The KMS uri used for attestation.
+            force (bool): Force the overwrite of files without asking.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            console (bool): Complete the flow while remaining inside the terminal
+            kms (StepValue): The uri to configure a Cloud KMS or an HSM.
+            x5c_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'x5c' header of a JWT.
+            x5c_key (StepValue): Private key file, used to sign a JWT, corresponding to
+                the certificate that will be stored in the 'x5c' header.
+            x5c_chain (StepValue): Certificate file, in PEM format
+            nebula_cert (StepValue): Certificate file in PEM format to store in the
+                'nebula' header of a JWT.
+            nebula_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the certificate that will be stored in the 'nebula' header.
+            acme (StepValue): ACME directory url to be used for requesting certificates
+                via the ACME protocol.
+            standalone (bool): Get a certificate using the ACME protocol and standalone
+                mode for validation.
+            webroot (StepValue): Specify a file to use as a 'web root' for validation in
+                the ACME protocol.
+            contact (StepValue): The email-address used for contact as part of the ACME
+                protocol.
+            http_listen (StepValue): Use a non-standard http address, behind a reverse
+                proxy or load balancer, for serving ACME challenges.
+            k8ssa_token_path (StepValue): Configure the file from which to read the
+                kubernetes service account token.
+        """
+        return self._call(
+            _CA_CERTIFICATE,
+            (subject, crt_file, key_file),
+            (
+                san,
+                attestation_ca_url,
+                attestation_ca_root,
+                tpm_storage_directory,
+                set,
+                set_file,
+                ca_config,
+                ca_url,
+                root,
+                token,
+                context,
+                provisioner,
+                provisioner_password_file,
+                kty,
+                curve,
+                size,
+                not_after,
+                not_before,
+                attestation_uri,
+                force,
+                offline,
+                password_file,
+                console,
+                kms,
+                x5c_cert,
+                x5c_key,
+                x5c_chain,
+                nebula_cert,
+                nebula_key,
+                acme,
+                standalone,
+                webroot,
+                contact,
+                http_listen,
+                k8ssa_token_path,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def rekey(
+        self,
+        crt_file: str | None = None,
+        key_file: str | None = None,
+        /,
+        *,
+        out_cert: StepValue | None = None,
+        out_key: StepValue | None = None,
+        private_key: StepValue | None = None,
+        expires_in: StepValue | None = None,
+        pid: StepValue | None = None,
+        pid_file: StepValue | None = None,
+        signal: StepValue | None = None,
+        exec: StepValue | None = None,
+        daemon: bool = False,
+        rekey_period: StepValue | None = None,
+        kty: StepValue | None = None,
+        curve: StepValue | None = None,
+        size: StepValue | None = None,
+        force: bool = False,
+        offline: bool = False,
+        password_file: StepValue | None = None,
+        root: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Rekey a certificate.
+
+        Args:
+            crt_file (str): The certificate in PEM format that we want to rekey.
+            key_file (str): They key file of the certificate.
+            out_cert (StepValue): The file where the new certificate will be saved to.
+            out_key (StepValue): The file to store the new private key.
+            private_key (StepValue): The file containing the private key for rekey-ing
+                the certificate.
+            expires_in (StepValue): The amount of time remaining before certificate
+                expiration, at which point a rekey should be attempted.
+            pid (StepValue): The process id to signal after the certificate has been
+                rekeyed.
+            pid_file (StepValue): The file from which to read the process id that will
+                be signaled after the certificate has been rekeyed.
+            signal (StepValue): The signal number to send to the selected PID, so it can
+                reload the configuration and load the new certificate.
+            exec (StepValue): The command to run after the certificate has been rekeyed.
+            daemon (bool): Run the rekey command as a daemon, rekeying and overwriting
+                the certificate periodically.
+            rekey_period (StepValue): The period with which to schedule rekeying of the
+                certificate in daemon mode.
+            kty (StepValue): The kty to build the certificate upon.
+            curve (StepValue): The elliptic curve to use for EC and OKP key types.
+            size (StepValue): The size (in bits) of the key for RSA and oct key types.
+            force (bool): Force the overwrite of files without asking.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            ca_config (StepValue): The certificate authority configuration file.
+        """
+        return self._call(
+            _CA_REKEY,
+            (crt_file, key_file),
+            (
+                out_cert,
+                out_key,
+                private_key,
+                expires_in,
+                pid,
+                pid_file,
+                signal,
+                exec,
+                daemon,
+                rekey_period,
+                kty,
+                curve,
+                size,
+                force,
+                offline,
+                password_file,
+                root,
+                ca_url,
+                ca_config,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def renew(
+        self,
+        crt_file: str | None = None,
+        key_file: str | None = None,
+        /,
+        *,
+        mtls: bool = False,
+        ca_config: StepValue | None = None,
+        force: bool = False,
+        offline: bool = False,
+        password_file: StepValue | None = None,
+        output_file: StepValue | None = None,
+        expires_in: StepValue | None = None,
+        pid: StepValue | None = None,
+        pid_file: StepValue | None = None,
+        signal: StepValue | None = None,
+        exec: StepValue | None = None,
+        daemon: bool = False,
+        renew_period: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Renew a certificate.
+
+        Args:
+            crt_file (str): The certificate in PEM format that we want to renew.
+            key_file (str): They key file of the certificate.
+            mtls (bool): Use mTLS to renew a certificate.
+            ca_config (StepValue): The certificate authority configuration file.
+            force (bool): Force the overwrite of files without asking.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            output_file (StepValue): The new certificate file path.
+            expires_in (StepValue): The amount of time remaining before certificate
+                expiration, at which point a renewal should be attempted.
+            pid (StepValue): The process id to signal after the certificate has been
+                renewed.
+            pid_file (StepValue): The file from which to read the process id that will
+                be signaled after the certificate has been renewed.
+            signal (StepValue): The signal number to send to the selected PID, so it can
+                reload the configuration and load the new certificate.
+            exec (StepValue): The command to run after the certificate has been renewed.
+            daemon (bool): Run the renew command as a daemon, renewing and overwriting
+                the certificate periodically.
+            renew_period (StepValue): The period with which to schedule renewals of the
+                certificate in daemon mode.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_RENEW,
+            (crt_file, key_file),
+            (
+                mtls,
+                ca_config,
+                force,
+                offline,
+                password_file,
+                output_file,
+                expires_in,
+                pid,
+                pid_file,
+                signal,
+                exec,
+                daemon,
+                renew_period,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def revoke(
+        self,
+        serial_number: str | None = None,
+        /,
+        *,
+        cert: StepValue | None = None,
+        key: StepValue | None = None,
+        reason: StepValue | None = None,
+        reasoncode: StepValue | None = None,
+        token: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        offline: bool = False,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Revoke a certificate.
+
+        Args:
+            serial_number (str): The serial number of the certificate that should be
+                revoked.
+            cert (StepValue): The file containing the cert that should be revoked.
+            key (StepValue): The file containing the key corresponding to the cert that
+                should be revoked.
+            reason (StepValue): The string representing the reason for which the cert is
+                being revoked.
+            reasoncode (StepValue): The reasonCode specifies the reason for revocation -
+                chose from a list of common revocation reasons.
+            token (StepValue): The one-time token used to authenticate with the CA in
+                order to create the certificate.
+            ca_config (StepValue): The certificate authority configuration file.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_REVOKE,
+            (serial_number,),
+            (
+                cert,
+                key,
+                reason,
+                reasoncode,
+                token,
+                ca_config,
+                offline,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def provisioner(self) -> _CaProvisioner:
+        """Create and manage the certificate authority provisioners."""
+        return _CaProvisioner(self._cli)
+
+    def sign(
+        self,
+        csr_file: str | None = None,
+        crt_file: str | None = None,
+        /,
+        *,
+        token: StepValue | None = None,
+        provisioner: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        not_before: StepValue | None = None,
+        not_after: StepValue | None = None,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        force: bool = False,
+        offline: bool = False,
+        password_file: StepValue | None = None,
+        console: bool = False,
+        kms: StepValue | None = None,
+        x5c_cert: StepValue | None = None,
+        x5c_key: StepValue | None = None,
+        x5c_chain: StepValue | None = None,
+        nebula_cert: StepValue | None = None,
+        nebula_key: StepValue | None = None,
+        acme: StepValue | None = None,
+        standalone: bool = False,
+        webroot: StepValue | None = None,
+        contact: StepValue | None = None,
+        http_listen: StepValue | None = None,
+        k8ssa_token_path: StepValue | None = None,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate a new certificate signing a certificate request.
+
+        Args:
+            csr_file (str): File with the certificate signing request (PEM format)
+            crt_file (str): File to write the certificate (PEM format)
+            token (StepValue): The one-time token used to authenticate with the CA in
+                order to create the certificate.
+            provisioner (StepValue): The provisioner name to use.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            not_before (StepValue): The time|duration when the certificate validity
+                period starts.
+            not_after (StepValue): The time|duration when the certificate validity
+                period ends.
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            force (bool): Force the overwrite of files without asking.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            console (bool): Complete the flow while remaining inside the terminal
+            kms (StepValue): The uri to configure a Cloud KMS or an HSM.
+            x5c_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'x5c' header of a JWT.
+            x5c_key (StepValue): Private key file, used to sign a JWT, corresponding to
+                the certificate that will be stored in the 'x5c' header.
+            x5c_chain (StepValue): Certificate file, in PEM format
+            nebula_cert (StepValue): Certificate file in PEM format to store in the
+                'nebula' header of a JWT.
+            nebula_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the certificate that will be stored in the 'nebula' header.
+            acme (StepValue): ACME directory url to be used for requesting certificates
+                via the ACME protocol.
+            standalone (bool): Get a certificate using the ACME protocol and standalone
+                mode for validation.
+            webroot (StepValue): Specify a file to use as a 'web root' for validation in
+                the ACME protocol.
+            contact (StepValue): The email-address used for contact as part of the ACME
+                protocol.
+            http_listen (StepValue): Use a non-standard http address, behind a reverse
+                proxy or load balancer, for serving ACME challenges.
+            k8ssa_token_path (StepValue): Configure the file from which to read the
+                kubernetes service account token.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_SIGN,
+            (csr_file, crt_file),
+            (
+                token,
+                provisioner,
+                provisioner_password_file,
+                not_before,
+                not_after,
+                set,
+                set_file,
+                force,
+                offline,
+                password_file,
+                console,
+                kms,
+                x5c_cert,
+                x5c_key,
+                x5c_chain,
+                nebula_cert,
+                nebula_key,
+                acme,
+                standalone,
+                webroot,
+                contact,
+                http_listen,
+                k8ssa_token_path,
+                ca_config,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def root(
+        self,
+        root_file: str | None = None,
+        /,
+        *,
+        force: bool = False,
+        fingerprint: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Download and validate the root certificate.
+
+        Args:
+            root_file (str): File to write root certificate (PEM format)
+            force (bool): Force the overwrite of files without asking.
+            fingerprint (StepValue): The fingerprint of the targeted root certificate.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ROOT,
+            (root_file,),
+            (force, fingerprint, ca_url, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def roots(
+        self,
+        roots_file: str | None = None,
+        /,
+        *,
+        ca_url: StepValue | None = None,
+        force: bool = False,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Download all the root certificates.
+
+        Args:
+            roots_file (str): File to write all the root certificates (PEM format)
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            force (bool): Force the overwrite of files without asking.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_ROOTS,
+            (roots_file,),
+            (ca_url, force, root, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def federation(
+        self,
+        federation_file: str | None = None,
+        /,
+        *,
+        ca_url: StepValue | None = None,
+        force: bool = False,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Download all the federated certificates.
+
+        Args:
+            federation_file (str): File to write federation certificates (PEM format)
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            force (bool): Force the overwrite of files without asking.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _CA_FEDERATION,
+            (federation_file,),
+            (ca_url, force, root, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def acme(self) -> _CaAcme:
+        """Manage ACME settings."""
+        return _CaAcme(self._cli)
+
+    @property
+    def policy(self) -> _CaPolicy:
+        """Manage certificate issuance policies."""
+        return _CaPolicy(self._cli)
+
+    @property
+    def admin(self) -> _CaAdmin:
+        """Create and manage the certificate authority admins."""
+        return _CaAdmin(self._cli)
+
+
+_BETA_CA_ACME_EAB_LIST = StepCommandSpec(
+    ("step", "beta", "ca", "acme", "eab", "list"),
+    (
+        "limit",
+        "no-pager",
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_BETA_CA_ACME_EAB_ADD = StepCommandSpec(
+    ("step", "beta", "ca", "acme", "eab", "add"),
+    (
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_BETA_CA_ACME_EAB_REMOVE = StepCommandSpec(
+    ("step", "beta", "ca", "acme", "eab", "remove"),
+    (
+        "admin-cert",
+        "admin-key",
+        "admin-subject",
+        "admin-provisioner",
+        "admin-password-file",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _BetaCaAcmeEab(StepCommandGroup):
+    """The commands of `step beta ca acme eab`: create and manage ACME External
+    Account Binding Keys.
+    """
+
+    __slots__ = ()
+
+    def list(
+        self,
+        provisioner: str | None = None,
+        eab_key_reference: str | None = None,
+        /,
+        *,
+        limit: StepValue | None = None,
+        no_pager: bool = False,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """List all ACME External Account Binding Keys.
+
+        Args:
+            provisioner (str): Name of the provisioner to list ACME EAB keys for
+            eab_key_reference (str): (Optional) reference (from external system) for the
+                key to be listed
+            limit (StepValue): The number of entities to return per (paging) API
+                request.
+            no_pager (bool): Disables usage of $PAGER for paging purposes
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _BETA_CA_ACME_EAB_LIST,
+            (provisioner, eab_key_reference),
+            (
+                limit,
+                no_pager,
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def add(
+        self,
+        provisioner: str | None = None,
+        eab_key_reference: str | None = None,
+        /,
+        *,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Add ACME External Account Binding Key.
+
+        Args:
+            provisioner (str): Name of the provisioner to which the ACME EAB key will be
+                added
+            eab_key_reference (str): (Optional) reference (from external system) for the
+                key that will be added
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _BETA_CA_ACME_EAB_ADD,
+            (provisioner, eab_key_reference),
+            (
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        provisioner: str | None = None,
+        eab_key_id: str | None = None,
+        /,
+        *,
+        admin_cert: StepValue | None = None,
+        admin_key: StepValue | None = None,
+        admin_subject: StepValue | None = None,
+        admin_provisioner: StepValue | None = None,
+        admin_password_file: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove an ACME EAB Key from the CA.
+
+        Args:
+            provisioner (str): Name of the provisioner to remove an ACME EAB key for
+            eab_key_id (str): The ACME EAB Key ID to remove
+            admin_cert (StepValue): Admin certificate (chain) in PEM format to store in
+                the 'x5c' header of a JWT.
+            admin_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the admin certificate that will be stored in the 'x5c' header.
+            admin_subject (StepValue): The admin subject to use for generating admin
+                credentials.
+            admin_provisioner (StepValue): The provisioner name to use for generating
+                admin credentials.
+            admin_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _BETA_CA_ACME_EAB_REMOVE,
+            (provisioner, eab_key_id),
+            (
+                admin_cert,
+                admin_key,
+                admin_subject,
+                admin_provisioner,
+                admin_password_file,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _BetaCaAcme(StepCommandGroup):
+    """The commands of `step beta ca acme`: manage ACME settings."""
+
+    __slots__ = ()
+
+    @property
+    def eab(self) -> _BetaCaAcmeEab:
+        """Create and manage ACME External Account Binding Keys."""
+        return _BetaCaAcmeEab(self._cli)
+
+
+class _BetaCa(StepCommandGroup):
+    """The commands of `step beta ca`: commands that are made available for testing
+    new features and APIs.
+    """
+
+    __slots__ = ()
+
+    @property
+    def acme(self) -> _BetaCaAcme:
+        """Manage ACME settings."""
+        return _BetaCaAcme(self._cli)
+
+
+class _Beta(StepCommandGroup):
+    """The commands of `step beta`: commands that are being tested; these APIs are
+    likely to change.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ca(self) -> _BetaCa:
+        """Commands that are made available for testing new features and APIs."""
+        return _BetaCa(self._cli)
+
+
+_CERTIFICATE_BUNDLE = StepCommandSpec(
+    ("step", "certificate", "bundle"),
+    ("force",),
+)
+
+
+_CERTIFICATE_CREATE = StepCommandSpec(
+    ("step", "certificate", "create"),
+    (
+        "kms",
+        "csr",
+        "profile",
+        "template",
+        "set",
+        "set-file",
+        "password-file",
+        "ca",
+        "ca-key",
+        "ca-password-file",
+        "key",
+        "no-password",
+        "not-before",
+        "not-after",
+        "san",
+        "bundle",
+        "kty",
+        "size",
+        "curve",
+        "force",
+        "subtle",
+    ),
+)
+
+
+_CERTIFICATE_FORMAT = StepCommandSpec(
+    ("step", "certificate", "format"),
+    ("out", "force"),
+)
+
+
+_CERTIFICATE_INSPECT = StepCommandSpec(
+    ("step", "certificate", "inspect"),
+    ("format", "roots", "servername", "bundle", "short", "insecure"),
+)
+
+
+_CERTIFICATE_FINGERPRINT = StepCommandSpec(
+    ("step", "certificate", "fingerprint"),
+    ("roots", "bundle", "insecure", "servername", "format", "sha1"),
+)
+
+
+_CERTIFICATE_LINT = StepCommandSpec(
+    ("step", "certificate", "lint"),
+    ("roots", "insecure", "servername"),
+)
+
+
+_CERTIFICATE_NEEDS_RENEWAL = StepCommandSpec(
+    ("step", "certificate", "needs-renewal"),
+    ("expires-in", "roots", "bundle", "verbose", "servername"),
+)
+
+
+_CERTIFICATE_SIGN = StepCommandSpec(
+    ("step", "certificate", "sign"),
+    (
+        "kms",
+        "profile",
+        "template",
+        "set",
+        "set-file",
+        "password-file",
+        "not-before",
+        "not-after",
+        "path-len",
+        "bundle",
+    ),
+)
+
+
+_CERTIFICATE_VERIFY = StepCommandSpec(
+    ("step", "certificate", "verify"),
+    ("host", "roots", "servername"),
+)
+
+
+_CERTIFICATE_KEY = StepCommandSpec(
+    ("step", "certificate", "key"),
+    ("output-file", "force"),
+)
+
+
+_CERTIFICATE_INSTALL = StepCommandSpec(
+    ("step", "certificate", "install"),
+    ("prefix", "java", "firefox", "no-system", "all"),
+)
+
+
+_CERTIFICATE_UNINSTALL = StepCommandSpec(
+    ("step", "certificate", "uninstall"),
+    ("prefix", "java", "firefox", "no-system", "all"),
+)
+
+
+_CERTIFICATE_P12 = StepCommandSpec(
+    ("step", "certificate", "p12"),
+    ("ca", "password-file", "no-password", "force", "insecure"),
+)
+
+
+class _Certificate(StepCommandGroup):
+    """The commands of `step certificate`: create, revoke, validate, bundle, and
+    otherwise manage certificates.
+    """
+
+    __slots__ = ()
+
+    def bundle(
+        self,
+        crt_file: str | None = None,
+        ca: str | None = None,
+        bundle_file: str | None = None,
+        /,
+        *,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Bundle a certificate with intermediate certificate(s) needed for
+        certificate path validation.
+
+        Args:
+            crt_file (str): The path to a leaf certificate to bundle with issuing
+                certificate(s).
+            ca (str): The path to the Certificate Authority issuing certificate.
+            bundle_file (str): The path to write the bundle.
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CERTIFICATE_BUNDLE,
+            (crt_file, ca, bundle_file),
+            (force,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def create(
+        self,
+        subject: str | None = None,
+        crt_file: str | None = None,
+        key_file: str | None = None,
+        /,
+        *,
+        kms: StepValue | None = None,
+        csr: bool = False,
+        profile: StepValue | None = None,
+        template: StepValue | None = None,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        password_file: StepValue | None = None,
+        ca: StepValue | None = None,
+        ca_key: StepValue | None = None,
+        ca_password_file: StepValue | None = None,
+        key: StepValue | None = None,
+        no_password: bool = False,
+        not_before: StepValue | None = None,
+        not_after: StepValue | None = None,
+        san: StepValue | None = None,
+        bundle: bool = False,
+        kty: StepValue | None = None,
+        size: StepValue | None = None,
+        curve: StepValue | None = None,
+        force: bool = False,
+        subtle: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Create a certificate or certificate signing request.
+
+        Args:
+            subject (str): The subject of the certificate.
+            crt_file (str): File to write CRT or CSR to (PEM format)
+            key_file (str): File to write private key to (PEM format).
+            kms (StepValue): The uri to configure a Cloud KMS or an HSM.
+            csr (bool): Generate a certificate signing request (CSR) instead of a
+                certificate.
+            profile (StepValue): The certificate profile sets various certificate
+                details such as certificate use and expiration.
+            template (StepValue): The certificate template file, a JSON representation
+                of the certificate to create.
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt the new private key or decrypt the user submitted private key.
+            ca (StepValue): The certificate authority used to issue the new certificate
+                (PEM file).
+            ca_key (StepValue): The certificate authority private key used to sign the
+                new certificate (PEM file).
+            ca_password_file (StepValue): The path to the file containing the password
+                to decrypt the CA private key.
+            key (StepValue): The file of the private key to use instead of creating a
+                new one (PEM file).
+            no_password (bool): Do not ask for a password to encrypt the private key.
+            not_before (StepValue): The time|duration set in the NotBefore property of
+                the certificate.
+            not_after (StepValue): The time|duration set in the NotAfter property of the
+                certificate.
+            san (StepValue): Add DNS or IP Address Subjective Alternative Names (SANs).
+            bundle (bool): Bundle the new leaf certificate with the signing certificate.
+            kty (StepValue): The kty to build the certificate upon.
+            size (StepValue): The size (in bits) of the key for RSA and oct key types.
+            curve (StepValue): The elliptic curve to use for EC and OKP key types.
+            force (bool): Force the overwrite of files without asking.
+            subtle (bool): EXIT CODES This command returns 0 on success and >0 if any
+                error occurs.
+        """
+        return self._call(
+            _CERTIFICATE_CREATE,
+            (subject, crt_file, key_file),
+            (
+                kms,
+                csr,
+                profile,
+                template,
+                set,
+                set_file,
+                password_file,
+                ca,
+                ca_key,
+                ca_password_file,
+                key,
+                no_password,
+                not_before,
+                not_after,
+                san,
+                bundle,
+                kty,
+                size,
+                curve,
+                force,
+                subtle,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def format(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        out: StepValue | None = None,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Reformat certificate.
+
+        Args:
+            crt_file (str): Path to a certificate or CSR file.
+            out (StepValue): Path to write the reformatted result.
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CERTIFICATE_FORMAT,
+            (crt_file,),
+            (out, force),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def inspect(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        format: StepValue | None = None,
+        roots: StepValue | None = None,
+        servername: StepValue | None = None,
+        bundle: bool = False,
+        short: bool = False,
+        insecure: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print certificate or CSR details in human readable format.
+
+        Args:
+            crt_file (str): Path to a certificate or certificate signing request (CSR)
+                to inspect.
+            format (StepValue): The output format for printing the introspection
+                details.
+            roots (StepValue): Root certificate(s) that will be used to verify the
+                authenticity of the remote server.
+            servername (StepValue): TLS Server Name Indication that should be sent to
+                request a specific certificate from the server.
+            bundle (bool): Print all certificates in the order in which they appear in
+                the bundle.
+            short (bool): Print the certificate or CSR details in shorter and more
+                friendly format.
+            insecure (bool): Use an insecure client to retrieve a remote peer
+                certificate.
+        """
+        return self._call(
+            _CERTIFICATE_INSPECT,
+            (crt_file,),
+            (format, roots, servername, bundle, short, insecure),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def fingerprint(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        roots: StepValue | None = None,
+        bundle: bool = False,
+        insecure: bool = False,
+        servername: StepValue | None = None,
+        format: StepValue | None = None,
+        sha1: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print the fingerprint of a certificate.
+
+        Args:
+            crt_file (str): A certificate PEM file, usually the root certificate.
+            roots (StepValue): Root certificate(s) that will be used to verify the
+                authenticity of the remote server.
+            bundle (bool): Print all fingerprints in the order in which they appear in
+                the bundle.
+            insecure (bool): Use an insecure client to retrieve a remote peer
+                certificate.
+            servername (StepValue): TLS Server Name Indication that should be sent to
+                request a specific certificate from the server.
+            format (StepValue): The format of the fingerprint, it must be "hex",
+                "base64", "base64-url", "base64-raw", "base64-url-raw" or "emoji".
+            sha1 (bool): Use the SHA-1 hash algorithm to hash the certificate.
+        """
+        return self._call(
+            _CERTIFICATE_FINGERPRINT,
+            (crt_file,),
+            (roots, bundle, insecure, servername, format, sha1),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def lint(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        roots: StepValue | None = None,
+        insecure: bool = False,
+        servername: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Lint certificate details.
+
+        Args:
+            crt_file (str): Path to a certificate or certificate signing request (CSR)
+                to lint.
+            roots (StepValue): Root certificate(s) that will be used to verify the
+                authenticity of the remote server.
+            insecure (bool): Use an insecure client to retrieve a remote peer
+                certificate.
+            servername (StepValue): TLS Server Name Indication that should be sent to
+                request a specific certificate from the server.
+        """
+        return self._call(
+            _CERTIFICATE_LINT,
+            (crt_file,),
+            (roots, insecure, servername),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def needs_renewal(
+        self,
+        cert_file_or_hostname: str | None = None,
+        /,
+        *,
+        expires_in: StepValue | None = None,
+        roots: StepValue | None = None,
+        bundle: bool = False,
+        verbose: bool = False,
+        servername: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Check if a certificate needs to be renewed.
+
+        Args:
+            cert_file_or_hostname (str): The path to a certificate OR a hostname with
+                protocol prefix.
+            expires_in (StepValue): Check if the certificate expires within the given
+                time window using percent|duration.
+            roots (StepValue): Root certificate(s) that will be used to verify the
+                authenticity of the remote server.
+            bundle (bool): Check all certificates in the order in which they appear in
+                the bundle.
+            verbose (bool): Print human readable affirmation if certificate requires
+                renewal.
+            servername (StepValue): TLS Server Name Indication that should be sent to
+                request a specific certificate from the server.
+        """
+        return self._call(
+            _CERTIFICATE_NEEDS_RENEWAL,
+            (cert_file_or_hostname,),
+            (expires_in, roots, bundle, verbose, servername),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def sign(
+        self,
+        csr_file: str | None = None,
+        crt_file: str | None = None,
+        key_file: str | None = None,
+        /,
+        *,
+        kms: StepValue | None = None,
+        profile: StepValue | None = None,
+        template: StepValue | None = None,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        password_file: StepValue | None = None,
+        not_before: StepValue | None = None,
+        not_after: StepValue | None = None,
+        path_len: StepValue | None = None,
+        bundle: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Sign a certificate signing request (CSR).
+
+        Args:
+            csr_file (str): The path to a certificate signing request (CSR) to be
+                signed.
+            crt_file (str): The path to an issuing certificate.
+            key_file (str): The path to a private key for signing the CSR.
+            kms (StepValue): The uri to configure a Cloud KMS or an HSM.
+            profile (StepValue): The certificate profile sets various certificate
+                details such as certificate use and expiration.
+            template (StepValue): The certificate template file, a JSON representation
+                of the certificate to create.
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            not_before (StepValue): The time|duration set in the NotBefore property of
+                the certificate.
+            not_after (StepValue): The time|duration set in the NotAfter property of the
+                certificate.
+            path_len (StepValue): The maximum path length to set in the
+                pathLenConstraint of an intermediate-ca.
+            bundle (bool): Bundle the new leaf certificate with the signing certificate.
+        """
+        return self._call(
+            _CERTIFICATE_SIGN,
+            (csr_file, crt_file, key_file),
+            (
+                kms,
+                profile,
+                template,
+                set,
+                set_file,
+                password_file,
+                not_before,
+                not_after,
+                path_len,
+                bundle,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def verify(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        host: StepValue | None = None,
+        roots: StepValue | None = None,
+        servername: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Verify a certificate.
+
+        Args:
+            crt_file (str): The path to a certificate to validate.
+            host (StepValue): Check whether the certificate is for the specified host.
+            roots (StepValue): Root certificate(s) that will be used to verify the
+                authenticity of the remote server.
+            servername (StepValue): TLS Server Name Indication that should be sent to
+                request a specific certificate from the server.
+        """
+        return self._call(
+            _CERTIFICATE_VERIFY,
+            (crt_file,),
+            (host, roots, servername),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def key(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        output_file: StepValue | None = None,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print public key embedded in a certificate.
+
+        Args:
+            crt_file (str): Path to a certificate or certificate signing request (CSR).
+            output_file (StepValue): The destination file of the public key.
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CERTIFICATE_KEY,
+            (crt_file,),
+            (output_file, force),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def install(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        prefix: StepValue | None = None,
+        java: bool = False,
+        firefox: bool = False,
+        no_system: bool = False,
+        all: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Install a root certificate in the system truststore.
+
+        Args:
+            crt_file (str): Certificate to install in the system truststore
+            prefix (StepValue): The prefix used to name the CA in the truststore.
+            java (bool): Install on the Java key store
+            firefox (bool): Install on the Firefox NSS security database
+            no_system (bool): Disables the install on the system truststore
+            all (bool): Install on the system, Firefox and Java truststores
+        """
+        return self._call(
+            _CERTIFICATE_INSTALL,
+            (crt_file,),
+            (prefix, java, firefox, no_system, all),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def uninstall(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        prefix: StepValue | None = None,
+        java: bool = False,
+        firefox: bool = False,
+        no_system: bool = False,
+        all: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Uninstall a root certificate from the system truststore.
+
+        Args:
+            crt_file (str): Certificate to uninstall from the system truststore
+            prefix (StepValue): The prefix used to name the CA in the truststore.
+            java (bool): Uninstall from the Java key store
+            firefox (bool): Uninstall from the Firefox NSS security database
+            no_system (bool): Disables the uninstall from the system truststore
+            all (bool): Uninstall from the system, Firefox and Java truststores
+        """
+        return self._call(
+            _CERTIFICATE_UNINSTALL,
+            (crt_file,),
+            (prefix, java, firefox, no_system, all),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def p12(
+        self,
+        *,
+        ca: StepValue | None = None,
+        password_file: StepValue | None = None,
+        no_password: bool = False,
+        force: bool = False,
+        insecure: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Package a certificate and keys into a .p12 file.
+
+        Args:
+            ca (StepValue): The path to the file containing a CA or intermediate
+                certificate to add to the .p12 file.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt the .p12 file.
+            no_password (bool): Do not ask for a password to encrypt a private key.
+            force (bool): Force the overwrite of files without asking.
+            insecure (bool):
+        """
+        return self._call(
+            _CERTIFICATE_P12,
+            (),
+            (ca, password_file, no_password, force, insecure),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_COMPLETION = StepCommandSpec(
+    ("step", "completion"),
+    (),
+)
+
+
+_CONTEXT_CURRENT = StepCommandSpec(
+    ("step", "context", "current"),
+    ("json",),
+)
+
+
+_CONTEXT_LIST = StepCommandSpec(
+    ("step", "context", "list"),
+    (),
+)
+
+
+_CONTEXT_REMOVE = StepCommandSpec(
+    ("step", "context", "remove"),
+    ("force",),
+)
+
+
+_CONTEXT_SELECT = StepCommandSpec(
+    ("step", "context", "select"),
+    (),
+)
+
+
+class _Context(StepCommandGroup):
+    """The commands of `step context`: manage certificate authority contexts."""
+
+    __slots__ = ()
+
+    def current(
+        self,
+        *,
+        json: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Current returns the name of the current context.
+
+        Args:
+            json (bool): Return stringified JSON containing the main attributes of a
+                context.
+        """
+        return self._call(
+            _CONTEXT_CURRENT,
+            (),
+            (json,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def list(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """List available certificate authority contexts."""
+        return self._call(
+            _CONTEXT_LIST,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        name: str | None = None,
+        /,
+        *,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Remove a context and all associated configuration.
+
+        Args:
+            name (str): The name of the context to remove .
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CONTEXT_REMOVE,
+            (name,),
+            (force,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def select(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Select the default certificate authority context."""
+        return self._call(
+            _CONTEXT_SELECT,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRL_INSPECT = StepCommandSpec(
+    ("step", "crl", "inspect"),
+    ("format", "ca", "from", "roots", "insecure"),
+)
+
+
+class _Crl(StepCommandGroup):
+    """The commands of `step crl`: initialize and manage a certificate revocation
+    list.
+    """
+
+    __slots__ = ()
+
+    def inspect(
+        self,
+        file_url: str | None = None,
+        /,
+        *,
+        format: StepValue | None = None,
+        ca: StepValue | None = None,
+        from_: bool = False,
+        roots: StepValue | None = None,
+        insecure: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print certificate revocation list (CRL) details in human-readable format.
+
+        Args:
+            file_url (str): The file or URL where the CRL is.
+            format (StepValue): The output format for printing the introspection
+                details.
+            ca (StepValue): The certificate file used to validate the CRL.
+            from_ (bool): Extract CRL and CA from the URL passed as argument.
+            roots (StepValue): Root certificate(s) that will be used to verify the
+                authenticity of the remote server.
+            insecure (bool): EXAMPLES Inspect a CRL: $ step crl inspect --insecure
+                http://ca.example.com/crls/exampleca.crl Inspect and validate a CRL in a
+                file: $ step crl inspect --ca ca.crt exampleca.crl Format the CRL in
+                JSON: $ step crl inspect --insecure --format json exampleca.crl Inspect
+                the CRL from the CRL distribution point of a given url: $ step crl
+                inspect --from https://www.google.com
+        """
+        return self._call(
+            _CRL_INSPECT,
+            (file_url,),
+            (format, ca, from_, roots, insecure),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_CHANGE_PASS = StepCommandSpec(
+    ("step", "crypto", "change-pass"),
+    (
+        "password-file",
+        "new-password-file",
+        "output-file",
+        "force",
+        "insecure",
+        "no-password",
+    ),
+)
+
+
+_CRYPTO_KEYPAIR = StepCommandSpec(
+    ("step", "crypto", "keypair"),
+    ("kty", "size", "curve", "from-jwk", "password-file", "no-password", "insecure"),
+)
+
+
+_CRYPTO_JWK_CREATE = StepCommandSpec(
+    ("step", "crypto", "jwk", "create"),
+    (
+        "type",
+        "size",
+        "curve",
+        "algorithm",
+        "use",
+        "kid",
+        "from-pem",
+        "password-file",
+        "no-password",
+        "subtle",
+    ),
+)
+
+
+_CRYPTO_JWK_KEYSET_ADD = StepCommandSpec(
+    ("step", "crypto", "jwk", "keyset", "add"),
+    (),
+)
+
+
+_CRYPTO_JWK_KEYSET_REMOVE = StepCommandSpec(
+    ("step", "crypto", "jwk", "keyset", "remove"),
+    ("kid",),
+)
+
+
+_CRYPTO_JWK_KEYSET_LIST = StepCommandSpec(
+    ("step", "crypto", "jwk", "keyset", "list"),
+    (),
+)
+
+
+_CRYPTO_JWK_KEYSET_FIND = StepCommandSpec(
+    ("step", "crypto", "jwk", "keyset", "find"),
+    ("kid",),
+)
+
+
+class _CryptoJwkKeyset(StepCommandGroup):
+    """The commands of `step crypto jwk keyset`: add, remove, and find JWKs in JWK
+    Sets.
+    """
+
+    __slots__ = ()
+
+    def add(
+        self,
+        jwks_file: str | None = None,
+        /,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """A JWK to a JWK Set.
+
+        Args:
+            jwks_file (str): File containing a JWK Set
+        """
+        return self._call(
+            _CRYPTO_JWK_KEYSET_ADD,
+            (jwks_file,),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def remove(
+        self,
+        jwks_file: str | None = None,
+        /,
+        *,
+        kid: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """A JWK from a JWK Set.
+
+        Args:
+            jwks_file (str): File containing a JWK Set
+            kid (StepValue): The key ID of the JWK to remove from the JWK Set.
+        """
+        return self._call(
+            _CRYPTO_JWK_KEYSET_REMOVE,
+            (jwks_file,),
+            (kid,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def list(
+        self,
+        jwks_file: str | None = None,
+        /,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Key IDs of JWKs in a JWK Set.
+
+        Args:
+            jwks_file (str): File containing a JWK Set
+        """
+        return self._call(
+            _CRYPTO_JWK_KEYSET_LIST,
+            (jwks_file,),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def find(
+        self,
+        jwks_file: str | None = None,
+        /,
+        *,
+        kid: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """A JWK in a JWK Set.
+
+        Args:
+            jwks_file (str): File containing a JWK Set
+            kid (StepValue): The key ID of the JWK to locate from the JWK Set.
+        """
+        return self._call(
+            _CRYPTO_JWK_KEYSET_FIND,
+            (jwks_file,),
+            (kid,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_JWK_PUBLIC = StepCommandSpec(
+    ("step", "crypto", "jwk", "public"),
+    (),
+)
+
+
+_CRYPTO_JWK_THUMBPRINT = StepCommandSpec(
+    ("step", "crypto", "jwk", "thumbprint"),
+    (),
+)
+
+
+class _CryptoJwk(StepCommandGroup):
+    """The commands of `step crypto jwk`: create JWKs (JSON Web Keys) and manage JWK
+    Key Sets.
+    """
+
+    __slots__ = ()
+
+    def create(
+        self,
+        public_jwk_file: str | None = None,
+        private_jwk_file: str | None = None,
+        /,
+        *,
+        type: StepValue | None = None,
+        size: StepValue | None = None,
+        curve: StepValue | None = None,
+        algorithm: StepValue | None = None,
+        use: StepValue | None = None,
+        kid: StepValue | None = None,
+        from_pem: StepValue | None = None,
+        password_file: StepValue | None = None,
+        no_password: bool = False,
+        subtle: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Create a JWK (JSON Web Key).
+
+        Args:
+            public_jwk_file (str): Path to which the public JWK should be written
+            private_jwk_file (str): Path to which the (JWE encrypted) private JWK should
+                be written
+            type (StepValue): The type of key to create.
+            size (StepValue): The size (in bits) of the key for RSA and oct key types.
+            curve (StepValue): The elliptic curve to use for EC and OKP key types.
+            algorithm (StepValue): The algorithm intended for use with this key.
+            use (StepValue): The intended use of the public key.
+            kid (StepValue): The kid (key ID) for this JWK.
+            from_pem (StepValue): Create a JWK representing the key encoded in an
+                existing pem-file instead of creating a new key.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            no_password (bool): Do not ask for a password to encrypt a private key.
+            subtle (bool): --insecure -f, --force Force the overwrite of files without
+                asking.
+        """
+        return self._call(
+            _CRYPTO_JWK_CREATE,
+            (public_jwk_file, private_jwk_file),
+            (
+                type,
+                size,
+                curve,
+                algorithm,
+                use,
+                kid,
+                from_pem,
+                password_file,
+                no_password,
+                subtle,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def keyset(self) -> _CryptoJwkKeyset:
+        """Add, remove, and find JWKs in JWK Sets."""
+        return _CryptoJwkKeyset(self._cli)
+
+    def public(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Extract a public JSON Web Key (JWK) from a private JWK."""
+        return self._call(
+            _CRYPTO_JWK_PUBLIC,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def thumbprint(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Compute thumbprint for a JWK."""
+        return self._call(
+            _CRYPTO_JWK_THUMBPRINT,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_JWT_SIGN = StepCommandSpec(
+    ("step", "crypto", "jwt", "sign"),
+    (
+        "algorithm",
+        "issuer",
+        "audience",
+        "subject",
+        "expiration",
+        "not-before",
+        "issued-at",
+        "jwt-id",
+        "header",
+        "x5c-key",
+        "jwks",
+        "kid",
+        "password-file",
+        "x5c-cert",
+        "x5t-cert",
+        "x5c-insecure",
+    ),
+)
+
+
+_CRYPTO_JWT_VERIFY = StepCommandSpec(
+    ("step", "crypto", "jwt", "verify"),
+    ("issuer", "audience", "algorithm", "key", "jwks", "kid", "password-file"),
+)
+
+
+_CRYPTO_JWT_INSPECT = StepCommandSpec(
+    ("step", "crypto", "jwt", "inspect"),
+    (),
+)
+
+
+class _CryptoJwt(StepCommandGroup):
+    """The commands of `step crypto jwt`: sign and verify data using JSON Web Tokens
+    (JWT).
+    """
+
+    __slots__ = ()
+
+    def sign(
+        self,
+        *,
+        algorithm: StepValue | None = None,
+        issuer: StepValue | None = None,
+        audience: StepValue | None = None,
+        subject: StepValue | None = None,
+        expiration: StepValue | None = None,
+        not_before: StepValue | None = None,
+        issued_at: StepValue | None = None,
+        jwt_id: StepValue | None = None,
+        header: StepValue | None = None,
+        x5c_key: StepValue | None = None,
+        jwks: StepValue | None = None,
+        kid: StepValue | None = None,
+        password_file: StepValue | None = None,
+        x5c_cert: StepValue | None = None,
+        x5t_cert: StepValue | None = None,
+        x5c_insecure: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Create a signed JWT data structure.
+
+        Args:
+            algorithm (StepValue): The signature or MAC algorithm to use.
+            issuer (StepValue): The issuer of this JWT.
+            audience (StepValue): The intended recipient(s) of the JWT, encoded as the
+                "aud" claim in the JWT.
+            subject (StepValue): The subject of this JWT.
+            expiration (StepValue): The expiration time on or after which the JWT must
+                not be accepted.
+            not_before (StepValue): The time before which the JWT must not be accepted.
+            issued_at (StepValue): The time at which the JWT was issued, used to
+                determine the age of the JWT.
+            jwt_id (StepValue): A unique identifier for the JWT.
+            header (StepValue): The key=value used as a header in the JWT token.
+            x5c_key (StepValue): The file containing the key with which to sign the JWT.
+            jwks (StepValue): The JWK Set containing the key to use to sign the JWT.
+            kid (StepValue): The ID of the key used to sign the JWT.
+            password_file (StepValue): The path to the file containing the password to
+                decrypt the key.
+            x5c_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'x5c' header of a JWT.
+            x5t_cert (StepValue): Certificate file in PEM format to use for the 'x5t'
+                header of a JWS or JWT
+            x5c_insecure (bool): Use the JWT header 'x5cInsecure' instead of 'x5c'.
+        """
+        return self._call(
+            _CRYPTO_JWT_SIGN,
+            (),
+            (
+                algorithm,
+                issuer,
+                audience,
+                subject,
+                expiration,
+                not_before,
+                issued_at,
+                jwt_id,
+                header,
+                x5c_key,
+                jwks,
+                kid,
+                password_file,
+                x5c_cert,
+                x5t_cert,
+                x5c_insecure,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def verify(
+        self,
+        *,
+        issuer: StepValue | None = None,
+        audience: StepValue | None = None,
+        algorithm: StepValue | None = None,
+        key: StepValue | None = None,
+        jwks: StepValue | None = None,
+        kid: StepValue | None = None,
+        password_file: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Verify a signed JWT data structure and return the payload.
+
+        Args:
+            issuer (StepValue): The issuer of this JWT.
+            audience (StepValue): The identity of the principal running this command.
+            algorithm (StepValue): The signature or MAC algorithm to use.
+            key (StepValue): The file containing the key to use to verify the JWT.
+            jwks (StepValue): The JWK Set containing the key to use to verify the JWS.
+            kid (StepValue): The ID of the key used to sign the JWK, used to select a
+                JWK from a JWK Set.
+            password_file (StepValue): The path to the file containing the password to
+                decrypt the key.
+        """
+        return self._call(
+            _CRYPTO_JWT_VERIFY,
+            (),
+            (issuer, audience, algorithm, key, jwks, kid, password_file),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def inspect(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Return the decoded JWT without verification."""
+        return self._call(
+            _CRYPTO_JWT_INSPECT,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_JWE_ENCRYPT = StepCommandSpec(
+    ("step", "crypto", "jwe", "encrypt"),
+    ("algorithm", "enc", "key", "jwks", "kid", "type", "content-type"),
+)
+
+
+_CRYPTO_JWE_DECRYPT = StepCommandSpec(
+    ("step", "crypto", "jwe", "decrypt"),
+    ("key", "jwks", "kid"),
+)
+
+
+class _CryptoJwe(StepCommandGroup):
+    """The commands of `step crypto jwe`: encrypt and decrypt data and keys using
+    JSON Web Encryption (JWE).
+    """
+
+    __slots__ = ()
+
+    def encrypt(
+        self,
+        *,
+        algorithm: StepValue | None = None,
+        enc: StepValue | None = None,
+        key: StepValue | None = None,
+        jwks: StepValue | None = None,
+        kid: StepValue | None = None,
+        type: StepValue | None = None,
+        content_type: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Encrypt a payload using JSON Web Encryption (JWE).
+
+        Args:
+            algorithm (StepValue): The cryptographic algorithm used to encrypt or
+                determine the value of the content encryption key (CEK).
+            enc (StepValue): --encryption-algorithm=content-enc-algorithm The
+                cryptographic content encryption algorithm used to perform authenticated
+                encryption on the plaintext payload (the content) to produce ciphertext
+                and the authentication tag.
+            key (StepValue): The file containing the JWE recipient's public key.
+            jwks (StepValue): The JWK Set containing the recipient's public key.
+            kid (StepValue): The ID of the recipient's public key.
+            type (StepValue): The media type of the JWE, used for disambiguation in
+                applications where more than one type of JWE may be processed.
+            content_type (StepValue): The media type of the JWE payload, used for
+                disambiguation of JWE objects in applications where more than one JWE
+                payload type may be present.
+        """
+        return self._call(
+            _CRYPTO_JWE_ENCRYPT,
+            (),
+            (algorithm, enc, key, jwks, kid, type, content_type),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def decrypt(
+        self,
+        *,
+        key: StepValue | None = None,
+        jwks: StepValue | None = None,
+        kid: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Verify a JWE and decrypt ciphertext.
+
+        Args:
+            key (StepValue): The argument should be the name of a file containing a
+                private JWK (or a JWK encrypted as a JWE payload) or a PEM encoded
+                private key (or a private key encrypted using the modes described on RFC
+                1423 or with PBES2+PBKDF2 described in RFC 2898).
+            jwks (StepValue): The JWK Set containing the recipient's private key.
+            kid (StepValue): The ID of the recipient's private key.
+        """
+        return self._call(
+            _CRYPTO_JWE_DECRYPT,
+            (),
+            (key, jwks, kid),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_JWS_SIGN = StepCommandSpec(
+    ("step", "crypto", "jws", "sign"),
+    (
+        "algorithm",
+        "jku",
+        "jwk",
+        "type",
+        "cty",
+        "x5c-key",
+        "jwks",
+        "kid",
+        "password-file",
+        "x5c-cert",
+        "x5t-cert",
+    ),
+)
+
+
+_CRYPTO_JWS_INSPECT = StepCommandSpec(
+    ("step", "crypto", "jws", "inspect"),
+    ("json",),
+)
+
+
+_CRYPTO_JWS_VERIFY = StepCommandSpec(
+    ("step", "crypto", "jws", "verify"),
+    ("algorithm", "key", "jwks", "kid", "json"),
+)
+
+
+class _CryptoJws(StepCommandGroup):
+    """The commands of `step crypto jws`: sign and verify data using JSON Web
+    Signature (JWS).
+    """
+
+    __slots__ = ()
+
+    def sign(
+        self,
+        *,
+        algorithm: StepValue | None = None,
+        jku: StepValue | None = None,
+        jwk: StepValue | None = None,
+        type: StepValue | None = None,
+        cty: StepValue | None = None,
+        x5c_key: StepValue | None = None,
+        jwks: StepValue | None = None,
+        kid: StepValue | None = None,
+        password_file: StepValue | None = None,
+        x5c_cert: StepValue | None = None,
+        x5t_cert: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Create a signed JWS data structure.
+
+        Args:
+            algorithm (StepValue): The signature or MAC algorithm to use.
+            jku (StepValue): The "jku" (JWK Set URL) Header Parameter is a URI that
+                refers to a resource for a set of JSON-encoded public keys, one of which
+                corresponds to the key used to digitally sign the JWS.
+            jwk (StepValue): The "jwk" (JSON Web Key) Header Parameter is the public key
+                that corresponds to the key used to digitally sign the JWS.
+            type (StepValue): The "typ" (type) Header Parameter is used by JWS
+                applications to declare the media type of this complete JWS.
+            cty (StepValue): The "cty" (content type) Header Parameter is used by JWS
+                applications to declare the media type of the secured content (the
+                payload).
+            x5c_key (StepValue): The file containing the key with which to sign the JWS.
+            jwks (StepValue): The JWK Set containing the key to use to sign the JWS.
+            kid (StepValue): The ID of the key used to sign the JWS.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            x5c_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'x5c' header of a JWT.
+            x5t_cert (StepValue): Certificate file in PEM format to use for the 'x5t'
+                header of a JWS or JWT
+        """
+        return self._call(
+            _CRYPTO_JWS_SIGN,
+            (),
+            (
+                algorithm,
+                jku,
+                jwk,
+                type,
+                cty,
+                x5c_key,
+                jwks,
+                kid,
+                password_file,
+                x5c_cert,
+                x5t_cert,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def inspect(
+        self,
+        *,
+        json: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Return the decoded JWS without verification.
+
+        Args:
+            json (bool): Displays the header, payload and signature as a JSON object.
+        """
+        return self._call(
+            _CRYPTO_JWS_INSPECT,
+            (),
+            (json,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def verify(
+        self,
+        *,
+        algorithm: StepValue | None = None,
+        key: StepValue | None = None,
+        jwks: StepValue | None = None,
+        kid: StepValue | None = None,
+        json: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Verify a signed JWS data structure and return the payload.
+
+        Args:
+            algorithm (StepValue): The signature or MAC algorithm to use.
+            key (StepValue): The file containing the key with which to verify the JWS.
+            jwks (StepValue): The JWK Set containing the key to use to verify the JWS.
+            kid (StepValue): The ID of the key used to sign the JWK, used to select a
+                JWK from a JWK Set.
+            json (bool): Displays the header, payload and signature as a JSON object.
+        """
+        return self._call(
+            _CRYPTO_JWS_VERIFY,
+            (),
+            (algorithm, key, jwks, kid, json),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_JOSE_FORMAT = StepCommandSpec(
+    ("step", "crypto", "jose", "format"),
+    (),
+)
+
+
+class _CryptoJose(StepCommandGroup):
+    """The commands of `step crypto jose`: collection of JOSE utilities."""
+
+    __slots__ = ()
+
+    def format(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Swap serialization format."""
+        return self._call(
+            _CRYPTO_JOSE_FORMAT,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_HASH_DIGEST = StepCommandSpec(
+    ("step", "crypto", "hash", "digest"),
+    ("alg",),
+)
+
+
+_CRYPTO_HASH_COMPARE = StepCommandSpec(
+    ("step", "crypto", "hash", "compare"),
+    ("alg",),
+)
+
+
+class _CryptoHash(StepCommandGroup):
+    """The commands of `step crypto hash`: generate and check hashes of files and
+    directories.
+    """
+
+    __slots__ = ()
+
+    def digest(
+        self,
+        file_or_directory: str | None = None,
+        /,
+        *,
+        alg: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate a hash digest of a file or directory.
+
+        Args:
+            file_or_directory (str): The path to a file or directory to hash.
+            alg (StepValue): The hash algorithm to use.
+        """
+        return self._call(
+            _CRYPTO_HASH_DIGEST,
+            (file_or_directory,),
+            (alg,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def compare(
+        self,
+        hash: str | None = None,
+        file_or_directory: str | None = None,
+        /,
+        *,
+        alg: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Verify the hash digest for a file or directory matches an expected value.
+
+        Args:
+            hash (str): The expected hash digest
+            file_or_directory (str): The path to a file or directory to hash.
+            alg (StepValue): The hash algorithm to use.
+        """
+        return self._call(
+            _CRYPTO_HASH_COMPARE,
+            (hash, file_or_directory),
+            (alg,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_KDF_HASH = StepCommandSpec(
+    ("step", "crypto", "kdf", "hash"),
+    ("alg",),
+)
+
+
+_CRYPTO_KDF_COMPARE = StepCommandSpec(
+    ("step", "crypto", "kdf", "compare"),
+    (),
+)
+
+
+class _CryptoKdf(StepCommandGroup):
+    """The commands of `step crypto kdf`: key derivation functions for password
+    hashing and verification.
+    """
+
+    __slots__ = ()
+
+    def hash(
+        self,
+        input: str | None = None,
+        /,
+        *,
+        alg: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Derive a secret key from a secret value (e.g., a password).
+
+        Args:
+            input (str): The input to the key derivation function.
+            alg (StepValue): The KDF algorithm to use.
+        """
+        return self._call(
+            _CRYPTO_KDF_HASH,
+            (input,),
+            (alg,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def compare(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Compare a plaintext value (e.g., a password) and a hash."""
+        return self._call(
+            _CRYPTO_KDF_COMPARE,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_KEY_FORMAT = StepCommandSpec(
+    ("step", "crypto", "key", "format"),
+    (
+        "pkcs8",
+        "pem",
+        "der",
+        "ssh",
+        "jwk",
+        "out",
+        "password-file",
+        "no-password",
+        "insecure",
+        "force",
+    ),
+)
+
+
+_CRYPTO_KEY_PUBLIC = StepCommandSpec(
+    ("step", "crypto", "key", "public"),
+    ("out", "password-file", "force"),
+)
+
+
+_CRYPTO_KEY_INSPECT = StepCommandSpec(
+    ("step", "crypto", "key", "inspect"),
+    ("password-file",),
+)
+
+
+_CRYPTO_KEY_FINGERPRINT = StepCommandSpec(
+    ("step", "crypto", "key", "fingerprint"),
+    ("sha1", "ssh", "password-file", "raw", "format"),
+)
+
+
+_CRYPTO_KEY_SIGN = StepCommandSpec(
+    ("step", "crypto", "key", "sign"),
+    ("key", "alg", "pss", "raw", "password-file"),
+)
+
+
+_CRYPTO_KEY_VERIFY = StepCommandSpec(
+    ("step", "crypto", "key", "verify"),
+    ("key", "signature", "alg", "pss"),
+)
+
+
+class _CryptoKey(StepCommandGroup):
+    """The commands of `step crypto key`: manage keys."""
+
+    __slots__ = ()
+
+    def format(
+        self,
+        key_file: str | None = None,
+        /,
+        *,
+        pkcs8: bool = False,
+        pem: bool = False,
+        der: bool = False,
+        ssh: bool = False,
+        jwk: bool = False,
+        out: StepValue | None = None,
+        password_file: StepValue | None = None,
+        no_password: bool = False,
+        insecure: bool = False,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Reformat a public or private key.
+
+        Args:
+            key_file (str): Path to a file with a public or private key, or the public
+                key of an X.509 certificate.
+            pkcs8 (bool): Convert RSA and ECDSA private keys to PKCS#8 PEM/DER format.
+            pem (bool): Uses PEM as the result encoding format.
+            der (bool): Uses DER as the result enconfig format.
+            ssh (bool): Uses OpenSSH as the result encoding format.
+            jwk (bool): Uses JSON Web Key as the result encoding format.
+            out (StepValue): Path to write the reformatted result.
+            password_file (StepValue): Location of file containing passphrase to decrypt
+                private key.
+            no_password (bool): Do not ask for a password to encrypt a private key with
+                PEM format.
+            insecure (bool):
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CRYPTO_KEY_FORMAT,
+            (key_file,),
+            (
+                pkcs8,
+                pem,
+                der,
+                ssh,
+                jwk,
+                out,
+                password_file,
+                no_password,
+                insecure,
+                force,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def public(
+        self,
+        key_file: str | None = None,
+        /,
+        *,
+        out: StepValue | None = None,
+        password_file: StepValue | None = None,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print the public key from a private key or certificate.
+
+        Args:
+            key_file (str): Path to a private key.
+            out (StepValue): The file to write the public key.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CRYPTO_KEY_PUBLIC,
+            (key_file,),
+            (out, password_file, force),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def inspect(
+        self,
+        key_file: str | None = None,
+        /,
+        *,
+        password_file: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print key details in human readable format.
+
+        Args:
+            key_file (str): Path to a public or private key.
+            password_file (StepValue): The path to the file containing passphrase to
+                decrypt private key.
+        """
+        return self._call(
+            _CRYPTO_KEY_INSPECT,
+            (key_file,),
+            (password_file,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def fingerprint(
+        self,
+        key_file: str | None = None,
+        /,
+        *,
+        sha1: bool = False,
+        ssh: bool = False,
+        password_file: StepValue | None = None,
+        raw: bool = False,
+        format: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print the fingerprint of a public key.
+
+        Args:
+            key_file (str): Path to a public, private key, certificate (X.509 and SSH)
+                or certificate request.
+            sha1 (bool): Use the SHA-1 hash with hexadecimal format.
+            ssh (bool): Use the SSH marshaling format instead of X.509.
+            password_file (StepValue): The path to the file containing passphrase to
+                decrypt a private key.
+            raw (bool): Print the raw bytes instead of the fingerprint.
+            format (StepValue): The format of the fingerprint, it must be "hex",
+                "base64", "base64-url", "base64-raw", "base64-url-raw" or "emoji".
+        """
+        return self._call(
+            _CRYPTO_KEY_FINGERPRINT,
+            (key_file,),
+            (sha1, ssh, password_file, raw, format),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def sign(
+        self,
+        file: str | None = None,
+        /,
+        *,
+        key: StepValue | None = None,
+        alg: StepValue | None = None,
+        pss: bool = False,
+        raw: bool = False,
+        password_file: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Sign a message using an asymmetric key.
+
+        Args:
+            file (str): File to sign
+            key (StepValue): The path to the file containing the private key.
+            alg (StepValue): The hash algorithm to use on RSA PKCS #1 1.5 and RSA-PSS
+                signatures.
+            pss (bool): Use RSA-PSS signature scheme.
+            raw (bool): Print the raw bytes instead of the base64 format.
+            password_file (StepValue): The path to the file containing passphrase to
+                decrypt the private key.
+        """
+        return self._call(
+            _CRYPTO_KEY_SIGN,
+            (file,),
+            (key, alg, pss, raw, password_file),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def verify(
+        self,
+        file: str | None = None,
+        /,
+        *,
+        key: StepValue | None = None,
+        signature: StepValue | None = None,
+        alg: StepValue | None = None,
+        pss: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Verify a signed message.
+
+        Args:
+            file (str): File to verify.
+            key (StepValue): The path to the file containing the public key.
+            signature (StepValue): The base64 version of the signature.
+            alg (StepValue): The hash algorithm to use on RSA PKCS #1 1.5 and RSA-PSS
+                signatures.
+            pss (bool): Verify using the RSA-PSS signature scheme.
+        """
+        return self._call(
+            _CRYPTO_KEY_VERIFY,
+            (file,),
+            (key, signature, alg, pss),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_NACL_AUTH_DIGEST = StepCommandSpec(
+    ("step", "crypto", "nacl", "auth", "digest"),
+    (),
+)
+
+
+_CRYPTO_NACL_AUTH_VERIFY = StepCommandSpec(
+    ("step", "crypto", "nacl", "auth", "verify"),
+    (),
+)
+
+
+class _CryptoNaclAuth(StepCommandGroup):
+    """The commands of `step crypto nacl auth`: authenticate a message using a secret
+    key.
+    """
+
+    __slots__ = ()
+
+    def digest(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate a 32-byte digest for a message."""
+        return self._call(
+            _CRYPTO_NACL_AUTH_DIGEST,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def verify(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Validate a digest for a message."""
+        return self._call(
+            _CRYPTO_NACL_AUTH_VERIFY,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_NACL_BOX_KEYPAIR = StepCommandSpec(
+    ("step", "crypto", "nacl", "box", "keypair"),
+    ("force",),
+)
+
+
+_CRYPTO_NACL_BOX_OPEN = StepCommandSpec(
+    ("step", "crypto", "nacl", "box", "open"),
+    ("raw",),
+)
+
+
+_CRYPTO_NACL_BOX_SEAL = StepCommandSpec(
+    ("step", "crypto", "nacl", "box", "seal"),
+    ("raw",),
+)
+
+
+class _CryptoNaclBox(StepCommandGroup):
+    """The commands of `step crypto nacl box`: authenticate and encrypt small
+    messages using public-key cryptography.
+    """
+
+    __slots__ = ()
+
+    def keypair(
+        self,
+        pub_file: str | None = None,
+        priv_file: str | None = None,
+        /,
+        *,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate a key for use with seal and open.
+
+        Args:
+            pub_file (str): The path to write the public key.
+            priv_file (str): The path to write the encrypted private key.
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CRYPTO_NACL_BOX_KEYPAIR,
+            (pub_file, priv_file),
+            (force,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def open(
+        self,
+        nonce: str | None = None,
+        sender_pub_key: str | None = None,
+        priv_key: str | None = None,
+        /,
+        *,
+        raw: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Authenticate and decrypt a box produced by seal.
+
+        Args:
+            nonce (str): The nonce provided when the box was sealed.
+            sender_pub_key (str): The path to the public key of the peer that produced
+                the sealed box.
+            priv_key (str): The path to the private key used to open the box.
+            raw (bool): Indicates that input is not base64 encoded
+        """
+        return self._call(
+            _CRYPTO_NACL_BOX_OPEN,
+            (nonce, sender_pub_key, priv_key),
+            (raw,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def seal(
+        self,
+        nonce: str | None = None,
+        recipient_pub_key: str | None = None,
+        priv_key: str | None = None,
+        /,
+        *,
+        raw: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Produce an authenticated and encrypted ciphertext.
+
+        Args:
+            nonce (str): Must be unique for each distinct message for a given pair of
+                keys.
+            recipient_pub_key (str): The path to the public key of the intended
+                recipient of the sealed box.
+            priv_key (str): The path to the private key used for authentication.
+            raw (bool): Do not base64 encode output
+        """
+        return self._call(
+            _CRYPTO_NACL_BOX_SEAL,
+            (nonce, recipient_pub_key, priv_key),
+            (raw,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_NACL_SECRETBOX_OPEN = StepCommandSpec(
+    ("step", "crypto", "nacl", "secretbox", "open"),
+    ("raw",),
+)
+
+
+_CRYPTO_NACL_SECRETBOX_SEAL = StepCommandSpec(
+    ("step", "crypto", "nacl", "secretbox", "seal"),
+    ("raw",),
+)
+
+
+class _CryptoNaclSecretbox(StepCommandGroup):
+    """The commands of `step crypto nacl secretbox`: encrypt and authenticate small
+    messages using secret-key cryptography.
+    """
+
+    __slots__ = ()
+
+    def open(
+        self,
+        nonce: str | None = None,
+        key_file: str | None = None,
+        /,
+        *,
+        raw: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Authenticate and decrypt a box produced by seal.
+
+        Args:
+            nonce (str): The nonce provided when the secretbox was sealed.
+            key_file (str): The path to the shared key.
+            raw (bool): Indicates that input is not base64 encoded
+        """
+        return self._call(
+            _CRYPTO_NACL_SECRETBOX_OPEN,
+            (nonce, key_file),
+            (raw,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def seal(
+        self,
+        nonce: str | None = None,
+        key_file: str | None = None,
+        /,
+        *,
+        raw: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Produce an encrypted ciphertext.
+
+        Args:
+            nonce (str): Must be unique for each distinct message for a given key.
+            key_file (str): The path to the shared key.
+            raw (bool): Do not base64 encode output
+        """
+        return self._call(
+            _CRYPTO_NACL_SECRETBOX_SEAL,
+            (nonce, key_file),
+            (raw,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_NACL_SIGN_KEYPAIR = StepCommandSpec(
+    ("step", "crypto", "nacl", "sign", "keypair"),
+    ("force",),
+)
+
+
+_CRYPTO_NACL_SIGN_OPEN = StepCommandSpec(
+    ("step", "crypto", "nacl", "sign", "open"),
+    ("raw",),
+)
+
+
+_CRYPTO_NACL_SIGN_SIGN = StepCommandSpec(
+    ("step", "crypto", "nacl", "sign", "sign"),
+    ("raw",),
+)
+
+
+class _CryptoNaclSign(StepCommandGroup):
+    """The commands of `step crypto nacl sign`: sign small messages using public-key
+    cryptography.
+    """
+
+    __slots__ = ()
+
+    def keypair(
+        self,
+        *,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate a pair for use with sign and open.
+
+        Args:
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CRYPTO_NACL_SIGN_KEYPAIR,
+            (),
+            (force,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def open(
+        self,
+        *,
+        raw: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Verify a signed message produced by sign.
+
+        Args:
+            raw (bool): Indicates that input is not base64 encoded
+        """
+        return self._call(
+            _CRYPTO_NACL_SIGN_OPEN,
+            (),
+            (raw,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def sign(
+        self,
+        *,
+        raw: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Sign a message using Ed25519.
+
+        Args:
+            raw (bool): Do not base64 encode output
+        """
+        return self._call(
+            _CRYPTO_NACL_SIGN_SIGN,
+            (),
+            (raw,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _CryptoNacl(StepCommandGroup):
+    """The commands of `step crypto nacl`: easy-to-use high-speed tools for
+    encryption and signing.
+    """
+
+    __slots__ = ()
+
+    @property
+    def auth(self) -> _CryptoNaclAuth:
+        """Authenticate a message using a secret key."""
+        return _CryptoNaclAuth(self._cli)
+
+    @property
+    def box(self) -> _CryptoNaclBox:
+        """Authenticate and encrypt small messages using public-key cryptography."""
+        return _CryptoNaclBox(self._cli)
+
+    @property
+    def secretbox(self) -> _CryptoNaclSecretbox:
+        """Encrypt and authenticate small messages using secret-key cryptography."""
+        return _CryptoNaclSecretbox(self._cli)
+
+    @property
+    def sign(self) -> _CryptoNaclSign:
+        """Sign small messages using public-key cryptography."""
+        return _CryptoNaclSign(self._cli)
+
+
+_CRYPTO_OTP_GENERATE = StepCommandSpec(
+    ("step", "crypto", "otp", "generate"),
+    (
+        "issuer",
+        "account",
+        "period",
+        "length",
+        "secret-size",
+        "algorithm",
+        "url",
+        "qr",
+        "force",
+    ),
+)
+
+
+_CRYPTO_OTP_VERIFY = StepCommandSpec(
+    ("step", "crypto", "otp", "verify"),
+    ("secret", "period", "skew", "length", "algorithm", "time"),
+)
+
+
+class _CryptoOtp(StepCommandGroup):
+    """The commands of `step crypto otp`: generate and verify one-time passwords."""
+
+    __slots__ = ()
+
+    def generate(
+        self,
+        *,
+        issuer: StepValue | None = None,
+        account: StepValue | None = None,
+        period: StepValue | None = None,
+        length: StepValue | None = None,
+        secret_size: StepValue | None = None,
+        algorithm: StepValue | None = None,
+        url: bool = False,
+        qr: StepValue | None = None,
+        force: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate a one-time password.
+
+        Args:
+            issuer (StepValue): Name of the issuing organization (e.g., smallstep.com)
+            account (StepValue): Name of the user's account (e.g., a username or email
+                address)
+            period (StepValue): Number of seconds a TOTP hash is valid.
+            length (StepValue): Length of one-time passwords.
+            secret_size (StepValue): Size of generated TOTP secret.
+            algorithm (StepValue): Algorithm to use for HMAC.
+            url (bool): Output a TOTP Key URI.
+            qr (StepValue): Write a QR code to the specified path
+            force (bool): Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CRYPTO_OTP_GENERATE,
+            (),
+            (issuer, account, period, length, secret_size, algorithm, url, qr, force),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def verify(
+        self,
+        *,
+        secret: StepValue | None = None,
+        period: StepValue | None = None,
+        skew: StepValue | None = None,
+        length: StepValue | None = None,
+        algorithm: StepValue | None = None,
+        time: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Verify a one-time password.
+
+        Args:
+            secret (StepValue): The file containing TOTP secret.
+            period (StepValue): Number of seconds a TOTP hash is valid.
+            skew (StepValue): Periods before or after current time to allow.
+            length (StepValue): Length of one-time passwords.
+            algorithm (StepValue): Algorithm to use for HMAC.
+            time (StepValue): The time|duration to use for TOTP validation.
+        """
+        return self._call(
+            _CRYPTO_OTP_VERIFY,
+            (),
+            (secret, period, skew, length, algorithm, time),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+_CRYPTO_WINPE_EXTRACT = StepCommandSpec(
+    ("step", "crypto", "winpe", "extract"),
+    (),
+)
+
+
+class _CryptoWinpe(StepCommandGroup):
+    """The commands of `step crypto winpe`: extract certificates and verify Windows
+    Portable Executable files.
+    """
+
+    __slots__ = ()
+
+    def extract(
+        self,
+        file: str | None = None,
+        /,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Extract certificates from Windows Portable Executable files.
+
+        Args:
+            file (str): The path to a Windows Portable Executable file
+        """
+        return self._call(
+            _CRYPTO_WINPE_EXTRACT,
+            (file,),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class _Crypto(StepCommandGroup):
+    """The commands of `step crypto`: useful cryptographic plumbing."""
+
+    __slots__ = ()
+
+    def change_pass(
+        self,
+        key_file: str | None = None,
+        /,
+        *,
+        password_file: StepValue | None = None,
+        new_password_file: StepValue | None = None,
+        output_file: StepValue | None = None,
+        force: bool = False,
+        insecure: bool = False,
+        no_password: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Change password of an encrypted private key (PEM or JWK format).
+
+        Args:
+            key_file (str): The PEM or JWK file with the encrypted key.
+            password_file (StepValue): The path to the file containing the password to
+                decrypt the private key.
+            new_password_file (StepValue): The path to the file containing the password
+                to encrypt the private key.
+            output_file (StepValue): The file new encrypted key path.
+            force (bool): Force the overwrite of files without asking.
+            insecure (bool):
+            no_password (bool): Do not ask for a password to encrypt a private key.
+        """
+        return self._call(
+            _CRYPTO_CHANGE_PASS,
+            (key_file,),
+            (
+                password_file,
+                new_password_file,
+                output_file,
+                force,
+                insecure,
+                no_password,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def keypair(
+        self,
+        pub_file: str | None = None,
+        priv_file: str | None = None,
+        /,
+        *,
+        kty: StepValue | None = None,
+        size: StepValue | None = None,
+        curve: StepValue | None = None,
+        from_jwk: StepValue | None = None,
+        password_file: StepValue | None = None,
+        no_password: bool = False,
+        insecure: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Generate a public / private keypair in PEM format.
+
+        Args:
+            pub_file (str): The path to write the public key.
+            priv_file (str): The path to write the private key.
+            kty (StepValue): The kty to build the certificate upon.
+            size (StepValue): The size (in bits) of the key for RSA and oct key types.
+            curve (StepValue): The elliptic curve to use for EC and OKP key types.
+            from_jwk (StepValue): Create a PEM representing the key encoded in an
+                existing jwk-file instead of creating a new key.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt or decrypt the private key.
+            no_password (bool): Do not ask for a password to encrypt a private key.
+            insecure (bool): -f, --force Force the overwrite of files without asking.
+        """
+        return self._call(
+            _CRYPTO_KEYPAIR,
+            (pub_file, priv_file),
+            (kty, size, curve, from_jwk, password_file, no_password, insecure),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def jwk(self) -> _CryptoJwk:
+        """Create JWKs (JSON Web Keys) and manage JWK Key Sets."""
+        return _CryptoJwk(self._cli)
+
+    @property
+    def jwt(self) -> _CryptoJwt:
+        """Sign and verify data using JSON Web Tokens (JWT)."""
+        return _CryptoJwt(self._cli)
+
+    @property
+    def jwe(self) -> _CryptoJwe:
+        """Encrypt and decrypt data and keys using JSON Web Encryption (JWE)."""
+        return _CryptoJwe(self._cli)
+
+    @property
+    def jws(self) -> _CryptoJws:
+        """Sign and verify data using JSON Web Signature (JWS)."""
+        return _CryptoJws(self._cli)
+
+    @property
+    def jose(self) -> _CryptoJose:
+        """Collection of JOSE utilities."""
+        return _CryptoJose(self._cli)
+
+    @property
+    def hash(self) -> _CryptoHash:
+        """Generate and check hashes of files and directories."""
+        return _CryptoHash(self._cli)
+
+    @property
+    def kdf(self) -> _CryptoKdf:
+        """Key derivation functions for password hashing and verification."""
+        return _CryptoKdf(self._cli)
+
+    @property
+    def key(self) -> _CryptoKey:
+        """Manage keys."""
+        return _CryptoKey(self._cli)
+
+    @property
+    def nacl(self) -> _CryptoNacl:
+        """Easy-to-use high-speed tools for encryption and signing."""
+        return _CryptoNacl(self._cli)
+
+    @property
+    def otp(self) -> _CryptoOtp:
+        """Generate and verify one-time passwords."""
+        return _CryptoOtp(self._cli)
+
+    @property
+    def winpe(self) -> _CryptoWinpe:
+        """Extract certificates and verify Windows Portable Executable files."""
+        return _CryptoWinpe(self._cli)
+
+
+_OAUTH = StepCommandSpec(
+    ("step", "oauth"),
+    (
+        "provider",
+        "email",
+        "console",
+        "console-flow",
+        "client-id",
+        "client-secret",
+        "account",
+        "authorization-endpoint",
+        "device-authorization-endpoint",
+        "token-endpoint",
+        "header",
+        "oidc",
+        "bare",
+        "scope",
+        "auth-param",
+        "prompt",
+        "jwt",
+        "listen",
+        "listen-url",
+        "redirect-url",
+    ),
+)
+
+
+_PATH = StepCommandSpec(
+    ("step", "path"),
+    ("base", "profile"),
+)
+
+
+_SSH_CERTIFICATE = StepCommandSpec(
+    ("step", "ssh", "certificate"),
+    (
+        "force",
+        "insecure",
+        "no-password",
+        "not-before",
+        "not-after",
+        "offline",
+        "provisioner",
+        "token",
+        "set",
+        "set-file",
+        "add-user",
+        "host",
+        "host-id",
+        "password-file",
+        "principal",
+        "private-key",
+        "provisioner-password-file",
+        "sign",
+        "kms",
+        "x5c-cert",
+        "x5c-key",
+        "x5c-chain",
+        "nebula-cert",
+        "nebula-key",
+        "k8ssa-token-path",
+        "no-agent",
+        "ca-config",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_SSH_CHECK_HOST = StepCommandSpec(
+    ("step", "ssh", "check-host"),
+    ("verbose", "ca-config", "offline", "ca-url", "root", "context"),
+)
+
+
+_SSH_CONFIG = StepCommandSpec(
+    ("step", "ssh", "config"),
+    (
+        "host",
+        "team",
+        "team-authority",
+        "team-url",
+        "roots",
+        "federation",
+        "set",
+        "set-file",
+        "dry-run",
+        "force",
+        "ca-config",
+        "ca-url",
+        "root",
+        "offline",
+        "context",
+        "profile",
+        "authority",
+    ),
+)
+
+
+_SSH_FINGERPRINT = StepCommandSpec(
+    ("step", "ssh", "fingerprint"),
+    ("format", "certificate"),
+)
+
+
+_SSH_HOSTS = StepCommandSpec(
+    ("step", "ssh", "hosts"),
+    ("set", "set-file", "offline", "ca-config", "ca-url", "root", "context"),
+)
+
+
+_SSH_INSPECT = StepCommandSpec(
+    ("step", "ssh", "inspect"),
+    ("format",),
+)
+
+
+_SSH_LIST = StepCommandSpec(
+    ("step", "ssh", "list"),
+    ("raw",),
+)
+
+
+_SSH_LOGIN = StepCommandSpec(
+    ("step", "ssh", "login"),
+    (
+        "identity",
+        "token",
+        "add-user",
+        "principal",
+        "provisioner",
+        "provisioner-password-file",
+        "not-before",
+        "not-after",
+        "set",
+        "set-file",
+        "force",
+        "offline",
+        "ca-config",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_SSH_LOGOUT = StepCommandSpec(
+    ("step", "ssh", "logout"),
+    ("identity", "all", "offline", "ca-config", "ca-url", "root", "context"),
+)
+
+
+_SSH_NEEDS_RENEWAL = StepCommandSpec(
+    ("step", "ssh", "needs-renewal"),
+    ("expires-in", "verbose"),
+)
+
+
+_SSH_PROXYCOMMAND = StepCommandSpec(
+    ("step", "ssh", "proxycommand"),
+    (
+        "provisioner",
+        "provisioner-password-file",
+        "set",
+        "set-file",
+        "offline",
+        "ca-config",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_SSH_REKEY = StepCommandSpec(
+    ("step", "ssh", "rekey"),
+    (
+        "out",
+        "provisioner",
+        "provisioner-password-file",
+        "no-password",
+        "insecure",
+        "force",
+        "sshpop-cert",
+        "sshpop-key",
+        "offline",
+        "ca-config",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_SSH_RENEW = StepCommandSpec(
+    ("step", "ssh", "renew"),
+    (
+        "output-file",
+        "provisioner",
+        "provisioner-password-file",
+        "sshpop-cert",
+        "sshpop-key",
+        "force",
+        "offline",
+        "ca-config",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+_SSH_REVOKE = StepCommandSpec(
+    ("step", "ssh", "revoke"),
+    (
+        "token",
+        "provisioner-password-file",
+        "provisioner",
+        "set",
+        "set-file",
+        "sshpop-cert",
+        "sshpop-key",
+        "reason",
+        "reasonCode",
+        "offline",
+        "ca-config",
+        "ca-url",
+        "root",
+        "context",
+    ),
+)
+
+
+class _Ssh(StepCommandGroup):
+    """The commands of `step ssh`: create and manage ssh certificates."""
+
+    __slots__ = ()
+
+    def certificate(
+        self,
+        key_id: str | None = None,
+        key_file: str | None = None,
+        /,
+        *,
+        force: bool = False,
+        insecure: bool = False,
+        no_password: bool = False,
+        not_before: StepValue | None = None,
+        not_after: StepValue | None = None,
+        offline: bool = False,
+        provisioner: StepValue | None = None,
+        token: StepValue | None = None,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        add_user: bool = False,
+        host: bool = False,
+        host_id: StepValue | None = None,
+        password_file: StepValue | None = None,
+        principal: StepValue | None = None,
+        private_key: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        sign: bool = False,
+        kms: StepValue | None = None,
+        x5c_cert: StepValue | None = None,
+        x5c_key: StepValue | None = None,
+        x5c_chain: StepValue | None = None,
+        nebula_cert: StepValue | None = None,
+        nebula_key: StepValue | None = None,
+        k8ssa_token_path: StepValue | None = None,
+        no_agent: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Sign a SSH certificate using the SSH CA.
+
+        Args:
+            key_id (str): The certificate identity.
+            key_file (str): The private key name when generating a new key pair, or the
+                public key path when we are just signing it.
+            force (bool): Force the overwrite of files without asking.
+            insecure (bool):
+            no_password (bool): Do not ask for a password to encrypt a private key.
+            not_before (StepValue): The time|duration when the certificate validity
+                period starts.
+            not_after (StepValue): The time|duration when the certificate validity
+                period ends.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            provisioner (StepValue): The provisioner name to use.
+            token (StepValue): The one-time token used to authenticate with the CA in
+                order to create the certificate.
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            add_user (bool): Create a user provisioner certificate used to create a new
+                user.
+            host (bool): Create a host certificate instead of a user certificate.
+            host_id (StepValue): Specify a UUID to identify the host rather than using
+                an auto-generated UUID.
+            password_file (StepValue): The path to the file containing the password to
+                encrypt the private key.
+            principal (StepValue): Add the specified principal (user or host names) to
+                the certificate request.
+            private_key (StepValue): When signing an existing public key, use this flag
+                to specify the corresponding private key so that the pair can be added
+                to an SSH Agent.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            sign (bool): Sign the public key passed as an argument instead of creating
+                one.
+            kms (StepValue): The uri to configure a Cloud KMS or an HSM.
+            x5c_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'x5c' header of a JWT.
+            x5c_key (StepValue): Private key file, used to sign a JWT, corresponding to
+                the certificate that will be stored in the 'x5c' header.
+            x5c_chain (StepValue): Certificate file, in PEM format
+            nebula_cert (StepValue): Certificate file in PEM format to store in the
+                'nebula' header of a JWT.
+            nebula_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the certificate that will be stored in the 'nebula' header.
+            k8ssa_token_path (StepValue): Configure the file from which to read the
+                kubernetes service account token.
+            no_agent (bool): Do not add the generated certificate and associated private
+                key to the SSH agent.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_CERTIFICATE,
+            (key_id, key_file),
+            (
+                force,
+                insecure,
+                no_password,
+                not_before,
+                not_after,
+                offline,
+                provisioner,
+                token,
+                set,
+                set_file,
+                add_user,
+                host,
+                host_id,
+                password_file,
+                principal,
+                private_key,
+                provisioner_password_file,
+                sign,
+                kms,
+                x5c_cert,
+                x5c_key,
+                x5c_chain,
+                nebula_cert,
+                nebula_key,
+                k8ssa_token_path,
+                no_agent,
+                ca_config,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def check_host(
+        self,
+        hostname: str | None = None,
+        /,
+        *,
+        verbose: bool = False,
+        ca_config: StepValue | None = None,
+        offline: bool = False,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Checks if a certificate has been issued for a host.
+
+        Args:
+            hostname (str): The hostname of the server to check.
+            verbose (bool): Return "true" or "false" in the terminal.
+            ca_config (StepValue): The certificate authority configuration file.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_CHECK_HOST,
+            (hostname,),
+            (verbose, ca_config, offline, ca_url, root, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def config(
+        self,
+        *,
+        host: bool = False,
+        team: StepValue | None = None,
+        team_authority: StepValue | None = None,
+        team_url: StepValue | None = None,
+        roots: bool = False,
+        federation: bool = False,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        dry_run: bool = False,
+        force: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        offline: bool = False,
+        context: StepValue | None = None,
+        profile: StepValue | None = None,
+        authority: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Configures ssh to be used with certificates.
+
+        Args:
+            host (bool): Configures a SSH server instead of a client.
+            team (StepValue): The team ID used to bootstrap the environment.
+            team_authority (StepValue): The sub-domain of the certificate authority to
+                bootstrap.
+            team_url (StepValue): The url step queries to retrieve initial team
+                configuration.
+            roots (bool): Prints the public keys used to verify user or host
+                certificates.
+            federation (bool): Prints all the public keys in the federation.
+            set (StepValue): The key=value used as a variable in the templates.
+            set_file (StepValue): The JSON file with the template data variables.
+            dry_run (bool): Executes the command without changing any file.
+            force (bool): Force the overwrite of files without asking.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            context (StepValue): The name of the context for the new authority.
+            profile (StepValue): The name that will serve as the profile name for the
+                context.
+            authority (StepValue): The name that will serve as the authority name for
+                the context.
+        """
+        return self._call(
+            _SSH_CONFIG,
+            (),
+            (
+                host,
+                team,
+                team_authority,
+                team_url,
+                roots,
+                federation,
+                set,
+                set_file,
+                dry_run,
+                force,
+                ca_config,
+                ca_url,
+                root,
+                offline,
+                context,
+                profile,
+                authority,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def fingerprint(
+        self,
+        file: str | None = None,
+        /,
+        *,
+        format: StepValue | None = None,
+        certificate: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print the fingerprint of an SSH public key or certificate.
+
+        Args:
+            file (str): The path to an SSH public key or certificate.
+            format (StepValue): The format of the fingerprint, it must be "hex",
+                "base64", "base64-url", "base64-raw", "base64-url-raw" or "emoji".
+            certificate (bool): Include SSH certificate bytes in fingerprint
+        """
+        return self._call(
+            _SSH_FINGERPRINT,
+            (file,),
+            (format, certificate),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def hosts(
+        self,
+        *,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        offline: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Returns a list of all valid hosts.
+
+        Args:
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_HOSTS,
+            (),
+            (set, set_file, offline, ca_config, ca_url, root, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def inspect(
+        self,
+        crt_file: str | None = None,
+        /,
+        *,
+        format: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print the contents of an ssh certificate.
+
+        Args:
+            crt_file (str): The path to an ssh certificate.
+            format (StepValue): The output format for printing the introspection
+                details.
+        """
+        return self._call(
+            _SSH_INSPECT,
+            (crt_file,),
+            (format,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def list(
+        self,
+        subject: str | None = None,
+        /,
+        *,
+        raw: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """List public keys known to the ssh agent.
+
+        Args:
+            subject (str): Optional subject or comment to filter keys by.
+            raw (bool): List public keys instead of fingerprints.
+        """
+        return self._call(
+            _SSH_LIST,
+            (subject,),
+            (raw,),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def login(
+        self,
+        *,
+        identity: StepValue | None = None,
+        token: StepValue | None = None,
+        add_user: bool = False,
+        principal: StepValue | None = None,
+        provisioner: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        not_before: StepValue | None = None,
+        not_after: StepValue | None = None,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        force: bool = False,
+        offline: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Adds a SSH certificate into the authentication agent.
+
+        Args:
+            identity (StepValue): The certificate identity.
+            token (StepValue): The one-time token used to authenticate with the CA in
+                order to create the certificate.
+            add_user (bool): Create a user provisioner certificate used to create a new
+                user.
+            principal (StepValue): Add the specified principal (username) to the
+                certificate request.
+            provisioner (StepValue): The provisioner name to use.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            not_before (StepValue): The time|duration when the certificate validity
+                period starts.
+            not_after (StepValue): The time|duration when the certificate validity
+                period ends.
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            force (bool): Force the overwrite of files without asking.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_LOGIN,
+            (),
+            (
+                identity,
+                token,
+                add_user,
+                principal,
+                provisioner,
+                provisioner_password_file,
+                not_before,
+                not_after,
+                set,
+                set_file,
+                force,
+                offline,
+                ca_config,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def logout(
+        self,
+        *,
+        identity: StepValue | None = None,
+        all: bool = False,
+        offline: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Removes a private key from the ssh-agent.
+
+        Args:
+            identity (StepValue): The certificate identity.
+            all (bool): Removes all the keys stored in the SSH agent.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_LOGOUT,
+            (),
+            (identity, all, offline, ca_config, ca_url, root, context),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def needs_renewal(
+        self,
+        cert_file: str | None = None,
+        /,
+        *,
+        expires_in: StepValue | None = None,
+        verbose: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Check if an SSH certificate needs to be renewed.
+
+        Args:
+            cert_file (str): The path to an SSH certificate.
+            expires_in (StepValue): Check if the certificate expires within the given
+                time window using percent|duration.
+            verbose (bool): Print human readable affirmation if certificate requires
+                renewal.
+        """
+        return self._call(
+            _SSH_NEEDS_RENEWAL,
+            (cert_file,),
+            (expires_in, verbose),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def proxycommand(
+        self,
+        user: str | None = None,
+        host: str | None = None,
+        port: str | None = None,
+        /,
+        *,
+        provisioner: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        offline: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Proxy ssh connections according to the host registry.
+
+        Args:
+            user (str): The remote username, and the subject used to login.
+            host (str): The host to connect to.
+            port (str): The port to connect to.
+            provisioner (StepValue): The provisioner name to use.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_PROXYCOMMAND,
+            (user, host, port),
+            (
+                provisioner,
+                provisioner_password_file,
+                set,
+                set_file,
+                offline,
+                ca_config,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def rekey(
+        self,
+        ssh_cert: str | None = None,
+        ssh_key: str | None = None,
+        /,
+        *,
+        out: StepValue | None = None,
+        provisioner: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        no_password: bool = False,
+        insecure: bool = False,
+        force: bool = False,
+        sshpop_cert: StepValue | None = None,
+        sshpop_key: StepValue | None = None,
+        offline: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Rekey a SSH certificate using the SSH CA.
+
+        Args:
+            ssh_cert (str): The ssh certificate to renew.
+            ssh_key (str): The ssh certificate private key.
+            out (StepValue): The new key file.
+            provisioner (StepValue): The provisioner name to use.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            no_password (bool): Do not ask for a password to encrypt a private key.
+            insecure (bool):
+            force (bool): Force the overwrite of files without asking.
+            sshpop_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'sshpop' header of a JWT.
+            sshpop_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the certificate that will be stored in the 'sshpop' header.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_REKEY,
+            (ssh_cert, ssh_key),
+            (
+                out,
+                provisioner,
+                provisioner_password_file,
+                no_password,
+                insecure,
+                force,
+                sshpop_cert,
+                sshpop_key,
+                offline,
+                ca_config,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def renew(
+        self,
+        ssh_cert: str | None = None,
+        ssh_key: str | None = None,
+        /,
+        *,
+        output_file: StepValue | None = None,
+        provisioner: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        sshpop_cert: StepValue | None = None,
+        sshpop_key: StepValue | None = None,
+        force: bool = False,
+        offline: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Renew a SSH certificate using the SSH CA.
+
+        Args:
+            ssh_cert (str): The ssh certificate to renew.
+            ssh_key (str): The ssh certificate private key.
+            output_file (StepValue): The new certificate file.
+            provisioner (StepValue): The provisioner name to use.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            sshpop_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'sshpop' header of a JWT.
+            sshpop_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the certificate that will be stored in the 'sshpop' header.
+            force (bool): Force the overwrite of files without asking.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_RENEW,
+            (ssh_cert, ssh_key),
+            (
+                output_file,
+                provisioner,
+                provisioner_password_file,
+                sshpop_cert,
+                sshpop_key,
+                force,
+                offline,
+                ca_config,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def revoke(
+        self,
+        serial_number: str | None = None,
+        /,
+        *,
+        token: StepValue | None = None,
+        provisioner_password_file: StepValue | None = None,
+        provisioner: StepValue | None = None,
+        set: StepValue | None = None,
+        set_file: StepValue | None = None,
+        sshpop_cert: StepValue | None = None,
+        sshpop_key: StepValue | None = None,
+        reason: StepValue | None = None,
+        reasoncode: StepValue | None = None,
+        offline: bool = False,
+        ca_config: StepValue | None = None,
+        ca_url: StepValue | None = None,
+        root: StepValue | None = None,
+        context: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Revoke a SSH certificate using the SSH CA.
+
+        Args:
+            serial_number (str): The serial number of the SSH certificate to revoke.
+            token (StepValue): The one-time token used to authenticate with the CA in
+                order to create the certificate.
+            provisioner_password_file (StepValue): The path to the file containing the
+                password to decrypt the one-time token generating key.
+            provisioner (StepValue): The provisioner name to use.
+            set (StepValue): The key=value pair with template data variables.
+            set_file (StepValue): The JSON file with the template data variables.
+            sshpop_cert (StepValue): Certificate (chain) in PEM format to store in the
+                'sshpop' header of a JWT.
+            sshpop_key (StepValue): Private key file, used to sign a JWT, corresponding
+                to the certificate that will be stored in the 'sshpop' header.
+            reason (StepValue): The string representing the reason for which the cert is
+                being revoked.
+            reasoncode (StepValue): The reasonCode specifies the reason for revocation -
+                chose from a list of common revocation reasons.
+            offline (bool): Creates a certificate without contacting the certificate
+                authority.
+            ca_config (StepValue): The certificate authority configuration file.
+            ca_url (StepValue): URI of the targeted Step Certificate Authority.
+            root (StepValue): The path to the PEM file used as the root certificate
+                authority.
+            context (StepValue): The context name to apply for the given command.
+        """
+        return self._call(
+            _SSH_REVOKE,
+            (serial_number,),
+            (
+                token,
+                provisioner_password_file,
+                provisioner,
+                set,
+                set_file,
+                sshpop_cert,
+                sshpop_key,
+                reason,
+                reasoncode,
+                offline,
+                ca_config,
+                ca_url,
+                root,
+                context,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+
+class StepCommands(StepCommandGroup):
+    """The commands of `step`: the (small)step cli."""
+
+    __slots__ = ()
+
+    def help(
+        self,
+        *,
+        http: StepValue | None = None,
+        html: StepValue | None = None,
+        markdown: StepValue | None = None,
+        report: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Display help for the specified command or command group.
+
+        Args:
+            http (StepValue): HTTP service address (e.g., ':8080')
+            html (StepValue): The export directory for HTML docs.
+            markdown (StepValue): The export directory for Markdown docs.
+            report (bool): Writes a JSON report to the HTML docs directory.
+        """
+        return self._call(
+            _HELP,
+            (),
+            (http, html, markdown, report),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def version(
+        self,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Display the current version of the cli."""
+        return self._call(
+            _VERSION,
+            (),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def base64(
+        self,
+        *,
+        decode: bool = False,
+        raw: bool = False,
+        url: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Encodes and decodes using base64 representation.
+
+        Args:
+            decode (bool): Decode base64 input
+            raw (bool): Use the unpadded base64 encoding
+            url (bool): Use the encoding format typically used in URLs and file names
+        """
+        return self._call(
+            _BASE64,
+            (),
+            (decode, raw, url),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def ca(self) -> _Ca:
+        """Initialize and manage a certificate authority."""
+        return _Ca(self._cli)
+
+    @property
+    def beta(self) -> _Beta:
+        """Commands that are being tested; these APIs are likely to change."""
+        return _Beta(self._cli)
+
+    @property
+    def certificate(self) -> _Certificate:
+        """Create, revoke, validate, bundle, and otherwise manage certificates."""
+        return _Certificate(self._cli)
+
+    def completion(
+        self,
+        shell: str | None = None,
+        /,
+        *,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print the shell completion script.
+
+        Args:
+            shell (str): The shell program.
+        """
+        return self._call(
+            _COMPLETION,
+            (shell,),
+            (),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def context(self) -> _Context:
+        """Manage certificate authority contexts."""
+        return _Context(self._cli)
+
+    @property
+    def crl(self) -> _Crl:
+        """Initialize and manage a certificate revocation list."""
+        return _Crl(self._cli)
+
+    @property
+    def crypto(self) -> _Crypto:
+        """Useful cryptographic plumbing."""
+        return _Crypto(self._cli)
+
+    def oauth(
+        self,
+        *,
+        provider: StepValue | None = None,
+        email: StepValue | None = None,
+        console: bool = False,
+        console_flow: StepValue | None = None,
+        client_id: StepValue | None = None,
+        client_secret: StepValue | None = None,
+        account: StepValue | None = None,
+        authorization_endpoint: StepValue | None = None,
+        device_authorization_endpoint: StepValue | None = None,
+        token_endpoint: StepValue | None = None,
+        header: bool = False,
+        oidc: bool = False,
+        bare: bool = False,
+        scope: StepValue | None = None,
+        auth_param: StepValue | None = None,
+        prompt: StepValue | None = None,
+        jwt: bool = False,
+        listen: StepValue | None = None,
+        listen_url: StepValue | None = None,
+        redirect_url: StepValue | None = None,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Authorization and single sign-on using OAuth & OIDC.
+
+        Args:
+            provider (StepValue): OAuth provider for authentication
+            email (StepValue): Email to authenticate
+            console (bool): Complete the flow while remaining only inside the terminal.
+            console_flow (StepValue): The alternative OAuth flow to use for input
+                constrained devices.
+            client_id (StepValue): OAuth Client ID
+            client_secret (StepValue): OAuth Client Secret
+            account (StepValue): JSON file containing account details
+            authorization_endpoint (StepValue): OAuth Authorization Endpoint
+            device_authorization_endpoint (StepValue): OAuth Device Authorization
+                Endpoint
+            token_endpoint (StepValue): OAuth Token Endpoint
+            header (bool): Output HTTP Authorization Header (suitable for use with curl)
+            oidc (bool): Output OIDC Token instead of OAuth Access Token
+            bare (bool): Only output the token
+            scope (StepValue): OAuth scopes
+            auth_param (StepValue): OAuth additional authentication parameters to
+                include as part of the URL query.
+            prompt (StepValue): Whether the Authorization Server prompts the End-User
+                for reauthentication and consent.
+            jwt (bool): Generate a JWT Auth token instead of an OAuth Token (only works
+                with service accounts)
+            listen (StepValue): Callback listener address (e.g.
+            listen_url (StepValue): The redirect_uri url in the authorize request (e.g.
+            redirect_url (StepValue): The url to open in the system browser when the
+                OAuth flow is successful.
+        """
+        return self._call(
+            _OAUTH,
+            (),
+            (
+                provider,
+                email,
+                console,
+                console_flow,
+                client_id,
+                client_secret,
+                account,
+                authorization_endpoint,
+                device_authorization_endpoint,
+                token_endpoint,
+                header,
+                oidc,
+                bare,
+                scope,
+                auth_param,
+                prompt,
+                jwt,
+                listen,
+                listen_url,
+                redirect_url,
+            ),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    def path(
+        self,
+        *,
+        base: bool = False,
+        profile: bool = False,
+        _no_stdin: bool = False,
+        _no_stderr: bool = False,
+        _raw_output: bool = False,
+    ) -> Any:
+        """Print the configured step path and exit.
+
+        Args:
+            base (bool): Return the base of the step path
+            profile (bool): Return the base path of the currently configured default
+                profile
+        """
+        return self._call(
+            _PATH,
+            (),
+            (base, profile),
+            _no_stdin,
+            _no_stderr,
+            _raw_output,
+        )
+
+    @property
+    def ssh(self) -> _Ssh:
+        """Create and manage ssh certificates."""
+        return _Ssh(self._cli)
@@ -0,0 +1,238 @@
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import bisect
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+SECONDS_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+BYTES_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRICS = {
+    "step_command_spawn_seconds": "Time to start a step process.",
+    "step_command_seconds": "Time to run a step command, by exit status.",
+    "step_command_output_bytes": "Size of the stdout of a step command.",
+    "step_command_parse_seconds": "Time to parse the output of a step command.",
+    "step_help_parse_seconds": "Time to parse the help of a step command.",
+    "step_ca_request_seconds": "Time of a request to the ca, by http status.",
+}
+
+# the command a step process is started for, for the spawn latency
+_command: ContextVar[str] = ContextVar("step_command", default="")
+
+
+def endpoint(path: str) -> str:
+    """Gets the endpoint of a request path, without ids and the query.
+
+    Args:
+        path (str): The path, like `/provisioners/jwk/encrypted-key`.
+    Returns:
+        str: The endpoint, like `/provisioners`.
+    """
+    return "/" + path.split("?")[0].strip("/").split("/")[0]
+
+
+class StepMetricsExporter(ABC):
+    """Receives every observation, while added to `step_metrics`."""
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: dict[str, str]) -> None:
+        """Records an observation.
+
+        Args:
+            name (str): The metric, one of `METRICS`.
+            value (float): The value, seconds or bytes.
+            labels (Dict[str, str]): The command or endpoint, and status.
+        """
+
+
+class CallbackExporter(StepMetricsExporter):
+    """Calls a function with every observation."""
+
+    callback: Callable[[str, float, dict[str, str]], None]
+
+    def __init__(self, callback: Callable[[str, float, dict[str, str]], None]) -> None:
+        """Initializes the exporter.
+
+        Args:
+            callback (Callable[[str, float, Dict[str, str]], None]): Called with
+                the metric, the value and the labels.
+        """
+        self.callback = callback
+
+    def observe(self, name: str, value: float, labels: dict[str, str]) -> None:
+        self.callback(name, value, labels)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last is +Inf
+        self.sum = 0.0
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusExporter(StepMetricsExporter):
+    """Keeps histograms of the observations, in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[tuple, _Histogram]] = {}
+
+    def observe(self, name: str, value: float, labels: dict[str, str]) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            histograms = self._histograms.setdefault(name, {})
+            histogram = histograms.get(key)
+            if histogram is None:
+                buckets = BYTES_BUCKETS if name.endswith("_bytes") else SECONDS_BUCKETS
+                histogram = histograms[key] = _Histogram(buckets)
+            histogram.counts[bisect.bisect_left(histogram.buckets, value)] += 1
+            histogram.sum += value
+
+    def render(self) -> str:
+        """Gets the histograms, to serve on a `/metrics` endpoint.
+
+        Returns:
+            str: The histograms, in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            for name, histograms in sorted(self._histograms.items()):
+                lines.append(f"# HELP {name} {METRICS.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(histograms.items()):
+                    labels = ",".join(f'{k}="{_label_value(v)}"' for k, v in key)
+                    prefix = f"{labels}," if labels else ""
+                    count = 0
+                    for le, bucket_count in zip(
+                        (*histogram.buckets, "+Inf"), histogram.counts
+                    ):
+                        count += bucket_count
+                        lines.append(f'{name}_bucket{{{prefix}le="{le}"}} {count}')
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                    lines.append(f"{name}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+class StepMetrics:
+    """Times step commands, help parsing and requests to the ca.
+
+    Nothing is measured until an exporter is added.
+    """
+
+    exporters: list[StepMetricsExporter]
+
+    def __init__(self) -> None:
+        self.exporters = []
+
+    def add_exporter(self, exporter: StepMetricsExporter) -> StepMetricsExporter:
+        """Sends the observations to an exporter, from now on.
+
+        Args:
+            exporter (StepMetricsExporter): The exporter.
+        Returns:
+            StepMetricsExporter: The exporter.
+        """
+        self.exporters = [*self.exporters, exporter]
+        return exporter
+
+    def remove_exporter(self, exporter: StepMetricsExporter) -> None:
+        """Stops sending the observations to an exporter.
+
+        Args:
+            exporter (StepMetricsExporter): The exporter.
+        """
+        self.exporters = [e for e in self.exporters if e is not exporter]
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Sends an observation to the exporters.
+
+        Args:
+            name (str): The metric, one of `METRICS`.
+            value (float): The value, seconds or bytes.
+            labels (str): The command or endpoint, and status.
+        """
+        for exporter in self.exporters:
+            exporter.observe(name, value, labels)
+
+    def spawned(self, started: float) -> None:
+        """Records the spawn latency of a step process, for the running command.
+
+        Args:
+            started (float): `time.perf_counter()` before the process started.
+        """
+        if self.exporters:
+            self.observe(
+                "step_command_spawn_seconds",
+                time.perf_counter() - started,
+                command=_command.get(),
+            )
+
+    @contextmanager
+    def command(self, command: str) -> Iterator[None]:
+        """Times running a command, with its exit status.
+
+        Args:
+            command (str): The command, like `step ca health`.
+        """
+        token = _command.set(command)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            yield
+            status = "0"
+        except subprocess.CalledProcessError as e:
+            status = str(e.returncode)
+            raise
+        finally:
+            _command.reset(token)
+            if self.exporters:
+                self.observe(
+                    "step_command_seconds",
+                    time.perf_counter() - started,
+                    command=command,
+                    status=status,
+                )
+
+
+step_metrics = StepMetrics()
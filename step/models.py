@@ -15,9 +15,17 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from datetime import datetime
+import base64
+import hashlib
+import os
+import re
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
 
 from cryptography import x509
+from cryptography.x509.oid import NameOID
 
 
 class StepVersion:
@@ -41,6 +49,8 @@ class StepVersion:
 
 
 class StepAdmin:
+    __slots__ = ("subject", "provisioner", "super_admin")
+
     subject: str
     provisioner: str
     super_admin: bool
@@ -66,17 +76,21 @@ class StepAdmin:
 
 
 class StepSshHost:
+    __slots__ = ("hostname", "host_id", "tags")
+
     hostname: str
-    host_id: int = 0
-    tags: list[str] = []
+    host_id: int
+    tags: tuple[str, ...]
 
     def __init__(self, line: str) -> None:
         self.hostname = line.split(" ")[0].strip()
+        self.host_id = 0
+        self.tags = ()
         if len(self.hostname) == len(line.strip()):
             return
         host_id_str = line[len(self.hostname) :].split()[0].strip()
         self.host_id = int(host_id_str) if host_id_str.isdigit() else 0
-        self.tags = line[line.index(host_id_str) :].split()
+        self.tags = tuple(line[line.index(host_id_str) :].split())
 
     def __repr__(self) -> str:
         return (
@@ -93,11 +107,273 @@ class StepSshHost:
         )
 
 
+def utc_time(value: Any, name: str) -> datetime | None:
+    """Gets a time of a certificate or CRL, like `not_valid_after`, in UTC.
+
+    cryptography 42 added the `*_utc` forms and deprecated the naive ones,
+    older versions only have the naive ones.
+
+    Args:
+        value (Any): The certificate or CRL.
+        name (str): The naive attribute, like `not_valid_after`.
+    Returns:
+        datetime | None: The time, aware in UTC, None if it is not set.
+    """
+    try:
+        return getattr(value, f"{name}_utc")
+    except AttributeError:
+        naive = getattr(value, name)
+        return naive.replace(tzinfo=timezone.utc) if naive else None
+
+
+_PEM_CERT = re.compile(
+    rb"-----BEGIN CERTIFICATE-----\s*(.+?)\s*-----END CERTIFICATE-----", re.DOTALL
+)
+
+
+class _lazy:
+    """Like functools.cached_property, for classes with __slots__.
+
+    The value is kept in the slot named after the property with a leading _.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+            return value
+
+
+def _decode(der: bytes) -> tuple:
+    """Parses a certificate into the values of the lazy StepCertificate fields.
+
+    Module level, so it can run on a process pool.
+    """
+    cert = x509.load_der_x509_certificate(der)
+    try:
+        sans = tuple(
+            str(name.value)
+            for name in cert.extensions.get_extension_for_class(
+                x509.SubjectAlternativeName
+            ).value
+            if not isinstance(name, (x509.DirectoryName, x509.OtherName))
+        )
+    except x509.ExtensionNotFound:
+        sans = ()
+    common_names = cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+    return (
+        cert.subject.rfc4514_string(),
+        str(common_names[0].value) if common_names else "",
+        sans,
+        cert.serial_number,
+        cert.issuer.rfc4514_string(),
+        utc_time(cert, "not_valid_before"),
+        utc_time(cert, "not_valid_after"),
+    )
+
+
+def _try_decode(der: bytes) -> tuple | None:
+    try:
+        return _decode(der)
+    except ValueError:
+        return None
+
+
 class StepCertificate:
-    cert: x509.Certificate
-    cert_path: str
+    """A certificate, kept as DER and only parsed when a field is first used.
+
+    Use `load_all` for every certificate of a bundle or a directory.
+    """
+
+    __slots__ = (
+        "cert_path",
+        "index",
+        "raw",
+        "_cert",
+        "_subject",
+        "_common_name",
+        "_sans",
+        "_serial",
+        "_issuer",
+        "_not_before",
+        "_not_after",
+        "_fingerprint",
+    )
+    _DECODED = (
+        "_subject",
+        "_common_name",
+        "_sans",
+        "_serial",
+        "_issuer",
+        "_not_before",
+        "_not_after",
+    )
+
+    cert_path: str  # file the certificate was read from, if any
+    index: int  # position of the certificate in the file
+    raw: bytes  # DER
+
+    def __init__(self, cert_path: str = "", raw: bytes = b"", index: int = 0) -> None:
+        """Initializes the certificate, from a file or from bytes.
 
-    def __init__(self, cert_path: str) -> None:
+        Args:
+            cert_path (str): A PEM or DER file, the first certificate of a
+                bundle unless `raw` is given.
+            raw (bytes): The DER of the certificate.
+            index (int): The position of the certificate in the file.
+        """
         self.cert_path = cert_path
-        with open(cert_path, "rb") as f:
-            self.cert = x509.load_pem_x509_certificate(f.read())
+        self.index = index
+        if not raw:
+            with open(cert_path, "rb") as f:
+                raw = next(_split(f.read()), b"")
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f"StepCertificate({self.cert_path or 'bytes'}#{self.index})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, StepCertificate) and self.raw == other.raw
+
+    def __hash__(self) -> int:
+        return hash(self.raw)
+
+    @_lazy
+    def cert(self) -> x509.Certificate:
+        """The parsed certificate."""
+        return x509.load_der_x509_certificate(self.raw)
+
+    def _decoded(self, slot: str) -> Any:
+        """Gets a decoded field, decoding them all on first use."""
+        try:
+            return getattr(self, slot)
+        except AttributeError:
+            self._set_decoded(_decode(self.raw))
+            return getattr(self, slot)
+
+    def _set_decoded(self, values: tuple) -> None:
+        for slot, value in zip(self._DECODED, values):
+            setattr(self, slot, value)
+
+    @property
+    def subject(self) -> str:
+        """The subject, RFC 4514."""
+        return self._decoded("_subject")
+
+    @property
+    def common_name(self) -> str:
+        """The common name of the subject, if any."""
+        return self._decoded("_common_name")
+
+    @property
+    def sans(self) -> tuple[str, ...]:
+        """The DNS names, emails, IPs and URIs the certificate is for."""
+        return self._decoded("_sans")
+
+    @property
+    def serial(self) -> int:
+        """The serial number."""
+        return self._decoded("_serial")
+
+    @property
+    def issuer(self) -> str:
+        """The issuer, RFC 4514."""
+        return self._decoded("_issuer")
+
+    @property
+    def not_before(self) -> datetime:
+        """The start of the validity, UTC."""
+        return self._decoded("_not_before")
+
+    @property
+    def not_after(self) -> datetime:
+        """The end of the validity, UTC."""
+        return self._decoded("_not_after")
+
+    @_lazy
+    def fingerprint(self) -> str:
+        """The sha256 fingerprint, hex, as step prints it."""
+        return hashlib.sha256(self.raw).hexdigest()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, cert_path: str = "") -> list["StepCertificate"]:
+        """Splits PEM or DER bytes into certificates, without parsing them.
+
+        Args:
+            data (bytes): A PEM bundle, or one DER certificate.
+            cert_path (str): The file the bytes were read from.
+        Returns:
+            List[StepCertificate]: The certificates, in order.
+        """
+        return [cls(cert_path, der, index) for index, der in enumerate(_split(data))]
+
+    @classmethod
+    def load_all(
+        cls, source: str | bytes, max_workers: int = 0
+    ) -> list["StepCertificate"]:
+        """Loads every certificate of a bundle, a directory or bytes.
+
+        Args:
+            source (str | bytes): PEM or DER bytes, a file, or a directory whose
+                files are loaded, not recursively.
+            max_workers (int): Decode the certificates on a pool of this many
+                processes, or lazily on first use if 0.
+        Returns:
+            List[StepCertificate]: The certificates.
+        """
+        if isinstance(source, bytes):
+            certs = cls.from_bytes(source)
+        elif os.path.isdir(source):
+            certs = []
+            for entry in sorted(os.scandir(source), key=lambda e: e.name):
+                if entry.is_file():
+                    with open(entry.path, "rb") as f:
+                        certs += cls.from_bytes(f.read(), entry.path)
+        else:
+            with open(source, "rb") as f:
+                certs = cls.from_bytes(f.read(), source)
+        if max_workers:
+            cls.decode_all(certs, max_workers)
+        return certs
+
+    @staticmethod
+    def decode_all(certs: list["StepCertificate"], max_workers: int = 0) -> None:
+        """Decodes the fields of many certificates, in parallel if asked.
+
+        Certificates that fail to parse are left to raise when used.
+
+        Args:
+            certs (List[StepCertificate]): The certificates to decode.
+            max_workers (int): The processes to decode on, 0 for this one.
+        """
+        raws = [cert.raw for cert in certs]
+        if max_workers:
+            with ProcessPoolExecutor(max_workers) as executor:
+                chunksize = max(1, len(certs) // (max_workers * 4))
+                decoded = list(executor.map(_try_decode, raws, chunksize=chunksize))
+        else:
+            decoded = list(map(_try_decode, raws))
+        for cert, values in zip(certs, decoded):
+            if values is not None:
+                cert._set_decoded(values)
+
+
+def _split(data: bytes) -> Iterator[bytes]:
+    """Yields the DER of each certificate in PEM bytes, or the DER bytes."""
+    if b"-----BEGIN" not in data:
+        if data:
+            yield data
+        return
+    for match in _PEM_CERT.finditer(data):
+        yield base64.b64decode(match.group(1))
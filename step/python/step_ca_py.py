@@ -0,0 +1,791 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import ssl
+import time
+import urllib.parse
+import warnings
+from collections.abc import Iterator
+from typing import Any
+
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives.serialization import Encoding
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InsecureRequestWarning
+
+from step.metrics import endpoint, step_metrics
+
+
+class StepCaError(Exception):
+    """An error response from a step-ca instance."""
+
+    status: int
+    message: str
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(f"step-ca returned {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+def _fingerprint(cert: x509.Certificate) -> str:
+    """Gets the fingerprint of a certificate, as step prints it."""
+    return hashlib.sha256(cert.public_bytes(Encoding.DER)).hexdigest()
+
+
+class StepCaClient:
+    """Client for the step-ca http api, on one pool of keep-alive connections.
+
+    Requests are verified against the root certificates in `root_cert_path`,
+    use `bootstrap_root` to get them from the ca by fingerprint first.
+    """
+
+    ca_url: str
+    root_cert_path: str
+    timeout: float
+    session: requests.Session
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        ca_url: str,
+        root_cert_path: str = "",
+        timeout: float = 30.0,
+        pool_size: int = 10,
+    ) -> None:
+        """Initializes the client.
+
+        Args:
+            ca_url (str): The url of the step-ca instance.
+            root_cert_path (str): The PEM file of roots to trust for the ca.
+            timeout (float): Seconds to wait for each request.
+            pool_size (int): The most connections to keep open to the ca.
+        """
+        self.ca_url = (
+            ca_url if ca_url.startswith("https://") else f"https://{ca_url}"
+        ).rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.pin(root_cert_path)
+
+    def pin(self, root_cert_path: str) -> None:
+        """Trusts only the roots in a PEM file for connections to the ca.
+
+        Args:
+            root_cert_path (str): The PEM file of roots to trust.
+        """
+        self.root_cert_path = root_cert_path
+
+    def close(self) -> None:
+        """Closes the pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "StepCaClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict | None = None,
+        cert: tuple[str, str] | None = None,
+        session: requests.Session | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Makes a request to the ca.
+
+        Args:
+            method (str): The http method.
+            path (str): The path of the endpoint.
+            json (Dict): The body to send as json.
+            cert (Tuple[str, str]): Certificate and key files for mutual tls.
+            session (requests.Session): The session to send it on, instead of
+                the pooled one.
+        Returns:
+            requests.Response: The successful response.
+        Raises:
+            StepCaError: If the ca returns an error.
+        """
+        self.log.debug(f"{method} {self.ca_url}{path}")
+        # passed on each request, as session.verify loses to REQUESTS_CA_BUNDLE
+        kwargs.setdefault("verify", self.root_cert_path or True)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = (session or self.session).request(
+                method,
+                f"{self.ca_url}{path}",
+                json=json,
+                cert=cert,
+                timeout=self.timeout,
+                **kwargs,
+            )
+            status = str(response.status_code)
+        finally:
+            if step_metrics.exporters:
+                step_metrics.observe(
+                    "step_ca_request_seconds",
+                    time.perf_counter() - started,
+                    method=method,
+                    path=endpoint(path),
+                    status=status,
+                )
+        if not response.ok:
+            try:
+                message = response.json().get("message", response.reason)
+            except ValueError:
+                message = response.text or response.reason
+            raise StepCaError(response.status_code, message)
+        return response
+
+    def _get(self, path: str, **kwargs: Any) -> dict:
+        return self._request("GET", path, **kwargs).json()
+
+    def _post(self, path: str, body: dict, **kwargs: Any) -> dict:
+        body = {key: value for key, value in body.items() if value is not None}
+        return self._request("POST", path, json=body, **kwargs).json()
+
+    def get_if_changed(self, path: str, etag: str = "") -> tuple[dict | None, str]:
+        """GETs a json endpoint, unless it still matches an etag from before.
+
+        Args:
+            path (str): The path of the endpoint.
+            etag (str): The etag of the response already held, if any.
+        Returns:
+            Tuple[Dict | None, str]: The json, or None if it has not changed,
+                and the etag of the response, empty if the ca sent none.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._request("GET", path, headers=headers)
+        etag = response.headers.get("ETag", "")
+        if response.status_code == 304:
+            return None, etag
+        return response.json(), etag
+
+    def bootstrap_root(self, fingerprint: str) -> x509.Certificate:
+        """Gets the root certificate of the ca, checked against its fingerprint.
+
+        The connection can not be verified yet, the fingerprint is what makes
+        the root trusted, like `step ca bootstrap` does. It is made on its own
+        session, so the unverified connection never joins the pool.
+
+        Args:
+            fingerprint (str): The sha256 fingerprint of the root certificate.
+        Returns:
+            x509.Certificate: The root certificate.
+        Raises:
+            StepCaError: If the root does not match the fingerprint.
+        """
+        with warnings.catch_warnings(), requests.Session() as session:
+            warnings.simplefilter("ignore", InsecureRequestWarning)
+            root_pem = self._get(f"/root/{fingerprint}", verify=False, session=session)[
+                "ca"
+            ]
+        root_cert = x509.load_pem_x509_certificate(root_pem.encode("utf-8"))
+        if _fingerprint(root_cert) != fingerprint.lower():
+            raise StepCaError(0, f"root does not match fingerprint {fingerprint}")
+        return root_cert
+
+    def version(self) -> dict:
+        """GET /version, the version of the ca."""
+        return self._get("/version")
+
+    def health(self) -> bool:
+        """GET /health, whether the ca is healthy."""
+        return self._get("/health").get("status") == "ok"
+
+    def root(self, fingerprint: str) -> str:
+        """GET /root/{sha}, a root certificate as PEM, over a verified connection."""
+        return self._get(f"/root/{fingerprint}")["ca"]
+
+    def sign(
+        self,
+        csr: str,
+        ott: str,
+        not_before: str | None = None,
+        not_after: str | None = None,
+        template_data: dict | None = None,
+    ) -> dict:
+        """POST /sign, signs a certificate request with a one-time token.
+
+        Args:
+            csr (str): The certificate request as PEM.
+            ott (str): The one-time token authorizing the request.
+            not_before (str): The start of the validity, RFC 3339 or duration.
+            not_after (str): The end of the validity, RFC 3339 or duration.
+            template_data (Dict): Data for the provisioner's template.
+        Returns:
+            Dict: The response, with `crt`, `ca` and `certChain` PEMs.
+        """
+        return self._post(
+            "/sign",
+            {
+                "csr": csr,
+                "ott": ott,
+                "notBefore": not_before,
+                "notAfter": not_after,
+                "templateData": template_data,
+            },
+        )
+
+    def renew(self, cert_path: str, key_path: str) -> dict:
+        """POST /renew, renews a certificate authenticated with itself.
+
+        Args:
+            cert_path (str): The certificate to renew.
+            key_path (str): The key of the certificate.
+        Returns:
+            Dict: The response, with `crt`, `ca` and `certChain` PEMs.
+        """
+        return self._post("/renew", {}, cert=(cert_path, key_path))
+
+    def rekey(self, csr: str, cert_path: str, key_path: str) -> dict:
+        """POST /rekey, renews a certificate with a new key.
+
+        Args:
+            csr (str): The certificate request for the new key, as PEM.
+            cert_path (str): The certificate to rekey.
+            key_path (str): The current key of the certificate.
+        Returns:
+            Dict: The response, with `crt`, `ca` and `certChain` PEMs.
+        """
+        return self._post("/rekey", {"csr": csr}, cert=(cert_path, key_path))
+
+    def revoke(
+        self,
+        serial: str,
+        ott: str | None = None,
+        reason: str | None = None,
+        reason_code: int | None = None,
+        cert: tuple[str, str] | None = None,
+    ) -> dict:
+        """POST /revoke, revokes a certificate by serial number.
+
+        Authorized with either a one-time token or the certificate itself.
+
+        Args:
+            serial (str): The serial number of the certificate, in decimal.
+            ott (str): The one-time token authorizing the revocation.
+            reason (str): Why the certificate is revoked.
+            reason_code (int): The RFC 5280 reason code.
+            cert (Tuple[str, str]): The certificate and key files to revoke with.
+        Returns:
+            Dict: The response, with the `status`.
+        """
+        return self._post(
+            "/revoke",
+            {
+                "serial": serial,
+                "ott": ott,
+                "reason": reason,
+                "reasonCode": reason_code,
+                "passive": True,
+            },
+            cert=cert,
+        )
+
+    def crl(self) -> bytes:
+        """GET /crl, the certificate revocation list as DER."""
+        return self._request("GET", "/crl").content
+
+    def crl_if_changed(self, etag: str = "") -> tuple[bytes | None, str]:
+        """GET /crl, unless it still matches an etag from before.
+
+        Args:
+            etag (str): The etag of the CRL already held, if any.
+        Returns:
+            Tuple[bytes | None, str]: The CRL as DER, or None if it has not
+                changed, and the etag of the response.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._request("GET", "/crl", headers=headers)
+        etag = response.headers.get("ETag", "")
+        if response.status_code == 304:
+            return None, etag
+        return response.content, etag
+
+    def intermediates(self) -> list[str]:
+        """GET /intermediates, the intermediate certificates as PEMs."""
+        return self._get("/intermediates")["crts"]
+
+    def provisioners(self, limit: int | None = None) -> Iterator[dict]:
+        """GET /provisioners, following the pages of results.
+
+        Args:
+            limit (int): The most provisioners to get per page.
+        Yields:
+            Dict: Each provisioner.
+        """
+        cursor = ""
+        while True:
+            params = {"cursor": cursor, "limit": limit}
+            page = self._get("/provisioners", params=params)
+            yield from page.get("provisioners") or []
+            cursor = page.get("nextCursor", "")
+            if not cursor:
+                return
+
+    def provisioner_key(self, kid: str) -> str:
+        """GET /provisioners/{kid}/encrypted-key, a JWK provisioner's key as JWE."""
+        return self._get(f"/provisioners/{kid}/encrypted-key")["key"]
+
+    def roots(self) -> list[str]:
+        """GET /roots, the root certificates as PEMs."""
+        return self._get("/roots")["crts"]
+
+    def roots_pem(self) -> str:
+        """GET /roots.pem, the root certificates as one PEM bundle."""
+        return self._request("GET", "/roots.pem").text
+
+    def federation(self) -> list[str]:
+        """GET /federation, the federated root certificates as PEMs."""
+        return self._get("/federation")["crts"]
+
+    def ssh_sign(
+        self,
+        public_key: str,
+        ott: str,
+        cert_type: str = "user",
+        principals: list[str] | None = None,
+        valid_after: str | None = None,
+        valid_before: str | None = None,
+        key_id: str | None = None,
+    ) -> dict:
+        """POST /ssh/sign, signs an ssh public key with a one-time token.
+
+        Args:
+            public_key (str): The base64 encoded ssh public key.
+            ott (str): The one-time token authorizing the request.
+            cert_type (str): `user` or `host`.
+            principals (List[str]): The users or hosts the certificate is for.
+            valid_after (str): The start of the validity.
+            valid_before (str): The end of the validity.
+            key_id (str): The key id of the certificate.
+        Returns:
+            Dict: The response, with the base64 encoded certificate in `crt`.
+        """
+        return self._post(
+            "/ssh/sign",
+            {
+                "publicKey": public_key,
+                "ott": ott,
+                "certType": cert_type,
+                "principals": principals,
+                "validAfter": valid_after,
+                "validBefore": valid_before,
+                "keyID": key_id,
+            },
+        )
+
+    def ssh_renew(self, ott: str) -> dict:
+        """POST /ssh/renew, renews an ssh host certificate named in the token."""
+        return self._post("/ssh/renew", {"ott": ott})
+
+    def ssh_rekey(self, public_key: str, ott: str) -> dict:
+        """POST /ssh/rekey, renews an ssh host certificate with a new key."""
+        return self._post("/ssh/rekey", {"publicKey": public_key, "ott": ott})
+
+    def ssh_revoke(
+        self,
+        serial: str,
+        ott: str,
+        reason: str | None = None,
+        reason_code: int | None = None,
+    ) -> dict:
+        """POST /ssh/revoke, revokes an ssh certificate by serial number."""
+        return self._post(
+            "/ssh/revoke",
+            {
+                "serial": serial,
+                "ott": ott,
+                "reason": reason,
+                "reasonCode": reason_code,
+                "passive": True,
+            },
+        )
+
+    def ssh_roots(self) -> dict:
+        """GET /ssh/roots, the ssh user and host ca keys."""
+        return self._get("/ssh/roots")
+
+    def ssh_federation(self) -> dict:
+        """GET /ssh/federation, the federated ssh user and host ca keys."""
+        return self._get("/ssh/federation")
+
+    def ssh_config(
+        self, config_type: str = "", data: dict[str, str] | None = None
+    ) -> dict:
+        """POST /ssh/config, the ssh config templates for a user or host.
+
+        Args:
+            config_type (str): `user` or `host`, or empty for the default.
+            data (Dict[str, str]): Data for the templates.
+        Returns:
+            Dict: The rendered templates.
+        """
+        path = f"/ssh/config/{config_type}" if config_type else "/ssh/config"
+        return self._post(path, {"type": config_type or None, "data": data})
+
+    def ssh_check_host(self, principal: str, token: str | None = None) -> bool:
+        """POST /ssh/check-host, whether a host has an ssh certificate."""
+        return self._post(
+            "/ssh/check-host",
+            {"type": "host", "principal": principal, "token": token},
+        ).get("exists", False)
+
+    def ssh_hosts(self, cert: tuple[str, str]) -> list[dict]:
+        """GET /ssh/hosts, the ssh hosts, authenticated with an x509 certificate.
+
+        Args:
+            cert (Tuple[str, str]): Certificate and key files for mutual tls.
+        Returns:
+            List[Dict]: The hosts.
+        """
+        return self._get("/ssh/hosts", cert=cert).get("hosts") or []
+
+    def ssh_bastion(self, hostname: str, user: str = "") -> dict:
+        """POST /ssh/bastion, the bastion to use for a host."""
+        return self._post("/ssh/bastion", {"hostname": hostname, "user": user})
+
+
+class AsyncStepCaClient:
+    """Asyncio client for the step-ca endpoints used in bulk, /sign, /renew
+    and /revoke.
+
+    Requests go over a pool of keep-alive HTTP/1.1 connections, with at most
+    `max_connections` in flight at once and each bounded by its own deadline,
+    so thousands of round-trips to the ca can overlap. Requests authenticated
+    with a client certificate get a connection of their own.
+    """
+
+    ca_url: str
+    root_cert_path: str
+    timeout: float
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        ca_url: str,
+        root_cert_path: str = "",
+        timeout: float = 30.0,
+        max_connections: int = 64,
+    ) -> None:
+        """Initializes the client.
+
+        Args:
+            ca_url (str): The url of the step-ca instance.
+            root_cert_path (str): The PEM file of roots to trust for the ca.
+            timeout (float): Default seconds each request has to finish,
+                including waiting for a connection.
+            max_connections (int): The most requests in flight at once.
+        """
+        self.ca_url = (
+            ca_url if ca_url.startswith("https://") else f"https://{ca_url}"
+        ).rstrip("/")
+        url = urllib.parse.urlsplit(self.ca_url)
+        self._host = url.hostname or ""
+        self._port = url.port or 443
+        self._netloc = url.netloc
+        self.root_cert_path = root_cert_path
+        self.timeout = timeout
+        self._ssl = ssl.create_default_context(cafile=root_cert_path or None)
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore = asyncio.Semaphore(max_connections)
+
+    async def close(self) -> None:
+        """Closes the pooled connections."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+    async def __aenter__(self) -> "AsyncStepCaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: dict | None = None,
+        cert: tuple[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """Makes a request to the ca.
+
+        Args:
+            method (str): The http method.
+            path (str): The path of the endpoint.
+            body (Dict): The body to send as json, None values are dropped.
+            cert (Tuple[str, str]): Certificate and key files for mutual tls.
+            timeout (float): Seconds the request has to finish, instead of
+                the client's timeout.
+        Returns:
+            Dict: The json of the successful response.
+        Raises:
+            StepCaError: If the ca returns an error.
+            TimeoutError: If the request misses its deadline.
+        """
+        payload = b""
+        if body is not None:
+            body = {key: value for key, value in body.items() if value is not None}
+            payload = json.dumps(body).encode("utf-8")
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self._netloc}\r\n"
+            "Accept: application/json\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            + ("Connection: close\r\n" if cert else "")
+            + "\r\n"
+        )
+        self.log.debug(f"{method} {self.ca_url}{path}")
+        started = time.perf_counter()
+        status = 0
+        try:
+            async with asyncio.timeout(self.timeout if timeout is None else timeout):
+                async with self._semaphore:
+                    status, response = await self._exchange(
+                        head.encode("latin-1") + payload, cert
+                    )
+        finally:
+            if step_metrics.exporters:
+                step_metrics.observe(
+                    "step_ca_request_seconds",
+                    time.perf_counter() - started,
+                    method=method,
+                    path=endpoint(path),
+                    status=str(status or "error"),
+                )
+        try:
+            data = json.loads(response) if response else {}
+        except ValueError:
+            data = {"message": response.decode("utf-8", "replace")}
+        if status >= 400:
+            raise StepCaError(status, data.get("message", "") or str(status))
+        return data
+
+    async def _exchange(
+        self, request: bytes, cert: tuple[str, str] | None
+    ) -> tuple[int, bytes]:
+        """Sends a request and reads its response, on a pooled connection if
+        it can.
+
+        A pooled connection the ca already closed is retried on a new one, but
+        only if nothing of the response was read, as the ca may have handled
+        the request otherwise.
+        """
+        while True:
+            reader, writer, reused = await self._connect(cert)
+            status_line = b""
+            try:
+                writer.write(request)
+                await writer.drain()
+                status_line = await reader.readline()
+                if not status_line:
+                    raise ConnectionResetError("connection closed by the ca")
+                status, keep_alive, response = await self._read_response(
+                    reader, status_line
+                )
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused and not status_line:
+                    self.log.debug("pooled connection was closed, reconnecting")
+                    continue
+                raise
+            except BaseException:
+                # cancelled by the deadline mid response, the connection is unusable
+                writer.close()
+                raise
+            if keep_alive and cert is None:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            return status, response
+
+    async def _connect(
+        self, cert: tuple[str, str] | None
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """Gets an idle pooled connection, or opens a new one."""
+        while cert is None and self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        ssl_context = self._ssl
+        if cert:
+            ssl_context = ssl.create_default_context(cafile=self.root_cert_path or None)
+            ssl_context.load_cert_chain(*cert)
+        reader, writer = await asyncio.open_connection(
+            self._host, self._port, ssl=ssl_context, server_hostname=self._host
+        )
+        return reader, writer, False
+
+    @staticmethod
+    async def _read_response(
+        reader: asyncio.StreamReader, status_line: bytes
+    ) -> tuple[int, bool, bytes]:
+        """Reads an HTTP/1.1 response.
+
+        Args:
+            reader (asyncio.StreamReader): The connection.
+            status_line (bytes): The first line of the response, already read.
+        Returns:
+            Tuple[int, bool, bytes]: The status, whether the connection can be
+                reused, and the body.
+        """
+        while True:
+            status = int(status_line.split()[1])
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if not 100 <= status < 200:
+                break
+            # an interim response, like 100 Continue, the final one follows
+            status_line = await reader.readline()
+            if not status_line:
+                raise asyncio.IncompleteReadError(b"", None)
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if status in (204, 304):
+            return status, keep_alive, b""
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while size := int((await reader.readline()).split(b";")[0], 16):
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass  # trailers
+            return status, keep_alive, b"".join(chunks)
+        if "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+            return status, keep_alive, body
+        # the body runs until the ca closes the connection
+        return status, False, await reader.read()
+
+    async def version(self, timeout: float | None = None) -> dict:
+        """GET /version, the version of the ca."""
+        return await self._request("GET", "/version", timeout=timeout)
+
+    async def health(self, timeout: float | None = None) -> bool:
+        """GET /health, whether the ca is healthy."""
+        response = await self._request("GET", "/health", timeout=timeout)
+        return response.get("status") == "ok"
+
+    async def sign(
+        self,
+        csr: str,
+        ott: str,
+        not_before: str | None = None,
+        not_after: str | None = None,
+        template_data: dict | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """POST /sign, signs a certificate request with a one-time token.
+
+        Args:
+            csr (str): The certificate request as PEM.
+            ott (str): The one-time token authorizing the request.
+            not_before (str): The start of the validity, RFC 3339 or duration.
+            not_after (str): The end of the validity, RFC 3339 or duration.
+            template_data (Dict): Data for the provisioner's template.
+            timeout (float): Seconds the request has to finish.
+        Returns:
+            Dict: The response, with `crt`, `ca` and `certChain` PEMs.
+        """
+        return await self._request(
+            "POST",
+            "/sign",
+            {
+                "csr": csr,
+                "ott": ott,
+                "notBefore": not_before,
+                "notAfter": not_after,
+                "templateData": template_data,
+            },
+            timeout=timeout,
+        )
+
+    async def renew(
+        self, cert_path: str, key_path: str, timeout: float | None = None
+    ) -> dict:
+        """POST /renew, renews a certificate authenticated with itself.
+
+        Args:
+            cert_path (str): The certificate to renew.
+            key_path (str): The key of the certificate.
+            timeout (float): Seconds the request has to finish.
+        Returns:
+            Dict: The response, with `crt`, `ca` and `certChain` PEMs.
+        """
+        return await self._request(
+            "POST", "/renew", {}, cert=(cert_path, key_path), timeout=timeout
+        )
+
+    async def revoke(
+        self,
+        serial: str,
+        ott: str | None = None,
+        reason: str | None = None,
+        reason_code: int | None = None,
+        cert: tuple[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """POST /revoke, revokes a certificate by serial number.
+
+        Authorized with either a one-time token or the certificate itself.
+
+        Args:
+            serial (str): The serial number of the certificate, in decimal.
+            ott (str): The one-time token authorizing the revocation.
+            reason (str): Why the certificate is revoked.
+            reason_code (int): The RFC 5280 reason code.
+            cert (Tuple[str, str]): The certificate and key files to revoke with.
+            timeout (float): Seconds the request has to finish.
+        Returns:
+            Dict: The response, with the `status`.
+        """
+        return await self._request(
+            "POST",
+            "/revoke",
+            {
+                "serial": serial,
+                "ott": ott,
+                "reason": reason,
+                "reasonCode": reason_code,
+                "passive": True,
+            },
+            cert=cert,
+            timeout=timeout,
+        )
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+
+import requests
+from cryptography import x509
+from cryptography.exceptions import InvalidSignature
+
+from step.models import StepCertificate, utc_time
+from step.python.step_ca_py import StepCaClient, StepCaError
+
+
+class StepCrl:
+    """The revoked serial numbers of a ca, from its CRL.
+
+    The CRL is verified against the roots, or an intermediate issued by one,
+    and refreshed once its nextUpdate passes, with a conditional fetch.
+    Lookups are a set membership test, with a time check for the refresh.
+    Once the nextUpdate passes without a successful refresh, lookups raise
+    rather than answer from the expired CRL.
+    """
+
+    client: StepCaClient
+    roots: list[x509.Certificate]
+    retry_interval: float
+    revoked: frozenset[int]  # serial numbers
+    crl_number: int  # of the CRL in use, CRLs older than it are rejected
+    issuer: x509.Name | None  # of the CRL in use
+    this_update: datetime | None
+    next_update: datetime | None
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        client: StepCaClient,
+        roots: list[x509.Certificate],
+        retry_interval: float = 60.0,
+    ) -> None:
+        """Initializes the manager, the CRL is fetched on first use.
+
+        Args:
+            client (StepCaClient): The client of the ca.
+            roots (List[x509.Certificate]): The roots to verify the CRL with.
+            retry_interval (float): Seconds to wait after a failed refresh.
+        """
+        self.client = client
+        self.roots = roots
+        self.retry_interval = retry_interval
+        self.revoked = frozenset()
+        self.crl_number = -1
+        self.issuer = None
+        self.this_update = None
+        self.next_update = None
+        self._etag = ""
+        self._refresh_at = 0.0  # epoch seconds, checked on every lookup
+        self._expires_at = 0.0  # epoch seconds of the nextUpdate, if any
+        self._issuer_name = ""  # RFC 4514, to compare with StepCertificate
+        self._issuers: list[x509.Certificate] = list(roots)
+        self._lock = threading.Lock()
+
+    def _issuer(self, crl: x509.CertificateRevocationList) -> x509.Certificate:
+        """Finds the trusted certificate that signed a CRL."""
+        for issuer in self._issuers:
+            if issuer.subject == crl.issuer and crl.is_signature_valid(
+                issuer.public_key()  # type: ignore[arg-type]
+            ):
+                return issuer
+        # not signed by a root, try the intermediates issued by one
+        for pem in self.client.intermediates():
+            intermediate = x509.load_pem_x509_certificate(pem.encode("utf-8"))
+            for root in self.roots:
+                try:
+                    intermediate.verify_directly_issued_by(root)
+                except (ValueError, TypeError, InvalidSignature):
+                    continue
+                self._issuers.append(intermediate)
+                if intermediate.subject == crl.issuer and crl.is_signature_valid(
+                    intermediate.public_key()  # type: ignore[arg-type]
+                ):
+                    return intermediate
+        raise StepCaError(0, f"CRL from {crl.issuer.rfc4514_string()} not trusted")
+
+    def refresh(self, force: bool = False) -> bool:
+        """Fetches the CRL, if it changed, and verifies it.
+
+        Args:
+            force (bool): Fetch without the etag of the CRL in use.
+        Returns:
+            bool: Whether the revoked serial numbers changed.
+        Raises:
+            StepCaError: If the CRL is not signed by a trusted issuer, or is
+                older than the one in use.
+        """
+        der, etag = self.client.crl_if_changed("" if force else self._etag)
+        if der is None:
+            self.log.debug("CRL not modified")
+            self._refresh_at = time.time() + self.retry_interval
+            return False
+        crl = x509.load_der_x509_crl(der)
+        self._issuer(crl)
+        try:
+            crl_number = crl.extensions.get_extension_for_class(
+                x509.CRLNumber
+            ).value.crl_number
+        except x509.ExtensionNotFound:
+            crl_number = 0
+        if crl_number < self.crl_number:
+            raise StepCaError(0, f"CRL {crl_number} is older than {self.crl_number}")
+        revoked = frozenset(entry.serial_number for entry in crl)
+        changed = revoked != self.revoked
+        self.revoked = revoked
+        self.crl_number = crl_number
+        self.issuer = crl.issuer
+        self.this_update = utc_time(crl, "last_update")
+        self.next_update = utc_time(crl, "next_update")
+        self._etag = etag
+        self._issuer_name = crl.issuer.rfc4514_string()
+        self._expires_at = (
+            self.next_update.timestamp() if self.next_update else math.inf
+        )
+        # a CRL past its nextUpdate already is not fetched again right away
+        now = time.time()
+        self._refresh_at = (
+            self._expires_at if self._expires_at > now else now + self.retry_interval
+        )
+        self.log.debug(f"CRL {crl_number} has {len(revoked)} revoked serials")
+        return changed
+
+    def _refresh_if_due(self) -> None:
+        """Refreshes the CRL once it expires, one thread at a time.
+
+        Raises:
+            StepCaError: If the CRL expired and the refresh failed.
+        """
+        expired = time.time() >= self._expires_at
+        if not self._lock.acquire(blocking=expired):
+            return  # another thread is refreshing, use the CRL in use till then
+        try:
+            if time.time() < self._refresh_at:
+                return
+            try:
+                self.refresh()
+            except (requests.RequestException, StepCaError, ValueError) as e:
+                if self.crl_number < 0:
+                    raise
+                self._refresh_at = time.time() + self.retry_interval
+                if time.time() >= self._expires_at:
+                    raise StepCaError(0, f"CRL expired and not refreshed: {e}") from e
+                self.log.warning(f"failed to refresh CRL, keeping the old one: {e}")
+        finally:
+            self._lock.release()
+
+    def is_revoked(
+        self, cert_or_serial: StepCertificate | x509.Certificate | int | str
+    ) -> bool:
+        """Checks a certificate against the CRL, refreshing it if expired.
+
+        Args:
+            cert_or_serial (StepCertificate | x509.Certificate | int | str): The
+                certificate, or its serial number, decimal if a string.
+        Returns:
+            bool: Whether the certificate is revoked.
+        Raises:
+            StepCaError: If the CRL expired and could not be refreshed, or the
+                certificate was not issued by the issuer of the CRL.
+        """
+        now = time.time()
+        if now >= self._refresh_at:
+            self._refresh_if_due()
+            now = time.time()
+        if now >= self._expires_at:
+            raise StepCaError(0, f"CRL {self.crl_number} expired at {self.next_update}")
+        if isinstance(cert_or_serial, StepCertificate):
+            if cert_or_serial.issuer != self._issuer_name:
+                raise StepCaError(0, f"{cert_or_serial} not issued by the CRL issuer")
+            serial = cert_or_serial.serial
+        elif isinstance(cert_or_serial, x509.Certificate):
+            if cert_or_serial.issuer != self.issuer:
+                raise StepCaError(0, f"{cert_or_serial} not issued by the CRL issuer")
+            serial = cert_or_serial.serial_number
+        else:
+            serial = int(cert_or_serial)
+        return serial in self.revoked
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from step.cli.step_cli_cache import read_json, write_json
+from step.models import StepCertificate
+from step.python.step_py import resolve_step_path
+
+INVENTORY_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class StepCertRecord:
+    """What the inventory knows of one certificate in a file."""
+
+    path: str
+    index: int  # position of the certificate in the file
+    subject: str  # RFC 4514
+    common_name: str
+    sans: tuple[str, ...]  # DNS names, emails, IPs and URIs, lowercased
+    serial: int
+    issuer: str  # RFC 4514
+    not_before: float  # epoch seconds
+    not_after: float  # epoch seconds
+    fingerprint: str  # sha256, hex
+
+    @classmethod
+    def from_cert(cls, cert: StepCertificate) -> "StepCertRecord":
+        return cls(
+            cert.cert_path,
+            cert.index,
+            cert.subject,
+            cert.common_name,
+            tuple(san.lower() for san in cert.sans),
+            cert.serial,
+            cert.issuer,
+            cert.not_before.timestamp(),
+            cert.not_after.timestamp(),
+            cert.fingerprint,
+        )
+
+    def to_dict(self) -> dict:
+        # faster than dataclasses.asdict, which deep copies every field
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class StepCertInventory:
+    """Index of the certificates under the `certs/` of a step path.
+
+    Certificates are indexed by subject and common name, SAN, serial, issuer
+    and expiry. `scan` only parses files whose mtime or size changed, and the
+    index is kept under `cache/` of the step path for the next process.
+    """
+
+    step_path: str
+    max_workers: int
+    certs_dir: str
+    index_path: str
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self, step_path: str = "", persist: bool = True, max_workers: int = 0
+    ) -> None:
+        """Initializes the inventory, loading the index of an earlier scan.
+
+        Args:
+            step_path (str): The path to the step files, resolved like step
+                does by default.
+            persist (bool): Keep the index on disk between processes.
+            max_workers (int): Parse changed files on a pool of this many
+                processes, 0 to parse them in this one.
+        """
+        self.max_workers = max_workers
+        self.step_path = step_path or resolve_step_path()
+        self.certs_dir = os.path.join(self.step_path, "certs")
+        self.index_path = (
+            os.path.join(self.step_path, "cache", "inventory.json") if persist else ""
+        )
+        self._lock = threading.RLock()
+        self._files: dict[str, tuple[int, int, list[StepCertRecord]]] = {}
+        self._by_name: dict[str, set[StepCertRecord]] = {}
+        self._by_san: dict[str, set[StepCertRecord]] = {}
+        self._by_serial: dict[int, set[StepCertRecord]] = {}
+        self._by_issuer: dict[str, set[StepCertRecord]] = {}
+        self._expiry: list[tuple[float, str, int]] = []
+        self._records: dict[tuple[str, int], StepCertRecord] = {}
+        self._load_index()
+
+    def _load_index(self) -> None:
+        index = read_json(self.index_path) if self.index_path else None
+        if not index or index.get("version") != INVENTORY_VERSION:
+            return
+        for path, (mtime_ns, size, certs) in index["files"].items():
+            records = [
+                StepCertRecord(**{**cert, "sans": tuple(cert["sans"])})
+                for cert in certs
+            ]
+            self._add_file(path, mtime_ns, size, records)
+        self._sort_expiry()
+
+    def _save_index(self) -> None:
+        if not self.index_path:
+            return
+        files = {
+            path: (mtime_ns, size, [record.to_dict() for record in records])
+            for path, (mtime_ns, size, records) in self._files.items()
+        }
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            write_json(self.index_path, {"version": INVENTORY_VERSION, "files": files})
+        except OSError as e:
+            self.log.warning(f"failed to save certificate inventory: {e}")
+
+    def _add_file(
+        self, path: str, mtime_ns: int, size: int, records: list[StepCertRecord]
+    ) -> None:
+        """Indexes the certificates of a file, except by expiry."""
+        self._files[path] = (mtime_ns, size, records)
+        for record in records:
+            self._records[(record.path, record.index)] = record
+            for name in {record.subject, record.common_name} - {""}:
+                self._by_name.setdefault(name, set()).add(record)
+            for san in record.sans:
+                self._by_san.setdefault(san, set()).add(record)
+            self._by_serial.setdefault(record.serial, set()).add(record)
+            self._by_issuer.setdefault(record.issuer, set()).add(record)
+
+    def _drop_file(self, path: str) -> None:
+        """Removes the certificates of a file from the index, except by expiry."""
+        _, _, records = self._files.pop(path)
+        for record in records:
+            del self._records[(record.path, record.index)]
+            for index, key in [
+                *(
+                    (self._by_name, name)
+                    for name in (record.subject, record.common_name)
+                ),
+                *((self._by_san, san) for san in record.sans),
+                (self._by_serial, record.serial),
+                (self._by_issuer, record.issuer),
+            ]:
+                records_for_key = index.get(key)
+                if records_for_key is not None:
+                    records_for_key.discard(record)
+                    if not records_for_key:
+                        del index[key]
+
+    def _sort_expiry(self) -> None:
+        self._expiry = sorted(
+            (record.not_after, record.path, record.index)
+            for record in self._records.values()
+        )
+
+    def _walk(self) -> Iterator[os.DirEntry]:
+        """Yields the files under the certs directory."""
+        dirs = [self.certs_dir]
+        while dirs:
+            try:
+                entries = list(os.scandir(dirs.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+    def scan(self) -> tuple[int, int]:
+        """Updates the index from the files that changed since the last scan.
+
+        Returns:
+            Tuple[int, int]: How many files were parsed and how many dropped.
+        """
+        with self._lock:
+            seen = set()
+            changed: list[tuple[str, os.stat_result, list[StepCertificate]]] = []
+            for entry in self._walk():
+                seen.add(entry.path)
+                stat = entry.stat()
+                known = self._files.get(entry.path)
+                if known and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        data = f.read()
+                except OSError as e:
+                    self.log.debug(f"skipping {entry.path}: {e}")
+                    data = b""
+                certs = []
+                if b"-----BEGIN CERTIFICATE-----" in data:
+                    certs = StepCertificate.from_bytes(data, entry.path)
+                changed.append((entry.path, stat, certs))
+            StepCertificate.decode_all(
+                [cert for _, _, certs in changed for cert in certs], self.max_workers
+            )
+            for path, stat, certs in changed:
+                try:
+                    records = [StepCertRecord.from_cert(cert) for cert in certs]
+                except ValueError as e:
+                    self.log.debug(f"skipping {path}: {e}")
+                    records = []
+                if path in self._files:
+                    self._drop_file(path)
+                self._add_file(path, stat.st_mtime_ns, stat.st_size, records)
+            removed = self._files.keys() - seen
+            for path in removed:
+                self._drop_file(path)
+            parsed = len(changed)
+            if parsed or removed:
+                self._sort_expiry()
+                self._save_index()
+            return parsed, len(removed)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[StepCertRecord]:
+        with self._lock:
+            return iter(list(self._records.values()))
+
+    def _sorted(self, records: set[StepCertRecord] | None) -> list[StepCertRecord]:
+        return sorted(records or (), key=lambda r: (r.not_after, r.path, r.index))
+
+    def by_subject(self, name: str) -> list[StepCertRecord]:
+        """Gets the certificates with a subject, RFC 4514 or common name."""
+        with self._lock:
+            return self._sorted(self._by_name.get(name))
+
+    def by_san(self, san: str) -> list[StepCertRecord]:
+        """Gets the certificates for a DNS name, email, IP or URI."""
+        with self._lock:
+            return self._sorted(self._by_san.get(san.lower()))
+
+    def by_serial(self, serial: int | str) -> list[StepCertRecord]:
+        """Gets the certificates with a serial number, decimal if a string."""
+        with self._lock:
+            return self._sorted(self._by_serial.get(int(serial)))
+
+    def by_issuer(self, issuer: str) -> list[StepCertRecord]:
+        """Gets the certificates from an issuer, RFC 4514."""
+        with self._lock:
+            return self._sorted(self._by_issuer.get(issuer))
+
+    def expiring(self, within: float, now: float | None = None) -> list[StepCertRecord]:
+        """Gets the certificates expiring soon, or already expired.
+
+        Args:
+            within (float): Seconds from now.
+            now (float): The time to count from, the current time by default.
+        Returns:
+            List[StepCertRecord]: The certificates, soonest to expire first.
+        """
+        deadline = (time.time() if now is None else now) + within
+        with self._lock:
+            end = bisect.bisect_right(self._expiry, deadline, key=lambda e: e[0])
+            return [
+                self._records[(path, index)] for _, path, index in self._expiry[:end]
+            ]
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import functools
+import ipaddress
+import logging
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.x509.oid import NameOID
+
+StepPrivateKey = (
+    ec.EllipticCurvePrivateKey | rsa.RSAPrivateKey | ed25519.Ed25519PrivateKey
+)
+
+_CURVES = {"P-256": ec.SECP256R1, "P-384": ec.SECP384R1, "P-521": ec.SECP521R1}
+# the hash go picks for a key, as step signs with
+_CURVE_HASHES = {"P-256": hashes.SHA256, "P-384": hashes.SHA384, "P-521": hashes.SHA512}
+
+
+@dataclass(frozen=True, slots=True)
+class StepKeyType:
+    """A type of key, like the --kty, --crv and --size flags of step."""
+
+    kty: str = "EC"  # EC, RSA or OKP
+    crv: str = "P-256"  # P-256, P-384 or P-521 for EC, Ed25519 for OKP
+    size: int = 2048  # bits, for RSA
+
+    def __post_init__(self) -> None:
+        if self.kty == "EC" and self.crv not in _CURVES:
+            raise ValueError(f"unsupported curve {self.crv}")
+        if self.kty == "OKP" and self.crv != "Ed25519":
+            raise ValueError(f"unsupported curve {self.crv}, only Ed25519")
+        if self.kty == "RSA" and self.size < 2048:
+            raise ValueError(f"RSA keys must be at least 2048 bits, not {self.size}")
+        if self.kty not in ("EC", "RSA", "OKP"):
+            raise ValueError(f"unsupported key type {self.kty}")
+
+    def generate(self) -> StepPrivateKey:
+        """Generates a key of the type, in this process."""
+        if self.kty == "EC":
+            return ec.generate_private_key(_CURVES[self.crv]())
+        if self.kty == "RSA":
+            return rsa.generate_private_key(65537, self.size)
+        return ed25519.Ed25519PrivateKey.generate()
+
+
+def _generate(key_type: StepKeyType) -> bytes:
+    """Generates a key as PKCS8 DER, to send it back from a worker process."""
+    return key_type.generate().private_bytes(
+        serialization.Encoding.DER,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def _load(der: bytes) -> StepPrivateKey:
+    # generated by _generate, so checking an RSA key again is wasted work
+    return serialization.load_der_private_key(  # type: ignore[return-value]
+        der, None, unsafe_skip_rsa_key_validation=True
+    )
+
+
+def private_key_pem(key: StepPrivateKey, password: bytes | None = None) -> bytes:
+    """Serializes a key as PEM, like step writes it.
+
+    Args:
+        key (StepPrivateKey): The key.
+        password (bytes): Encrypts the key if given.
+    Returns:
+        bytes: The PEM, PKCS8 for Ed25519 and encrypted keys.
+    """
+    encryption = (
+        serialization.BestAvailableEncryption(password)
+        if password
+        else serialization.NoEncryption()
+    )
+    key_format = serialization.PrivateFormat.PKCS8
+    if not password and isinstance(
+        key, (ec.EllipticCurvePrivateKey, rsa.RSAPrivateKey)
+    ):
+        key_format = serialization.PrivateFormat.TraditionalOpenSSL
+    return key.private_bytes(serialization.Encoding.PEM, key_format, encryption)
+
+
+def _general_name(san: str) -> x509.GeneralName:
+    """Types a SAN like step does: IP, email, URI, or else DNS name."""
+    try:
+        return x509.IPAddress(ipaddress.ip_address(san))
+    except ValueError:
+        pass
+    if "://" in san:
+        return x509.UniformResourceIdentifier(san)
+    if "@" in san:
+        return x509.RFC822Name(san)
+    return x509.DNSName(san)
+
+
+def build_csr(key: StepPrivateKey, subject: str, sans: Iterable[str] = ()) -> str:
+    """Builds a certificate request, like `step certificate create --csr`.
+
+    Args:
+        key (StepPrivateKey): The key of the certificate.
+        subject (str): The common name, also the only SAN if none are given.
+        sans (Iterable[str]): DNS names, IPs, emails and URIs.
+    Returns:
+        str: The certificate request as PEM.
+    """
+    names = list(dict.fromkeys(sans)) or [subject]
+    builder = (
+        x509.CertificateSigningRequestBuilder()
+        .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, subject)]))
+        .add_extension(
+            x509.SubjectAlternativeName([_general_name(san) for san in names]),
+            critical=False,
+        )
+    )
+    algorithm: hashes.HashAlgorithm | None = None
+    if isinstance(key, ec.EllipticCurvePrivateKey):
+        curve = {cls.name: crv for crv, cls in _CURVES.items()}[key.curve.name]
+        algorithm = _CURVE_HASHES[curve]()
+    elif isinstance(key, rsa.RSAPrivateKey):
+        algorithm = hashes.SHA256()
+    csr = builder.sign(key, algorithm)
+    return csr.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+
+
+class StepKeyPool:
+    """Keys generated ahead of time on worker processes.
+
+    Up to `depth` keys of each type are kept ready, and taking one starts the
+    generation of the next. Keys of other types, or taken while the pool is
+    stopped, are generated in the calling process.
+    """
+
+    key_types: tuple[StepKeyType, ...]
+    depth: int
+    max_workers: int
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        key_types: Iterable[StepKeyType] = (StepKeyType(),),
+        depth: int = 32,
+        max_workers: int = 0,
+    ) -> None:
+        """Initializes the pool, `start` starts generating.
+
+        Args:
+            key_types (Iterable[StepKeyType]): The types of keys to keep ready,
+                the first is taken by default.
+            depth (int): How many keys of each type to keep ready.
+            max_workers (int): The worker processes, one per cpu by default.
+        """
+        self.key_types = tuple(key_types)
+        self.depth = depth
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._ready: dict[StepKeyType, deque[bytes]] = {
+            key_type: deque() for key_type in self.key_types
+        }
+        self._pending = dict.fromkeys(self.key_types, 0)
+        self._condition = threading.Condition()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "StepKeyPool":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> "StepKeyPool":
+        """Starts the workers and fills the pool."""
+        with self._condition:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.max_workers)
+        for key_type in self.key_types:
+            self._fill(key_type)
+        return self
+
+    def close(self) -> None:
+        """Stops the workers, dropping the keys not taken yet."""
+        with self._condition:
+            executor, self._executor = self._executor, None
+            for ready in self._ready.values():
+                ready.clear()
+            self._condition.notify_all()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def ready(self, key_type: StepKeyType | None = None) -> int:
+        """Gets how many keys of a type are ready to take."""
+        with self._condition:
+            return len(self._ready.get(key_type or self.key_types[0], ()))
+
+    def _fill(self, key_type: StepKeyType) -> None:
+        """Starts generating keys of a type, up to the depth."""
+        with self._condition:
+            executor = self._executor
+            if executor is None:
+                return
+            missing = self.depth - len(self._ready[key_type]) - self._pending[key_type]
+            self._pending[key_type] += max(missing, 0)
+        # submitted outside the lock, the callbacks take it
+        for _ in range(missing):
+            try:
+                future = executor.submit(_generate, key_type)
+            except RuntimeError:  # closed meanwhile
+                with self._condition:
+                    self._pending[key_type] -= 1
+                continue
+            future.add_done_callback(functools.partial(self._generated, key_type))
+
+    def _generated(self, key_type: StepKeyType, future: Future) -> None:
+        with self._condition:
+            self._pending[key_type] -= 1
+            self._condition.notify_all()
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                self.log.warning(f"failed to generate a {key_type} key: {error}")
+            elif self._executor is not None:
+                self._ready[key_type].append(future.result())
+
+    def pop(self, key_type: StepKeyType | None = None) -> StepPrivateKey:
+        """Takes a key, waiting for one being generated if none is ready.
+
+        Args:
+            key_type (StepKeyType): The type of key, the first of the pool by
+                default.
+        Returns:
+            StepPrivateKey: The key, only ever given out once.
+        """
+        key_type = key_type or self.key_types[0]
+        der = None
+        with self._condition:
+            ready = self._ready.get(key_type)
+            if ready is not None:
+                while not ready and self._pending[key_type] and self._executor:
+                    self._condition.wait()
+                if ready:
+                    der = ready.popleft()
+        if der is None:
+            return key_type.generate()
+        self._fill(key_type)
+        return _load(der)
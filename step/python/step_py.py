@@ -16,24 +16,29 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import logging
 import os
 
 import requests
-from cryptography import x509
+from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509 import Certificate
 
+from step.python.step_ca_py import AsyncStepCaClient, StepCaClient, StepCaError
+from step.python.step_crl import StepCrl
+from step.python.step_keys import StepKeyPool, StepKeyType, StepPrivateKey, build_csr
+from step.python.step_token import StepTokens
+from step.python.step_trust_cache import (
+    STEP_TRUST_TTL,
+    StepTrustBundle,
+    StepTrustCache,
+)
+
 
 def _path(path_str: str) -> str:
     if not path_str:
         return ""
-    path_list = path_str.split("/")
-    if path_list[0].startswith("~"):
-        path_list[0] = os.path.expanduser(path_list[0])
-        print(f"expanded path: {path_list[0]}")
-    rtn = os.path.join(*path_list)
-    rtn = os.path.normpath(rtn)
-    print(f"resolved path: {rtn}")
-    return rtn
+    # expanding in place keeps the leading / of absolute paths
+    return os.path.normpath(os.path.expanduser(path_str))
 
 
 def _mkdir(path_str: str) -> None:
@@ -41,6 +46,16 @@ def _mkdir(path_str: str) -> None:
         os.mkdir(_path(path_str))
 
 
+def resolve_step_path() -> str:
+    """Resolves the path to the step files, like step does."""
+    if os.environ.get("STEPPATH"):
+        return os.environ.get("STEPPATH", "")
+    for step_path in ["~/.step", "/usr/local/etc/step", "/etc/step"]:
+        if os.path.isdir(_path(step_path)):
+            return _path(step_path)
+    return _path("~/.step")
+
+
 class StepContext:
     ca_url: str = ""  # URL of step-ca instance
     fingerprint: str = ""  # Fingerprint of step-ca instance
@@ -51,6 +66,11 @@ class StepContext:
     step_path: str = ""  # Path locally to files for step
     root_cert_path: str = ""  # Path locally to certificate of step-ca instance
     root_certs: list[Certificate] = []  # Root certificates of step-ca instance
+    client: StepCaClient  # Client for the api of step-ca instance
+    _crl: StepCrl | None = None  # Revoked certificates of step-ca instance
+    _tokens: StepTokens | None = None  # Token minter of step-ca instance
+    trust_cache: StepTrustCache  # Cached root certificates of step-ca instances
+    log = logging.getLogger(__name__)
 
     def __init__(
         self,
@@ -59,99 +79,212 @@ class StepContext:
         context: str = "",
         authority: str = "",
         profile: str = "",
+        trust_ttl: float = STEP_TRUST_TTL,
+        refresh: bool = False,
     ) -> None:
+        """Initializes the context, from cached roots if they are fresh.
+
+        Args:
+            ca_url (str): The url of the step-ca instance.
+            fingerprint (str): The fingerprint of its root certificate.
+            context (str): The name of the context.
+            authority (str): The name of the authority.
+            profile (str): The name of the profile.
+            trust_ttl (float): Seconds cached roots are used without asking the
+                step-ca instance.
+            refresh (bool): Revalidate the cached roots, even if fresh.
+        """
         self.ca_url = ca_url if ca_url.startswith("https://") else f"https://{ca_url}"
         self.fingerprint = fingerprint
         self.context = context
         self.authority = authority
         self.profile = profile
+        self.client = StepCaClient(self.ca_url)
         self._resolve_step_path()
         self._init_step_path()
-        self._get_version()
-        self._get_root_certs()
+        self.trust_cache = StepTrustCache(self.step_path, trust_ttl)
+        self._get_root_certs(refresh)
 
     @property
     def path(self) -> str:
         """Get the path to the step files."""
         return self.step_path
 
+    @property
+    def crl(self) -> StepCrl:
+        """The revoked certificates of the step-ca instance, from its CRL."""
+        if self._crl is None:
+            self._crl = StepCrl(self.client, self.root_certs)
+        return self._crl
+
+    @property
+    def tokens(self) -> StepTokens:
+        """The minter of one-time tokens of the JWK provisioners."""
+        if self._tokens is None:
+            self._tokens = StepTokens(self.client, self.ca_url, self.fingerprint)
+        return self._tokens
+
+    def async_client(self, max_connections: int = 64) -> AsyncStepCaClient:
+        """Creates an asyncio client for the step-ca instance, for bulk requests.
+
+        Args:
+            max_connections (int): The most requests in flight at once.
+        Returns:
+            AsyncStepCaClient: The client, pinned to the root certificates.
+        """
+        return AsyncStepCaClient(
+            self.ca_url, self.root_cert_path, max_connections=max_connections
+        )
+
     def _resolve_step_path(self) -> None:
         """Resolves the path to the step files."""
-        if os.environ.get("STEPPATH"):
-            self.step_path = os.environ.get("STEPPATH", "")
-            return
-        elif os.path.isdir(_path("~/.step")):
-            self.step_path = _path("~/.step")
-            return
-        elif os.path.isdir(_path("/usr/local/etc/step")):
-            self.step_path = _path("/usr/local/etc/step")
-            return
-        elif os.path.isdir(_path("/etc/step")):
-            self.step_path = _path("/etc/step")
-            return
-        else:
-            self.step_path = _path("~/.step")
+        self.step_path = resolve_step_path()
 
     def _init_step_path(self) -> None:
         _mkdir(self.step_path)
         [_mkdir(f"{self.step_path}/{path}") for path in ["certs", "ssh", "config"]]
 
-    def _get_version(self) -> None:
-        """Get the version of the step-ca instance."""
-        response = requests.get(f"{self.ca_url}/version", verify=False)
-        self.version = response.json().get("version", "")
+    def _get_root_certs(self, refresh: bool = False) -> None:
+        """Get the root certificates of the step-ca instance.
+
+        Fresh cached roots are used as is. Otherwise the cached roots, or the
+        root checked against the fingerprint, verify the connection to get
+        the roots and federated roots, which then verify all other requests.
 
-    def _get_root_certs(self) -> None:
-        """Get the root certificates of the step-ca instance."""
-        response = requests.get(f"{self.ca_url}/root/{self.fingerprint}", verify=False)
+        Args:
+            refresh (bool): Revalidate the cached roots, even if fresh.
+        """
         self.root_cert_path = _path(f"{self.path}/certs/root_ca.crt")
-        with open(self.root_cert_path, "wb") as f:
-            self.root_certs = list(x509.load_pem_x509_certificate(response.content))
-            [
-                f.write(root_cert.public_bytes(encoding=x509.Encoding.PEM))
-                for root_cert in self.root_certs
-            ]
+        bundle = self.trust_cache.get(self.ca_url, self.fingerprint)
+        if bundle and not refresh and self.trust_cache.is_fresh(bundle):
+            self.log.debug(f"using cached roots of {self.ca_url}")
+        elif bundle:
+            self._pin(bundle)
+            try:
+                if bundle.revalidate(self.client, self.trust_cache.ttl):
+                    self.log.info(f"roots of {self.ca_url} changed")
+            except (requests.RequestException, StepCaError) as e:
+                self.log.warning(f"using stale roots of {self.ca_url}: {e}")
+            else:
+                self.trust_cache.put(bundle)
+        else:
+            root_cert = self.client.bootstrap_root(self.fingerprint)
+            bundle = StepTrustBundle(
+                self.ca_url,
+                self.fingerprint,
+                roots=[root_cert.public_bytes(Encoding.PEM).decode("utf-8")],
+            )
+            self._pin(bundle)
+            bundle.revalidate(self.client)
+            self.trust_cache.put(bundle)
+        self._pin(bundle)
+        self.root_certs = bundle.certs
+        self.version = bundle.version
+
+    def _pin(self, bundle: StepTrustBundle) -> None:
+        """Writes the roots of a bundle, if changed, and pins the client to them."""
+        pem = bundle.pem
+        try:
+            with open(self.root_cert_path, "rb") as f:
+                unchanged = f.read() == pem
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            with open(self.root_cert_path, "wb") as f:
+                f.write(pem)
+        self.client.pin(self.root_cert_path)
 
 
 class StepPy:
     """Class for interacting with a step-ca instance through python."""
 
     context: StepContext | None = None
+    key_pool: StepKeyPool | None = None  # keys generated ahead of time for `issue`
+
+    @property
+    def client(self) -> StepCaClient:
+        """The client for the api of the bootstrapped step-ca instance."""
+        if not self.context:
+            raise ValueError("not bootstrapped to a step-ca instance")
+        return self.context.client
 
-    def bootstrap(self, ca_url: str, fingerprint: str) -> None:
-        """Bootstrap a connection to step-ca instance."""
-        self.context = StepContext(ca_url, fingerprint)
+    def bootstrap(
+        self,
+        ca_url: str,
+        fingerprint: str,
+        trust_ttl: float = STEP_TRUST_TTL,
+        refresh: bool = False,
+    ) -> None:
+        """Bootstrap a connection to step-ca instance.
+
+        Args:
+            ca_url (str): The url of the step-ca instance.
+            fingerprint (str): The fingerprint of its root certificate.
+            trust_ttl (float): Seconds cached roots are used without asking the
+                step-ca instance.
+            refresh (bool): Revalidate the cached roots, even if fresh.
+        """
+        self.context = StepContext(
+            ca_url, fingerprint, trust_ttl=trust_ttl, refresh=refresh
+        )
         self.ca_url = ca_url
         self.fingerprint = fingerprint
-        self._get_version()
-        self._get_root_certs()
-
-
-# apis to implement
-API_TODO = """
-    r.MethodFunc("GET", "/version", Version)
-    r.MethodFunc("GET", "/health", Health)
-    r.MethodFunc("GET", "/root/{sha}", Root)
-    r.MethodFunc("POST", "/sign", Sign)
-    r.MethodFunc("POST", "/renew", Renew)
-    r.MethodFunc("POST", "/rekey", Rekey)
-    r.MethodFunc("POST", "/revoke", Revoke)
-    r.MethodFunc("GET", "/crl", CRL)
-    r.MethodFunc("GET", "/provisioners", Provisioners)
-    r.MethodFunc("GET", "/provisioners/{kid}/encrypted-key", ProvisionerKey)
-    r.MethodFunc("GET", "/roots", Roots)
-    r.MethodFunc("GET", "/roots.pem", RootsPEM)
-    r.MethodFunc("GET", "/federation", Federation)
-    // SSH CA
-    r.MethodFunc("POST", "/ssh/sign", SSHSign)
-    r.MethodFunc("POST", "/ssh/renew", SSHRenew)
-    r.MethodFunc("POST", "/ssh/revoke", SSHRevoke)
-    r.MethodFunc("POST", "/ssh/rekey", SSHRekey)
-    r.MethodFunc("GET", "/ssh/roots", SSHRoots)
-    r.MethodFunc("GET", "/ssh/federation", SSHFederation)
-    r.MethodFunc("POST", "/ssh/config", SSHConfig)
-    r.MethodFunc("POST", "/ssh/config/{type}", SSHConfig)
-    r.MethodFunc("POST", "/ssh/check-host", SSHCheckHost)
-    r.MethodFunc("GET", "/ssh/hosts", SSHGetHosts)
-    r.MethodFunc("POST", "/ssh/bastion", SSHBastion)
-"""
+
+    def token(
+        self,
+        subject: str,
+        provisioner: str,
+        password: bytes | str,
+        sans: list[str] | None = None,
+        audience: str = "/1.0/sign",
+    ) -> str:
+        """Mints a one-time token of a JWK provisioner, like `step ca token`.
+
+        The provisioner key is fetched and decrypted once, then kept in memory
+        for a while, so minting usually needs neither step nor the ca.
+
+        Args:
+            subject (str): The subject, also the only SAN if none are given.
+            provisioner (str): The name of the JWK provisioner.
+            password (bytes | str): The password of its key.
+            sans (List[str]): The SANs the token allows.
+            audience (str): The endpoint of the ca the token is for.
+        Returns:
+            str: The token.
+        """
+        if not self.context:
+            raise ValueError("not bootstrapped to a step-ca instance")
+        return self.context.tokens.token(
+            subject, provisioner, password, sans or (), audience
+        )
+
+    def issue(
+        self,
+        subject: str,
+        ott: str,
+        sans: list[str] | None = None,
+        key_type: StepKeyType | None = None,
+        not_before: str | None = None,
+        not_after: str | None = None,
+    ) -> tuple[StepPrivateKey, dict]:
+        """Gets a certificate for a new key, like `step ca certificate`.
+
+        The key is taken from `key_pool` if one is set, otherwise generated.
+
+        Args:
+            subject (str): The common name, also the only SAN if none are given.
+            ott (str): The one-time token authorizing the request, see `token`.
+            sans (List[str]): DNS names, IPs, emails and URIs.
+            key_type (StepKeyType): The type of key, EC P-256 by default.
+            not_before (str): The start of the validity, RFC 3339 or duration.
+            not_after (str): The end of the validity, RFC 3339 or duration.
+        Returns:
+            Tuple[StepPrivateKey, Dict]: The key, and the response with `crt`,
+                `ca` and `certChain` PEMs.
+        """
+        if self.key_pool:
+            key = self.key_pool.pop(key_type)
+        else:
+            key = (key_type or StepKeyType()).generate()
+        csr = build_csr(key, subject, sans or ())
+        return key, self.client.sign(csr, ott, not_before, not_after)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import random
+import subprocess
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from step.cli.step_cli_exec import StepExecutor, SubprocessExecutor
+from step.models import StepCertificate, utc_time
+from step.python.step_ca_py import StepCaClient
+
+
+class StepRenewer(ABC):
+    """Renews a certificate in place, with its own key."""
+
+    log = logging.getLogger(__name__)
+
+    @abstractmethod
+    def renew(self, cert_path: str, key_path: str) -> None:
+        """Renews a certificate, replacing the file.
+
+        Args:
+            cert_path (str): The certificate to renew.
+            key_path (str): The key of the certificate.
+        Raises:
+            Exception: If the renewal fails.
+        """
+
+
+class CliRenewer(StepRenewer):
+    """Renews with `step ca renew --force`."""
+
+    executor: StepExecutor
+
+    def __init__(self, executor: StepExecutor | None = None) -> None:
+        """Initializes the renewer.
+
+        Args:
+            executor (StepExecutor): How to run step, subprocess by default.
+        """
+        self.executor = executor or SubprocessExecutor()
+
+    def renew(self, cert_path: str, key_path: str) -> None:
+        self.executor.run(
+            ["step", "ca", "renew", "--force", cert_path, key_path],
+            stdin=subprocess.DEVNULL,
+        )
+
+
+class HttpRenewer(StepRenewer):
+    """Renews with POST /renew to the ca, authenticated by the certificate."""
+
+    client: StepCaClient
+
+    def __init__(self, client: StepCaClient) -> None:
+        """Initializes the renewer.
+
+        Args:
+            client (StepCaClient): The client of the ca that issued the certs.
+        """
+        self.client = client
+
+    def renew(self, cert_path: str, key_path: str) -> None:
+        response = self.client.renew(cert_path, key_path)
+        chain = response.get("certChain") or [response["crt"], response["ca"]]
+        directory = os.path.dirname(os.path.abspath(cert_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.write("".join(chain))
+            os.chmod(tmp_path, os.stat(cert_path).st_mode & 0o777)
+            os.replace(tmp_path, cert_path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+
+class _RateLimiter:
+    """Token bucket allowing `rate` events per second, in bursts of `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def wait(self) -> float:
+        """Takes a token, or gets the seconds until one is available."""
+        if not self.rate:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+@dataclass(slots=True)
+class _Renewal:
+    cert_path: str
+    key_path: str
+    renew_at: float = 0.0  # epoch seconds
+    not_after: float = 0.0  # epoch seconds the certificate expires at
+    failures: int = 0
+
+
+class StepRenewalScheduler:
+    """Renews many certificates from one thread, instead of one
+    `step ca renew --daemon` process each.
+
+    Certificates wait in a heap ordered by when they are due, a `fraction` of
+    the way through their lifetime, less up to `jitter` of it at random so
+    certificates issued together are not renewed together. Renewals run on a
+    small pool of workers, started no faster than `rate` per second.
+    """
+
+    renewer: StepRenewer
+    fraction: float
+    jitter: float
+    max_workers: int
+    retry_interval: float
+    on_renewed: Callable[[str], None] | None
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        renewer: StepRenewer | None = None,
+        fraction: float = 2 / 3,
+        jitter: float = 0.05,
+        rate: float = 10.0,
+        burst: int = 1,
+        max_workers: int = 4,
+        retry_interval: float = 30.0,
+        on_renewed: Callable[[str], None] | None = None,
+    ) -> None:
+        """Initializes the scheduler.
+
+        Args:
+            renewer (StepRenewer): How to renew, `step ca renew` by default.
+            fraction (float): How far through their lifetime certs are renewed.
+            jitter (float): The most of the lifetime to renew early by.
+            rate (float): The most renewals started per second, 0 for no limit.
+            burst (int): The most renewals started at once after a lull.
+            max_workers (int): The most renewals running at once.
+            retry_interval (float): Seconds before the first retry of a failed
+                renewal, doubled on each failure after, but never more than
+                half the time left before the certificate expires.
+            on_renewed (Callable[[str], None]): Called with the path of each
+                renewed certificate, to reload the services using it.
+        """
+        self.renewer = renewer or CliRenewer()
+        self.fraction = fraction
+        self.jitter = jitter
+        self.max_workers = max_workers
+        self.retry_interval = retry_interval
+        self.on_renewed = on_renewed
+        self._limiter = _RateLimiter(rate, burst)
+        self._renewals: dict[str, _Renewal] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._renewals)
+
+    def _renew_at(self, cert_path: str) -> tuple[float, float]:
+        """Gets when a certificate is due, with jitter, and when it expires."""
+        cert = StepCertificate(cert_path).cert
+        not_before = utc_time(cert, "not_valid_before").timestamp()
+        not_after = utc_time(cert, "not_valid_after").timestamp()
+        lifetime = not_after - not_before
+        jitter = random.uniform(0, self.jitter)
+        return not_before + lifetime * (self.fraction - jitter), not_after
+
+    def _retry_in(self, renewal: _Renewal) -> float:
+        """Gets the seconds before retrying a failed renewal."""
+        backoff = self.retry_interval * 2 ** min(renewal.failures - 1, 32)
+        # still retried a few times before the certificate expires
+        time_left = renewal.not_after - time.time()
+        return min(backoff, max(time_left / 2, self.retry_interval))
+
+    def _push(self, renewal: _Renewal) -> None:
+        heapq.heappush(
+            self._heap, (renewal.renew_at, next(self._counter), renewal.cert_path)
+        )
+        self._condition.notify()
+
+    def add(self, cert_path: str, key_path: str) -> float:
+        """Manages a certificate, replacing any with the same path.
+
+        Args:
+            cert_path (str): The certificate to renew.
+            key_path (str): The key of the certificate.
+        Returns:
+            float: When the certificate will be renewed, in epoch seconds.
+        """
+        renewal = _Renewal(cert_path, key_path, *self._renew_at(cert_path))
+        with self._condition:
+            self._renewals[cert_path] = renewal
+            self._push(renewal)
+        return renewal.renew_at
+
+    def remove(self, cert_path: str) -> None:
+        """Stops managing a certificate.
+
+        Args:
+            cert_path (str): The certificate to stop renewing.
+        """
+        with self._condition:
+            # the heap entry is skipped when it comes up
+            self._renewals.pop(cert_path, None)
+
+    def next_renewal(self) -> tuple[str, float] | None:
+        """Gets the next certificate due and when, in epoch seconds."""
+        with self._condition:
+            self._drop_removed()
+            if not self._heap:
+                return None
+            renew_at, _, cert_path = self._heap[0]
+            return cert_path, renew_at
+
+    def _drop_removed(self) -> None:
+        """Pops heap entries of removed or rescheduled certificates."""
+        while self._heap:
+            renew_at, _, cert_path = self._heap[0]
+            renewal = self._renewals.get(cert_path)
+            if renewal is not None and renewal.renew_at == renew_at:
+                return
+            heapq.heappop(self._heap)
+
+    def _next_due(self) -> _Renewal | float | None:
+        """Pops the next certificate due, or gets the seconds to wait for it."""
+        self._drop_removed()
+        if not self._heap:
+            return None
+        wait = self._heap[0][0] - time.time()
+        if wait > 0:
+            return wait
+        wait = self._limiter.wait()
+        if wait > 0:
+            return wait
+        _, _, cert_path = heapq.heappop(self._heap)
+        return self._renewals[cert_path]
+
+    def run(self) -> None:
+        """Renews certificates as they come due, until `stop` is called."""
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            while True:
+                with self._condition:
+                    while not self._stopped:
+                        due = self._next_due()
+                        if isinstance(due, _Renewal):
+                            break
+                        self._condition.wait(due)
+                    if self._stopped:
+                        return
+                executor.submit(self._renew, due)
+
+    def _renew(self, renewal: _Renewal) -> None:
+        """Renews a certificate and schedules its next renewal or retry."""
+        self.log.debug(f"renewing {renewal.cert_path}")
+        renewed = False
+        try:
+            self.renewer.renew(renewal.cert_path, renewal.key_path)
+            renew_at, not_after = self._renew_at(renewal.cert_path)
+            if renew_at <= time.time():
+                raise ValueError("renewed certificate is already due")
+        except Exception as e:
+            renewal.failures += 1
+            retry = self._retry_in(renewal)
+            self.log.warning(
+                f"failed to renew {renewal.cert_path}, retrying in {retry}s: {e}"
+            )
+            renew_at = time.time() + retry
+        else:
+            renewal.failures = 0
+            renewal.not_after = not_after
+            renewed = True
+        with self._condition:
+            if self._renewals.get(renewal.cert_path) is renewal:
+                renewal.renew_at = renew_at
+                self._push(renewal)
+        # only once rescheduled, so a failing callback can't drop the cert
+        if renewed and self.on_renewed:
+            try:
+                self.on_renewed(renewal.cert_path)
+            except Exception:
+                self.log.exception(f"on_renewed failed for {renewal.cert_path}")
+
+    def start(self) -> "StepRenewalScheduler":
+        """Runs the scheduler in a background thread."""
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self.run, name="step-renewal-scheduler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops scheduling renewals, letting running ones finish."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import base64
+import hmac
+import json
+import logging
+import secrets
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.keywrap import InvalidUnwrap, aes_key_unwrap
+
+from step.python.step_ca_py import StepCaClient
+from step.python.step_keys import StepPrivateKey
+
+STEP_KEY_TTL = 60 * 60  # seconds a decrypted provisioner key is kept
+STEP_TOKEN_LIFETIME = 5 * 60  # seconds a token is valid, like step ca token
+
+_CURVES = {"P-256": ec.SECP256R1, "P-384": ec.SECP384R1, "P-521": ec.SECP521R1}
+_HASHES = {"256": hashes.SHA256, "384": hashes.SHA384, "512": hashes.SHA512}
+# the key wrapping and content encryption of the keys of JWK provisioners
+_JWE_KEY_SIZES = {
+    "PBES2-HS256+A128KW": 16,
+    "PBES2-HS384+A192KW": 24,
+    "PBES2-HS512+A256KW": 32,
+}
+# the most PBKDF2 iterations of a JWE, like go-jose, so a forged header
+# cannot keep a thread busy for minutes
+_JWE_MAX_P2C = 1_000_000
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _int(data: str) -> int:
+    return int.from_bytes(_b64decode(data), "big")
+
+
+def decrypt_jwe(jwe: str, password: bytes) -> bytes:
+    """Decrypts a compact JWE encrypted with a password, like step crypto jwe.
+
+    Args:
+        jwe (str): The JWE, with a PBES2 key wrapping and AES-GCM encryption.
+        password (bytes): The password.
+    Returns:
+        bytes: The plaintext.
+    Raises:
+        ValueError: If the JWE is not supported, or the password is wrong.
+    """
+    protected, encrypted_key, iv, ciphertext, tag = jwe.split(".")
+    header = json.loads(_b64decode(protected))
+    alg, enc = header.get("alg", ""), header.get("enc", "")
+    if alg not in _JWE_KEY_SIZES or enc not in ("A128GCM", "A192GCM", "A256GCM"):
+        raise ValueError(f"unsupported JWE {alg} {enc}")
+    iterations = header.get("p2c")
+    if type(iterations) is not int or not 0 < iterations <= _JWE_MAX_P2C:
+        raise ValueError(f"unsupported JWE p2c {iterations}")
+    kek = PBKDF2HMAC(
+        _HASHES[alg[8:11]](),
+        _JWE_KEY_SIZES[alg],
+        alg.encode("ascii") + b"\0" + _b64decode(header["p2s"]),
+        iterations,
+    ).derive(password)
+    try:
+        cek = aes_key_unwrap(kek, _b64decode(encrypted_key))
+        return AESGCM(cek).decrypt(
+            _b64decode(iv),
+            _b64decode(ciphertext) + _b64decode(tag),
+            protected.encode("ascii"),
+        )
+    except (InvalidUnwrap, InvalidTag):
+        raise ValueError("wrong password, or a corrupted JWE")
+
+
+def jwk_private_key(jwk: dict) -> tuple[StepPrivateKey, str]:
+    """Loads a private JWK.
+
+    Args:
+        jwk (Dict): The JWK, an EC, OKP Ed25519 or RSA key.
+    Returns:
+        Tuple[StepPrivateKey, str]: The key, and the JWS algorithm to sign with.
+    Raises:
+        ValueError: If the key type is not supported.
+    """
+    kty = jwk.get("kty")
+    if kty == "EC" and jwk.get("crv") in _CURVES:
+        public = ec.EllipticCurvePublicNumbers(
+            _int(jwk["x"]), _int(jwk["y"]), _CURVES[jwk["crv"]]()
+        )
+        key = ec.EllipticCurvePrivateNumbers(_int(jwk["d"]), public).private_key()
+        return key, jwk.get("alg") or f"ES{jwk['crv'][2:].replace('521', '512')}"
+    if kty == "OKP" and jwk.get("crv") == "Ed25519":
+        key = ed25519.Ed25519PrivateKey.from_private_bytes(_b64decode(jwk["d"]))
+        return key, "EdDSA"
+    if kty == "RSA":
+        numbers = rsa.RSAPrivateNumbers(
+            *(_int(jwk[name]) for name in ("p", "q", "d", "dp", "dq", "qi")),
+            rsa.RSAPublicNumbers(_int(jwk["e"]), _int(jwk["n"])),
+        )
+        return numbers.private_key(), jwk.get("alg") or "RS256"
+    raise ValueError(f"unsupported JWK {kty} {jwk.get('crv', '')}")
+
+
+def sign_jws(key: StepPrivateKey, alg: str, header: dict, claims: dict) -> str:
+    """Signs claims as a compact JWS.
+
+    Args:
+        key (StepPrivateKey): The signing key.
+        alg (str): The algorithm, ES*, EdDSA, RS* or PS*.
+        header (Dict): The protected header, alg is added.
+        claims (Dict): The payload.
+    Returns:
+        str: The JWS.
+    """
+    signing_input = ".".join(
+        _b64encode(json.dumps(part, separators=(",", ":")).encode("utf-8"))
+        for part in ({"alg": alg, **header}, claims)
+    ).encode("ascii")
+    if isinstance(key, ec.EllipticCurvePrivateKey):
+        r, s = decode_dss_signature(
+            key.sign(signing_input, ec.ECDSA(_HASHES[alg[2:]]()))
+        )
+        size = (key.curve.key_size + 7) // 8
+        signature = r.to_bytes(size, "big") + s.to_bytes(size, "big")
+    elif isinstance(key, ed25519.Ed25519PrivateKey):
+        signature = key.sign(signing_input)
+    else:
+        hash_algorithm = _HASHES[alg[2:]]()
+        pad = (
+            padding.PSS(padding.MGF1(hash_algorithm), hash_algorithm.digest_size)
+            if alg.startswith("PS")
+            else padding.PKCS1v15()
+        )
+        signature = key.sign(signing_input, pad, hash_algorithm)
+    return f"{signing_input.decode('ascii')}.{_b64encode(signature)}"
+
+
+@dataclass(frozen=True, slots=True)
+class StepProvisionerKey:
+    """The decrypted key of a JWK provisioner."""
+
+    name: str  # name of the provisioner, the issuer of its tokens
+    kid: str  # id of the key, in the header of its tokens
+    key: StepPrivateKey
+    alg: str  # JWS algorithm of the key
+    expires: float  # time.monotonic() after which it is fetched again
+
+
+class StepTokens:
+    """Mints the one-time tokens of JWK provisioners, like `step ca token`.
+
+    The encrypted key of a provisioner is fetched from the ca and decrypted
+    on first use, then kept for `key_ttl` seconds, so a token is signed in
+    process without running step or asking the ca. A kept key is only used
+    with the password it was decrypted with.
+    """
+
+    client: StepCaClient
+    ca_url: str
+    fingerprint: str
+    key_ttl: float
+    log = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        client: StepCaClient,
+        ca_url: str,
+        fingerprint: str,
+        key_ttl: float = STEP_KEY_TTL,
+    ) -> None:
+        """Initializes the minter, keys are fetched on first use.
+
+        Args:
+            client (StepCaClient): The client of the ca.
+            ca_url (str): The url of the ca, the audience of the tokens.
+            fingerprint (str): The fingerprint of the root of the ca.
+            key_ttl (float): Seconds a decrypted key is kept.
+        """
+        self.client = client
+        self.ca_url = ca_url.rstrip("/")
+        self.fingerprint = fingerprint
+        self.key_ttl = key_ttl
+        # the keys, with a keyed digest of the password they were decrypted with
+        self._keys: dict[str, tuple[bytes, StepProvisionerKey]] = {}
+        self._digest_key = secrets.token_bytes(32)
+        self._lock = threading.Lock()
+
+    def key(self, provisioner: str, password: bytes | str) -> StepProvisionerKey:
+        """Gets the decrypted key of a JWK provisioner, fetching it if expired.
+
+        Args:
+            provisioner (str): The name of the provisioner.
+            password (bytes | str): The password of its key.
+        Returns:
+            StepProvisionerKey: The key.
+        Raises:
+            ValueError: If there is no such JWK provisioner, or the password
+                is wrong.
+        """
+        if isinstance(password, str):
+            password = password.encode("utf-8")
+        digest = hmac.digest(self._digest_key, password, "sha256")
+        with self._lock:
+            cached_digest, cached = self._keys.get(provisioner, (b"", None))
+            if (
+                cached
+                and cached.expires > time.monotonic()
+                and hmac.compare_digest(cached_digest, digest)
+            ):
+                return cached
+            found = next(
+                (
+                    p
+                    for p in self.client.provisioners()
+                    if p.get("type") == "JWK" and p.get("name") == provisioner
+                ),
+                None,
+            )
+            if found is None:
+                raise ValueError(f"no JWK provisioner {provisioner}")
+            kid = found["key"]["kid"]
+            jwk = json.loads(decrypt_jwe(self.client.provisioner_key(kid), password))
+            key, alg = jwk_private_key(jwk)
+            self.log.debug(f"decrypted the key {kid} of provisioner {provisioner}")
+            cached = StepProvisionerKey(
+                provisioner, kid, key, alg, time.monotonic() + self.key_ttl
+            )
+            self._keys[provisioner] = (digest, cached)
+            return cached
+
+    def forget(self, provisioner: str | None = None) -> None:
+        """Drops the decrypted key of a provisioner, or of all of them."""
+        with self._lock:
+            if provisioner is None:
+                self._keys.clear()
+            else:
+                self._keys.pop(provisioner, None)
+
+    def token(
+        self,
+        subject: str,
+        provisioner: str,
+        password: bytes | str,
+        sans: Iterable[str] = (),
+        audience: str = "/1.0/sign",
+        lifetime: float = STEP_TOKEN_LIFETIME,
+    ) -> str:
+        """Mints a one-time token, like `step ca token`.
+
+        Args:
+            subject (str): The subject, also the only SAN if none are given.
+            provisioner (str): The name of the JWK provisioner.
+            password (bytes | str): The password of its key.
+            sans (Iterable[str]): The SANs the token allows.
+            audience (str): The endpoint of the ca the token is for, like
+                /1.0/sign or /1.0/revoke.
+            lifetime (float): Seconds the token is valid.
+        Returns:
+            str: The token.
+        """
+        key = self.key(provisioner, password)
+        now = int(time.time())
+        claims = {
+            "aud": f"{self.ca_url}{audience}",
+            "exp": now + int(lifetime),
+            "iat": now,
+            "iss": key.name,
+            "jti": secrets.token_hex(32),
+            "nbf": now,
+            "sans": list(dict.fromkeys(sans)) or [subject],
+            "sha": self.fingerprint,
+            "sub": subject,
+        }
+        return sign_jws(key.key, key.alg, {"kid": key.kid, "typ": "JWT"}, claims)
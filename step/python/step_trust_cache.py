@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Copyright (C) 2023 Clayton Rosenthal.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.serialization import Encoding
+
+from step.cli.step_cli_cache import read_json, write_json
+from step.python.step_ca_py import StepCaClient, StepCaError
+
+STEP_TRUST_TTL = float(os.environ.get("STEP_TRUST_TTL", 24 * 60 * 60))
+
+
+@dataclass(slots=True)
+class StepTrustBundle:
+    """The roots trusted for a step-ca instance, as fetched at `fetched_at`."""
+
+    ca_url: str
+    fingerprint: str
+    roots: list[str] = field(default_factory=list)  # PEMs from /roots
+    federation: list[str] = field(default_factory=list)  # PEMs from /federation
+    etags: dict[str, str] = field(default_factory=dict)  # endpoint path to etag
+    version: str = ""  # version of the step-ca instance
+    fetched_at: float = 0.0  # epoch seconds of the last revalidation
+    version_fetched_at: float = 0.0  # epoch seconds the version was fetched
+    log = logging.getLogger(__name__)
+
+    @property
+    def certs(self) -> list[x509.Certificate]:
+        """The roots then the federated roots, without duplicates."""
+        certs: dict[bytes, x509.Certificate] = {}
+        for pem in self.roots + self.federation:
+            for cert in x509.load_pem_x509_certificates(pem.encode("utf-8")):
+                certs.setdefault(cert.fingerprint(hashes.SHA256()), cert)
+        return list(certs.values())
+
+    @property
+    def pem(self) -> bytes:
+        """The bundle as one PEM file."""
+        return b"".join(cert.public_bytes(Encoding.PEM) for cert in self.certs)
+
+    def revalidate(self, client: StepCaClient, version_ttl: float = 0.0) -> bool:
+        """Refreshes the roots over a connection verified by the current ones.
+
+        Unchanged endpoints are not downloaded again if the ca sends etags. The
+        version is only fetched again once older than `version_ttl`, and if
+        that fails the roots are still refreshed.
+
+        Args:
+            client (StepCaClient): A client pinned to the current roots.
+            version_ttl (float): Seconds the version is kept, 0 to fetch it.
+        Returns:
+            bool: Whether the roots changed.
+        """
+        old_pem = self.pem
+        for path in ("/roots", "/federation"):
+            response, self.etags[path] = client.get_if_changed(
+                path, self.etags.get(path, "")
+            )
+            if response is not None:
+                setattr(self, path.strip("/"), response.get("crts") or [])
+        now = time.time()
+        if not self.version or not 0 <= now - self.version_fetched_at < version_ttl:
+            try:
+                self.version = client.version().get("version", "")
+                self.version_fetched_at = now
+            except (requests.RequestException, StepCaError) as e:
+                self.log.warning(f"failed to get the version of {self.ca_url}: {e}")
+        self.fetched_at = now
+        return self.pem != old_pem
+
+
+class StepTrustCache:
+    """On-disk cache of trust bundles, keyed by ca url and root fingerprint.
+
+    Bundles younger than `ttl` are used without asking the ca, older ones are
+    revalidated before use.
+    """
+
+    cache_dir: str
+    ttl: float
+    log = logging.getLogger(__name__)
+
+    def __init__(self, step_path: str, ttl: float = STEP_TRUST_TTL) -> None:
+        """Initializes the cache.
+
+        Args:
+            step_path (str): The path to the step files, the cache goes in it.
+            ttl (float): Seconds a bundle is used without revalidating it.
+        """
+        self.cache_dir = os.path.join(step_path, "cache", "trust")
+        self.ttl = ttl
+
+    def _bundle_path(self, ca_url: str, fingerprint: str) -> str:
+        key = hashlib.sha256(f"{ca_url}\n{fingerprint.lower()}".encode("utf-8"))
+        return os.path.join(self.cache_dir, f"{key.hexdigest()[:16]}.json")
+
+    def get(self, ca_url: str, fingerprint: str) -> StepTrustBundle | None:
+        """Gets the cached bundle of a ca.
+
+        Args:
+            ca_url (str): The url of the step-ca instance.
+            fingerprint (str): The fingerprint of its root certificate.
+        Returns:
+            StepTrustBundle | None: The bundle, fresh or not, if cached.
+        """
+        data = read_json(self._bundle_path(ca_url, fingerprint))
+        try:
+            return StepTrustBundle(**data) if data else None
+        except TypeError:
+            self.log.debug(f"ignoring malformed trust bundle for {ca_url}")
+            return None
+
+    def put(self, bundle: StepTrustBundle) -> None:
+        """Stores a bundle.
+
+        Args:
+            bundle (StepTrustBundle): The bundle to store.
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            write_json(
+                self._bundle_path(bundle.ca_url, bundle.fingerprint), asdict(bundle)
+            )
+        except OSError as e:
+            self.log.warning(f"failed to cache trust bundle: {e}")
+
+    def is_fresh(self, bundle: StepTrustBundle) -> bool:
+        """Whether a bundle can be used without revalidating it."""
+        return 0 <= time.time() - bundle.fetched_at < self.ttl
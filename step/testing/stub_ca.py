@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+# A stand-in for step-ca, serving enough of its api over tls for the tests and
+# benchmarks, with certificates issued by a throwaway root.
+
+import base64
+import hashlib
+import ipaddress
+import json
+import re
+import secrets
+import ssl
+import sys
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.keywrap import aes_key_wrap
+from cryptography.x509.oid import NameOID
+
+from step.models import utc_time
+
+DURATION = re.compile(r"(\d+)([hms])")
+DURATION_UNITS = {"h": "hours", "m": "minutes", "s": "seconds"}
+
+
+def _time(value: str | None, default: datetime) -> datetime:
+    """Parses an RFC 3339 time or a duration from now, like step-ca does."""
+    if not value:
+        return default
+    if re.fullmatch(r"(\d+[hms])+", value):
+        delta = timedelta()
+        for amount, unit in DURATION.findall(value):
+            delta += timedelta(**{DURATION_UNITS[unit]: int(amount)})
+        return datetime.now(timezone.utc) + delta
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _pem(cert: x509.Certificate) -> str:
+    return cert.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def encrypt_jwe(plaintext: bytes, password: bytes, iterations: int = 1000) -> str:
+    """Encrypts with a password like step does the keys of JWK provisioners."""
+    salt = secrets.token_bytes(16)
+    protected = _b64(
+        json.dumps(
+            {
+                "alg": "PBES2-HS256+A128KW",
+                "enc": "A128GCM",
+                "p2c": iterations,
+                "p2s": _b64(salt),
+                "cty": "jwk+json",
+            }
+        ).encode("utf-8")
+    )
+    kek = PBKDF2HMAC(
+        hashes.SHA256(), 16, b"PBES2-HS256+A128KW\0" + salt, iterations
+    ).derive(password)
+    cek, iv = secrets.token_bytes(16), secrets.token_bytes(12)
+    sealed = AESGCM(cek).encrypt(iv, plaintext, protected.encode("ascii"))
+    return ".".join(
+        [
+            protected,
+            _b64(aes_key_wrap(kek, cek)),
+            _b64(iv),
+            _b64(sealed[:-16]),
+            _b64(sealed[-16:]),
+        ]
+    )
+
+
+class StubCa:
+    """A stand-in step-ca on 127.0.0.1, started and stopped around a test."""
+
+    url: str
+    root_path: str
+    fingerprint: str
+    requests: list[tuple[str, str]]  # (method, path) of each request served
+    connections: set[tuple[str, int]]  # client addresses that connected
+    revoked: dict[int, int]  # revoked serial numbers to reason codes
+    crl_lifetime: timedelta  # from thisUpdate to nextUpdate of the CRL
+    crl_number: int  # of the last CRL made
+    crl_issuer: tuple[x509.Certificate, ec.EllipticCurvePrivateKey] | None
+    federated: list[str]  # PEMs of other roots in the federation
+    provisioners: list[dict]  # returned by /provisioners
+    encrypted_keys: dict[str, str]  # kid to JWE returned by encrypted-key
+    check_token: Callable[[str, str], bool]  # (token, endpoint), True if valid
+    delay: float  # seconds to wait before each response
+    cert_lifetime: timedelta  # validity of certificates without notAfter
+
+    def __init__(self, tmp_dir: Path) -> None:
+        now = datetime.now(timezone.utc)
+        self.root_key = ec.generate_private_key(ec.SECP256R1())
+        root_name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Stub Root CA")])
+        self.root = (
+            x509.CertificateBuilder()
+            .subject_name(root_name)
+            .issuer_name(root_name)
+            .public_key(self.root_key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - timedelta(minutes=1))
+            .not_valid_after(now + timedelta(days=365))
+            .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+            .sign(self.root_key, hashes.SHA256())
+        )
+        self.root_pem = _pem(self.root)
+        self.fingerprint = hashlib.sha256(
+            self.root.public_bytes(serialization.Encoding.DER)
+        ).hexdigest()
+        self.root_path = str(tmp_dir / "stub_root_ca.crt")
+        Path(self.root_path).write_text(self.root_pem)
+
+        server_key = ec.generate_private_key(ec.SECP256R1())
+        server_cert = self.issue(
+            "localhost",
+            server_key.public_key(),
+            [
+                x509.DNSName("localhost"),
+                x509.IPAddress(ipaddress.ip_address("127.0.0.1")),
+            ],
+            now + timedelta(days=1),
+        )
+        server_cert_path = tmp_dir / "stub_ca.crt"
+        server_key_path = tmp_dir / "stub_ca.key"
+        server_cert_path.write_text(_pem(server_cert) + self.root_pem)
+        server_key_path.write_bytes(
+            server_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        self.ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self.ssl_context.load_cert_chain(server_cert_path, server_key_path)
+        self.ssl_context.load_verify_locations(self.root_path)
+        self.ssl_context.verify_mode = ssl.CERT_OPTIONAL
+
+        self.ssh_user_key = ec.generate_private_key(ec.SECP256R1())
+        self.ssh_host_key = ec.generate_private_key(ec.SECP256R1())
+        self.requests = []
+        self.connections = set()
+        self.revoked = {}
+        self.crl_lifetime = timedelta(hours=1)
+        self.crl_number = 0
+        self.crl_issuer = None  # an intermediate signing the CRL, not the root
+        self._crl: tuple[frozenset, datetime, bytes] | None = None
+        self.federated = []
+        self.provisioners = []
+        self.encrypted_keys = {}
+        self.check_token = lambda token, endpoint: bool(token)
+        self.delay = 0.0
+        self.cert_lifetime = timedelta(hours=24)
+        self.server: ThreadingHTTPServer | None = None
+
+    def issue(
+        self,
+        subject: str,
+        public_key,
+        sans: list[x509.GeneralName],
+        not_after: datetime,
+        not_before: datetime | None = None,
+    ) -> x509.Certificate:
+        """Issues a leaf certificate signed by the stub root."""
+        builder = (
+            x509.CertificateBuilder()
+            .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, subject)]))
+            .issuer_name(self.root.subject)
+            .public_key(public_key)
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(
+                not_before or datetime.now(timezone.utc) - timedelta(seconds=30)
+            )
+            .not_valid_after(not_after)
+            .add_extension(x509.BasicConstraints(ca=False, path_length=None), True)
+        )
+        if sans:
+            builder = builder.add_extension(x509.SubjectAlternativeName(sans), False)
+        return builder.sign(self.root_key, hashes.SHA256())
+
+    def jwk_provisioner(self, name: str, password: bytes) -> ec.EllipticCurvePrivateKey:
+        """Adds a JWK provisioner with a new P-256 key, returning the key."""
+        key = ec.generate_private_key(ec.SECP256R1())
+        numbers = key.private_numbers()
+        jwk = {
+            "kty": "EC",
+            "crv": "P-256",
+            "x": _b64(numbers.public_numbers.x.to_bytes(32, "big")),
+            "y": _b64(numbers.public_numbers.y.to_bytes(32, "big")),
+            "use": "sig",
+            "alg": "ES256",
+            "kid": _b64(secrets.token_bytes(16)),
+        }
+        public = dict(jwk)
+        jwk["d"] = _b64(numbers.private_value.to_bytes(32, "big"))
+        self.provisioners.append({"type": "JWK", "name": name, "key": public})
+        self.encrypted_keys[jwk["kid"]] = encrypt_jwe(
+            json.dumps(jwk).encode("utf-8"), password
+        )
+        return key
+
+    def crl(self) -> bytes:
+        """Makes a CRL of the revoked serial numbers, signed by the root.
+
+        The CRL is only made again once a serial is revoked or it expires.
+        """
+        now = datetime.now(timezone.utc)
+        revoked = frozenset(self.revoked)
+        if self._crl and self._crl[0] == revoked and self._crl[1] > now:
+            return self._crl[2]
+        self.crl_number += 1
+        issuer, issuer_key = self.crl_issuer or (self.root, self.root_key)
+        builder = (
+            x509.CertificateRevocationListBuilder()
+            .issuer_name(issuer.subject)
+            .last_update(now)
+            .next_update(now + self.crl_lifetime)
+            .add_extension(x509.CRLNumber(self.crl_number), False)
+        )
+        for serial in self.revoked:
+            builder = builder.add_revoked_certificate(
+                x509.RevokedCertificateBuilder()
+                .serial_number(serial)
+                .revocation_date(now)
+                .build()
+            )
+        crl = builder.sign(issuer_key, hashes.SHA256()).public_bytes(
+            serialization.Encoding.DER
+        )
+        self._crl = (revoked, now + self.crl_lifetime, crl)
+        return crl
+
+    def start(self) -> "StubCa":
+        self.server = _StubCaServer(("127.0.0.1", 0), _StubCaHandler)
+        self.server.daemon_threads = True
+        self.server.stub = self  # type: ignore[attr-defined]
+        # handshakes happen in the handler threads, not one at a time in accept
+        self.server.socket = self.ssl_context.wrap_socket(
+            self.server.socket, server_side=True, do_handshake_on_connect=False
+        )
+        self.url = f"https://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+class _StubCaServer(ThreadingHTTPServer):
+    request_queue_size = 128  # room for many clients connecting at once
+
+    def handle_error(self, request, client_address) -> None:
+        # failed handshakes and dropped connections are expected in tests
+        if not isinstance(sys.exc_info()[1], OSError):
+            super().handle_error(request, client_address)
+
+
+class _StubCaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: ThreadingHTTPServer
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    @property
+    def stub(self) -> StubCa:
+        return self.server.stub  # type: ignore[attr-defined]
+
+    def _send(
+        self, status: int, body: bytes, content_type: str, etag: str = ""
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, body: dict, status: int = 200) -> None:
+        self._send(status, json.dumps(body).encode("utf-8"), "application/json")
+
+    def _tagged(self, data: bytes, content_type: str) -> None:
+        """Sends a body with an etag, or 304 if the client has it already."""
+        etag = f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", content_type, etag)
+            return
+        self._send(200, data, content_type, etag)
+
+    def _tagged_json(self, body: dict) -> None:
+        self._tagged(json.dumps(body).encode("utf-8"), "application/json")
+
+    def _error(self, status: int, message: str) -> None:
+        self._json({"status": status, "message": message}, status)
+
+    def _peer_cert(self) -> x509.Certificate | None:
+        der = self.connection.getpeercert(binary_form=True)
+        return x509.load_der_x509_certificate(der) if der else None
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _chain(self, cert: x509.Certificate) -> None:
+        crt = _pem(cert)
+        self._json(
+            {
+                "crt": crt,
+                "ca": self.stub.root_pem,
+                "certChain": [crt, self.stub.root_pem],
+            },
+            201,
+        )
+
+    def _handle(self, method: str) -> None:
+        stub = self.stub
+        path, _, query = self.path.partition("?")
+        stub.requests.append((method, path))
+        stub.connections.add(self.client_address)
+        if stub.delay:
+            time.sleep(stub.delay)
+        parts = path.strip("/").split("/")
+        name = "_".join(parts[:2] if parts[0] == "ssh" else parts[:1])
+        handler = getattr(self, f"_{method}_{re.sub('[.-]', '_', name)}", None)
+        if handler is None:
+            self._error(404, "not found")
+            return
+        handler(path, query)
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def _GET_version(self, path: str, query: str) -> None:
+        self._json({"version": "0.24.2", "requireClientAuthentication": False})
+
+    def _GET_health(self, path: str, query: str) -> None:
+        self._json({"status": "ok"})
+
+    def _GET_root(self, path: str, query: str) -> None:
+        if path.split("/")[-1].lower() != self.stub.fingerprint:
+            self._error(404, "root not found")
+            return
+        self._json({"ca": self.stub.root_pem})
+
+    def _GET_roots(self, path: str, query: str) -> None:
+        self._tagged_json({"crts": [self.stub.root_pem]})
+
+    def _GET_roots_pem(self, path: str, query: str) -> None:
+        self._send(200, self.stub.root_pem.encode("utf-8"), "application/x-pem-file")
+
+    def _GET_federation(self, path: str, query: str) -> None:
+        self._tagged_json({"crts": [self.stub.root_pem, *self.stub.federated]})
+
+    def _GET_crl(self, path: str, query: str) -> None:
+        self._tagged(self.stub.crl(), "application/pkix-crl")
+
+    def _GET_intermediates(self, path: str, query: str) -> None:
+        issuer = self.stub.crl_issuer
+        self._json({"crts": [_pem(issuer[0])] if issuer else []})
+
+    def _GET_provisioners(self, path: str, query: str) -> None:
+        parts = path.strip("/").split("/")
+        if len(parts) == 3:
+            key = self.stub.encrypted_keys.get(parts[1])
+            if key is None:
+                self._error(404, "provisioner not found")
+                return
+            self._json({"key": key})
+            return
+        params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+        start = int(params.get("cursor") or 0)
+        limit = int(params.get("limit") or 20)
+        page = self.stub.provisioners[start : start + limit]
+        more = start + limit < len(self.stub.provisioners)
+        self._json(
+            {"provisioners": page, "nextCursor": str(start + limit) if more else ""}
+        )
+
+    def _POST_sign(self, path: str, query: str) -> None:
+        body = self._body()
+        if not self.stub.check_token(body.get("ott", ""), "/sign"):
+            self._error(401, "invalid token")
+            return
+        csr = x509.load_pem_x509_csr(body["csr"].encode("utf-8"))
+        try:
+            sans = list(
+                csr.extensions.get_extension_for_class(
+                    x509.SubjectAlternativeName
+                ).value
+            )
+        except x509.ExtensionNotFound:
+            sans = []
+        subject = csr.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
+        now = datetime.now(timezone.utc)
+        self._chain(
+            self.stub.issue(
+                subject,
+                csr.public_key(),
+                sans,
+                _time(body.get("notAfter"), now + self.stub.cert_lifetime),
+                _time(body.get("notBefore"), now - timedelta(seconds=30)),
+            )
+        )
+
+    def _renewed(self, public_key) -> None:
+        cert = self._peer_cert()
+        if cert is None:
+            self._error(401, "missing client certificate")
+            return
+        try:
+            sans = list(
+                cert.extensions.get_extension_for_class(
+                    x509.SubjectAlternativeName
+                ).value
+            )
+        except x509.ExtensionNotFound:
+            sans = []
+        lifetime = utc_time(cert, "not_valid_after") - utc_time(
+            cert, "not_valid_before"
+        )
+        subject = cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
+        now = datetime.now(timezone.utc)
+        self._chain(
+            self.stub.issue(
+                subject, public_key or cert.public_key(), sans, now + lifetime, now
+            )
+        )
+
+    def _POST_renew(self, path: str, query: str) -> None:
+        self._body()
+        self._renewed(None)
+
+    def _POST_rekey(self, path: str, query: str) -> None:
+        csr = x509.load_pem_x509_csr(self._body()["csr"].encode("utf-8"))
+        self._renewed(csr.public_key())
+
+    def _POST_revoke(self, path: str, query: str) -> None:
+        body = self._body()
+        if not (
+            self._peer_cert() or self.stub.check_token(body.get("ott", ""), "/revoke")
+        ):
+            self._error(401, "invalid token")
+            return
+        self.stub.revoked[int(body["serial"])] = body.get("reasonCode", 0)
+        self._json({"status": "ok"})
+
+    def _ssh_key(self, key) -> str:
+        return (
+            key.public_key()
+            .public_bytes(
+                serialization.Encoding.OpenSSH, serialization.PublicFormat.OpenSSH
+            )
+            .decode("utf-8")
+        )
+
+    def _GET_ssh_roots(self, path: str, query: str) -> None:
+        self._json(
+            {
+                "userKey": [self._ssh_key(self.stub.ssh_user_key)],
+                "hostKey": [self._ssh_key(self.stub.ssh_host_key)],
+            }
+        )
+
+    _GET_ssh_federation = _GET_ssh_roots
+
+    def _POST_ssh_sign(self, path: str, query: str) -> None:
+        body = self._body()
+        if not self.stub.check_token(body.get("ott", ""), "/ssh/sign"):
+            self._error(401, "invalid token")
+            return
+        # the key is base64 of the ssh wire format, which starts with its type
+        wire_key = base64.b64decode(body["publicKey"])
+        key_type = wire_key[4 : 4 + int.from_bytes(wire_key[:4], "big")]
+        public_key = serialization.load_ssh_public_key(
+            key_type + b" " + body["publicKey"].encode("utf-8")
+        )
+        host = body.get("certType") == "host"
+        now = int(time.time())
+        cert = (
+            serialization.SSHCertificateBuilder()
+            .public_key(public_key)
+            .serial(secrets.randbits(63))
+            .type(
+                serialization.SSHCertificateType.HOST
+                if host
+                else serialization.SSHCertificateType.USER
+            )
+            .key_id(body.get("keyID", "").encode("utf-8"))
+            .valid_principals([p.encode("utf-8") for p in body.get("principals", [])])
+            .valid_after(now - 30)
+            .valid_before(now + 3600)
+            .sign(self.stub.ssh_host_key if host else self.stub.ssh_user_key)
+        )
+        self._json({"crt": cert.public_bytes().split(b" ")[1].decode("utf-8")}, 201)
+
+    def _POST_ssh_check_host(self, path: str, query: str) -> None:
+        body = self._body()
+        self._json({"exists": body.get("principal", "").endswith(".internal")})
+
+    def _GET_ssh_hosts(self, path: str, query: str) -> None:
+        if self._peer_cert() is None:
+            self._error(401, "missing client certificate")
+            return
+        self._json({"hosts": [{"hostname": "a.internal"}, {"hostname": "b.internal"}]})
+
+    def _POST_ssh_bastion(self, path: str, query: str) -> None:
+        body = self._body()
+        self._json({"hostname": body["hostname"], "bastion": None})
+
+    def _POST_ssh_config(self, path: str, query: str) -> None:
+        body = self._body()
+        self._json({"userKey": [], "hostKey": [], "data": body.get("data") or {}})
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from step import StepCliParser
+from step.cli.step_cli import StepCommand
+from step.cli.step_cli_exec import step_binary
+from step.testing.stub_ca import StubCa
+
+STEP_JSON = os.path.join(os.path.dirname(__file__), "..", "cli", "step-cli.json")
+
+
+@pytest.fixture(autouse=True)
+def no_step_cli_cache(monkeypatch):
+    """Keeps tests from reading or writing the user's step command cache."""
+    monkeypatch.setattr(StepCliParser, "_cache", None)
+    monkeypatch.setattr(StepCliParser, "_cache_resolved", True)
+    monkeypatch.setattr(StepCliParser, "_cli_version", None)
+    monkeypatch.setattr(StepCliParser, "_rejected_schemas", set())
+
+
+@pytest.fixture(autouse=True)
+def no_step_commands(monkeypatch):
+    """Forgets the commands navigated to by other tests."""
+    monkeypatch.setattr(StepCommand, "_commands", {})
+
+
+@pytest.fixture(autouse=True)
+def no_step_binary():
+    """Resolves the step binary again for each test, as the PATH may change."""
+    step_binary.cache_clear()
+    yield
+    step_binary.cache_clear()
+
+
+@pytest.fixture
+def step_schema(monkeypatch):
+    """Loads the shipped schema, without checking for a step binary."""
+    monkeypatch.setattr("step.cli.step_cli.STEP_JSON", STEP_JSON)
+    monkeypatch.setattr(StepCliParser, "_installed_cli_version", lambda: "")
+
+
+@pytest.fixture
+def fake_step(tmp_path, monkeypatch):
+    """Puts a shell script named step first on the PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def make(script: str) -> str:
+        step = bin_dir / "step"
+        step.write_text(f"#!/bin/sh\n{script}\n")
+        step.chmod(0o755)
+        return str(step)
+
+    return make
+
+
+@pytest.fixture
+def stub_ca(tmp_path):
+    """Runs a stand-in step-ca for the test."""
+    ca = StubCa(tmp_path).start()
+    yield ca
+    ca.stop()
+
+
+@pytest.fixture
+def make_csr():
+    """Makes a P-256 key and a PEM CSR for a subject, also its DNS name."""
+
+    def make(subject: str) -> tuple[ec.EllipticCurvePrivateKey, str]:
+        key = ec.generate_private_key(ec.SECP256R1())
+        csr = (
+            x509.CertificateSigningRequestBuilder()
+            .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, subject)]))
+            .add_extension(x509.SubjectAlternativeName([x509.DNSName(subject)]), False)
+            .sign(key, hashes.SHA256())
+        )
+        return key, csr.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+
+    return make
+
+
+@pytest.fixture
+def make_cert():
+    """Makes certificates, self-signed unless an issuer and its key are given."""
+
+    def make(
+        name: str,
+        issuer: tuple[x509.Certificate, ec.EllipticCurvePrivateKey] | None = None,
+        key: ec.EllipticCurvePrivateKey | None = None,
+        serial: int | None = None,
+        not_before: datetime | None = None,
+        not_after: datetime | None = None,
+        sans: list[x509.GeneralName] | None = None,
+        ca: bool = False,
+    ) -> tuple[x509.Certificate, ec.EllipticCurvePrivateKey]:
+        key = key or ec.generate_private_key(ec.SECP256R1())
+        subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, name)])
+        issuer_cert, issuer_key = issuer or (None, key)
+        now = datetime.now(timezone.utc)
+        builder = (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(issuer_cert.subject if issuer_cert else subject)
+            .public_key(key.public_key())
+            .serial_number(serial or x509.random_serial_number())
+            .not_valid_before(not_before or now - timedelta(minutes=1))
+            .not_valid_after(not_after or now + timedelta(days=1))
+        )
+        if sans:
+            builder = builder.add_extension(x509.SubjectAlternativeName(sans), False)
+        if ca:
+            builder = builder.add_extension(
+                x509.BasicConstraints(ca=True, path_length=None), True
+            )
+        return builder.sign(issuer_key, hashes.SHA256()), key
+
+    return make
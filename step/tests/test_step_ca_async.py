@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+
+from step.python.step_ca_py import AsyncStepCaClient, StepCaError
+
+
+def test_bulk_sign(stub_ca, make_csr):
+    """Tests that concurrent requests share a bounded pool of connections."""
+    _, csr = make_csr("host.example.com")
+
+    async def sign_all():
+        async with AsyncStepCaClient(
+            stub_ca.url, stub_ca.root_path, max_connections=4
+        ) as client:
+            return await asyncio.gather(*(client.sign(csr, "token") for _ in range(40)))
+
+    responses = asyncio.run(sign_all())
+    serials = {
+        x509.load_pem_x509_certificate(r["crt"].encode()).serial_number
+        for r in responses
+    }
+    assert len(serials) == 40
+    assert len(stub_ca.connections) <= 4
+
+
+def test_renew_and_revoke(stub_ca, tmp_path, make_csr):
+    """Tests renewing and revoking with the certificate itself."""
+    key, csr = make_csr("host.example.com")
+    cert_path, key_path = tmp_path / "host.crt", tmp_path / "host.key"
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+
+    async def renew_and_revoke():
+        async with AsyncStepCaClient(stub_ca.url, stub_ca.root_path) as client:
+            cert_path.write_text((await client.sign(csr, "token"))["crt"])
+            cert_files = (str(cert_path), str(key_path))
+            renewed = await client.renew(*cert_files)
+            cert = x509.load_pem_x509_certificate(cert_path.read_bytes())
+            revoked = await client.revoke(str(cert.serial_number), cert=cert_files)
+            return renewed, revoked, cert
+
+    renewed, revoked, cert = asyncio.run(renew_and_revoke())
+    assert x509.load_pem_x509_certificate(renewed["crt"].encode()).subject == (
+        cert.subject
+    )
+    assert revoked["status"] == "ok"
+    assert cert.serial_number in stub_ca.revoked
+
+
+def test_error(stub_ca, make_csr):
+    """Tests that error responses raise with the ca's message."""
+    _, csr = make_csr("host.example.com")
+
+    async def sign():
+        async with AsyncStepCaClient(stub_ca.url, stub_ca.root_path) as client:
+            await client.sign(csr, "")
+
+    with pytest.raises(StepCaError) as e:
+        asyncio.run(sign())
+    assert (e.value.status, e.value.message) == (401, "invalid token")
+
+
+def test_deadline(stub_ca):
+    """Tests that a request past its deadline is abandoned, not the client."""
+
+    async def slow_then_fast():
+        async with AsyncStepCaClient(stub_ca.url, stub_ca.root_path) as client:
+            stub_ca.delay = 0.5
+            with pytest.raises(TimeoutError):
+                await client.version(timeout=0.1)
+            stub_ca.delay = 0.0
+            return await client.health()
+
+    assert asyncio.run(slow_then_fast())
+
+
+def test_chunked_response():
+    """Tests reading a chunked response."""
+
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            + b'5\r\n{"ok"\r\n6;ext=1\r\n: true\r\n1\r\n}\r\n0\r\n\r\n'
+        )
+        return await AsyncStepCaClient._read_response(reader, await reader.readline())
+
+    assert asyncio.run(read()) == (200, True, b'{"ok": true}')
+
+
+def test_bodyless_responses():
+    """Tests that 1xx, 204 and 304 responses are not read up to EOF."""
+
+    async def read(data: bytes):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)  # no EOF, like a kept alive connection
+        return await asyncio.wait_for(
+            AsyncStepCaClient._read_response(reader, await reader.readline()), 1
+        )
+
+    assert asyncio.run(read(b"HTTP/1.1 204 No Content\r\n\r\n")) == (204, True, b"")
+    assert asyncio.run(
+        read(
+            b"HTTP/1.1 100 Continue\r\n\r\n"
+            + b"HTTP/1.1 304 Not Modified\r\nETag: x\r\n\r\n"
+        )
+    ) == (304, True, b"")
+
+
+class FakeWriter:
+    def __init__(self):
+        self.closed = False
+
+    def write(self, data):
+        pass
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def is_closing(self):
+        return self.closed
+
+
+@pytest.mark.parametrize(
+    "reply, retried",
+    [(b"", True), (b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nabc", False)],
+)
+def test_retry_only_unanswered(reply, retried):
+    """Tests that a broken pooled connection is only retried without a reply."""
+    client = AsyncStepCaClient("https://ca.example.com", "")
+    connections = []
+
+    async def connect(cert):
+        reader = asyncio.StreamReader()
+        if connections:
+            reader.feed_data(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+        else:
+            reader.feed_data(reply)
+            reader.feed_eof()
+        connections.append(reader)
+        return reader, FakeWriter(), len(connections) == 1
+
+    client._connect = connect
+
+    async def exchange():
+        return await client._exchange(b"POST /1.0/sign HTTP/1.1\r\n\r\n", None)
+
+    if retried:
+        assert asyncio.run(exchange()) == (200, b"{}")
+        assert len(connections) == 2
+    else:
+        with pytest.raises(asyncio.IncompleteReadError):
+            asyncio.run(exchange())
+        assert len(connections) == 1
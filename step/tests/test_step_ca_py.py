@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+import os
+
+import pytest
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from step.python.step_ca_py import StepCaClient, StepCaError
+from step.python.step_py import StepContext, StepPy
+
+
+@pytest.fixture
+def client(stub_ca):
+    with StepCaClient(stub_ca.url, stub_ca.root_path) as client:
+        yield client
+
+
+@pytest.fixture
+def issued(client, tmp_path, make_csr):
+    """Signs a certificate and writes it and its key to files."""
+    key, csr = make_csr("host.example.com")
+    response = client.sign(csr, "token")
+    cert_path, key_path = tmp_path / "host.crt", tmp_path / "host.key"
+    cert_path.write_text(response["crt"])
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return x509.load_pem_x509_certificate(response["crt"].encode()), (
+        str(cert_path),
+        str(key_path),
+    )
+
+
+def test_bootstrap_root(stub_ca):
+    """Tests getting the root by fingerprint before trusting it."""
+    client = StepCaClient(stub_ca.url)
+    root = client.bootstrap_root(stub_ca.fingerprint)
+    assert root.subject == stub_ca.root.subject
+    with pytest.raises(StepCaError) as e:
+        client.bootstrap_root("00" * 32)
+    assert e.value.status == 404
+
+
+@pytest.mark.parametrize("bootstrap", [False, True])
+def test_pinned_root(stub_ca, tmp_path, bootstrap, make_cert):
+    """Tests that connections are only verified against the pinned root.
+
+    Also after bootstrapping, whose unverified connection must not be reused.
+    """
+    other, _ = make_cert("Other Root", ca=True)
+    other_root = tmp_path / "other.crt"
+    other_root.write_bytes(other.public_bytes(serialization.Encoding.PEM))
+    client = StepCaClient(stub_ca.url)
+    if bootstrap:
+        client.bootstrap_root(stub_ca.fingerprint)
+    client.pin(str(other_root))
+    with pytest.raises(requests.exceptions.SSLError):
+        client.version()
+
+
+def test_keep_alive(client, stub_ca):
+    """Tests that requests reuse a pooled connection."""
+    for _ in range(5):
+        assert client.health()
+    assert client.version()["version"] == "0.24.2"
+    assert len(stub_ca.connections) == 1
+
+
+def test_sign(client, stub_ca, make_csr):
+    """Tests signing a certificate request."""
+    _, csr = make_csr("host.example.com")
+    response = client.sign(csr, "token", not_after="1h")
+    cert = x509.load_pem_x509_certificate(response["crt"].encode())
+    assert cert.issuer == stub_ca.root.subject
+    assert response["certChain"][1] == stub_ca.root_pem
+    with pytest.raises(StepCaError) as e:
+        client.sign(csr, "")
+    assert e.value.status == 401
+    assert e.value.message == "invalid token"
+
+
+def test_renew_and_rekey(client, issued, make_csr):
+    """Tests renewing with the certificate itself."""
+    cert, cert_files = issued
+    renewed = x509.load_pem_x509_certificate(client.renew(*cert_files)["crt"].encode())
+    assert renewed.subject == cert.subject
+    assert renewed.serial_number != cert.serial_number
+    assert renewed.public_key() == cert.public_key()
+
+    new_key, csr = make_csr("host.example.com")
+    rekeyed = x509.load_pem_x509_certificate(
+        client.rekey(csr, *cert_files)["crt"].encode()
+    )
+    assert rekeyed.public_key() == new_key.public_key()
+
+
+def test_revoke_and_crl(client, issued):
+    """Tests that revoked serials show up in the CRL."""
+    cert, cert_files = issued
+    assert client.revoke(str(cert.serial_number), cert=cert_files)["status"] == "ok"
+    crl = x509.load_der_x509_crl(client.crl())
+    assert crl.get_revoked_certificate_by_serial_number(cert.serial_number)
+
+
+def test_roots(client, stub_ca):
+    """Tests the root and federation endpoints."""
+    assert client.roots() == [stub_ca.root_pem]
+    assert client.roots_pem() == stub_ca.root_pem
+    assert client.federation() == [stub_ca.root_pem]
+    assert client.root(stub_ca.fingerprint) == stub_ca.root_pem
+
+
+def test_provisioners(client, stub_ca):
+    """Tests following the pages of provisioners."""
+    stub_ca.provisioners = [{"name": f"prov-{i}", "type": "JWK"} for i in range(7)]
+    stub_ca.encrypted_keys = {"kid-1": "jwe"}
+    assert [p["name"] for p in client.provisioners(limit=3)] == [
+        f"prov-{i}" for i in range(7)
+    ]
+    assert client.provisioner_key("kid-1") == "jwe"
+
+
+def test_ssh(client, stub_ca, issued):
+    """Tests the ssh endpoints."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    public_key = key.public_key().public_bytes(
+        serialization.Encoding.OpenSSH, serialization.PublicFormat.OpenSSH
+    )
+    response = client.ssh_sign(
+        public_key.split(b" ")[1].decode(), "token", principals=["alice"]
+    )
+    ssh_cert = serialization.load_ssh_public_identity(
+        b"ecdsa-sha2-nistp256-cert-v01@openssh.com " + response["crt"].encode()
+    )
+    assert ssh_cert.valid_principals == [b"alice"]
+    assert client.ssh_roots()["userKey"]
+    assert client.ssh_check_host("a.internal")
+    assert not client.ssh_check_host("a.example.com")
+    assert [h["hostname"] for h in client.ssh_hosts(issued[1])] == [
+        "a.internal",
+        "b.internal",
+    ]
+    with pytest.raises(StepCaError):
+        client.ssh_hosts(None)
+
+
+def test_step_py_bootstrap_context(stub_ca, tmp_path, monkeypatch):
+    """Tests that the context pins the client to the bootstrapped root."""
+    monkeypatch.setenv("STEPPATH", str(tmp_path / "step"))
+    step = StepPy()
+    step.context = StepContext(stub_ca.url, stub_ca.fingerprint)
+    assert step.context.version == "0.24.2"
+    assert step.client.root_cert_path == os.path.join(
+        str(tmp_path / "step"), "certs", "root_ca.crt"
+    )
+    assert open(step.client.root_cert_path).read() == stub_ca.root_pem
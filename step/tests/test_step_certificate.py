@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from step import StepCertificate
+from step.models import utc_time
+
+KEY = ec.generate_private_key(ec.SECP256R1())
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+@pytest.fixture
+def host_cert(make_cert):
+    """Makes self-signed host certificates of one key, valid for a day."""
+
+    def make(name: str, serial: int) -> x509.Certificate:
+        cert, _ = make_cert(
+            name,
+            key=KEY,
+            serial=serial,
+            not_before=NOW,
+            not_after=NOW + timedelta(days=1),
+            sans=[x509.DNSName(name), x509.RFC822Name(f"admin@{name}")],
+        )
+        return cert
+
+    return make
+
+
+@pytest.fixture
+def bundle(tmp_path, host_cert):
+    certs = [host_cert(f"host{i}.example.com", i + 1) for i in range(3)]
+    path = tmp_path / "bundle.crt"
+    path.write_bytes(
+        b"".join(cert.public_bytes(serialization.Encoding.PEM) for cert in certs)
+    )
+    return str(path), certs
+
+
+def test_fields(bundle):
+    """Tests the decoded fields of a certificate."""
+    path, certs = bundle
+    cert = StepCertificate(path)
+    assert cert.subject == "CN=host0.example.com"
+    assert cert.common_name == "host0.example.com"
+    assert cert.sans == ("host0.example.com", "admin@host0.example.com")
+    assert cert.serial == 1
+    assert cert.issuer == "CN=host0.example.com"
+    assert (cert.not_before, cert.not_after) == (NOW, NOW + timedelta(days=1))
+    assert cert.cert == certs[0]
+
+
+def test_lazy(bundle):
+    """Tests that nothing is parsed until a field needs it."""
+    path, certs = bundle
+    cert = StepCertificate(path)
+    assert not hasattr(cert, "__dict__")
+    der = certs[0].public_bytes(serialization.Encoding.DER)
+    assert cert.raw == der
+    assert cert.fingerprint == hashlib.sha256(der).hexdigest()
+    with pytest.raises(AttributeError):
+        cert._subject
+    assert cert.serial == 1
+    assert cert._subject == "CN=host0.example.com"
+
+
+def test_load_bundle(bundle):
+    """Tests that every certificate of a bundle is kept."""
+    path, certs = bundle
+    loaded = StepCertificate.load_all(path)
+    assert [(c.index, c.serial) for c in loaded] == [(0, 1), (1, 2), (2, 3)]
+    assert all(c.cert_path == path for c in loaded)
+    with open(path, "rb") as f:
+        assert StepCertificate.load_all(f.read()) == loaded
+
+
+def test_load_directory(bundle, tmp_path, host_cert):
+    """Tests loading a directory, on a process pool."""
+    path, _ = bundle
+    der_cert = host_cert("der.example.com", 10)
+    (tmp_path / "der.crt").write_bytes(
+        der_cert.public_bytes(serialization.Encoding.DER)
+    )
+    (tmp_path / "bad.crt").write_bytes(
+        b"-----BEGIN CERTIFICATE-----\nbm90IGEgY2VydA==\n-----END CERTIFICATE-----\n"
+    )
+    loaded = StepCertificate.load_all(str(tmp_path), max_workers=2)
+    assert [c.serial for c in loaded if not c.cert_path.endswith("bad.crt")] == [
+        1,
+        2,
+        3,
+        10,
+    ]
+    with pytest.raises(ValueError):
+        loaded[0].serial  # bad.crt sorts first and fails when used
+
+
+def test_utc_time_naive(host_cert):
+    """Tests the fallback to the naive times of cryptography before 42."""
+
+    class Crl:
+        last_update = NOW.replace(tzinfo=None)
+        next_update = None
+
+    assert utc_time(Crl(), "last_update") == NOW
+    assert utc_time(Crl(), "next_update") is None
+    assert utc_time(host_cert("a", 1), "not_valid_after").tzinfo is timezone.utc
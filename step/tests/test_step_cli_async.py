@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import pytest
+
+from step import AsyncStepCli
+
+pytestmark = pytest.mark.usefixtures("step_schema")
+
+
+def test_async_call(fake_step):
+    """Tests running a command from asyncio."""
+    fake_step('for arg in "$@"; do echo "$arg"; done')
+    step = AsyncStepCli()
+    output = asyncio.run(
+        step.ca.certificate(
+            "host with spaces", ca_url="https://ca.example.com", _raw_output=True
+        )
+    )
+    assert output.split("\n") == [
+        "ca",
+        "certificate",
+        "host with spaces",
+        "--ca-url=https://ca.example.com",
+    ]
+
+
+def test_async_processed_output(fake_step):
+    """Tests that the output is processed like StepCli does."""
+    fake_step("echo ok")
+    assert asyncio.run(AsyncStepCli().ca.health()) is True
+
+
+def test_async_error(fake_step):
+    """Tests that a failing command returns None."""
+    fake_step("exit 1")
+    assert asyncio.run(AsyncStepCli().ca.health(_no_stderr=True)) is None
+
+
+def test_async_concurrency_limit(fake_step, tmp_path):
+    """Tests that the semaphore limits the running step processes."""
+    log_path = tmp_path / "runs.log"
+    fake_step(
+        f'echo start >> {log_path}; sleep 0.05; echo end >> {log_path}; echo "$3"'
+    )
+    step = AsyncStepCli(max_concurrency=3)
+
+    async def run_all():
+        return await asyncio.gather(
+            *[step.ca.certificate(f"host-{i}", _raw_output=True) for i in range(12)]
+        )
+
+    assert asyncio.run(run_all()) == [f"host-{i}" for i in range(12)]
+    running = most_running = 0
+    for line in log_path.read_text().split():
+        running += 1 if line == "start" else -1
+        most_running = max(most_running, running)
+    assert 1 < most_running <= 3
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import subprocess
+
+import pytest
+
+from step import StepCli
+
+pytestmark = pytest.mark.usefixtures("step_schema")
+
+
+@pytest.fixture
+def step(fake_step):
+    fake_step(
+        'case "$3" in bad) echo "no $3" >&2; exit 2;; slow) sleep 0.2;; esac\n'
+        'echo "$3"'
+    )
+    return StepCli()
+
+
+def test_batch_ordered(step):
+    """Tests that results come back in the order of the items."""
+    items = [("ca certificate", [f"host-{i}"], {}) for i in range(20)]
+    items.insert(0, (["ca", "certificate"], ["slow"], {}))
+    results = list(step._batch(items, max_workers=4, _raw_output=True))
+    assert [r.index for r in results] == list(range(21))
+    assert [r.output for r in results] == ["slow"] + [f"host-{i}" for i in range(20)]
+    assert all(r.ok and r.command == "step ca certificate" for r in results)
+
+
+def test_batch_completion_order(step):
+    """Tests that results can come back as they complete."""
+    items = [("ca certificate", ["slow"], {})]
+    items += [("ca certificate", [f"host-{i}"], {}) for i in range(5)]
+    results = list(step._batch(items, max_workers=2, ordered=False, _raw_output=True))
+    assert results[-1].output == "slow"
+    assert sorted(r.index for r in results) == list(range(6))
+
+
+def test_batch_errors(step):
+    """Tests that each failed item carries its own error."""
+    items = [
+        ("ca certificate", ["bad"], {}),
+        ("ca not-a-command", [], {}),
+        ("ca certificate", ["host"], {"not_an_argument": 1}),
+        ("ca certificate", ["host"], {"ca_url": "https://ca.example.com"}),
+    ]
+    bad, unknown, bad_arg, good = step._batch(items, _raw_output=True)
+    assert isinstance(bad.error, subprocess.CalledProcessError)
+    assert bad.error.returncode == 2
+    assert bad.error.stderr == b"no bad\n"
+    assert isinstance(unknown.error, AttributeError)
+    assert isinstance(bad_arg.error, ValueError)
+    assert good.ok and good.output == "host"
+
+
+def test_batch_stops_early(step):
+    """Tests that stopping the iteration does not run the remaining items."""
+    taken = []
+
+    def items():
+        for i in range(1000):
+            taken.append(i)
+            yield ("ca certificate", [f"host-{i}"], {})
+
+    results = step._batch(items(), max_workers=2, _raw_output=True)
+    assert next(results).output == "host-0"
+    results.close()
+    assert len(taken) < 10
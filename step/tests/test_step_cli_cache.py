@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+import os
+
+import pytest
+
+from step.cli.step_cli_cache import StepCliCache
+
+
+@pytest.fixture
+def binary(tmp_path):
+    path = tmp_path / "bin" / "step"
+    path.parent.mkdir()
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+    return path
+
+
+def test_cache_round_trip(binary, tmp_path):
+    """Tests that nodes are shared between cache instances."""
+    cache = StepCliCache(str(binary), "0.1.1", str(tmp_path / "cache"))
+    assert cache.get(["step", "ca"]) is None
+    cache.put(
+        ["step", "ca"],
+        {"__subcommands__": {"health": "get the status"}, "health": {}},
+    )
+    other = StepCliCache(str(binary), "0.1.1", str(tmp_path / "cache"))
+    assert other.key == cache.key
+    assert other.get(["step", "ca"]) == {
+        "__subcommands__": {"health": "get the status"}
+    }
+
+
+def test_cache_cli_version(binary, tmp_path):
+    """Tests that entries for another version of step are removed."""
+    cache = StepCliCache(str(binary), "0.1.1", str(tmp_path / "cache"), "0.24.4")
+    assert cache.cli_version == "0.24.4"
+    cache.put(["step"], {"__cli_version__": "0.24.4"})
+    upgraded = StepCliCache(str(binary), "0.1.1", str(tmp_path / "cache"), "0.25.0")
+    assert upgraded.key != cache.key
+    assert not os.path.exists(cache.cache_dir)
+    assert upgraded.get(["step"]) is None
+
+
+def test_cache_drops_stale(binary, tmp_path):
+    """Tests that entries for a changed binary are removed."""
+    cache = StepCliCache(str(binary), "0.1.1", str(tmp_path / "cache"))
+    cache.put(["step"], {"__cli_version__": "0.24.4"})
+    binary.write_text("#!/bin/sh\n# upgraded\n")
+    upgraded = StepCliCache(str(binary), "0.1.1", str(tmp_path / "cache"))
+    assert upgraded.key != cache.key
+    assert not os.path.exists(cache.cache_dir)
+    assert upgraded.get(["step"]) is None
+
+
+def test_cache_keeps_other_binaries(binary, tmp_path):
+    """Tests that entries for other binaries are kept."""
+    other_binary = tmp_path / "bin" / "step-other"
+    other_binary.write_text("#!/bin/sh\n")
+    cache = StepCliCache(str(binary), "0.1.1", str(tmp_path / "cache"))
+    other = StepCliCache(str(other_binary), "0.1.1", str(tmp_path / "cache"))
+    assert os.path.isdir(cache.cache_dir)
+    assert os.path.isdir(other.cache_dir)
+
+
+def test_cache_keeps_unknown_dirs(binary, tmp_path):
+    """Tests that directories without a binary file are kept."""
+    unknown = tmp_path / "cache" / "unknown"
+    unknown.mkdir(parents=True)
+    (tmp_path / "cache" / "broken").mkdir()
+    (tmp_path / "cache" / "broken" / "binary.json").write_text("{")
+    StepCliCache(str(binary), "0.1.1", str(tmp_path / "cache"))
+    assert unknown.is_dir()
+    assert (tmp_path / "cache" / "broken").is_dir()
+
+
+def test_for_binary_missing(tmp_path):
+    """Tests that there is no cache without a step binary."""
+    assert StepCliCache.for_binary("0.1.1", str(tmp_path / "missing")) is None
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+import os
+import subprocess
+
+import pytest
+
+from step import StepCli
+from step.cli.step_cli_exec import PosixSpawnExecutor, SubprocessExecutor, step_binary
+
+EXECUTORS = [SubprocessExecutor(), PosixSpawnExecutor()]
+
+
+@pytest.fixture
+def step(fake_step):
+    return fake_step(
+        'for arg in "$@"; do echo "$arg"; done\n'
+        'read line && echo "stdin: $line"\n'
+        'echo "to stderr" >&2\n'
+        '[ "$1" = fail ] && exit 3\n'
+        "exit 0"
+    )
+
+
+def test_step_binary(step):
+    """Tests that step resolves to the binary on the PATH."""
+    assert step_binary() == step
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_run_argv(step, executor):
+    """Tests that arguments reach step unchanged, without a shell."""
+    args = ["ca", "certificate", "it's a host", "--san=$HOME", "--set=a b"]
+    result = executor.run(
+        ["step", *args], stdin=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    assert result.args[0] == step
+    assert result.stdout.decode("utf-8").split("\n")[:-1] == args
+    assert result.stderr == b"to stderr\n"
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_run_error(step, executor):
+    """Tests that a failing command raises with its output."""
+    with pytest.raises(subprocess.CalledProcessError) as e:
+        executor.run(["step", "fail"], stdin=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    assert e.value.returncode == 3
+    assert e.value.stdout == b"fail\n"
+    assert e.value.stderr == b"to stderr\n"
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_run_stdin_fd(step, executor, tmp_path):
+    """Tests passing stdin as an open file descriptor."""
+    (tmp_path / "stdin").write_text("a line\n")
+    with open(tmp_path / "stdin") as stdin:
+        result = executor.run(["step", "version"], stdin=stdin.fileno())
+    assert result.stdout == b"version\nstdin: a line\n"
+
+
+def test_posix_spawn_bad_stdin(step):
+    """Tests that a stdin posix_spawn cannot give step raises."""
+    with pytest.raises(ValueError, match="stdin"):
+        PosixSpawnExecutor().run(["step", "version"], stdin=subprocess.PIPE)
+
+
+def test_posix_spawn_failure_closes_pipes(step, monkeypatch):
+    """Tests that the pipes are closed when the spawn fails."""
+
+    def fail(*args, **kwargs):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr("os.posix_spawn", fail)
+    fds = set(os.listdir("/proc/self/fd"))
+    with pytest.raises(PermissionError):
+        PosixSpawnExecutor().run(["step", "version"], stderr=subprocess.PIPE)
+    assert set(os.listdir("/proc/self/fd")) == fds
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_run_devnull_stderr(step, executor):
+    """Tests discarding stderr."""
+    result = executor.run(
+        ["step", "version"], stdin=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    assert result.stdout == b"version\n"
+    assert result.stderr is None
+
+
+def test_posix_spawn_missing_binary(tmp_path, monkeypatch):
+    """Tests that a missing binary raises like subprocess does."""
+    monkeypatch.setenv("PATH", str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        PosixSpawnExecutor().run(["step", "version"])
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+@pytest.mark.usefixtures("step_schema")
+def test_step_cli_executor(step, executor):
+    """Tests running StepCli commands through an executor."""
+    output = StepCli(executor=executor).ca.certificate(
+        "a host", ca_url="https://ca.example.com", _no_stdin=True, _raw_output=True
+    )
+    assert output.split("\n")[:4] == [
+        "ca",
+        "certificate",
+        "a host",
+        "--ca-url=https://ca.example.com",
+    ]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import asyncio
+import base64
+import hashlib
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from step import AsyncStepCli, StepCli
+
+pytestmark = pytest.mark.usefixtures("step_schema")
+
+
+@pytest.fixture
+def no_step(fake_step):
+    """Fails if step is run."""
+    fake_step("echo step ran; exit 1")
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    """Writes a bundle of two certificates."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    now = datetime.now(timezone.utc)
+    certs = []
+    for name in ("leaf", "root"):
+        subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, name)])
+        certs.append(
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(subject)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=1))
+            .sign(key, hashes.SHA256())
+        )
+    path = tmp_path / "bundle.crt"
+    path.write_bytes(
+        b"".join(c.public_bytes(serialization.Encoding.PEM) for c in certs)
+    )
+    return str(path), certs
+
+
+def fingerprint(cert: x509.Certificate) -> str:
+    return cert.fingerprint(hashes.SHA256()).hex()
+
+
+def test_certificate_fingerprint(no_step, bundle):
+    """Tests fingerprints without running step."""
+    path, certs = bundle
+    step = StepCli()
+    assert step.certificate.fingerprint(path) == fingerprint(certs[0])
+    assert step.certificate.fingerprint(path, bundle=True) == "\n".join(
+        fingerprint(c) for c in certs
+    )
+    digest = certs[0].fingerprint(hashes.SHA256())
+    assert step.certificate.fingerprint(path, format="base64-url-raw") == (
+        base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+    )
+    assert asyncio.run(AsyncStepCli().certificate.fingerprint(path)) == (
+        fingerprint(certs[0])
+    )
+
+
+def test_fallback(fake_step, bundle):
+    """Tests that step runs for calls the native commands don't cover."""
+    path, _ = bundle
+    fake_step('echo "$@"')
+    step = StepCli()
+    assert step.certificate.fingerprint(path, insecure=True) == (
+        f"certificate fingerprint {path} --insecure"
+    )
+    assert step.certificate.fingerprint("ca.example.com:443") == (
+        "certificate fingerprint ca.example.com:443"
+    )
+    assert step.certificate.inspect(path, format="pem") == (
+        f"certificate inspect {path} --format=pem"
+    )
+    assert StepCli(native=False).certificate.fingerprint(path) == (
+        f"certificate fingerprint {path}"
+    )
+
+
+def test_hash_digest(no_step, tmp_path):
+    """Tests file digests without running step."""
+    path = tmp_path / "data"
+    path.write_bytes(b"data")
+    digest = StepCli().crypto.hash.digest(str(path), alg="sha512-256")
+    assert digest == f"{hashlib.new('sha512_256', b'data').hexdigest()}  {path}"
+
+
+def test_base64(no_step, monkeypatch):
+    """Tests base64 of stdin without running step."""
+    step = StepCli()
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b"\xfb\xff")))
+    assert step.base64(url=True, raw=True) == "-_8"
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b"aGk\n")))
+    assert step.base64(decode=True) == "hi"
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b"a!b")))
+    assert step.base64(d=True) is None
+    assert step.base64(_no_stdin=True) == ""
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from step import StepAdmin, StepCli, StepOutputParser
+from step.cli import step_cli_output
+from step.cli.step_cli_output import register_output_parser
+
+pytestmark = pytest.mark.usefixtures("step_schema")
+
+
+@pytest.fixture(autouse=True)
+def output_parsers(monkeypatch):
+    """Forgets the output parsers registered by other tests."""
+    monkeypatch.setattr(step_cli_output, "_PARSERS", dict(step_cli_output._PARSERS))
+
+
+def test_resolved_once_per_command():
+    """Tests the parsers resolved from the registry and the arguments."""
+    step = StepCli()
+    assert step.certificate.inspect._step_command.output.json_argv == ("--format=json",)
+    assert step.context.current._step_command.output.json_argv == ("--json",)
+    assert step.certificate.fingerprint._step_command.output.json_argv == ()
+    assert step.ca.admin.list._step_command.output.record is StepAdmin
+    assert step.ca.admin.list._step_command is StepCli().ca.admin.list._step_command
+
+
+def test_json_flag(fake_step):
+    """Tests that JSON is asked for, unless another format or raw output is."""
+    fake_step('printf \'{"argv": "%s"}\' "$*"')
+    inspect = StepCli().certificate.inspect
+    assert inspect("root_ca.crt") == {
+        "argv": "certificate inspect root_ca.crt --format=json"
+    }
+    assert inspect("root_ca.crt", format="pem") == {
+        "argv": "certificate inspect root_ca.crt --format=pem"
+    }
+    assert inspect("root_ca.crt", _raw_output=True) == (
+        '{"argv": "certificate inspect root_ca.crt"}'
+    )
+
+
+def test_text_output(fake_step):
+    """Tests that only JSON objects and arrays are parsed."""
+    fake_step("echo 1234")
+    assert StepCli().path() == "1234"
+    fake_step("echo '[1, 2]'")
+    assert StepCli().path() == [1, 2]
+
+
+def test_registered_parser(fake_step):
+    """Tests that registered parsers are used for the command and below."""
+    register_output_parser(
+        "step crypto", StepOutputParser(lambda stdout, args: (stdout, args)), True
+    )
+    fake_step("echo out")
+    assert StepCli().crypto.otp.generate("x") == (b"out\n", ["x"])
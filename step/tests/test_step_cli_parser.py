@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from step import StepCli, StepCliCrawler, StepCliParser
+from step.cli.step_cli_cache import StepCliCache
+from step.cli.step_cli_parser import (
+    HELP_BLANK,
+    HELP_FLAG,
+    HELP_NAME,
+    HELP_SECTION,
+    HELP_TEXT,
+    tokenize_help,
+)
+
+log = logging.getLogger("test-step-cli-parser")
+
+SCHEMA = {
+    "__subcommands__": {"ca": "initialize and manage a certificate authority"},
+    "__arguments__": {},
+    "__cli_version__": "0.24.4 (linux/amd64)",
+    "__version__": StepCliParser.PARSER_VERSION,
+    "ca": {
+        "__subcommands__": {"health": "get the status of the CA"},
+        "health": {
+            "__arguments__": {
+                "ca-url": {
+                    "description": "URI of the targeted Step Certificate Authority.",
+                    "param": "URI",
+                    "type": "optional argument",
+                }
+            }
+        },
+    },
+}
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    path = tmp_path / "step-cli.json"
+    path.write_text(json.dumps(SCHEMA))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def empty_schema(monkeypatch):
+    """Resets the shared command dict and schema around each test."""
+    monkeypatch.setattr(StepCliParser, "_schema", None)
+    command_dict = StepCliParser().command_dict
+    saved = dict(command_dict)
+    command_dict.clear()
+    yield
+    command_dict.clear()
+    command_dict.update(saved)
+
+
+@pytest.fixture
+def no_scrape(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError(f"unexpected scrape: {args}")
+
+    monkeypatch.setattr("subprocess.run", fail)
+
+
+def test_load_schema(schema_path, monkeypatch, no_scrape):
+    """Tests that a matching schema is used without scraping."""
+    monkeypatch.setattr(StepCliParser, "_installed_cli_version", lambda: "0.24.4")
+    assert StepCliParser.load_schema(schema_path)
+    command_dict = StepCliParser().parse(["step", "ca", "health"])
+    assert "ca-url" in command_dict["__arguments__"]
+
+
+def test_load_schema_cli_mismatch(schema_path, monkeypatch):
+    """Tests that a schema for another step version is not used."""
+    monkeypatch.setattr(StepCliParser, "_installed_cli_version", lambda: "0.25.0")
+    assert not StepCliParser.load_schema(schema_path)
+    assert "ca" not in StepCliParser().command_dict
+
+
+def test_load_schema_rejection_remembered(schema_path, monkeypatch, no_scrape):
+    """Tests that a rejected schema is not read again until it changes."""
+    monkeypatch.setattr(StepCliParser, "_installed_cli_version", lambda: "0.25.0")
+    reads = []
+    monkeypatch.setattr(
+        StepCliParser, "_load_schema", lambda *args: reads.append(args) or False
+    )
+    for _ in range(5):
+        assert not StepCliParser.load_schema(schema_path)
+    assert len(reads) == 1
+    stat = os.stat(schema_path)
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert not StepCliParser.load_schema(schema_path)
+    assert len(reads) == 2
+
+
+def test_installed_cli_version_once(monkeypatch):
+    """Tests that step version is only run once without a cache."""
+    runs = []
+
+    def run(args, **kwargs):
+        runs.append(args)
+        return subprocess.CompletedProcess(args, 0, b"Smallstep CLI/0.24.4 (x)\n")
+
+    monkeypatch.setattr(StepCliParser.executor, "run", run)
+    for _ in range(3):
+        assert StepCliParser._installed_cli_version() == "0.24.4"
+    assert runs == [["step", "version"]]
+
+
+def test_load_schema_parser_mismatch(tmp_path, monkeypatch):
+    """Tests that a schema from another parser version is not used."""
+    monkeypatch.setattr(StepCliParser, "_installed_cli_version", lambda: "0.24.4")
+    path = tmp_path / "step-cli.json"
+    path.write_text(json.dumps({**SCHEMA, "__version__": "0.0.1"}))
+    assert not StepCliParser.load_schema(str(path))
+
+
+def test_step_cli_uses_schema(schema_path, monkeypatch, no_scrape):
+    """Tests that StepCli construction reads the schema file."""
+    monkeypatch.setattr("step.cli.step_cli.STEP_JSON", schema_path)
+    monkeypatch.setattr(StepCliParser, "_installed_cli_version", lambda: "")
+    step = StepCli()
+    assert "ca" in step._command_dict["__subcommands__"]
+
+
+def render_help(command_stack: list[str], node: dict) -> str:
+    """Renders a command node as step formats its help output."""
+    bolder, underline, end = "\x1b[0;1;99m", "\x1b[0;4;39m", "\x1b[0m"
+    lines = [f"{bolder}NAME{end}", f"      {' '.join(command_stack)}", ""]
+    if node.get("__subcommands__"):
+        lines.append(f"{bolder}COMMANDS{end}")
+        lines += [
+            f"{underline}{name}{end}      {description}"
+            for name, description in node["__subcommands__"].items()
+        ]
+        lines.append("")
+    if node.get("__arguments__"):
+        lines.append(f"{bolder}OPTIONS{end}")
+        for name, arg in node["__arguments__"].items():
+            param = f"={underline}{arg['param']}{end}" if "param" in arg else ""
+            lines += [
+                f"  {bolder}--{name}{end}{param}",
+                f"    {arg['description']}",
+                "",
+            ]
+    if "__cli_version__" in node:
+        lines += [f"{bolder}VERSION{end}", f"  Smallstep CLI/{node['__cli_version__']}"]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def fake_help(monkeypatch):
+    """Serves help pages for the SCHEMA tree instead of running step."""
+    calls = []
+
+    def run(argv, **kwargs):
+        argv = ["step", *argv[1:]]  # step may resolve to an installed binary
+        calls.append(argv)
+        node = SCHEMA
+        for part in argv[1:-1]:
+            if part not in node:
+                raise subprocess.CalledProcessError(1, argv)
+            node = node[part]
+        return subprocess.CompletedProcess(
+            argv, 0, render_help(argv[:-1], node).encode("utf-8")
+        )
+
+    monkeypatch.setattr("subprocess.run", run)
+    return calls
+
+
+def test_parse_help(fake_help):
+    """Tests parsing a single help page."""
+    command_dict = StepCliParser().parse_help(["step", "ca", "health"])
+    assert fake_help == [["step", "ca", "health", "--help"]]
+    assert command_dict["__arguments__"]["ca-url"] == {
+        "description": "URI of the targeted Step Certificate Authority.",
+        "param": "URI",
+        "type": "optional argument",
+    }
+    assert "__subcommands__" not in command_dict
+
+
+def test_tokenize_help():
+    """Tests that lines are classified by their styles, whatever the codes."""
+    tokens = tokenize_help(
+        "\x1b[1mOPTIONS\x1b[22m\n"
+        "\n"
+        "  \x1b[0;1;99m--provisioner\x1b[0m=\x1b[0;4;39mname\x1b[0m, "
+        "\x1b[0;1;99m--issuer\x1b[0m=\x1b[0;4;39mname\x1b[0m\n"
+        "    The \x1b[0;3;39mprovisioner\x1b[0m\x07 to use.\n"
+        "\x1b[4mhealth, h\x1b[24m    get the \x1b[1mstatus\x1b[0m\n"
+    )
+    assert [token.kind for token in tokens] == [
+        HELP_SECTION,
+        HELP_BLANK,
+        HELP_FLAG,
+        HELP_TEXT,
+        HELP_NAME,
+        HELP_BLANK,
+    ]
+    assert tokens[0].text == "OPTIONS"
+    flag = tokens[2]
+    assert (flag.name, flag.alt_form, flag.param) == ("provisioner", "issuer", "name")
+    assert tokens[3].text == "The provisioner to use."
+    name = tokens[4]
+    assert (name.name, name.alt_form, name.description) == (
+        "health",
+        "h",
+        "get the status",
+    )
+
+
+def test_parse_help_other_styles(fake_help, monkeypatch):
+    """Tests that help styled with other SGR sequences parses the same."""
+    expected = StepCliParser().parse_help(["step", "ca", "health"])
+    page = render_help(["step", "ca", "health"], SCHEMA["ca"]["health"])
+    page = page.replace("\x1b[0;1;99m", "\x1b[1;97m").replace("\x1b[0;4;39m", "\x1b[4m")
+    page = page.replace("OPTIONS\x1b[0m\n", "OPTIONS\x1b[0m\n\n")
+    monkeypatch.setattr(
+        "subprocess.run",
+        lambda argv, **kwargs: subprocess.CompletedProcess(argv, 0, page.encode()),
+    )
+    assert StepCliParser().parse_help(["step", "ca", "health"]) == expected
+
+
+def test_crawler(fake_help):
+    """Tests crawling the full tree."""
+    progress = []
+    crawler = StepCliCrawler(
+        max_workers=4, progress=lambda done, total, _: progress.append((done, total))
+    )
+    command_dict = crawler.crawl()
+    assert not crawler.failed
+    assert command_dict == {k: v for k, v in SCHEMA.items() if k != "__arguments__"}
+    assert progress[-1] == (3, 3)
+
+
+def test_crawler_failed_node(fake_help, monkeypatch):
+    """Tests that failed nodes are recorded and left empty."""
+    monkeypatch.setitem(SCHEMA["ca"]["__subcommands__"], "missing", "not there")
+    crawler = StepCliCrawler()
+    command_dict = crawler.crawl()
+    assert crawler.failed == [["step", "ca", "missing"]]
+    assert command_dict["ca"]["missing"] == {}
+
+
+def test_crawler_unparsable_node(fake_help, monkeypatch):
+    """Tests that a help page the parser chokes on does not stop the crawl."""
+    parse_help = StepCliParser.parse_help
+
+    def choke(self, command_stack):
+        if command_stack == ["step", "ca"]:
+            raise IndexError("list index out of range")
+        return parse_help(self, command_stack)
+
+    monkeypatch.setattr(StepCliParser, "parse_help", choke)
+    crawler = StepCliCrawler()
+    command_dict = crawler.crawl()
+    assert crawler.failed == [["step", "ca"]]
+    assert command_dict["ca"] == {}
+    assert "ca" in command_dict["__subcommands__"]
+
+
+def test_parse_uses_cache(fake_help, monkeypatch, tmp_path):
+    """Tests that parsed nodes are written to and read from the cache."""
+    binary = tmp_path / "step"
+    binary.write_text("#!/bin/sh\n")
+    cache = StepCliCache(str(binary), StepCliParser.PARSER_VERSION, str(tmp_path))
+    monkeypatch.setattr(StepCliParser, "_cache", cache)
+    StepCliParser().parse(["step", "ca", "health"])
+    assert fake_help == [["step", "ca", "--help"], ["step", "ca", "health", "--help"]]
+    assert "ca-url" in cache.get(["step", "ca", "health"])["__arguments__"]
+
+    StepCliParser().command_dict.clear()
+    fake_help.clear()
+    command_dict = StepCliParser().parse(["step", "ca", "health"])
+    assert fake_help == []
+    assert "ca-url" in command_dict["__arguments__"]
+
+
+def test_parse_concurrent(fake_help, monkeypatch):
+    """Tests that threads parsing the same tree each parse a node only once."""
+    run = subprocess.run
+
+    def slow_run(argv, **kwargs):
+        time.sleep(0.01)
+        return run(argv, **kwargs)
+
+    monkeypatch.setattr("subprocess.run", slow_run)
+    stacks = [["step", "ca", "health"], ["step", "ca"], ["step"]] * 20
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda s: StepCliParser().parse(s), stacks))
+    assert sorted(fake_help) == [
+        ["step", "--help"],
+        ["step", "ca", "--help"],
+        ["step", "ca", "health", "--help"],
+    ]
+    assert all(r is results[0] for r in results[::3])
+    assert "ca-url" in results[0]["__arguments__"]
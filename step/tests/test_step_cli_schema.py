@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+import json
+import os
+
+import pytest
+
+from step import StepCliParser
+from step.cli.step_cli_cache import StepCliCache
+from step.cli.step_cli_schema import StepSchema
+
+STEP_JSON = os.path.join(os.path.dirname(__file__), "..", "cli", "step-cli.json")
+
+
+@pytest.fixture(scope="module")
+def schema_dict():
+    with open(STEP_JSON) as schema_file:
+        return json.load(schema_file)
+
+
+@pytest.fixture(scope="module")
+def schema(schema_dict):
+    return StepSchema(StepSchema.compile(schema_dict))
+
+
+@pytest.fixture(autouse=True)
+def empty_schema(monkeypatch):
+    """Resets the shared command dict and schema around each test."""
+    monkeypatch.setattr(StepCliParser, "_schema", None)
+    command_dict = StepCliParser().command_dict
+    saved = dict(command_dict)
+    command_dict.clear()
+    yield
+    command_dict.clear()
+    command_dict.update(saved)
+
+
+def walk(node: dict, command_stack: list[str]):
+    yield command_stack, node
+    for subcommand in node.get("__subcommands__", {}):
+        if isinstance(node.get(subcommand), dict):
+            yield from walk(node[subcommand], command_stack + [subcommand])
+
+
+def test_round_trip(schema, schema_dict):
+    """Tests that every node decodes to what the schema file has."""
+    for command_stack, node in walk(schema_dict, ["step"]):
+        decoded = schema.node(command_stack)
+        for key in ("__subcommands__", "__arguments__"):
+            expected = node.get(key) or None
+            actual = decoded.get(key)
+            if key == "__arguments__" and actual:
+                actual = {name: dict(arg) for name, arg in actual.items()}
+            assert actual == expected, command_stack
+    assert schema.node(["step", "no-such-command"]) is None
+    assert schema.cli_version == schema_dict["__cli_version__"]
+
+
+def test_shared_arguments(schema):
+    """Tests that both forms of a flag, and repeated flags, share a spec."""
+    arguments = schema.node(["step", "ca", "certificate"])["__arguments__"]
+    provisioner, issuer = arguments["provisioner"], arguments["issuer"]
+    assert provisioner.spec is issuer.spec
+    assert provisioner["alt_form"] == "issuer"
+    other = schema.node(["step", "ca", "token"])["__arguments__"]["provisioner"]
+    assert other is provisioner
+    assert schema.node(["step", "ca", "certificate"])["__arguments__"]["issuer"] is (
+        issuer
+    )
+
+
+def test_load_keeps_blob(tmp_path):
+    """Tests that the compiled schema is kept and used again."""
+    loaded = StepSchema.load(STEP_JSON, str(tmp_path))
+    (blob_path,) = tmp_path.iterdir()
+    assert blob_path.name.startswith("schema-")
+    blob_path.write_bytes(StepSchema.compile({"__cli_version__": "0.0.0"}))
+    assert StepSchema.load(STEP_JSON, str(tmp_path)).cli_version == "0.0.0"
+    assert len(loaded) > 100
+
+
+def test_load_bad_blob(tmp_path):
+    """Tests that a corrupted blob is compiled again."""
+    with pytest.raises(ValueError):
+        StepSchema(b"\0\0\0\4nope")
+    StepSchema.load(STEP_JSON, str(tmp_path))
+    (blob_path,) = tmp_path.iterdir()
+    blob_path.write_bytes(b"garbage")
+    assert (
+        "ca"
+        in StepSchema.load(STEP_JSON, str(tmp_path)).node(["step"])["__subcommands__"]
+    )
+
+
+@pytest.fixture
+def parser_cache(tmp_path, monkeypatch):
+    binary = tmp_path / "step"
+    binary.write_text("#!/bin/sh\n")
+    cache = StepCliCache(str(binary), StepCliParser.PARSER_VERSION, str(tmp_path))
+    monkeypatch.setattr(StepCliParser, "_cache", cache)
+    monkeypatch.setattr(StepCliParser, "_installed_cli_version", lambda: "")
+    return cache
+
+
+def test_load_schema_lazy(parser_cache):
+    """Tests that the parser only decodes the nodes it navigates to."""
+    assert StepCliParser.load_schema(STEP_JSON)
+    command_dict = StepCliParser().command_dict
+    assert "ca" not in command_dict
+    parsed = StepCliParser().parse(["step", "ca", "health"])
+    assert parsed["__arguments__"]["ca-url"]["param"] == "URI"
+    assert "roots" not in command_dict["ca"]
+    assert "certificate" not in command_dict
+    assert any(
+        name.startswith("schema-") for name in os.listdir(parser_cache.cache_dir)
+    )
+
+
+def test_load_schema_serializable(parser_cache, schema_dict):
+    """Tests that the tree decoded from the schema is still plain json."""
+    assert StepCliParser.load_schema(STEP_JSON)
+    StepCliParser().parse(["step", "ca", "certificate"])
+    dumped = json.loads(json.dumps(StepCliParser().command_dict))
+    assert dumped["ca"]["certificate"]["__arguments__"] == (
+        schema_dict["ca"]["certificate"]["__arguments__"]
+    )
+
+
+def test_load_schema_uncached(monkeypatch):
+    """Tests that without a cache the schema file is read whole."""
+    monkeypatch.setattr(StepCliParser, "_installed_cli_version", lambda: "")
+    assert StepCliParser.load_schema(STEP_JSON)
+    assert StepCliParser._schema is None
+    assert "certificate" in StepCliParser().command_dict["ca"]
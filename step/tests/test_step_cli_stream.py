@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import asyncio
+import subprocess
+import time
+
+import pytest
+
+from step import AsyncStepCli, StepCli, StepSshHost
+from step.cli.step_cli_exec import PosixSpawnExecutor
+
+HOSTS = """HOSTNAME ID TAGS
+a.internal 1 env=prod
+b.internal
+c.internal 3 env=dev role=db
+"""
+
+pytestmark = pytest.mark.usefixtures("step_schema")
+
+
+def test_stream_records(fake_step):
+    """Tests that list outputs stream a record per line."""
+    fake_step(f"cat <<'EOF'\n{HOSTS}EOF")
+    hosts = list(StepCli().ssh.hosts._stream())
+    assert all(isinstance(host, StepSshHost) for host in hosts)
+    assert [(h.hostname, h.host_id) for h in hosts] == [
+        ("a.internal", 1),
+        ("b.internal", 0),
+        ("c.internal", 3),
+    ]
+    assert hosts[1].tags == () and hosts[1].tags is not hosts[0].tags
+    assert not hasattr(hosts[0], "__dict__")
+
+
+def test_stream_lines(fake_step):
+    """Tests that other commands stream their lines."""
+    fake_step('echo one; echo; echo "$@"')
+    step = StepCli(executor=PosixSpawnExecutor())
+    assert list(step.ca.roots._stream()) == ["one", "ca roots"]
+
+
+def test_stream_stops_early(fake_step, tmp_path):
+    """Tests that step is stopped when the iteration is."""
+    marker = tmp_path / "finished"
+    fake_step(
+        "echo HOSTNAME ID TAGS; echo a.internal 1\n"
+        + f"for i in $(seq 1 50); do echo x.internal; sleep 0.1; done; touch {marker}"
+    )
+    start = time.monotonic()
+    for host in StepCli().ssh.hosts._stream():
+        break
+    assert host.hostname == "a.internal"
+    assert time.monotonic() - start < 2
+    time.sleep(0.2)
+    assert not marker.exists()
+
+
+def test_stream_error(fake_step):
+    """Tests that a failed command raises after its output."""
+    fake_step("echo HOSTNAME ID TAGS; echo a.internal; exit 3")
+    hosts = StepCli().ssh.hosts._stream()
+    assert next(hosts).hostname == "a.internal"
+    with pytest.raises(subprocess.CalledProcessError):
+        next(hosts)
+
+
+def test_async_stream(fake_step):
+    """Tests streaming from asyncio, stopping early."""
+    fake_step(f"cat <<'EOF'\n{HOSTS}EOF\nsleep 5")
+
+    async def first_two():
+        hosts = []
+        stream = AsyncStepCli().ssh.hosts._stream()
+        async for host in stream:
+            hosts.append(host.hostname)
+            if len(hosts) == 2:
+                break
+        await stream.aclose()
+        return hosts
+
+    start = time.monotonic()
+    assert asyncio.run(first_two()) == ["a.internal", "b.internal"]
+    assert time.monotonic() - start < 2
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from step import StepCli, StepCliParser
+
+pytestmark = pytest.mark.usefixtures("step_schema")
+
+
+@pytest.fixture(autouse=True)
+def no_subprocess(monkeypatch):
+    """Fails tests that would run the step binary."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError(f"unexpected subprocess: {args}")
+
+    monkeypatch.setattr("subprocess.run", fail)
+
+
+def test_navigation():
+    """Tests navigating to subcommands."""
+    step = StepCli()
+    assert str(step) == "step"
+    assert str(step.ca.certificate) == "step ca certificate"
+    assert str(step.ssh.check_host) == "step ssh check-host"
+
+
+def test_navigation_memoized(monkeypatch):
+    """Tests that navigating again does not parse again."""
+    step = StepCli()
+    certificate = step.ca.certificate
+    monkeypatch.setattr(StepCliParser, "parse", None)
+    assert step.ca.certificate is certificate
+    assert StepCli().ca.certificate._step_command is certificate._step_command
+
+
+def test_command_arguments():
+    """Tests the precomputed argument spec."""
+    step_command = StepCli().ca.certificate._step_command
+    assert step_command.command_stack == ("step", "ca", "certificate")
+    assert step_command.flags["ca_url"] == "ca-url"
+    assert step_command.arguments["ca-url"]["param"] == "URI"
+    with pytest.raises(AttributeError):
+        step_command.command = "step ca renew"
+
+
+def test_unknown_subcommand():
+    """Tests that unknown subcommands and private names are not found."""
+    step = StepCli()
+    with pytest.raises(AttributeError):
+        step.ca.not_a_command
+    with pytest.raises(AttributeError):
+        step._not_an_attribute
+
+
+def test_global_args_shared():
+    """Tests that global args apply to the subcommands."""
+    step = StepCli()
+    step._add_args(ca_url="https://ca.example.com")
+    assert step.ca.certificate._global_args == {"ca_url": "https://ca.example.com"}
+
+
+def test_call_concurrent(monkeypatch):
+    """Tests that concurrent calls do not see each other's arguments."""
+
+    def echo(argv, **kwargs):
+        time.sleep(0.001)
+        return subprocess.CompletedProcess(argv, 0, "\n".join(argv).encode("utf-8"))
+
+    monkeypatch.setattr("subprocess.run", echo)
+    step = StepCli()
+
+    def call(i: int) -> tuple[int, str]:
+        step._add_args(not_after=f"{i}h")
+        return i, step.ca.certificate(
+            f"host-{i}", ca_url=f"https://ca-{i}.example.com", _raw_output=True
+        )
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(call, range(200)))
+    for i, output in results:
+        argv = output.split("\n")
+        assert argv[1:4] == ["ca", "certificate", f"host-{i}"]
+        assert f"--ca-url=https://ca-{i}.example.com" in argv
+        assert output.count("--ca-url") == 1
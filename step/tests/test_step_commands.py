@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import inspect
+import json
+import shutil
+import sys
+
+import pytest
+
+from step import StepCli, StepCommands
+from step.cli import step_cli
+from step.cli.step_cli_codegen import OUTPUT, generate, main
+
+pytestmark = pytest.mark.usefixtures("step_schema")
+
+
+def test_generated_is_current():
+    """Tests that step_commands.py was generated from the shipped schema."""
+    with open(step_cli.STEP_JSON) as schema_file, open(OUTPUT) as output_file:
+        assert generate(json.load(schema_file)) == output_file.read()
+
+
+def test_check_stale(tmp_path, monkeypatch, capsys):
+    """Tests that --check fails with the diff when the module is stale."""
+    output = tmp_path / "step_commands.py"
+    shutil.copy(OUTPUT, output)
+    monkeypatch.setattr(sys, "argv", ["codegen", "--check", "-o", str(output)])
+    main()
+    output.write_text(output.read_text().replace("class StepCommands", "class Old"))
+    with pytest.raises(SystemExit, match="out of date"):
+        main()
+    assert "+class StepCommands" in capsys.readouterr().out
+
+
+def test_signatures():
+    """Tests positional arguments, flags and aliases in the signatures."""
+    parameters = inspect.signature(StepCommands().ca.certificate).parameters
+    assert list(parameters)[:3] == ["subject", "crt_file", "key_file"]
+    assert parameters["subject"].kind is inspect.Parameter.POSITIONAL_ONLY
+    assert parameters["not_after"].kind is inspect.Parameter.KEYWORD_ONLY
+    # the long form of `--force, -f` and the first of `--provisioner, --issuer`
+    assert "force" in parameters and "f" not in parameters
+    assert "provisioner" in parameters and "issuer" not in parameters
+    assert parameters["force"].default is False
+    # python keywords get a trailing underscore
+    assert "from_" in inspect.signature(StepCommands().crl.inspect).parameters
+
+
+def test_call(fake_step):
+    """Tests that calls run the same step arguments as StepCli."""
+    fake_step('echo "$*"')
+    commands = StepCommands()
+    argv = commands.ca.certificate(
+        "host",
+        "host.crt",
+        "host.key",
+        san=["host", "10.0.0.1"],
+        not_after="24h",
+        force=True,
+        offline=False,
+        _raw_output=True,
+    )
+    assert argv == (
+        "ca certificate host host.crt host.key --san=host --san=10.0.0.1 "
+        + "--not-after=24h --force"
+    )
+    assert argv == StepCli().ca.certificate(
+        "host",
+        "host.crt",
+        "host.key",
+        san=["host", "10.0.0.1"],
+        not_after="24h",
+        force=True,
+        _raw_output=True,
+    )
+    assert commands.certificate.inspect("root_ca.crt", _raw_output=True) == (
+        "certificate inspect root_ca.crt"
+    )
+
+
+def test_global_args(fake_step):
+    """Tests that the global args of the StepCli are passed."""
+    fake_step('echo "$*"')
+    cli = StepCli()
+    cli._add_args(ca_url="https://ca.example.com")
+    assert StepCommands(cli).ca.roots(_raw_output=True) == (
+        "ca roots --ca-url=https://ca.example.com"
+    )
+
+
+def test_error(fake_step):
+    fake_step("exit 1")
+    assert StepCommands().ca.health() is None
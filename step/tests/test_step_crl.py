@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from step import StepCertificate
+from step.python.step_ca_py import StepCaClient, StepCaError
+from step.python.step_crl import StepCrl
+
+
+@pytest.fixture
+def client(stub_ca):
+    with StepCaClient(stub_ca.url, stub_ca.root_path) as client:
+        yield client
+
+
+def crl_requests(stub_ca) -> int:
+    return sum(path == "/crl" for _, path in stub_ca.requests)
+
+
+def test_is_revoked(stub_ca, client):
+    """Tests lookups by serial, certificate and StepCertificate."""
+    stub_ca.revoked = {1234: 1}
+    crl = StepCrl(client, [stub_ca.root])
+    assert crl.is_revoked(1234)
+    assert crl.is_revoked("1234")
+    assert not crl.is_revoked(5678)
+    cert = stub_ca.issue(
+        "host",
+        ec.generate_private_key(ec.SECP256R1()).public_key(),
+        [],
+        datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    assert not crl.is_revoked(cert)
+    stub_ca.revoked[cert.serial_number] = 1
+    assert crl.refresh()
+    assert crl.is_revoked(cert)
+    pem = cert.public_bytes(serialization.Encoding.PEM)
+    assert crl.is_revoked(StepCertificate.from_bytes(pem)[0])
+    assert crl_requests(stub_ca) == 2
+
+
+def test_conditional_refresh(stub_ca, client):
+    """Tests that an unchanged CRL is not downloaded again."""
+    crl = StepCrl(client, [stub_ca.root])
+    assert not crl.is_revoked(1)
+    number = crl.crl_number
+    assert not crl.refresh()
+    assert crl.crl_number == number
+    assert stub_ca.crl_number == number
+
+
+def test_refresh_on_next_update(stub_ca, client):
+    """Tests that the CRL is fetched again once it expires."""
+    stub_ca.crl_lifetime = timedelta(seconds=2)
+    crl = StepCrl(client, [stub_ca.root], retry_interval=0.1)
+    assert not crl.is_revoked(42)
+    stub_ca.revoked[42] = 1
+    assert not crl.is_revoked(42)
+    time.sleep(max(crl.next_update.timestamp() - time.time(), 0) + 0.1)
+    assert crl.is_revoked(42)
+    assert crl_requests(stub_ca) == 2
+
+
+def test_untrusted_crl(stub_ca, client, make_cert):
+    """Tests that a CRL not signed by the roots is rejected."""
+    other_root, _ = make_cert("Other Root", ca=True)
+    with pytest.raises(StepCaError):
+        StepCrl(client, [other_root]).is_revoked(1)
+
+
+def test_intermediate_issuer(stub_ca, client, make_cert):
+    """Tests a CRL signed by an intermediate of the root."""
+    stub_ca.crl_issuer = make_cert(
+        "Intermediate", (stub_ca.root, stub_ca.root_key), ca=True
+    )
+    stub_ca.revoked = {7: 1}
+    assert StepCrl(client, [stub_ca.root]).is_revoked(7)
+
+    stub_ca.crl_issuer = make_cert("Rogue Intermediate", ca=True)
+    stub_ca.revoked = {8: 1}
+    with pytest.raises(StepCaError):
+        StepCrl(client, [stub_ca.root]).is_revoked(8)
+
+
+def ca_down(client, monkeypatch):
+    def fail(etag):
+        raise requests.ConnectionError("ca is down")
+
+    monkeypatch.setattr(client, "crl_if_changed", fail)
+
+
+def test_keeps_crl_when_ca_is_down(stub_ca, client, monkeypatch):
+    """Tests that a failed refresh keeps the CRL in use."""
+    stub_ca.revoked = {9: 1}
+    crl = StepCrl(client, [stub_ca.root])
+    assert crl.is_revoked(9)
+    ca_down(client, monkeypatch)
+    crl._refresh_at = 0
+    assert crl.is_revoked(9)
+
+
+def test_expired_crl_fails_closed(stub_ca, client, monkeypatch):
+    """Tests that lookups raise once the CRL expires without a refresh."""
+    stub_ca.crl_lifetime = timedelta(seconds=1)
+    stub_ca.revoked = {9: 1}
+    crl = StepCrl(client, [stub_ca.root], retry_interval=60)
+    assert crl.is_revoked(9)
+    ca_down(client, monkeypatch)
+    time.sleep(max(crl.next_update.timestamp() - time.time(), 0) + 0.1)
+    with pytest.raises(StepCaError):
+        crl.is_revoked(9)
+    with pytest.raises(StepCaError):
+        crl.is_revoked(10)
+
+
+def test_other_issuer(stub_ca, client, make_cert):
+    """Tests that a certificate of another issuer is not looked up."""
+    other_root, other_key = make_cert("Other Root", ca=True)
+    leaf, _ = make_cert("leaf", (other_root, other_key))
+    crl = StepCrl(client, [stub_ca.root])
+    with pytest.raises(StepCaError):
+        crl.is_revoked(leaf)
+    pem = leaf.public_bytes(serialization.Encoding.PEM)
+    with pytest.raises(StepCaError):
+        crl.is_revoked(StepCertificate.from_bytes(pem)[0])
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+
+from step.python.step_inventory import StepCertInventory
+
+
+@pytest.fixture
+def issue(make_cert):
+    """Issues PEM certificates from one test issuer, expiring after a time."""
+    issuer = make_cert("Test Issuer", ca=True)
+
+    def make(name: str, expires_in: timedelta, serial: int) -> bytes:
+        now = datetime.now(timezone.utc)
+        cert, _ = make_cert(
+            name,
+            issuer,
+            serial=serial,
+            not_before=now - timedelta(days=1),
+            not_after=now + expires_in,
+            sans=[x509.DNSName(name), x509.DNSName("Shared")],
+        )
+        return cert.public_bytes(serialization.Encoding.PEM)
+
+    return make
+
+
+@pytest.fixture
+def step_path(tmp_path, issue):
+    certs = tmp_path / "certs"
+    (certs / "hosts").mkdir(parents=True)
+    (certs / "soon.crt").write_bytes(issue("soon.example.com", timedelta(hours=2), 1))
+    (certs / "hosts" / "chain.crt").write_bytes(
+        issue("later.example.com", timedelta(days=30), 2)
+        + issue("Intermediate", timedelta(days=365), 3)
+    )
+    (certs / "notes.txt").write_text("not a certificate")
+    return tmp_path
+
+
+def test_queries(step_path):
+    """Tests looking certificates up by each index."""
+    inventory = StepCertInventory(str(step_path))
+    assert inventory.scan() == (3, 0)
+    assert len(inventory) == 3
+
+    assert [r.common_name for r in inventory.by_san("shared")] == [
+        "soon.example.com",
+        "later.example.com",
+        "Intermediate",
+    ]
+    (record,) = inventory.by_subject("later.example.com")
+    assert (record.path.endswith("chain.crt"), record.index) == (True, 0)
+    assert inventory.by_subject("CN=Intermediate")[0].serial == 3
+    assert inventory.by_serial("1")[0].common_name == "soon.example.com"
+    assert len(inventory.by_issuer("CN=Test Issuer")) == 3
+    assert [r.serial for r in inventory.expiring(24 * 3600)] == [1]
+    assert [r.serial for r in inventory.expiring(60 * 24 * 3600)] == [1, 2]
+    assert inventory.expiring(0, now=time.time() + 400 * 24 * 3600)[-1].serial == 3
+
+
+def test_incremental_scan(step_path, issue):
+    """Tests that only changed files are parsed again."""
+    inventory = StepCertInventory(str(step_path))
+    inventory.scan()
+    assert inventory.scan() == (0, 0)
+
+    soon = step_path / "certs" / "soon.crt"
+    soon.write_bytes(issue("soon.example.com", timedelta(days=90), 4))
+    os.utime(soon, ns=(time.time_ns(), time.time_ns() + 10**9))
+    os.remove(step_path / "certs" / "hosts" / "chain.crt")
+    assert inventory.scan() == (1, 1)
+    assert inventory.expiring(24 * 3600) == []
+    assert inventory.by_serial(1) == []
+    assert inventory.by_san("later.example.com") == []
+    assert [r.serial for r in inventory.by_san("shared")] == [4]
+
+
+def test_persisted_index(step_path):
+    """Tests that another process starts from the saved index."""
+    StepCertInventory(str(step_path)).scan()
+    inventory = StepCertInventory(str(step_path))
+    assert len(inventory) == 3
+    assert inventory.scan() == (0, 0)
+    assert inventory.by_san("soon.example.com")[0].sans == (
+        "soon.example.com",
+        "shared",
+    )
+    assert len(StepCertInventory(str(step_path), persist=False)) == 0
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+import pytest
+
+from step import AsyncStepCli, StepCli
+from step.cli.step_cli_exec import PosixSpawnExecutor
+from step.metrics import (
+    CallbackExporter,
+    PrometheusExporter,
+    endpoint,
+    step_metrics,
+)
+from step.python.step_ca_py import StepCaClient, StepCaError
+
+pytestmark = pytest.mark.usefixtures("step_schema")
+
+
+@pytest.fixture
+def observed():
+    """Collects the observations made during the test."""
+    observations = []
+    exporter = step_metrics.add_exporter(
+        CallbackExporter(lambda *observation: observations.append(observation))
+    )
+    yield observations
+    step_metrics.remove_exporter(exporter)
+
+
+def names(observations) -> dict[str, dict]:
+    return {name: labels for name, _, labels in observations}
+
+
+@pytest.mark.parametrize("executor", [None, PosixSpawnExecutor()])
+def test_command_metrics(fake_step, observed, executor):
+    """Tests the metrics of a command run."""
+    fake_step("echo ok")
+    assert StepCli(executor).ca.health() is True
+    command = {"command": "step ca health"}
+    assert names(observed) == {
+        "step_command_spawn_seconds": command,
+        "step_command_seconds": {**command, "status": "0"},
+        "step_command_output_bytes": command,
+        "step_command_parse_seconds": command,
+    }
+    assert ("step_command_output_bytes", 3, command) in observed
+
+
+def test_failed_command_metrics(fake_step, observed):
+    """Tests that the exit status of a failed command is recorded."""
+    fake_step("exit 3")
+    assert StepCli().ca.health(_no_stderr=True) is None
+    assert asyncio.run(AsyncStepCli().ca.health(_no_stderr=True)) is None
+    statuses = [l["status"] for n, _, l in observed if n == "step_command_seconds"]
+    assert statuses == ["3", "3"]
+
+
+def test_request_metrics(stub_ca, observed):
+    """Tests the metrics of requests to the ca."""
+    with StepCaClient(stub_ca.url, stub_ca.root_path) as client:
+        client.version()
+        with pytest.raises(StepCaError):
+            client.provisioner_key("missing")
+    assert [labels for _, _, labels in observed] == [
+        {"method": "GET", "path": "/version", "status": "200"},
+        {"method": "GET", "path": "/provisioners", "status": "404"},
+    ]
+
+
+def test_no_exporters(fake_step):
+    """Tests that nothing is measured without an exporter."""
+    assert not step_metrics.exporters
+    fake_step("echo ok")
+    assert StepCli().ca.health() is True
+
+
+def test_prometheus_render():
+    """Tests the Prometheus text format."""
+    exporter = PrometheusExporter()
+    for seconds in (0.002, 0.02, 40):
+        exporter.observe("step_command_seconds", seconds, {"command": 'say "hi"'})
+    exporter.observe("step_command_output_bytes", 100, {"command": "step"})
+    lines = exporter.render().splitlines()
+    assert "# TYPE step_command_seconds histogram" in lines
+    assert 'step_command_seconds_bucket{command="say \\"hi\\"",le="0.001"} 0' in lines
+    assert 'step_command_seconds_bucket{command="say \\"hi\\"",le="0.0025"} 1' in lines
+    assert 'step_command_seconds_bucket{command="say \\"hi\\"",le="30.0"} 2' in lines
+    assert 'step_command_seconds_bucket{command="say \\"hi\\"",le="+Inf"} 3' in lines
+    assert 'step_command_seconds_count{command="say \\"hi\\""} 3' in lines
+    assert 'step_command_output_bytes_bucket{command="step",le="256"} 1' in lines
+
+
+def test_endpoint():
+    """Tests that ids and queries are dropped from request paths."""
+    assert endpoint("/sign") == "/sign"
+    assert endpoint("/root/abc123") == "/root"
+    assert endpoint("/provisioners?limit=10") == "/provisioners"
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+import shutil
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from step.python.step_ca_py import StepCaClient
+from step.python.step_renewer import (
+    CliRenewer,
+    HttpRenewer,
+    StepRenewalScheduler,
+    StepRenewer,
+    _RateLimiter,
+    _Renewal,
+)
+
+
+@pytest.fixture
+def issue(stub_ca, tmp_path):
+    """Writes a certificate from the stub ca and its key to files."""
+
+    def issue(name: str, lifetime: timedelta) -> tuple[str, str]:
+        key = ec.generate_private_key(ec.SECP256R1())
+        now = datetime.now(timezone.utc)
+        cert = stub_ca.issue(name, key.public_key(), [], now + lifetime, now)
+        cert_path, key_path = tmp_path / f"{name}.crt", tmp_path / f"{name}.key"
+        cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+        key_path.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        return str(cert_path), str(key_path)
+
+    return issue
+
+
+def serial(cert_path: str) -> int:
+    with open(cert_path, "rb") as f:
+        return x509.load_pem_x509_certificate(f.read()).serial_number
+
+
+def test_schedule(issue):
+    """Tests that certificates are ordered by when they are due, with jitter."""
+    scheduler = StepRenewalScheduler(fraction=0.5, jitter=0.1)
+    start = time.time()
+    long = scheduler.add(*issue("long", timedelta(hours=10)))
+    short = scheduler.add(*issue("short", timedelta(hours=1)))
+    assert start + 4 * 3600 - 1 <= long <= start + 5 * 3600 + 1
+    assert start + 0.4 * 3600 - 1 <= short <= start + 0.5 * 3600 + 1
+    cert_path, renew_at = scheduler.next_renewal()
+    assert cert_path.endswith("short.crt") and renew_at == short
+
+    scheduler.remove(scheduler.next_renewal()[0])
+    assert scheduler.next_renewal()[0].endswith("long.crt")
+    assert len(scheduler) == 1
+
+
+def test_renew_over_http(stub_ca, issue):
+    """Tests that certificates are renewed again and again as they come due."""
+    # validity is in whole seconds, so renewals come a bit early
+    cert_files = issue("host", timedelta(seconds=3))
+    first_serial = serial(cert_files[0])
+    renewed = []
+    done = threading.Event()
+
+    def on_renewed(cert_path):
+        renewed.append(serial(cert_path))
+        if len(renewed) == 2:
+            done.set()
+
+    client = StepCaClient(stub_ca.url, stub_ca.root_path)
+    scheduler = StepRenewalScheduler(
+        HttpRenewer(client), fraction=0.5, jitter=0, on_renewed=on_renewed
+    )
+    scheduler.add(*cert_files)
+    scheduler.start()
+    try:
+        assert done.wait(10)
+    finally:
+        scheduler.stop()
+    assert first_serial not in renewed
+    assert len(set(renewed)) == 2
+    assert [path for _, path in stub_ca.requests] == ["/renew", "/renew"]
+
+
+def test_failed_renewal_retries(issue):
+    """Tests that failed renewals back off."""
+
+    class Failing(StepRenewer):
+        calls = 0
+
+        def renew(self, cert_path, key_path):
+            self.calls += 1
+            raise OSError("ca is down")
+
+    renewer = Failing()
+    scheduler = StepRenewalScheduler(renewer, fraction=0, jitter=0, retry_interval=60)
+    cert_path, _ = cert_files = issue("host", timedelta(hours=1))
+    scheduler.add(*cert_files)
+    scheduler.start()
+    try:
+        deadline = time.time() + 5
+        while scheduler.next_renewal() is None or renewer.calls == 0:
+            assert time.time() < deadline
+            time.sleep(0.01)
+    finally:
+        scheduler.stop()
+    assert renewer.calls == 1
+    assert scheduler.next_renewal()[1] > time.time() + 50
+
+
+def test_retry_capped_before_expiry():
+    """Tests that the back off stays under half the time left."""
+    scheduler = StepRenewalScheduler(retry_interval=30)
+    renewal = _Renewal("host.crt", "host.key", not_after=time.time() + 600)
+    renewal.failures = 1
+    assert scheduler._retry_in(renewal) == 30
+    renewal.failures = 2000
+    assert 299 <= scheduler._retry_in(renewal) <= 300
+    renewal.not_after = time.time() - 10
+    assert scheduler._retry_in(renewal) == 30
+
+
+def test_failing_callback_keeps_schedule(issue):
+    """Tests that a certificate stays scheduled when on_renewed raises."""
+    cert_files = issue("host", timedelta(seconds=2))
+
+    class Reissue(StepRenewer):
+        def renew(self, cert_path, key_path):
+            shutil.copy(issue("new", timedelta(hours=1))[0], cert_path)
+
+    called = threading.Event()
+
+    def on_renewed(cert_path):
+        called.set()
+        raise RuntimeError("reload failed")
+
+    scheduler = StepRenewalScheduler(
+        Reissue(), fraction=0.5, jitter=0, on_renewed=on_renewed
+    )
+    scheduler.add(*cert_files)
+    scheduler.start()
+    try:
+        assert called.wait(5)
+        deadline = time.time() + 5
+        while (next_renewal := scheduler.next_renewal()) is None or (
+            next_renewal[1] < time.time() + 60
+        ):
+            assert time.time() < deadline
+            time.sleep(0.01)
+    finally:
+        scheduler.stop()
+    assert len(scheduler) == 1
+
+
+def test_rate_limiter():
+    """Tests that the limiter allows a burst, then paces."""
+    limiter = _RateLimiter(rate=10, burst=2)
+    assert limiter.wait() == 0
+    assert limiter.wait() == 0
+    assert 0.09 < limiter.wait() <= 0.1
+    assert _RateLimiter(rate=0).wait() == 0
+
+
+def test_cli_renewer(fake_step, tmp_path):
+    """Tests running step ca renew."""
+    args = tmp_path / "args"
+    fake_step(f'echo "$@" > {args}')
+    CliRenewer().renew("host.crt", "host.key")
+    assert args.read_text() == "ca renew --force host.crt host.key\n"
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+import base64
+import json
+
+import pytest
+from cryptography import x509
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+
+from step.python.step_ca_py import StepCaClient
+from step.python.step_py import StepPy
+from step.python.step_token import StepTokens, decrypt_jwe, sign_jws
+from step.testing.stub_ca import encrypt_jwe
+
+PASSWORD = b"correct horse battery staple"
+
+
+def b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def verify(token: str, public_key) -> tuple[dict, dict]:
+    """Verifies an ES256 JWT, returning its header and claims."""
+    header, claims, signature = token.split(".")
+    raw = b64decode(signature)
+    public_key.verify(
+        encode_dss_signature(
+            int.from_bytes(raw[:32], "big"), int.from_bytes(raw[32:], "big")
+        ),
+        f"{header}.{claims}".encode("ascii"),
+        ec.ECDSA(hashes.SHA256()),
+    )
+    return json.loads(b64decode(header)), json.loads(b64decode(claims))
+
+
+@pytest.fixture
+def tokens(stub_ca):
+    return StepTokens(
+        StepCaClient(stub_ca.url, stub_ca.root_path), stub_ca.url, stub_ca.fingerprint
+    )
+
+
+def test_decrypt_jwe():
+    jwe = encrypt_jwe(b'{"kty":"EC"}', PASSWORD)
+    assert decrypt_jwe(jwe, PASSWORD) == b'{"kty":"EC"}'
+    with pytest.raises(ValueError):
+        decrypt_jwe(jwe, b"wrong")
+    header = json.loads(b64decode(jwe.split(".")[0]))
+    for p2c in (10**9, 0, "1000"):
+        forged = base64.urlsafe_b64encode(json.dumps({**header, "p2c": p2c}).encode())
+        with pytest.raises(ValueError, match="p2c"):
+            decrypt_jwe(".".join([forged.decode()] + jwe.split(".")[1:]), PASSWORD)
+
+
+def test_sign_jws():
+    """Tests signatures of the other key types."""
+    key = ed25519.Ed25519PrivateKey.generate()
+    header, claims, signature = sign_jws(key, "EdDSA", {}, {"a": 1}).split(".")
+    key.public_key().verify(b64decode(signature), f"{header}.{claims}".encode())
+    key = rsa.generate_private_key(65537, 2048)
+    header, claims, signature = sign_jws(key, "PS384", {}, {"a": 1}).split(".")
+    key.public_key().verify(
+        b64decode(signature),
+        f"{header}.{claims}".encode(),
+        padding.PSS(padding.MGF1(hashes.SHA384()), 48),
+        hashes.SHA384(),
+    )
+    assert json.loads(b64decode(header)) == {"alg": "PS384"}
+
+
+def test_token(stub_ca, tokens):
+    """Tests the claims of a token, and that the key is only fetched once."""
+    key = stub_ca.jwk_provisioner("admin", PASSWORD)
+    token = tokens.token("host", "admin", PASSWORD.decode(), ["host", "10.0.0.1"])
+    header, claims = verify(token, key.public_key())
+    assert header == {
+        "alg": "ES256",
+        "kid": stub_ca.provisioners[0]["key"]["kid"],
+        "typ": "JWT",
+    }
+    assert claims["aud"] == f"{stub_ca.url}/1.0/sign"
+    assert claims["iss"] == "admin"
+    assert claims["sub"] == "host"
+    assert claims["sans"] == ["host", "10.0.0.1"]
+    assert claims["sha"] == stub_ca.fingerprint
+    assert claims["exp"] - claims["nbf"] == 300
+    second = tokens.token("other", "admin", PASSWORD)
+    assert verify(second, key.public_key())[1]["jti"] != claims["jti"]
+    assert len(stub_ca.requests) == 2
+
+
+def test_key_expiry(stub_ca, tokens):
+    stub_ca.jwk_provisioner("admin", PASSWORD)
+    tokens.key_ttl = 0
+    tokens.token("host", "admin", PASSWORD)
+    tokens.token("host", "admin", PASSWORD)
+    assert len(stub_ca.requests) == 4
+
+
+def test_key_errors(stub_ca, tokens):
+    stub_ca.jwk_provisioner("admin", PASSWORD)
+    with pytest.raises(ValueError, match="no JWK provisioner"):
+        tokens.key("other", PASSWORD)
+    with pytest.raises(ValueError, match="wrong password"):
+        tokens.key("admin", b"wrong")
+
+
+def test_key_wrong_password_cached(stub_ca, tokens):
+    """Tests that a kept key is not handed out for another password."""
+    stub_ca.jwk_provisioner("admin", PASSWORD)
+    tokens.key("admin", PASSWORD)
+    with pytest.raises(ValueError, match="wrong password"):
+        tokens.key("admin", b"wrong")
+    tokens.key("admin", PASSWORD)
+
+
+def test_issue(stub_ca, tmp_path, monkeypatch):
+    """Tests issuing with a token minted in process."""
+    monkeypatch.setenv("STEPPATH", str(tmp_path / "step"))
+    key = stub_ca.jwk_provisioner("admin", PASSWORD)
+
+    def check_token(token: str, endpoint: str) -> bool:
+        try:
+            claims = verify(token, key.public_key())[1]
+        except InvalidSignature:
+            return False
+        return claims["aud"].endswith(endpoint)
+
+    stub_ca.check_token = check_token
+    step = StepPy()
+    step.bootstrap(stub_ca.url, stub_ca.fingerprint)
+    _, response = step.issue("host", step.token("host", "admin", PASSWORD))
+    cert = x509.load_pem_x509_certificate(response["crt"].encode())
+    assert cert.subject.rfc4514_string() == "CN=host"
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import os
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+
+from step.python.step_ca_py import StepCaClient, StepCaError
+from step.python.step_py import StepContext, StepPy
+
+
+@pytest.fixture
+def step_path(tmp_path, monkeypatch):
+    path = tmp_path / "step"
+    monkeypatch.setenv("STEPPATH", str(path))
+    return path
+
+
+@pytest.fixture
+def make_root(make_cert):
+    """Makes a PEM root certificate."""
+
+    def make(name: str) -> str:
+        root, _ = make_cert(name, ca=True)
+        return root.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+
+    return make
+
+
+def test_bootstrap_once(stub_ca, step_path, make_root):
+    """Tests that fresh cached roots cost no requests to the ca."""
+    stub_ca.federated = [make_root("Federated Root")]
+    context = StepContext(stub_ca.url, stub_ca.fingerprint)
+    assert [path for _, path in stub_ca.requests] == [
+        f"/root/{stub_ca.fingerprint}",
+        "/roots",
+        "/federation",
+        "/version",
+    ]
+    assert [cert.subject.rfc4514_string() for cert in context.root_certs] == [
+        "CN=Stub Root CA",
+        "CN=Federated Root",
+    ]
+    mtime = os.stat(context.root_cert_path).st_mtime_ns
+
+    stub_ca.requests.clear()
+    context = StepContext(stub_ca.url, stub_ca.fingerprint)
+    assert stub_ca.requests == []
+    assert context.version == "0.24.2"
+    assert len(context.root_certs) == 2
+    assert os.stat(context.root_cert_path).st_mtime_ns == mtime
+    assert context.client.health()
+
+
+def test_revalidate(stub_ca, step_path, make_root):
+    """Tests that stale roots are revalidated over the pinned connection."""
+    StepContext(stub_ca.url, stub_ca.fingerprint)
+    stub_ca.requests.clear()
+    context = StepContext(stub_ca.url, stub_ca.fingerprint, trust_ttl=0)
+    assert [path for _, path in stub_ca.requests] == [
+        "/roots",
+        "/federation",
+        "/version",
+    ]
+    assert len(context.root_certs) == 1
+
+    stub_ca.federated = [make_root("Federated Root")]
+    stub_ca.requests.clear()
+    context = StepContext(stub_ca.url, stub_ca.fingerprint, refresh=True)
+    assert [path for _, path in stub_ca.requests] == ["/roots", "/federation"]
+    assert context.version == "0.24.2"
+    assert len(context.root_certs) == 2
+    assert open(context.root_cert_path).read().count("BEGIN CERTIFICATE") == 2
+
+
+def test_stale_roots_when_ca_is_down(stub_ca, step_path):
+    """Tests that stale roots are still used if the ca can not be reached."""
+    StepContext(stub_ca.url, stub_ca.fingerprint)
+    stub_ca.stop()
+    context = StepContext(stub_ca.url, stub_ca.fingerprint, trust_ttl=0)
+    assert len(context.root_certs) == 1
+
+
+def test_bootstrap_without_version(stub_ca, step_path, monkeypatch):
+    """Tests that a failed /version does not fail the first bootstrap."""
+
+    def fail(self):
+        raise StepCaError(500, "the version is not available")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(StepCaClient, "version", fail)
+        context = StepContext(stub_ca.url, stub_ca.fingerprint)
+    assert context.version == ""
+    assert len(context.root_certs) == 1
+
+    # the version is fetched again while it is unknown
+    context = StepContext(stub_ca.url, stub_ca.fingerprint, refresh=True)
+    assert context.version == "0.24.2"
+
+
+def test_step_py_bootstrap(stub_ca, step_path):
+    """Tests that bootstrapping requests the roots only once."""
+    step = StepPy()
+    step.bootstrap(stub_ca.url, stub_ca.fingerprint)
+    assert len(stub_ca.requests) == 4
+    assert step.client.version()["version"] == step.context.version